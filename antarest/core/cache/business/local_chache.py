@@ -1,79 +1,120 @@
+import dataclasses
 import logging
+import pickle
+import sys
 import threading
 import time
-from typing import Dict, List, Optional
-
-from pydantic import BaseModel
+from collections import OrderedDict
+from typing import List, Optional
 
 from antarest.core.config import CacheConfig
-from antarest.core.interfaces.cache import ICache
+from antarest.core.interfaces.cache import CacheStats, ICache
 from antarest.core.model import JSON
 
 logger = logging.getLogger(__name__)
 
 
-class LocalCacheElement(BaseModel):
-    timeout: int
+def _estimate_size(data: JSON) -> int:
+    """
+    Estimate the memory footprint of a cached value, in bytes.
+
+    The size of the pickled value is used as an approximation: it is computed in C
+    and it is proportional to the size of the nested containers and strings.
+    """
+    try:
+        return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return sys.getsizeof(data)
+
+
+@dataclasses.dataclass
+class LocalCacheElement:
+    timeout: float
     duration: int
     data: JSON
+    size: int = 0
 
 
 class LocalCache(ICache):
+    """
+    In-memory cache with a memory budget and a least-recently-used eviction policy.
+
+    Expired entries are removed when they are accessed, or evicted like any other entry
+    when the memory budget is exceeded. The lock only protects the operations on the
+    dictionary of entries: the size of the values is estimated outside the lock.
+    """
+
     def __init__(self, config: CacheConfig = CacheConfig()):
-        self.cache: Dict[str, LocalCacheElement] = {}
+        # Entries are ordered from the least recently used to the most recently used.
+        self.cache: "OrderedDict[str, LocalCacheElement]" = OrderedDict()
         self.lock = threading.Lock()
-        self.checker_delay = config.checker_delay
-        self.checker_thread = threading.Thread(
-            target=self.checker,
-            name=self.__class__.__name__,
-            daemon=True,
-        )
+        self.max_size = config.max_size
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def start(self) -> None:
-        self.checker_thread.start()
-
-    def checker(self) -> None:
-        while True:
-            time.sleep(self.checker_delay)
-            with self.lock:
-                current_time = time.time()
-                to_delete: List[str] = []
-                for id in self.cache.keys():
-                    if current_time >= self.cache[id].timeout:
-                        to_delete.append(id)
-                for id in to_delete:
-                    del self.cache[id]
+        # Nothing to start: expired entries are removed lazily.
+        pass
 
     def put(self, id: str, data: JSON, duration: int = 3600) -> None:  # Duration in second
+        size = _estimate_size(data)
+        if size > self.max_size:
+            logger.debug(f"Cache key {id} not stored: {size} bytes exceed the cache budget")
+            self.invalidate(id)
+            return
+        element = LocalCacheElement(timeout=time.time() + duration, duration=duration, data=data, size=size)
         with self.lock:
-            logger.info(f"Adding cache key {id}")
-            self.cache[id] = LocalCacheElement(
-                data=data,
-                timeout=(int(time.time()) + duration),
-                duration=duration,
-            )
+            previous = self.cache.pop(id, None)
+            if previous is not None:
+                self._size -= previous.size
+            self.cache[id] = element
+            self._size += size
+            while self._size > self.max_size:
+                _, evicted = self.cache.popitem(last=False)
+                self._size -= evicted.size
+                self._evictions += 1
 
     def get(self, id: str, refresh_duration: Optional[int] = None) -> Optional[JSON]:
-        res = None
+        now = time.time()
         with self.lock:
-            logger.info(f"Trying to retrieve cache key {id}")
-            if id in self.cache:
-                logger.info(f"Cache key {id} found")
-                if refresh_duration:
-                    self.cache[id].duration = refresh_duration
-                self.cache[id].timeout = int(time.time()) + self.cache[id].duration
-                res = self.cache[id].data
-        return res
+            element = self.cache.get(id)
+            if element is None:
+                self._misses += 1
+                return None
+            if now >= element.timeout:
+                del self.cache[id]
+                self._size -= element.size
+                self._misses += 1
+                return None
+            self.cache.move_to_end(id)
+            self._hits += 1
+        if refresh_duration:
+            element.duration = refresh_duration
+        element.timeout = now + element.duration
+        return element.data
 
     def invalidate(self, id: str) -> None:
         with self.lock:
-            logger.info(f"Removing cache key {id}")
-            if id in self.cache:
-                del self.cache[id]
+            element = self.cache.pop(id, None)
+            if element is not None:
+                self._size -= element.size
 
     def invalidate_all(self, ids: List[str]) -> None:
         with self.lock:
-            logger.info(f"Removing cache keys {ids}")
             for id in ids:
-                if id in self.cache:
-                    del self.cache[id]
+                element = self.cache.pop(id, None)
+                if element is not None:
+                    self._size -= element.size
+
+    def get_stats(self) -> CacheStats:
+        with self.lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                count=len(self.cache),
+                size=self._size,
+                max_size=self.max_size,
+            )
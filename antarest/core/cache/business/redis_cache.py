@@ -1,56 +1,104 @@
-import json
 import logging
-from typing import List, Optional
+import threading
+from typing import Any, List, Optional, Tuple
 
-from pydantic import BaseModel
+import msgpack  # type: ignore
+from pydantic.json import pydantic_encoder
 from redis.client import Redis
 
-from antarest.core.interfaces.cache import ICache
+from antarest.core.interfaces.cache import CacheStats, ICache
 from antarest.core.model import JSON
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_VERSION = 1
+"""
+Version of the encoding of the cache entries, stored with each entry.
 
-class RedisCacheElement(BaseModel):
-    duration: int
-    data: JSON
+Entries stored with another version (for instance by a previous version of the application)
+are considered missing and are removed when they are read.
+"""
+
+
+def _encode(data: JSON, duration: int) -> bytes:
+    """
+    Encode a cache entry as a MessagePack array: `[SCHEMA_VERSION, duration, data]`.
+
+    The values which are not natively supported by MessagePack (paths, enums, sets, Pydantic models...)
+    are converted like in the JSON encoding of Pydantic.
+    """
+    return msgpack.packb([SCHEMA_VERSION, duration, data], default=pydantic_encoder)  # type: ignore
+
+
+def _decode(payload: bytes) -> Optional[Tuple[int, JSON]]:
+    """
+    Decode a cache entry.
+
+    Returns:
+        The duration and the data of the entry, or `None` if the entry has another schema version.
+    """
+    try:
+        entry: Any = msgpack.unpackb(payload, strict_map_key=False)
+    except (ValueError, TypeError, msgpack.UnpackException):
+        return None
+    if not isinstance(entry, list) or len(entry) != 3 or entry[0] != SCHEMA_VERSION:
+        return None
+    return entry[1], entry[2]
 
 
 class RedisCache(ICache):
     def __init__(self, redis_client: Redis):  # type: ignore
         self.redis = redis_client
+        # Lookups made by this process, the entries being shared by all the processes.
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    def _count_lookups(self, hits: int, misses: int) -> None:
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
 
     def start(self) -> None:
         # Assuming the Redis service is already running; no need to start it here.
         pass
 
     def put(self, id: str, data: JSON, duration: int = 3600) -> None:
-        redis_element = RedisCacheElement(duration=duration, data=data)
-        redis_key = f"cache:{id}"
-        logger.info(f"Adding cache key {id}")
-        self.redis.set(redis_key, redis_element.json())
-        self.redis.expire(redis_key, duration)
+        self.redis.set(f"cache:{id}", _encode(data, duration), ex=duration)
 
     def get(self, id: str, refresh_timeout: Optional[int] = None) -> Optional[JSON]:
         redis_key = f"cache:{id}"
-        result = self.redis.get(redis_key)
-        logger.info(f"Trying to retrieve cache key {id}")
-        if result is not None:
-            logger.info(f"Cache key {id} found")
-            json_result = json.loads(result)
-            redis_element = RedisCacheElement(duration=json_result["duration"], data=json_result["data"])
-            self.redis.expire(
-                redis_key,
-                redis_element.duration if refresh_timeout is None else refresh_timeout,
-            )
-            return redis_element.data
-        logger.info(f"Cache key {id} not found")
-        return None
+        if refresh_timeout is None:
+            payload = self.redis.get(redis_key)
+        else:
+            # The new duration is known: the entry is read and refreshed in a single round trip.
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.get(redis_key)
+            pipeline.expire(redis_key, refresh_timeout)
+            payload, _ = pipeline.execute()
+        entry = None if payload is None else _decode(payload)
+        if entry is None:
+            self._count_lookups(0, 1)
+            if payload is not None:
+                logger.warning(f"Removing cache key {id} stored with an unknown encoding")
+                self.redis.delete(redis_key)
+            return None
+        self._count_lookups(1, 0)
+        duration, data = entry
+        if refresh_timeout is None:
+            self.redis.expire(redis_key, duration)
+        return data
 
     def invalidate(self, id: str) -> None:
-        logger.info(f"Removing cache key {id}")
         self.redis.delete(f"cache:{id}")
 
     def invalidate_all(self, ids: List[str]) -> None:
-        logger.info(f"Removing cache keys {ids}")
-        self.redis.delete(*[f"cache:{id}" for id in ids])
+        if ids:
+            self.redis.delete(*[f"cache:{id}" for id in ids])
+
+    def get_stats(self) -> CacheStats:
+        """
+        Get the lookups made by this process: the size of the entries stored in Redis is not tracked.
+        """
+        with self._stats_lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
@@ -7,12 +7,42 @@ from antarest.core.cache.business.local_chache import LocalCache
 from antarest.core.cache.business.redis_cache import RedisCache
 from antarest.core.config import Config
 from antarest.core.interfaces.cache import ICache
+from antarest.core.metrics import REGISTRY
 
 logger = logging.getLogger(__name__)
 
 
+def _register_cache_metrics(cache: ICache) -> None:
+    """Expose the usage counters of the cache, read from its statistics when the metrics are scraped."""
+
+    def get_hit_ratio() -> float:
+        stats = cache.get_stats()
+        lookups = stats.hits + stats.misses
+        return stats.hits / lookups if lookups else 0.0
+
+    for name, documentation, attribute, type_name in [
+        ("antarest_cache_hits_total", "Number of cache lookups which found a value", "hits", "counter"),
+        ("antarest_cache_misses_total", "Number of cache lookups which found no value", "misses", "counter"),
+        ("antarest_cache_evictions_total", "Number of entries evicted to respect the budget", "evictions", "counter"),
+        ("antarest_cache_entries", "Number of entries stored in the local cache", "count", "gauge"),
+        ("antarest_cache_size_bytes", "Estimated size of the entries stored in the local cache", "size", "gauge"),
+    ]:
+        REGISTRY.register_callback(
+            name,
+            documentation,
+            lambda attribute=attribute: getattr(cache.get_stats(), attribute),  # type: ignore
+            type_name=type_name,
+        )
+    REGISTRY.register_callback(
+        "antarest_cache_hit_ratio",
+        "Ratio of the cache lookups which found a value, since the start of the worker",
+        get_hit_ratio,
+    )
+
+
 def build_cache(config: Config, redis_client: Optional[Redis] = None) -> ICache:  # type: ignore
     cache = RedisCache(redis_client) if redis_client is not None else LocalCache(config=config.cache)
     logger.info("Redis cache" if config.redis is not None else "Local cache")
     cache.start()
+    _register_cache_metrics(cache)
     return cache
@@ -46,6 +46,7 @@ class SecurityConfig:
     admin_pwd: str = ""
     disabled: bool = False
     external_auth: ExternalAuthConfig = ExternalAuthConfig()
+    identity_cache_ttl: int = 30
 
     @classmethod
     def from_dict(cls, data: JSON) -> "SecurityConfig":
@@ -54,6 +55,7 @@ class SecurityConfig:
             jwt_key=data.get("jwt", {}).get("key", defaults.jwt_key),
             admin_pwd=data.get("login", {}).get("admin", {}).get("pwd", defaults.admin_pwd),
             disabled=data.get("disabled", defaults.disabled),
+            identity_cache_ttl=data.get("identity_cache_ttl", defaults.identity_cache_ttl),
             external_auth=(
                 ExternalAuthConfig.from_dict(data["external_auth"])
                 if "external_auth" in data
@@ -99,6 +101,14 @@ class DbConfig:
     pool_max_overflow: int = 10
     pool_size: int = 5
     pool_use_lifo: bool = False
+    pool_timeout: int = 10
+    background_pool_size: int = 5
+    background_pool_max_overflow: int = 5
+    background_pool_timeout: int = 60
+    query_budget: int = 0
+    query_budgets: Dict[str, int] = field(default_factory=dict)
+    query_repeat_threshold: int = 20
+    query_budget_strict: bool = False
 
     @classmethod
     def from_dict(cls, data: JSON) -> "DbConfig":
@@ -113,6 +123,16 @@ class DbConfig:
             pool_max_overflow=data.get("pool_max_overflow", defaults.pool_max_overflow),
             pool_size=data.get("pool_size", defaults.pool_size),
             pool_use_lifo=data.get("pool_use_lifo", defaults.pool_use_lifo),
+            pool_timeout=data.get("pool_timeout", defaults.pool_timeout),
+            background_pool_size=data.get("background_pool_size", defaults.background_pool_size),
+            background_pool_max_overflow=data.get(
+                "background_pool_max_overflow", defaults.background_pool_max_overflow
+            ),
+            background_pool_timeout=data.get("background_pool_timeout", defaults.background_pool_timeout),
+            query_budget=data.get("query_budget", defaults.query_budget),
+            query_budgets=data.get("query_budgets", defaults.query_budgets),
+            query_repeat_threshold=data.get("query_repeat_threshold", defaults.query_repeat_threshold),
+            query_budget_strict=data.get("query_budget_strict", defaults.query_budget_strict),
         )
 
 
@@ -130,6 +150,7 @@ class StorageConfig:
     watcher_lock: bool = True
     watcher_lock_delay: int = 10
     download_default_expiration_timeout_minutes: int = 1440
+    export_cache_max_size_mb: int = 2048
     matrix_gc_sleeping_time: int = 3600
     matrix_gc_dry_run: bool = False
     auto_archive_threshold_days: int = 60
@@ -159,6 +180,7 @@ class StorageConfig:
                     defaults.download_default_expiration_timeout_minutes,
                 )
             ),
+            export_cache_max_size_mb=data.get("export_cache_max_size_mb", defaults.export_cache_max_size_mb),
             matrix_gc_sleeping_time=data.get("matrix_gc_sleeping_time", defaults.matrix_gc_sleeping_time),
             matrix_gc_dry_run=data.get("matrix_gc_dry_run", defaults.matrix_gc_dry_run),
             auto_archive_threshold_days=data.get("auto_archive_threshold_days", defaults.auto_archive_threshold_days),
@@ -490,13 +512,13 @@ class CacheConfig:
     Sub config object dedicated to cache module
     """
 
-    checker_delay: float = 0.2  # in seconds
+    max_size: int = 256 * 1024 * 1024  # in bytes
 
     @classmethod
     def from_dict(cls, data: JSON) -> "CacheConfig":
         defaults = cls()
         return cls(
-            checker_delay=data.get("checker_delay", defaults.checker_delay),
+            max_size=data.get("max_size", defaults.max_size),
         )
 
 
@@ -521,6 +543,7 @@ class TaskConfig:
     """
 
     max_workers: int = 5
+    max_workers_by_type: Dict[str, int] = field(default_factory=dict)
     remote_workers: List[RemoteWorkerConfig] = field(default_factory=list)
 
     @classmethod
@@ -533,6 +556,7 @@ class TaskConfig:
         )
         return cls(
             max_workers=data.get("max_workers", defaults.max_workers),
+            max_workers_by_type=data.get("max_workers_by_type", defaults.max_workers_by_type),
             remote_workers=remote_workers,
         )
 
@@ -545,6 +569,8 @@ class ServerConfig:
 
     worker_threadpool_size: int = 5
     services: List[str] = field(default_factory=list)
+    profiling_sampling_ratio: float = 0
+    profiling_interval: float = 0.01  # in seconds
 
     @classmethod
     def from_dict(cls, data: JSON) -> "ServerConfig":
@@ -552,6 +578,8 @@ class ServerConfig:
         return cls(
             worker_threadpool_size=data.get("worker_threadpool_size", defaults.worker_threadpool_size),
             services=data.get("services", defaults.services),
+            profiling_sampling_ratio=data.get("profiling_sampling_ratio", defaults.profiling_sampling_ratio),
+            profiling_interval=data.get("profiling_interval", defaults.profiling_interval),
         )
 
 
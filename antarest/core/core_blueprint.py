@@ -1,12 +1,18 @@
 import logging
-from typing import Any
+from typing import Any, List
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from starlette.responses import Response
 
 from antarest.core.config import Config
+from antarest.core.exceptions import ProfileNotFoundError
 from antarest.core.jwt import JWTUser
+from antarest.core.metrics import CONTENT_TYPE, REGISTRY
+from antarest.core.profiling import ProfileDTO, get_profiler
 from antarest.core.requests import UserHasNotPermissionError
+from antarest.core.utils.fastapi_sqlalchemy.middleware import get_query_monitor
+from antarest.core.utils.fastapi_sqlalchemy.query_monitor import QueryStatsSummaryDTO
 from antarest.core.utils.web import APITag
 from antarest.core.version_info import VersionInfoDTO, get_commit_id, get_dependencies
 from antarest.login.auth import Auth
@@ -54,6 +60,88 @@ def create_utils_routes(config: Config) -> APIRouter:
             dependencies=get_dependencies(),
         )
 
+    @bp.get(
+        "/v1/core/db-statistics",
+        tags=[APITag.misc],
+        summary="Get the statistics of the SQL statements",
+        response_model=List[QueryStatsSummaryDTO],
+    )
+    def get_db_statistics(
+        reset: bool = False,
+        current_user: JWTUser = Depends(auth.get_current_user),
+    ) -> Any:
+        """
+        Returns the statistics of the SQL statements executed by the HTTP requests (by route)
+        and the background tasks (by task type) since the start of the worker, the most expensive first.
+
+        - `max_statement_count`: The maximum number of statements executed by a request or task.
+        - `budget`: The maximum number of statements allowed (0 means no limit).
+        - `repeated_statements`: The statements executed many times by the same request or task,
+          which are likely N+1 queries, with their maximum number of executions.
+
+        Use `reset=true` to clear the statistics once they are returned. Only available to administrators.
+        """
+        if not current_user.is_site_admin():
+            raise UserHasNotPermissionError()
+        query_monitor = get_query_monitor()
+        if query_monitor is None:
+            return []
+        summaries = query_monitor.get_summaries()
+        if reset:
+            query_monitor.reset()
+        return summaries
+
+    @bp.get(
+        "/metrics",
+        tags=[APITag.misc],
+        summary="Get the operational metrics in the Prometheus text format",
+        response_class=Response,
+    )
+    def get_metrics(current_user: JWTUser = Depends(auth.get_current_user)) -> Any:
+        """
+        Returns the operational metrics of the worker in the Prometheus text format:
+        task queue and durations, cache usage, snapshot generation durations, matrix store
+        reads and writes, event bus backlog, websocket connections, watcher scan durations
+        and simulation jobs.
+
+        Only available to administrators: the scraper must be configured with the token of an administrator bot.
+        """
+        if not current_user.is_site_admin():
+            raise UserHasNotPermissionError()
+        return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    @bp.get(
+        "/v1/core/profiles/{profile_id}",
+        tags=[APITag.misc],
+        summary="Get the profile of a request",
+        response_model=ProfileDTO,
+    )
+    def get_profile(
+        profile_id: str,
+        current_user: JWTUser = Depends(auth.get_current_user),
+    ) -> Any:
+        """
+        Returns the profile of a request, identified by the `X-Profile-Id` header of its response.
+
+        The requests sent by an administrator with the `X-Profile: true` header are profiled,
+        as well as a ratio of the other requests (see the `profiling_sampling_ratio` server setting).
+        The profiles are kept one hour.
+
+        - `sql_statements`: The SQL statements executed by the request, the slowest first.
+        - `tree_operations`: The time spent reading, writing and resolving the files of the study tree, by node type.
+        - `functions`: The functions found in the stack samples of the endpoint, the most frequent on top first.
+        - `stacks`: The stack samples of the endpoint in the "collapsed stacks" format, to draw a flame graph.
+
+        Only available to administrators.
+        """
+        if not current_user.is_site_admin():
+            raise UserHasNotPermissionError()
+        profiler = get_profiler()
+        profile = profiler.get_profile(profile_id) if profiler is not None else None
+        if profile is None:
+            raise ProfileNotFoundError(profile_id)
+        return profile
+
     @bp.get("/kill", include_in_schema=False)
     def kill_worker(
         current_user: JWTUser = Depends(auth.get_current_user),
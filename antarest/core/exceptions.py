@@ -603,3 +603,8 @@ class CannotScanInternalWorkspace(HTTPException):
             HTTPStatus.BAD_REQUEST,
             "You cannot scan the default internal workspace",
         )
+
+
+class ProfileNotFoundError(HTTPException):
+    def __init__(self, profile_id: str) -> None:
+        super().__init__(HTTPStatus.NOT_FOUND, f"Profile '{profile_id}' not found or expired")
@@ -1,10 +1,15 @@
+import contextlib
 import datetime
 import logging
 import os
+import shutil
 import tempfile
+import threading
+import time
 import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from starlette.background import BackgroundTasks
 
@@ -19,6 +24,45 @@ from antarest.core.requests import MustBeAuthenticatedError, RequestParameters,
 logger = logging.getLogger(__name__)
 
 
+EXPORT_CACHE_DIR = "export-cache"
+"""
+Directory of the cached export archives, in the temporary directory.
+
+The directory is the index of the cache, shared by all the workers: an archive is named
+`<export key>.<task ID>`, its modification date is its creation date and its access date
+is the date of its last use.
+"""
+
+
+@dataclass
+class _PendingExport:
+    """
+    Export being built, shared by all the downloads of this worker requesting the same export.
+
+    Attributes:
+        use_cache: whether the archive is kept in the export cache once built.
+        archive: path of the built archive, only set once the export is done.
+        task_id: ID of the task building the archive, only set once the task is registered.
+        task_registered: event set when the task is registered (or when the export fails).
+        waiting_downloads: downloads (ID and path) waiting for the archive to be built.
+    """
+
+    use_cache: bool = True
+    archive: Optional[Path] = None
+    task_id: Optional[str] = None
+    task_registered: threading.Event = field(default_factory=threading.Event)
+    waiting_downloads: List[Tuple[str, Path]] = field(default_factory=list)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard link the file `src` to `dst` (or copy it if the link is not possible), replacing `dst`."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 class FileTransferManager:
     _instance: Optional["FileTransferManager"] = None
 
@@ -33,6 +77,14 @@ class FileTransferManager:
         self.event_bus = event_bus
         self.tmp_dir = config.storage.tmp_dir
         self.download_default_expiration_timeout_minutes = config.storage.download_default_expiration_timeout_minutes
+        self.export_cache_max_size = config.storage.export_cache_max_size_mb * 1024 * 1024
+        self.export_cache_dir = Path(self.tmp_dir) / EXPORT_CACHE_DIR
+        self.export_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._exports: Dict[str, _PendingExport] = {}
+        self._exports_lock = threading.Lock()
+        # The archives cached before a restart are kept, but the expired ones are removed at once
+        with self._exports_lock:
+            self._clean_up_expired_exports()
 
     @staticmethod
     def _cleanup_file(tmpfile: Path) -> None:
@@ -122,6 +174,193 @@ class FileTransferManager:
             )
         )
 
+    def request_export(
+        self,
+        key: str,
+        filename: str,
+        name: Optional[str] = None,
+        owner: Optional[JWTUser] = None,
+        use_cache: bool = True,
+    ) -> Tuple[FileDownload, Optional[str]]:
+        """
+        Request the download of an export, identified by a key built from the exported content.
+
+        If the archive of the same export is already cached, it is linked to the new download which is ready at once.
+        If it is being built, the new download will be ready when the export is done (see `export_done`).
+        Otherwise, the caller must build the archive in the download file and register its task
+        with `register_export_task`, then call `export_done` (or `export_failed`).
+
+        The cache is shared by all the workers, but an export being built is only shared
+        by the requests of the worker which builds it.
+
+        Args:
+            key: key of the export, which must change when the exported content changes.
+            filename: filename of the download.
+            name: name of the download.
+            owner: owner of the download.
+            use_cache: whether the archive can be taken from the cache and kept in it once built.
+                If the key cannot follow the changes of the exported content, the archive is only
+                shared by the concurrent requests.
+
+        Returns:
+            The download and the ID of the task building the archive,
+            or `None` if the caller must build the archive.
+        """
+        download = self.request_download(filename, name, owner)
+        while True:
+            with self._exports_lock:
+                self._clean_up_expired_exports()
+                entry = self._exports.get(key)
+                if entry is None:
+                    task_id = self._link_cached_export(key, Path(download.path)) if use_cache else None
+                    if task_id is not None:
+                        break
+                    self._exports[key] = _PendingExport(use_cache=use_cache)
+                    return download, None
+                if entry.task_id is not None:
+                    entry.waiting_downloads.append((download.id, Path(download.path)))
+                    return download, entry.task_id
+            # The export is requested but its task is not registered yet.
+            entry.task_registered.wait(1)
+
+        logger.info(f"Export {key} found in cache for download {download.id}")
+        self.set_ready(download.id)
+        return download, task_id
+
+    def register_export_task(self, key: str, task_id: str) -> None:
+        """
+        Register the task building the archive of an export requested with `request_export`.
+        """
+        with self._exports_lock:
+            entry = self._exports.get(key)
+            if entry is None or entry.task_id is not None:
+                return
+            entry.task_id = task_id
+            entry.task_registered.set()
+            if entry.archive is None:
+                return
+            # The task was done before being registered
+            ready_downloads: Optional[List[str]]
+            try:
+                ready_downloads = self._publish_export(key)
+            except OSError as e:
+                logger.error(f"Failed to publish export {key}", exc_info=e)
+                ready_downloads = None
+        if ready_downloads is None:
+            self.export_failed(key, "Failed to publish export")
+            return
+        for download_id in ready_downloads:
+            self.set_ready(download_id)
+
+    def export_done(self, key: str, archive: Path) -> None:
+        """
+        Keep the archive of an export in cache and make it available to the downloads waiting for it.
+
+        The archive is linked to the cache, so the file of the download which built it can be removed.
+        The least recently used archives are removed if the cache exceeds its maximum size.
+
+        Args:
+            key: key of the export.
+            archive: path of the built archive.
+        """
+        with self._exports_lock:
+            entry = self._exports.get(key)
+            if entry is None or entry.archive is not None:
+                return
+            entry.archive = archive
+            ready_downloads = self._publish_export(key) if entry.task_id is not None else []
+        for download_id in ready_downloads:
+            self.set_ready(download_id)
+
+    def export_failed(self, key: str, reason: str = "") -> None:
+        """
+        Remove an export from the cache and fail the downloads waiting for it.
+        """
+        with self._exports_lock:
+            # The archive may be cached, if the export failed after `export_done`
+            self._remove_export(key)
+            entry = self._exports.pop(key, None)
+            if entry is None:
+                return
+            waiting_downloads, entry.waiting_downloads = entry.waiting_downloads, []
+            entry.task_registered.set()
+        for download_id, _ in waiting_downloads:
+            self.fail(download_id, reason)
+
+    def _publish_export(self, key: str) -> List[str]:
+        """
+        Store the archive of a built export in the cache, and link it to the downloads waiting for it.
+
+        Returns:
+            The IDs of the downloads which are ready.
+        """
+        entry = self._exports[key]
+        assert entry.archive is not None and entry.task_id is not None
+        archive = entry.archive
+        if entry.use_cache:
+            # The archive is renamed once complete, so the other workers never use a partial archive
+            fh, path = tempfile.mkstemp(dir=self.export_cache_dir, prefix=".")
+            os.close(fh)
+            _link_or_copy(archive, Path(path))
+            archive = self.export_cache_dir / f"{key}.{entry.task_id}"
+            os.replace(path, archive)
+        for _, download_path in entry.waiting_downloads:
+            _link_or_copy(archive, download_path)
+        # The export is removed once published: if the publication fails, `export_failed` fails its downloads
+        del self._exports[key]
+        if entry.use_cache:
+            self._evict_exports()
+        return [download_id for download_id, _ in entry.waiting_downloads]
+
+    def _link_cached_export(self, key: str, download_path: Path) -> Optional[str]:
+        """
+        Link the cached archive of an export to a download.
+
+        Returns:
+            The ID of the task which built the archive, or `None` if the archive is not cached.
+        """
+        for archive in self.export_cache_dir.glob(f"{key}.*"):
+            try:
+                _link_or_copy(archive, download_path)
+                # The access date orders the archives from the least to the most recently used
+                os.utime(archive, (time.time(), archive.stat().st_mtime))
+            except FileNotFoundError:
+                # The archive was removed by another worker
+                continue
+            return archive.name.split(".", 1)[1]
+        return None
+
+    def _remove_export(self, key: str) -> None:
+        for archive in self.export_cache_dir.glob(f"{key}.*"):
+            archive.unlink(missing_ok=True)
+
+    def _list_cached_exports(self) -> List[Tuple[Path, os.stat_result]]:
+        cached_exports = []
+        for archive in self.export_cache_dir.iterdir():
+            with contextlib.suppress(FileNotFoundError):
+                cached_exports.append((archive, archive.stat()))
+        return cached_exports
+
+    def _evict_exports(self) -> None:
+        """Remove the least recently used archives until the cache fits in its maximum size."""
+        cached_exports = [(archive, st) for archive, st in self._list_cached_exports() if archive.name[0] != "."]
+        cache_size = sum(st.st_size for _, st in cached_exports)
+        for archive, st in sorted(cached_exports, key=lambda export: export[1].st_atime):
+            if cache_size <= self.export_cache_max_size:
+                break
+            logger.info(f"Removing export {archive.name} from cache ({st.st_size} bytes)")
+            cache_size -= st.st_size
+            archive.unlink(missing_ok=True)
+
+    def _clean_up_expired_exports(self) -> None:
+        """Remove the archives (and the partial archives of interrupted exports) older than a download."""
+        timeout = datetime.timedelta(minutes=self.download_default_expiration_timeout_minutes).total_seconds()
+        now = time.time()
+        for archive, st in self._list_cached_exports():
+            if st.st_mtime + timeout <= now:
+                logger.info(f"Removing expired export {archive.name} from cache")
+                archive.unlink(missing_ok=True)
+
     def request_tmp_file(self, background_tasks: BackgroundTasks) -> Path:
         """
         Returns a new tmp path that will be deleted at the end of the request
@@ -151,6 +390,8 @@ class FileTransferManager:
         return [d.to_dto() for d in downloads]
 
     def _clean_up_expired_downloads(self, file_downloads: List[FileDownload]) -> None:
+        with self._exports_lock:
+            self._clean_up_expired_exports()
         now = datetime.datetime.utcnow()
         to_remove = []
         for file_download in file_downloads:
@@ -2,6 +2,8 @@ from abc import abstractmethod
 from enum import Enum
 from typing import List, Optional
 
+from pydantic import BaseModel
+
 from antarest.core.model import JSON
 
 
@@ -25,6 +27,27 @@ class CacheConstants(Enum):
     STUDY_FACTORY = "STUDY_FACTORY"
 
 
+class CacheStats(BaseModel):
+    """
+    Usage counters of a cache backend.
+
+    Attributes:
+        hits: Number of `get` calls which found a value.
+        misses: Number of `get` calls which found no value (missing or expired key).
+        evictions: Number of entries removed to respect the memory budget.
+        count: Number of entries currently stored.
+        size: Estimated size of the stored entries, in bytes.
+        max_size: Memory budget of the cache, in bytes (0 if the backend has no budget).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    count: int = 0
+    size: int = 0
+    max_size: int = 0
+
+
 class ICache:
     @abstractmethod
     def start(self) -> None:
@@ -45,3 +68,11 @@ class ICache:
     @abstractmethod
     def invalidate_all(self, ids: List[str]) -> None:
         pass
+
+    def get_stats(self) -> CacheStats:
+        """
+        Get the usage counters of the cache.
+
+        The backends which do not collect any counter return empty statistics.
+        """
+        return CacheStats()
@@ -35,6 +35,7 @@ class EventType(str, Enum):
     WORKER_TASK_STARTED = "WORKER_TASK_STARTED"
     WORKER_TASK_ENDED = "WORKER_TASK_ENDED"
     LAUNCH_PROGRESS = "LAUNCH_PROGRESS"
+    IDENTITIES_EDITED = "IDENTITIES_EDITED"
 
 
 class EventChannelDirectory:
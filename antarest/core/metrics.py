@@ -0,0 +1,326 @@
+"""
+Operational metrics of the application, exposed in the Prometheus text format.
+
+The metrics are always collected, so updating them must stay cheap: a counter increment or
+a histogram observation only takes a lock and a few additions. The metrics which reflect
+the state of a service (queue depths, cache statistics, connection counts...) are not updated
+by the service: they are computed by callbacks, only when the metrics are scraped.
+
+The metrics are registered in the `REGISTRY` of the process, for instance:
+
+>>> TASK_DURATION = REGISTRY.histogram("antarest_task_duration_seconds", "Duration of the tasks", ("type",))
+>>> TASK_DURATION.labels("EXPORT").observe(1.5)
+"""
+import bisect
+import contextlib
+import logging
+import math
+import threading
+import time
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text format."""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+"""Default upper bounds of the histogram buckets (in seconds), suitable for request and task durations."""
+
+Labels = t.Tuple[str, ...]
+CallbackValue = t.Union[float, t.Mapping[Labels, float]]
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labelnames: t.Sequence[str], labels: t.Sequence[str], value: float) -> str:
+    if not labelnames:
+        return f"{name} {_format_value(value)}"
+    text = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(labelnames, labels))
+    return f"{name}{{{text}}} {_format_value(value)}"
+
+
+class _Value:
+    """Value of a counter or a gauge, for a combination of labels."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def get(self) -> float:
+        with self._lock:
+            return self._value
+
+
+class _HistogramValue:
+    """Observations of a histogram, for a combination of labels."""
+
+    def __init__(self, buckets: t.Sequence[float]) -> None:
+        self._upper_bounds = buckets
+        self._bucket_counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._sum += value
+
+    @contextlib.contextmanager
+    def time(self) -> t.Iterator[None]:
+        """Observe the duration of the `with` block (in seconds)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def get(self) -> t.Tuple[t.List[int], float]:
+        with self._lock:
+            return list(self._bucket_counts), self._sum
+
+
+V = t.TypeVar("V", _Value, _HistogramValue)
+
+
+class _Metric(t.Generic[V]):
+    """
+    Base class of the metrics: a metric has a value for each combination of its labels.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: t.Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: t.Dict[Labels, V] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # a metric without labels is exposed (with a zero value) before its first update
+            self.labels()
+
+    def _new_value(self) -> V:
+        raise NotImplementedError()
+
+    def labels(self, *labels: t.Any) -> V:
+        """
+        Get the value of the metric for the given label values (in the order of the label names).
+        """
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects the labels {self.labelnames}, got {labels}")
+        key = tuple(str(label) for label in labels)
+        value = self._values.get(key)
+        if value is None:
+            with self._lock:
+                value = self._values.setdefault(key, self._new_value())
+        return value
+
+    def _get_values(self) -> t.List[t.Tuple[Labels, V]]:
+        with self._lock:
+            return sorted(self._values.items())
+
+    def collect(self) -> t.List[str]:
+        raise NotImplementedError()
+
+
+class Counter(_Metric[_Value]):
+    """A value which can only increase, for instance a number of requests."""
+
+    type_name = "counter"
+
+    def _new_value(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+    def collect(self) -> t.List[str]:
+        return [_format_sample(self.name, self.labelnames, k, v.get()) for k, v in self._get_values()]
+
+
+class Gauge(Counter):
+    """A value which can increase and decrease, for instance a number of connections."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_Metric[_HistogramValue]):
+    """Distribution of observed values, for instance durations, counted in buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_value(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> t.ContextManager[None]:
+        return self.labels().time()
+
+    def collect(self) -> t.List[str]:
+        lines = []
+        labelnames = self.labelnames + ("le",)
+        for labels, value in self._get_values():
+            bucket_counts, total = value.get()
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), bucket_counts):
+                cumulative += count
+                bound_labels = labels + (_format_value(upper_bound),)
+                lines.append(_format_sample(f"{self.name}_bucket", labelnames, bound_labels, cumulative))
+            lines.append(_format_sample(f"{self.name}_sum", self.labelnames, labels, total))
+            lines.append(_format_sample(f"{self.name}_count", self.labelnames, labels, cumulative))
+        return lines
+
+
+class _CallbackMetric:
+    """A counter or a gauge whose values are computed when the metrics are scraped."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: t.Callable[[], CallbackValue],
+        type_name: str,
+        labelnames: t.Sequence[str],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.type_name = type_name
+        self.labelnames = tuple(labelnames)
+
+    def collect(self) -> t.List[str]:
+        values = self.callback()
+        if not isinstance(values, t.Mapping):
+            values = {(): values}
+        return [_format_sample(self.name, self.labelnames, k, v) for k, v in sorted(values.items())]
+
+
+class MetricsRegistry:
+    """
+    Registry of the metrics of the process.
+
+    Registering a metric which already exists returns the existing metric, and registering
+    a callback with the name of an existing callback replaces it: the modules and services
+    can be loaded or created several times (for instance in the tests).
+    """
+
+    def __init__(self) -> None:
+        self._metrics: t.Dict[str, t.Union[_Metric[t.Any], _CallbackMetric]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: t.Any) -> t.Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if isinstance(existing, _CallbackMetric) or existing is None or isinstance(metric, _CallbackMetric):
+                self._metrics[metric.name] = metric
+                return metric
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} is already registered with another type or other labels")
+            return existing
+
+    def counter(self, name: str, documentation: str, labelnames: t.Sequence[str] = ()) -> Counter:
+        return t.cast(Counter, self._register(Counter(name, documentation, labelnames)))
+
+    def gauge(self, name: str, documentation: str, labelnames: t.Sequence[str] = ()) -> Gauge:
+        return t.cast(Gauge, self._register(Gauge(name, documentation, labelnames)))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return t.cast(Histogram, self._register(Histogram(name, documentation, labelnames, buckets)))
+
+    def register_callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: t.Callable[[], CallbackValue],
+        *,
+        type_name: str = "gauge",
+        labelnames: t.Sequence[str] = (),
+    ) -> None:
+        """
+        Register a metric computed when the metrics are scraped.
+
+        Args:
+            name: name of the metric.
+            documentation: description of the metric.
+            callback: function returning the value of the metric, or its values by label values
+                (tuples in the order of the label names).
+            type_name: "gauge" or "counter" (for a value which can only increase).
+            labelnames: names of the labels.
+        """
+        self._register(_CallbackMetric(name, documentation, callback, type_name, labelnames))
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        """
+        Render all the metrics in the Prometheus text format.
+
+        A callback which fails is logged and its metric is skipped, so that the other metrics are still available.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.collect()
+            except Exception as exc:
+                logger.warning(f"Failed to collect the metric {metric.name}: {exc}", exc_info=True)
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+"""Registry of the metrics of the process, exposed by the `/metrics` endpoint."""
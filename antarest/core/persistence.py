@@ -3,9 +3,6 @@ import os
 from io import StringIO
 from pathlib import Path
 
-from alembic import command
-from alembic.config import Config
-from alembic.util import CommandError
 from sqlalchemy.orm import declarative_base  # type: ignore
 
 from antarest.core.utils.utils import get_local_path
@@ -16,6 +13,11 @@ Base = declarative_base()
 
 
 def upgrade_db(config_file: Path) -> None:
+    # Alembic is only needed to upgrade the database, this module is imported by all the models
+    from alembic import command
+    from alembic.config import Config
+    from alembic.util import CommandError
+
     os.environ.setdefault("ANTAREST_CONF", str(config_file))
     alembic_cfg = Config(str(get_local_path() / "alembic.ini"))
     alembic_cfg.stdout = StringIO()
@@ -0,0 +1,387 @@
+"""
+Profiling of the HTTP requests, to find where the time of a slow endpoint goes.
+
+A request is profiled when an administrator sends the `X-Profile` header, or when it is drawn
+by the sampling ratio of the configuration. While a profiled request runs:
+
+- a sampler thread periodically records the call stacks of the threads running its endpoint
+  (the endpoint function and everything it calls, in the event loop or in the thread pool),
+- the SQL statements executed in the request are timed,
+- the time spent reading and writing the files of the study tree is recorded by node type.
+
+The profile is stored in the cache and its identifier is returned in the `X-Profile-Id` response header,
+it can then be retrieved with the `/v1/core/profiles/{profile_id}` endpoint.
+"""
+import collections
+import contextlib
+import datetime
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import typing as t
+import uuid
+from contextvars import ContextVar
+from types import CodeType, FrameType
+
+from fastapi_jwt_auth import AuthJWT  # type: ignore
+from pydantic import BaseModel
+from sqlalchemy import event  # type: ignore
+from sqlalchemy.engine import Connection, Engine  # type: ignore
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from antarest.core.interfaces.cache import ICache
+from antarest.core.utils.fastapi_sqlalchemy.middleware import get_route_name
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from antarest.login.auth import Auth
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+"""Request header used by an administrator to profile a request."""
+
+PROFILE_ID_HEADER = "X-Profile-Id"
+"""Response header containing the identifier of the profile of a request."""
+
+PROFILE_RETENTION = 3600
+"""Duration (in seconds) during which a profile is kept in the cache."""
+
+_CACHE_PREFIX = "profile:"
+_START_TIMES_KEY = "profiler_start_times"
+_MAX_FUNCTIONS = 50
+
+_profile: ContextVar[t.Optional["RequestProfile"]] = ContextVar("_profile", default=None)
+_profiler: t.Optional["Profiler"] = None
+
+
+def get_profiler() -> t.Optional["Profiler"]:
+    """Return the profiler of the HTTP requests, if any."""
+    return _profiler
+
+
+class ProfileItemDTO(BaseModel):
+    """
+    Time spent in a SQL statement or in a study tree operation.
+
+    Attributes:
+        name: the parameterized SQL statement, or the node type and the operation, like "InputSeriesMatrix.load".
+        count: number of executions.
+        duration: total duration of the executions (in seconds).
+    """
+
+    name: str
+    count: int = 0
+    duration: float = 0
+
+
+class ProfileFunctionDTO(BaseModel):
+    """
+    Number of stack samples in which a function appears.
+
+    Attributes:
+        name: the module and the name of the function.
+        self_samples: number of samples where the function was running (the top of the stack).
+        total_samples: number of samples where the function was running or calling another function.
+    """
+
+    name: str
+    self_samples: int = 0
+    total_samples: int = 0
+
+
+class ProfileDTO(BaseModel):
+    """
+    Profile of an HTTP request.
+
+    The time spent in a function can be estimated with its number of samples multiplied by the sampling interval.
+    The `stacks` are in the "collapsed stacks" format (frames separated by ";", from the endpoint to the top
+    of the stack) which can be converted into a flame graph by the usual tools (`flamegraph.pl`, `speedscope`...).
+    """
+
+    id: str
+    route: str
+    url: str
+    status_code: int
+    start_date: datetime.datetime
+    duration: float
+    sampling_interval: float
+    sample_count: int
+    sql_statement_count: int
+    sql_duration: float
+    sql_statements: t.List[ProfileItemDTO]
+    tree_duration: float
+    tree_operations: t.List[ProfileItemDTO]
+    functions: t.List[ProfileFunctionDTO]
+    stacks: t.Dict[str, int]
+
+
+def _get_frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class RequestProfile:
+    """
+    Measures collected while a request is profiled.
+
+    The stack samples are recorded by the sampler thread, and the SQL statements and the tree operations
+    by the threads of the request, so the measures are protected by a lock.
+    """
+
+    def __init__(self, request: Request, sampling_interval: float) -> None:
+        self.id = str(uuid.uuid4())
+        self.scope = request.scope
+        self.url = str(request.url)
+        self.sampling_interval = sampling_interval
+        self.start_date = datetime.datetime.utcnow()
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.stacks: t.Counter[str] = collections.Counter()
+        self.statements: t.Dict[str, ProfileItemDTO] = {}
+        self.operations: t.Dict[str, ProfileItemDTO] = {}
+        self._lock = threading.Lock()
+
+    def get_endpoint_code(self) -> t.Optional[CodeType]:
+        """
+        Return the code of the endpoint function, which is known once the request is routed.
+        """
+        endpoint = self.scope.get("endpoint")
+        return getattr(endpoint, "__code__", None)
+
+    def record_stack(self, stack: str) -> None:
+        with self._lock:
+            self.stacks[stack] += 1
+
+    @staticmethod
+    def _record(items: t.Dict[str, ProfileItemDTO], name: str, duration: float) -> None:
+        item = items.get(name)
+        if item is None:
+            item = items[name] = ProfileItemDTO(name=name)
+        item.count += 1
+        item.duration += duration
+
+    def record_statement(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self._record(self.statements, statement, duration)
+
+    def record_operation(self, name: str, duration: float) -> None:
+        with self._lock:
+            self._record(self.operations, name, duration)
+
+    def _get_functions(self) -> t.List[ProfileFunctionDTO]:
+        functions: t.Dict[str, ProfileFunctionDTO] = {}
+        for stack, count in self.stacks.items():
+            names = stack.split(";")
+            for name in set(names):
+                function = functions.setdefault(name, ProfileFunctionDTO(name=name))
+                function.total_samples += count
+            functions[names[-1]].self_samples += count
+        ordered = sorted(functions.values(), key=lambda f: (f.self_samples, f.total_samples), reverse=True)
+        return ordered[:_MAX_FUNCTIONS]
+
+    def to_dto(self, route: str, status_code: int) -> ProfileDTO:
+        with self._lock:
+            statements = sorted(self.statements.values(), key=lambda s: s.duration, reverse=True)
+            operations = sorted(self.operations.values(), key=lambda o: o.duration, reverse=True)
+            return ProfileDTO(
+                id=self.id,
+                route=route,
+                url=self.url,
+                status_code=status_code,
+                start_date=self.start_date,
+                duration=self.duration,
+                sampling_interval=self.sampling_interval,
+                sample_count=sum(self.stacks.values()),
+                sql_statement_count=sum(s.count for s in statements),
+                sql_duration=sum(s.duration for s in statements),
+                sql_statements=statements,
+                tree_duration=sum(o.duration for o in operations),
+                tree_operations=operations,
+                functions=self._get_functions(),
+                stacks=dict(self.stacks.most_common()),
+            )
+
+
+@contextlib.contextmanager
+def profile_operation(name: str) -> t.Iterator[None]:
+    """
+    Record the duration of an operation in the profile of the current request, if it is profiled.
+
+    Args:
+        name: name of the operation, like "InputSeriesMatrix.load".
+    """
+    profile = _profile.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record_operation(name, time.perf_counter() - start)
+
+
+class Profiler:
+    """
+    Profiler of the HTTP requests.
+
+    Args:
+        cache: cache where the profiles are stored.
+        sampling_ratio: ratio of the requests which are profiled without the `X-Profile` header (0 to disable).
+        sampling_interval: interval (in seconds) between two stack samples.
+    """
+
+    def __init__(self, cache: ICache, sampling_ratio: float = 0, sampling_interval: float = 0.01) -> None:
+        self.cache = cache
+        self.sampling_ratio = sampling_ratio
+        self.sampling_interval = sampling_interval
+        self._profiles: t.Dict[str, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._thread: t.Optional[threading.Thread] = None
+        self._engines: t.List[Engine] = []
+
+    def install(self, engine: Engine) -> None:
+        """
+        Time the statements executed by the engine in the profiled requests.
+        """
+        if engine in self._engines:
+            return
+        self._engines.append(engine)
+
+        def before_cursor_execute(conn: Connection, *_: t.Any) -> None:
+            if _profile.get() is not None:
+                conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+        def after_cursor_execute(conn: Connection, cursor: t.Any, statement: str, *_: t.Any) -> None:
+            profile = _profile.get()
+            if profile is not None and conn.info.get(_START_TIMES_KEY):
+                profile.record_statement(statement, time.perf_counter() - conn.info[_START_TIMES_KEY].pop())
+
+        def handle_error(context: t.Any) -> None:
+            # The `after_cursor_execute` event is not fired for the failed statements
+            if _profile.get() is not None and context.connection is not None:
+                if context.connection.info.get(_START_TIMES_KEY):
+                    context.connection.info[_START_TIMES_KEY].pop()
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+        event.listen(engine, "handle_error", handle_error)
+
+    def start(self, profile: RequestProfile) -> None:
+        """Start sampling the stacks of a request."""
+        with self._lock:
+            self._profiles[profile.id] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def stop(self, profile: RequestProfile) -> None:
+        """Stop sampling the stacks of a request."""
+        profile.duration = time.perf_counter() - profile.start
+        with self._lock:
+            self._profiles.pop(profile.id, None)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.sampling_interval)
+            with self._lock:
+                profiles = list(self._profiles.values())
+                if not profiles:
+                    # The thread is started again with the next profiled request
+                    self._thread = None
+                    return
+            try:
+                self._sample(profiles)
+            except Exception as exc:
+                logger.warning(f"Failed to sample the stacks of the profiled requests: {exc}", exc_info=True)
+
+    @staticmethod
+    def _sample(profiles: t.Sequence[RequestProfile]) -> None:
+        endpoint_codes = [(profile, profile.get_endpoint_code()) for profile in profiles]
+        current_thread_id = threading.get_ident()
+        for thread_id, top_frame in sys._current_frames().items():
+            if thread_id == current_thread_id:
+                continue
+            frames: t.List[FrameType] = []
+            frame: t.Optional[FrameType] = top_frame
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            # A thread is attributed to a request when it runs the endpoint of the request:
+            # the samples of concurrent profiled requests to the same endpoint may be mixed.
+            for profile, code in endpoint_codes:
+                endpoint_index = next((i for i, f in enumerate(frames) if f.f_code is code), None)
+                if endpoint_index is not None:
+                    stack = ";".join(_get_frame_name(f) for f in reversed(frames[: endpoint_index + 1]))
+                    profile.record_stack(stack)
+
+    def save(self, profile: ProfileDTO) -> None:
+        try:
+            self.cache.put(f"{_CACHE_PREFIX}{profile.id}", json.loads(profile.json()), PROFILE_RETENTION)
+        except Exception as exc:
+            # The request must not fail because of its profiling
+            logger.warning(f"Failed to save the profile {profile.id}: {exc}", exc_info=True)
+            return
+        logger.info(
+            f"Profile {profile.id} of {profile.route}: {profile.duration:.3f}s,"
+            f" {profile.sql_statement_count} SQL statements in {profile.sql_duration:.3f}s,"
+            f" study tree operations in {profile.tree_duration:.3f}s"
+        )
+
+    def get_profile(self, profile_id: str) -> t.Optional[ProfileDTO]:
+        data = self.cache.get(f"{_CACHE_PREFIX}{profile_id}")
+        return ProfileDTO.parse_obj(data) if data is not None else None
+
+
+class ProfilerMiddleware(BaseHTTPMiddleware):
+    """
+    Profile the requests sent with the `X-Profile` header by an administrator,
+    and a ratio of the other requests.
+
+    The profile ends when the response starts: the streaming of the response body is not profiled.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: Profiler, auth: "Auth") -> None:
+        super().__init__(app)
+        global _profiler
+        _profiler = profiler
+        self.profiler = profiler
+        self.auth = auth
+
+    def _is_admin(self, request: Request) -> bool:
+        try:
+            user = self.auth.get_current_user(AuthJWT(request))
+        except Exception as exc:
+            logger.debug("Cannot profile a request of an unauthenticated user", exc_info=exc)
+            return False
+        return user.is_site_admin()
+
+    def _should_profile(self, request: Request) -> bool:
+        if request.headers.get(PROFILE_HEADER, "").lower() in {"1", "true", "yes"}:
+            return self._is_admin(request)
+        return random.random() < self.profiler.sampling_ratio
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if not self._should_profile(request):
+            return await call_next(request)
+
+        profile = RequestProfile(request, self.profiler.sampling_interval)
+        token = _profile.set(profile)
+        self.profiler.start(profile)
+        response: t.Optional[Response] = None
+        try:
+            response = await call_next(request)
+            response.headers[PROFILE_ID_HEADER] = profile.id
+        finally:
+            self.profiler.stop(profile)
+            _profile.reset(token)
+            # The profile of a request which failed with an unexpected error is also saved
+            status_code = 500 if response is None else response.status_code
+            self.profiler.save(profile.to_dto(get_route_name(request), status_code))
+        return response
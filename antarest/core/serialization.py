@@ -0,0 +1,113 @@
+"""
+Fast JSON encoding of the large payloads (matrices, raw study data, simulation outputs...).
+
+The web application returns `NaN`, `+Infinity` and `-Infinity` values as the non-standard
+JSON literals `NaN`, `Infinity` and `-Infinity`, which are supported in JavaScript.
+This is the behavior of the standard `json` module (with `allow_nan=True`), but encoding
+a 8760×N matrix with it takes more time than reading the matrix file.
+
+`orjson` is about ten times faster, and encodes the NumPy arrays directly, but it converts
+the non-finite values to `null`. So the payloads are encoded with `orjson`, then the `null`
+of the non-finite values are replaced, in the order of the encoding. The payloads which mix
+non-finite values with `None` values (or "null" texts) are encoded again with the `json` module.
+"""
+import json
+import math
+import typing as t
+
+import numpy as np
+import orjson
+from pydantic import BaseModel
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: t.Any) -> t.Any:
+    """Convert the objects which are not natively supported by `orjson` or the `json` module."""
+    if isinstance(obj, BaseModel):
+        # shallow conversion: the field values are converted by the encoder
+        return dict(obj)
+    if isinstance(obj, np.ndarray):
+        # `orjson` only supports the C-contiguous arrays of numbers and booleans
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _collect_non_finite(obj: t.Any, values: t.List[float]) -> None:
+    """Collect the `NaN` and infinite values of the object, in the order of their JSON encoding."""
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            values.append(obj)
+    elif isinstance(obj, (list, tuple)):
+        try:
+            # fast check of the rows of numbers (an overflow is checked item by item)
+            if math.isfinite(sum(obj)):
+                return
+        except (TypeError, OverflowError):
+            pass
+        for item in obj:
+            _collect_non_finite(item, values)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _collect_non_finite(value, values)
+    elif isinstance(obj, BaseModel):
+        for _, value in obj:
+            _collect_non_finite(value, values)
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            values.extend(obj[~np.isfinite(obj)].tolist())
+        elif obj.dtype.kind == "O":
+            for item in obj.flat:
+                _collect_non_finite(item, values)
+    elif isinstance(obj, np.floating) and not np.isfinite(obj):
+        values.append(float(obj))
+
+
+def _encode_non_finite(value: float) -> bytes:
+    if math.isnan(value):
+        return b"NaN"
+    return b"Infinity" if value > 0 else b"-Infinity"
+
+
+def to_json(obj: t.Any) -> bytes:
+    """
+    Encode an object in compact JSON (UTF-8), with support for the NumPy arrays and the Pydantic models.
+
+    The non-finite values are encoded as `NaN`, `Infinity` and `-Infinity`, like `json.dumps(obj, allow_nan=True)`.
+
+    Args:
+        obj: the object to encode.
+
+    Returns:
+        The JSON bytes.
+
+    Raises:
+        TypeError: if the object contains values which cannot be encoded.
+    """
+    try:
+        content = orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        # integers larger than 64 bits, invalid UTF-8 strings, deeply nested objects...
+        pass
+    else:
+        if b"null" not in content:
+            return content
+        values: t.List[float] = []
+        _collect_non_finite(obj, values)
+        parts = content.split(b"null")
+        if len(parts) == len(values) + 1:
+            # each `null` of the result is a non-finite value: there is no `None` value and no "null" text
+            encoded = [_encode_non_finite(value) for value in values]
+            return b"".join(part for pair in zip(parts, encoded) for part in pair) + parts[-1]
+        if not values:
+            return content
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        allow_nan=True,
+        indent=None,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 
 from pydantic import BaseModel, Extra
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Sequence, String  # type: ignore
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, Sequence, String  # type: ignore
 from sqlalchemy.engine.base import Engine  # type: ignore
 from sqlalchemy.orm import relationship, sessionmaker  # type: ignore
 
@@ -19,6 +19,7 @@ if t.TYPE_CHECKING:
 class TaskType(str, Enum):
     EXPORT = "EXPORT"
     VARIANT_GENERATION = "VARIANT_GENERATION"
+    VARIANT_COMPACTION = "VARIANT_COMPACTION"
     COPY = "COPY"
     ARCHIVE = "ARCHIVE"
     UNARCHIVE = "UNARCHIVE"
@@ -78,6 +79,8 @@ class TaskDTO(BaseModel, extra=Extra.forbid):
     logs: t.Optional[t.List[TaskLogDTO]]
     type: t.Optional[str] = None
     ref_id: t.Optional[str] = None
+    queue_depth: t.Optional[int] = None
+    wait_time: t.Optional[float] = None
 
 
 class TaskListFilter(BaseModel, extra=Extra.forbid):
@@ -130,6 +133,9 @@ class TaskJob(Base):  # type: ignore
     result: t.Optional[str] = Column(String(), nullable=True, default=None)
     result_status: t.Optional[bool] = Column(Boolean(), nullable=True, default=None)
     type: t.Optional[str] = Column(String(), nullable=True, default=None, index=True)
+    # Number of pending tasks when the task was queued, and time spent in the queue (in seconds)
+    queue_depth: t.Optional[int] = Column(Integer(), nullable=True, default=None)
+    wait_time: t.Optional[float] = Column(Float(), nullable=True, default=None)
     owner_id: int = Column(
         Integer(),
         ForeignKey("identities.id", name="fk_taskjob_identity_id", ondelete="SET NULL"),
@@ -175,6 +181,8 @@ class TaskJob(Base):  # type: ignore
             logs=sorted([log.to_dto() for log in self.logs], key=lambda log: log.id) if with_logs else None,
             type=self.type,
             ref_id=self.ref_id,
+            queue_depth=self.queue_depth,
+            wait_time=self.wait_time,
         )
 
     def __eq__(self, other: t.Any) -> bool:
@@ -0,0 +1,169 @@
+import collections
+import enum
+import logging
+import threading
+import time
+import typing as t
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPriority(enum.IntEnum):
+    """
+    Priority classes of the tasks: the pending tasks of a higher class are always started first.
+
+    - `HIGH`: short tasks a user is waiting for (for instance, the generation of a variant to display it).
+    - `NORMAL`: the default class.
+    - `LOW`: long tasks running in the background (exports, archiving, scans...).
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class _ScheduledTask:
+    def __init__(
+        self,
+        future: "Future[None]",
+        fn: t.Callable[[float], None],
+        task_type: t.Optional[str],
+        owner: t.Optional[int],
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.task_type = task_type
+        self.owner = owner
+        self.queued_at = time.monotonic()
+
+
+class TaskScheduler:
+    """
+    Thread pool running the tasks by priority, with concurrency limits per task type
+    and a fair sharing of the workers between the users.
+
+    The pending tasks are queued by priority class, then by owner. When a worker is available,
+    the scheduler picks a task in the highest priority class which has a task allowed to run
+    (a task type may be limited to a number of concurrent tasks). Within a class, the owners
+    are served in turn (round-robin), in the order of their oldest pending task: a user who
+    submits many tasks does not delay the tasks of the other users.
+
+    The submitted functions receive the time (in seconds) spent by the task in the queue.
+    The returned futures can be used like the futures of a `ThreadPoolExecutor`:
+    a pending task can be cancelled, and the result can be awaited.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_workers_by_type: t.Optional[t.Mapping[str, int]] = None,
+        thread_name_prefix: str = "taskjob_",
+    ) -> None:
+        """
+        Args:
+            max_workers: Maximum number of tasks running at the same time.
+            max_workers_by_type: Maximum number of tasks of a given type running at the same time.
+            thread_name_prefix: Prefix of the name of the worker threads.
+        """
+        self.max_workers = max_workers
+        self.max_workers_by_type = dict(max_workers_by_type or {})
+        self.thread_name_prefix = thread_name_prefix
+        self._queues: t.Dict[TaskPriority, "collections.OrderedDict[t.Optional[int], t.Deque[_ScheduledTask]]"] = {
+            priority: collections.OrderedDict() for priority in TaskPriority
+        }
+        self._running_by_type: t.Counter[t.Optional[str]] = collections.Counter()
+        self._idle_workers = 0
+        self._workers: t.List[threading.Thread] = []
+        self._condition = threading.Condition()
+
+    def submit(
+        self,
+        fn: t.Callable[[float], None],
+        task_type: t.Optional[str] = None,
+        owner: t.Optional[int] = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+    ) -> "Future[None]":
+        """
+        Queue a task.
+
+        Args:
+            fn: Function running the task, it receives the time spent by the task in the queue.
+            task_type: Type of the task, used to limit the number of concurrent tasks of the same type.
+            owner: ID of the owner of the task, used to share the workers between the users.
+            priority: Priority class of the task.
+
+        Returns:
+            The future of the task.
+        """
+        future: "Future[None]" = Future()
+        with self._condition:
+            queue = self._queues[priority].setdefault(owner, collections.deque())
+            queue.append(_ScheduledTask(future, fn, task_type, owner))
+            if self._idle_workers:
+                self._condition.notify_all()
+            elif len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def queue_depth(self) -> int:
+        """
+        Number of pending tasks (the cancelled tasks are removed from the queue when they are reached).
+        """
+        with self._condition:
+            return sum(len(queue) for queues in self._queues.values() for queue in queues.values())
+
+    def running_by_type(self) -> t.Dict[t.Optional[str], int]:
+        """
+        Number of running tasks by task type.
+        """
+        with self._condition:
+            return {task_type: count for task_type, count in self._running_by_type.items() if count}
+
+    def _can_run(self, task_type: t.Optional[str]) -> bool:
+        limit = self.max_workers_by_type.get(task_type or "")
+        return limit is None or self._running_by_type[task_type] < limit
+
+    def _pop_next(self) -> t.Optional[_ScheduledTask]:
+        # this method must be called with the lock acquired
+        for queues in self._queues.values():
+            for owner, queue in queues.items():
+                for index, task in enumerate(queue):
+                    if task.future.cancelled() or self._can_run(task.task_type):
+                        del queue[index]
+                        # The owner is moved at the end of the round.
+                        del queues[owner]
+                        if queue:
+                            queues[owner] = queue
+                        return task
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                task = self._pop_next()
+                while task is None:
+                    self._idle_workers += 1
+                    self._condition.wait()
+                    self._idle_workers -= 1
+                    task = self._pop_next()
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                self._running_by_type[task.task_type] += 1
+            try:
+                task.fn(time.monotonic() - task.queued_at)
+            except BaseException as exc:
+                task.future.set_exception(exc)
+            else:
+                task.future.set_result(None)
+            finally:
+                with self._condition:
+                    self._running_by_type[task.task_type] -= 1
+                    # A task of the same type may be waiting for this worker or for another one.
+                    self._condition.notify_all()
@@ -1,9 +1,10 @@
 import datetime
 import logging
+import threading
 import time
 import typing as t
 from abc import ABC, abstractmethod
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from http import HTTPStatus
 
 from fastapi import HTTPException
@@ -11,6 +12,7 @@ from sqlalchemy.orm import Session  # type: ignore
 
 from antarest.core.config import Config
 from antarest.core.interfaces.eventbus import Event, EventChannelDirectory, EventType, IEventBus
+from antarest.core.metrics import REGISTRY
 from antarest.core.model import PermissionInfo, PublicMode
 from antarest.core.requests import MustBeAuthenticatedError, RequestParameters, UserHasNotPermissionError
 from antarest.core.tasks.model import (
@@ -25,6 +27,7 @@ from antarest.core.tasks.model import (
     TaskType,
 )
 from antarest.core.tasks.repository import TaskJobRepository
+from antarest.core.tasks.scheduler import TaskPriority, TaskScheduler
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.worker.worker import WorkerTaskCommand, WorkerTaskResult
 
@@ -36,6 +39,39 @@ Task = t.Callable[[TaskUpdateNotifier], TaskResult]
 DEFAULT_AWAIT_MAX_TIMEOUT = 172800  # 48 hours
 """Default timeout for `await_task` in seconds."""
 
+DB_POLLING_INTERVAL = 30  # in seconds
+"""
+Interval between two checks of the task status in the database when a task of another worker is awaited.
+
+The completion of the task is normally notified by an event:
+the database is only checked in case an event is missed (for instance, when a task is cancelled).
+"""
+
+TASK_PRIORITIES: t.Mapping[str, TaskPriority] = {
+    TaskType.VARIANT_GENERATION: TaskPriority.HIGH,
+    TaskType.EXPORT: TaskPriority.LOW,
+    TaskType.ARCHIVE: TaskPriority.LOW,
+    TaskType.UNARCHIVE: TaskPriority.LOW,
+    TaskType.SCAN: TaskPriority.LOW,
+}
+"""Priority class of the task types, the other types have the `NORMAL` priority."""
+
+TASK_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0)
+"""Upper bounds of the buckets of the task durations (in seconds)."""
+
+TASK_DURATION = REGISTRY.histogram(
+    "antarest_task_duration_seconds",
+    "Duration of the tasks run by this worker, by task type and status",
+    ("type", "status"),
+    buckets=TASK_BUCKETS,
+)
+TASK_WAIT_TIME = REGISTRY.histogram(
+    "antarest_task_wait_seconds",
+    "Time spent by the tasks in the queue before running, by task type",
+    ("type",),
+    buckets=TASK_BUCKETS,
+)
+
 
 class ITaskService(ABC):
     @abstractmethod
@@ -116,9 +152,24 @@ class TaskJobService(ITaskService):
         self.repo = repository
         self.event_bus = event_bus
         self.tasks: t.Dict[str, Future[None]] = {}
-        self.threadpool = ThreadPoolExecutor(max_workers=config.tasks.max_workers, thread_name_prefix="taskjob_")
+        self.scheduler = TaskScheduler(
+            max_workers=config.tasks.max_workers,
+            max_workers_by_type=config.tasks.max_workers_by_type,
+            thread_name_prefix="taskjob_",
+        )
         self.event_bus.add_listener(self.create_task_event_callback(), [EventType.TASK_CANCEL_REQUEST])
         self.remote_workers = config.tasks.remote_workers
+        REGISTRY.register_callback(
+            "antarest_task_queue_depth",
+            "Number of pending tasks in the queue of this worker",
+            self.scheduler.queue_depth,
+        )
+        REGISTRY.register_callback(
+            "antarest_tasks_running",
+            "Number of tasks running in this worker, by task type",
+            lambda: {(task_type or "UNKNOWN",): count for task_type, count in self.scheduler.running_by_type().items()},
+            labelnames=("type",),
+        )
 
     def _create_worker_task(
         self,
@@ -130,18 +181,21 @@ class TaskJobService(ITaskService):
 
         def _create_awaiter(
             res_wrapper: t.List[TaskResult],
+            task_ended: threading.Event,
         ) -> t.Callable[[Event], t.Awaitable[None]]:
             async def _await_task_end(event: Event) -> None:
                 task_event = WorkerTaskResult.parse_obj(event.payload)
                 if task_event.task_id == task_id:
                     res_wrapper.append(task_event.task_result)
+                    task_ended.set()
 
             return _await_task_end
 
         # noinspection PyUnusedLocal
         def _send_worker_task(logger_: TaskUpdateNotifier) -> TaskResult:
+            task_ended = threading.Event()
             listener_id = self.event_bus.add_listener(
-                _create_awaiter(task_result_wrapper),
+                _create_awaiter(task_result_wrapper, task_ended),
                 [EventType.WORKER_TASK_ENDED],
             )
             self.event_bus.queue(
@@ -157,9 +211,7 @@ class TaskJobService(ITaskService):
                 ),
                 task_type,
             )
-            while not task_result_wrapper:
-                logger.info("💤 Sleeping 1 second...")
-                time.sleep(1)
+            task_ended.wait()
             self.event_bus.remove_listener(listener_id)
             return task_result_wrapper[0]
 
@@ -219,6 +271,7 @@ class TaskJobService(ITaskService):
                 owner_id=request_params.user.impersonator,
                 type=task_type,
                 ref_id=ref_id,
+                queue_depth=self.scheduler.queue_depth(),
             )
         )
 
@@ -244,8 +297,20 @@ class TaskJobService(ITaskService):
                 permissions=PermissionInfo(owner=request_params.user.impersonator),
             )
         )
-        future = self.threadpool.submit(self._run_task, action, task.id, custom_event_messages)
-        self.tasks[task.id] = future
+        task_id = task.id
+        future = self.scheduler.submit(
+            lambda wait_time: self._run_task(
+                action,
+                task_id,
+                custom_event_messages,
+                wait_time=wait_time,
+                task_type=TaskType(task.type) if task.type else None,
+            ),
+            task_type=task.type,
+            owner=request_params.user.impersonator,
+            priority=TASK_PRIORITIES.get(task.type or "", TaskPriority.NORMAL),
+        )
+        self.tasks[task_id] = future
 
     def create_task_event_callback(self) -> t.Callable[[Event], t.Awaitable[None]]:
         async def task_event_callback(event: Event) -> None:
@@ -311,17 +376,28 @@ class TaskJobService(ITaskService):
                 logger.critical(f"🤕 Task '{task_id}' failed: {exc}.")
                 raise
         else:
-            logger.warning(f"Task '{task_id}' not handled by this worker, will poll for task completion from db")
-            end = time.time() + timeout_sec
-            while time.time() < end:
-                task_status = db.session.query(TaskJob.status).filter(TaskJob.id == task_id).scalar()
-                if task_status is None:
-                    logger.error(f"Awaited task '{task_id}' was not found")
-                    return
-                if TaskStatus(task_status).is_final():
-                    return
-                logger.info("💤 Sleeping 2 seconds...")
-                time.sleep(2)
+            logger.info(f"Task '{task_id}' not handled by this worker, awaiting its completion event")
+            task_ended = threading.Event()
+
+            async def _on_task_end(event: Event) -> None:
+                if isinstance(event.payload, dict) and event.payload.get("id") == task_id:
+                    task_ended.set()
+
+            # The listener is added before checking the task status, so that no event can be missed.
+            listener_id = self.event_bus.add_listener(_on_task_end, [EventType.TASK_COMPLETED, EventType.TASK_FAILED])
+            try:
+                end = time.time() + timeout_sec
+                while time.time() < end:
+                    task_ended.clear()
+                    task_status = db.session.query(TaskJob.status).filter(TaskJob.id == task_id).scalar()
+                    if task_status is None:
+                        logger.error(f"Awaited task '{task_id}' was not found")
+                        return
+                    if TaskStatus(task_status).is_final():
+                        return
+                    task_ended.wait(min(DB_POLLING_INTERVAL, max(end - time.time(), 0)))
+            finally:
+                self.event_bus.remove_listener(listener_id)
 
             logger.error(f"Timeout while awaiting task '{task_id}'")
             db.session.query(TaskJob).filter(TaskJob.id == task_id).update(
@@ -338,8 +414,13 @@ class TaskJobService(ITaskService):
         callback: Task,
         task_id: str,
         custom_event_messages: t.Optional[CustomTaskEventMessages] = None,
+        wait_time: t.Optional[float] = None,
+        task_type: t.Optional[TaskType] = None,
     ) -> None:
         # attention: this function is executed in a thread, not in the main process
+        type_name = task_type.value if task_type else "UNKNOWN"
+        if wait_time is not None:
+            TASK_WAIT_TIME.labels(type_name).observe(wait_time)
 
         self.event_bus.push(
             Event(
@@ -357,16 +438,23 @@ class TaskJobService(ITaskService):
 
         logger.info(f"Starting task {task_id}")
         with db():
-            db.session.query(TaskJob).filter(TaskJob.id == task_id).update({TaskJob.status: TaskStatus.RUNNING.value})
+            db.session.query(TaskJob).filter(TaskJob.id == task_id).update(
+                {TaskJob.status: TaskStatus.RUNNING.value, TaskJob.wait_time: wait_time}
+            )
             db.session.commit()
         logger.info(f"Task {task_id} set to RUNNING")
 
+        start = time.monotonic()
+        duration: t.Optional[float] = None
         try:
-            with db():
+            # The SQL statements of the task are monitored by task type
+            with db(name=f"task {type_name}"):
                 # We must use the DB session attached to the current thread
                 result = callback(TaskJobLogRecorder(task_id, session=db.session))
 
+            duration = time.monotonic() - start
             status = TaskStatus.COMPLETED if result.success else TaskStatus.FAILED
+            TASK_DURATION.labels(type_name, status.name).observe(duration)
             logger.info(f"Task {task_id} ended with status {status}")
 
             with db():
@@ -403,6 +491,9 @@ class TaskJobService(ITaskService):
         except Exception as exc:
             err_msg = f"Task {task_id} failed: Unhandled exception {exc}"
             logger.error(err_msg, exc_info=exc)
+            if duration is None:
+                # the task raised an exception (not the update of its status)
+                TASK_DURATION.labels(type_name, TaskStatus.FAILED.name).observe(time.monotonic() - start)
 
             with db():
                 result_msg = f"{err_msg}\nSee the logs for detailed information and the error traceback."
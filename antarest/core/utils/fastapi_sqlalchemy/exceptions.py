@@ -1,3 +1,6 @@
+from sqlalchemy.exc import TimeoutError  # type: ignore
+
+
 class MissingSessionError(Exception):
     """Exception raised for when the user tries to access a database session before it is created."""
 
@@ -24,3 +27,22 @@ class SessionNotInitialisedError(Exception):
         """
 
         super().__init__(msg)
+
+
+class QueryBudgetExceededError(Exception):
+    """Exception raised when a DB session context executes more SQL statements than its budget (in strict mode)."""
+
+    def __init__(self, name: str, statement_count: int, budget: int) -> None:
+        msg = f"{name}: {statement_count} SQL statements exceed the budget of {budget}"
+        super().__init__(msg)
+
+
+class PoolTimeoutError(TimeoutError):  # type: ignore
+    """Exception raised when no connection of a database pool is available before the checkout timeout."""
+
+    def __init__(self, pool_name: str, timeout: float, status: str) -> None:
+        msg = (
+            f"No connection available in the '{pool_name}' database pool after {timeout:g} seconds,"
+            f" the pool is saturated ({status})"
+        )
+        super().__init__(msg)
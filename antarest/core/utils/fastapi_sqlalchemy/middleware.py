@@ -10,10 +10,39 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import ASGIApp
 
-from antarest.core.utils.fastapi_sqlalchemy.exceptions import MissingSessionError, SessionNotInitialisedError
+from antarest.core.utils.fastapi_sqlalchemy.exceptions import (
+    MissingSessionError,
+    QueryBudgetExceededError,
+    SessionNotInitialisedError,
+)
+from antarest.core.utils.fastapi_sqlalchemy.query_monitor import QueryMonitor, QueryStats
 
 _Session: sessionmaker = None
-_session: ContextVar[Optional[Session]] = ContextVar("_session", default=None)
+_background_engine: Optional[Engine] = None
+_session: ContextVar[Optional["DBSession"]] = ContextVar("_session", default=None)
+_query_monitor: Optional[QueryMonitor] = None
+
+
+def get_query_monitor() -> Optional[QueryMonitor]:
+    """Return the monitor of the SQL statements, if any."""
+    return _query_monitor
+
+
+def _get_query_stats() -> Optional[QueryStats]:
+    context = _session.get()
+    return context.query_stats if context is not None else None
+
+
+def get_route_name(request: Request) -> str:
+    """
+    Return the name of the route of a request, like "GET /v1/studies/{uuid}",
+    so that the statistics of the requests to the same route are aggregated.
+    """
+    if "endpoint" not in request.scope:
+        return f"{request.method} <unmatched>"
+    path_params = {str(value): name for name, value in request.scope.get("path_params", {}).items()}
+    parts = [f"{{{path_params[part]}}}" if part in path_params else part for part in request.url.path.split("/")]
+    return f"{request.method} {'/'.join(parts)}"
 
 
 class DBSessionMiddleware(BaseHTTPMiddleware):
@@ -25,10 +54,24 @@ class DBSessionMiddleware(BaseHTTPMiddleware):
         engine_args: Optional[Dict[str, Any]] = None,
         session_args: Optional[Dict[str, Any]] = None,
         commit_on_exit: bool = False,
+        query_monitor: Optional[QueryMonitor] = None,
+        background_engine: Optional[Engine] = None,
     ) -> None:
+        """
+        Args:
+            app: the application, `None` to only initialize the DB session contexts (in the workers).
+            db_url: URL of the database, used to create the engine if `custom_engine` is not given.
+            custom_engine: engine of the HTTP requests (and of the background work if `background_engine` is not given).
+            engine_args: arguments used to create the engine from `db_url`.
+            session_args: arguments of the sessions.
+            commit_on_exit: commit the session at the end of each request.
+            query_monitor: monitor of the SQL statements, if any.
+            background_engine: engine of the contexts opened outside the HTTP requests
+                (tasks, watcher, garbage collector...), with its own connection pool.
+        """
         if app:
             super().__init__(app)
-        global _Session
+        global _Session, _query_monitor, _background_engine
         engine_args = engine_args or {}
         self.commit_on_exit = commit_on_exit
 
@@ -40,10 +83,19 @@ class DBSessionMiddleware(BaseHTTPMiddleware):
         else:
             engine = custom_engine
         _Session = sessionmaker(bind=engine, **session_args)
+        _background_engine = background_engine
+        if query_monitor is not None:
+            query_monitor.install(engine, _get_query_stats)
+            if background_engine is not None:
+                query_monitor.install(background_engine, _get_query_stats)
+        _query_monitor = query_monitor
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        with db(commit_on_exit=self.commit_on_exit):
+        context = DBSession(commit_on_exit=self.commit_on_exit, background=False)
+        with context:
             response = await call_next(request)
+            if context.query_stats is not None:
+                context.query_stats.name = get_route_name(request)
         return response
 
 
@@ -56,11 +108,11 @@ class DBSessionMeta(type):
         if _Session is None:
             raise SessionNotInitialisedError
 
-        session = _session.get()
-        if session is None:
+        context = _session.get()
+        if context is None:
             raise MissingSessionError
 
-        return session
+        return context.get_session()
 
 
 class DBSession(metaclass=DBSessionMeta):
@@ -68,19 +120,51 @@ class DBSession(metaclass=DBSessionMeta):
         self,
         session_args: Optional[Dict[str, Any]] = None,
         commit_on_exit: bool = False,
+        name: str = "",
+        background: Optional[bool] = None,
     ) -> None:
         self.token: Optional[Token[Optional[Any]]] = None
         self.session_args = session_args or {}
         self.commit_on_exit = commit_on_exit
+        self.name = name
+        # A context is interactive when it is opened by an HTTP request (or nested in such a context),
+        # the contexts opened by the background threads (tasks, watcher...) use the background engine
+        self.background = background
+        self._session: Optional[Session] = None
+        # The statements of the nested contexts are counted in the statistics of the outermost context
+        self.query_stats: Optional[QueryStats] = None
+        self._owns_query_stats = False
+
+    def get_session(self) -> Session:
+        """
+        Return the session of this context, creating it on first use.
+
+        The session is created lazily, so that a context (like the one opened by
+        the `DBSessionMiddleware` for each HTTP request) which never accesses
+        the database does not pay for it.
+        """
+        if self._session is None:
+            if self.background and _background_engine is not None:
+                self._session = _Session(bind=_background_engine, **self.session_args)
+            else:
+                self._session = _Session(**self.session_args)
+        return self._session
 
     def __enter__(self) -> Type["DBSession"]:
         if not isinstance(_Session, sessionmaker):
             raise SessionNotInitialisedError
-        self.token = _session.set(_Session(**self.session_args))
+        parent = _session.get()
+        if self.background is None:
+            self.background = parent.background if parent is not None else True
+        if _query_monitor is not None:
+            self._owns_query_stats = parent is None or parent.query_stats is None
+            self.query_stats = QueryStats(self.name) if self._owns_query_stats else parent.query_stats  # type: ignore
+        self.token = _session.set(self)
         return type(self)
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
-        sess: Optional[Session] = _session.get()
+        sess: Optional[Session] = self._session
+        self._session = None
         if sess is not None:
             if exc_type is not None:
                 sess.rollback()
@@ -91,6 +175,13 @@ class DBSession(metaclass=DBSessionMeta):
             sess.close()
         if self.token is not None:
             _session.reset(self.token)
+        if self._owns_query_stats and self.query_stats is not None and _query_monitor is not None:
+            try:
+                _query_monitor.check(self.query_stats)
+            except QueryBudgetExceededError:
+                # Don't hide the exception raised in the context, if any
+                if exc_type is None:
+                    raise
 
 
 db: DBSessionMeta = DBSession
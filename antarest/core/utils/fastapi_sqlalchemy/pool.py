@@ -0,0 +1,112 @@
+"""
+Connection pools of the database engines.
+
+The HTTP requests and the background work (tasks, watcher, garbage collector, launcher callbacks...)
+use separate engines, each with its own pool, so that the requests don't wait behind the background
+work for a connection. The pools are named after their traffic ("interactive" or "background"),
+count their checkouts, and fail with a clear error when no connection is available before the timeout.
+"""
+import threading
+import time
+import typing as t
+from operator import attrgetter
+
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.exc import TimeoutError  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
+
+from antarest.core.metrics import REGISTRY
+from antarest.core.utils.fastapi_sqlalchemy.exceptions import PoolTimeoutError
+
+INTERACTIVE_POOL = "interactive"
+BACKGROUND_POOL = "background"
+
+
+class MonitoredQueuePool(QueuePool):  # type: ignore
+    """
+    Queue pool which records the statistics of its checkouts.
+
+    The name of the pool is its logging name (the `pool_logging_name` argument of `create_engine`).
+
+    Attributes:
+        checkout_count: number of connections checked out from the pool.
+        checkout_wait: total time spent waiting for a connection (in seconds).
+        timeout_count: number of checkouts which failed because the pool was saturated.
+    """
+
+    def __init__(self, creator: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(creator, **kwargs)
+        self.checkout_count = 0
+        self.checkout_wait = 0.0
+        self.timeout_count = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.logging_name or "default"
+
+    def capacity(self) -> int:
+        """Maximum number of connections of the pool, including the overflow."""
+        return int(self.size() + max(self._max_overflow, 0))
+
+    def saturation(self) -> float:
+        """Ratio of the connections in use to the capacity of the pool."""
+        return float(self.checkedout() / max(self.capacity(), 1))
+
+    def _do_get(self) -> t.Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError as exc:
+            with self._stats_lock:
+                self.timeout_count += 1
+            raise PoolTimeoutError(self.name, self.timeout(), self.status()) from exc
+        with self._stats_lock:
+            self.checkout_count += 1
+            self.checkout_wait += time.perf_counter() - start
+        return connection
+
+    def recreate(self) -> "MonitoredQueuePool":
+        # the statistics are kept when the engine is disposed
+        pool = t.cast(MonitoredQueuePool, super().recreate())
+        pool.checkout_count = self.checkout_count
+        pool.checkout_wait = self.checkout_wait
+        pool.timeout_count = self.timeout_count
+        return pool
+
+
+# The engines whose pool metrics are exposed, by pool name.
+# The pool of an engine is replaced when the engine is disposed, so it is read when the metrics are scraped.
+_engines: t.Dict[str, Engine] = {}
+
+
+def _get_pool_values(get_value: t.Callable[[MonitoredQueuePool], float]) -> t.Dict[t.Tuple[str, ...], float]:
+    pools = [engine.pool for engine in list(_engines.values())]
+    return {(pool.name,): get_value(pool) for pool in pools if isinstance(pool, MonitoredQueuePool)}
+
+
+def register_pool_metrics(engine: Engine) -> None:
+    """
+    Expose the metrics of the pool of an engine, which must be a `MonitoredQueuePool`.
+
+    When the saturation of a pool reaches 1, the checkouts wait for a connection,
+    and fail after the pool timeout.
+    """
+    pool = t.cast(MonitoredQueuePool, engine.pool)
+    _engines[pool.name] = engine
+    for name, documentation, get_value, type_name in [
+        ("antarest_db_pool_capacity", "Maximum number of connections", MonitoredQueuePool.capacity, "gauge"),
+        ("antarest_db_pool_connections_in_use", "Number of connections checked out", QueuePool.checkedout, "gauge"),
+        ("antarest_db_pool_connections_idle", "Number of idle connections in the pool", QueuePool.checkedin, "gauge"),
+        ("antarest_db_pool_saturation", "Connections in use / capacity", MonitoredQueuePool.saturation, "gauge"),
+        ("antarest_db_pool_checkouts_total", "Number of checkouts", attrgetter("checkout_count"), "counter"),
+        ("antarest_db_pool_checkout_wait_seconds_total", "Time spent waiting", attrgetter("checkout_wait"), "counter"),
+        ("antarest_db_pool_timeouts_total", "Number of failed checkouts", attrgetter("timeout_count"), "counter"),
+    ]:
+        REGISTRY.register_callback(
+            name,
+            documentation,
+            lambda get_value=get_value: _get_pool_values(get_value),  # type: ignore
+            type_name=type_name,
+            labelnames=("pool",),
+        )
@@ -0,0 +1,178 @@
+"""
+Monitor the SQL statements executed in the DB session contexts (HTTP requests and background tasks).
+
+The monitor counts the statements and their duration for each context,
+flags the statements repeated many times in the same context (the "N+1 queries" pattern)
+and checks the number of statements against a query budget.
+"""
+import collections
+import logging
+import threading
+import time
+import typing as t
+
+from pydantic import BaseModel
+from sqlalchemy import event  # type: ignore
+from sqlalchemy.engine import Connection, Engine  # type: ignore
+
+from antarest.core.utils.fastapi_sqlalchemy.exceptions import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+UNNAMED_CONTEXT = "<unnamed>"
+
+_START_TIMES_KEY = "query_monitor_start_times"
+
+
+class QueryStats:
+    """
+    Statistics of the SQL statements executed in a DB session context.
+
+    Attributes:
+        name: name of the context, for instance "GET /v1/studies/{uuid}" for an HTTP request.
+        statement_count: number of executed statements.
+        duration: total duration of the statements (in seconds).
+        statements: number of executions of each statement, the statements being parameterized.
+    """
+
+    def __init__(self, name: str = "") -> None:
+        self.name = name or UNNAMED_CONTEXT
+        self.statement_count = 0
+        self.duration = 0.0
+        self.statements: t.Counter[str] = collections.Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statement_count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def get_repeated_statements(self, threshold: int) -> t.Dict[str, int]:
+        """
+        Get the statements executed at least `threshold` times, which are likely N+1 queries.
+        """
+        if threshold <= 0:
+            return {}
+        return {statement: count for statement, count in self.statements.most_common() if count >= threshold}
+
+
+class QueryStatsSummaryDTO(BaseModel):
+    """
+    Statistics of the SQL statements aggregated for all the contexts of the same name.
+    """
+
+    name: str
+    context_count: int = 0
+    statement_count: int = 0
+    max_statement_count: int = 0
+    duration: float = 0
+    max_duration: float = 0
+    budget: int = 0
+    budget_exceeded_count: int = 0
+    repeated_statements: t.Dict[str, int] = {}
+
+
+class QueryMonitor:
+    """
+    Monitor the SQL statements executed by an engine in the DB session contexts.
+
+    Args:
+        budget: default maximum number of statements of a context (0 means no limit).
+        budgets: maximum number of statements of the contexts, by name (for instance "GET /v1/studies").
+        repeat_threshold: number of executions of the same statement in a context
+            from which the statement is reported as an N+1 query (0 to disable the detection).
+        strict: raise a `QueryBudgetExceededError` when a context exceeds its budget,
+            instead of only logging a warning (used in the tests to catch regressions).
+    """
+
+    def __init__(
+        self,
+        budget: int = 0,
+        budgets: t.Optional[t.Mapping[str, int]] = None,
+        repeat_threshold: int = 0,
+        strict: bool = False,
+    ) -> None:
+        self.budget = budget
+        self.budgets = dict(budgets or {})
+        self.repeat_threshold = repeat_threshold
+        self.strict = strict
+        self._summaries: t.Dict[str, QueryStatsSummaryDTO] = {}
+        self._lock = threading.Lock()
+        self._engines: t.List[Engine] = []
+
+    def install(self, engine: Engine, get_stats: t.Callable[[], t.Optional[QueryStats]]) -> None:
+        """
+        Listen to the statements executed by the engine.
+
+        Args:
+            engine: monitored engine.
+            get_stats: function returning the statistics of the current context (if any).
+        """
+        # The middleware may be instantiated several times with the same engine
+        if engine in self._engines:
+            return
+        self._engines.append(engine)
+
+        def before_cursor_execute(conn: Connection, *_: t.Any) -> None:
+            conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+        def after_cursor_execute(conn: Connection, cursor: t.Any, statement: str, *_: t.Any) -> None:
+            duration = time.perf_counter() - conn.info[_START_TIMES_KEY].pop()
+            stats = get_stats()
+            if stats is not None:
+                stats.record(statement, duration)
+
+        def handle_error(context: t.Any) -> None:
+            # The `after_cursor_execute` event is not fired for the failed statements
+            if context.connection is not None and context.connection.info.get(_START_TIMES_KEY):
+                context.connection.info[_START_TIMES_KEY].pop()
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+        event.listen(engine, "handle_error", handle_error)
+
+    def get_budget(self, name: str) -> int:
+        return self.budgets.get(name, self.budget)
+
+    def check(self, stats: QueryStats) -> None:
+        """
+        Report the statistics of a finished context: the N+1 queries and the exceeded budget are logged,
+        and the statistics are aggregated with the ones of the previous contexts of the same name.
+
+        Raises:
+            QueryBudgetExceededError: if the context exceeds its budget in strict mode.
+        """
+        budget = self.get_budget(stats.name)
+        budget_exceeded = 0 < budget < stats.statement_count
+        repeated_statements = stats.get_repeated_statements(self.repeat_threshold)
+        logger.debug(f"{stats.name}: {stats.statement_count} SQL statements in {stats.duration:.3f}s")
+        for statement, count in repeated_statements.items():
+            logger.warning(f"{stats.name}: possible N+1 query, statement executed {count} times: {statement}")
+        if budget_exceeded:
+            logger.warning(f"{stats.name}: {stats.statement_count} SQL statements exceed the budget of {budget}")
+
+        with self._lock:
+            summary = self._summaries.setdefault(stats.name, QueryStatsSummaryDTO(name=stats.name))
+            summary.context_count += 1
+            summary.statement_count += stats.statement_count
+            summary.max_statement_count = max(summary.max_statement_count, stats.statement_count)
+            summary.duration += stats.duration
+            summary.max_duration = max(summary.max_duration, stats.duration)
+            summary.budget = budget
+            summary.budget_exceeded_count += budget_exceeded
+            for statement, count in repeated_statements.items():
+                summary.repeated_statements[statement] = max(summary.repeated_statements.get(statement, 0), count)
+
+        if budget_exceeded and self.strict:
+            raise QueryBudgetExceededError(stats.name, stats.statement_count, budget)
+
+    def get_summaries(self) -> t.List[QueryStatsSummaryDTO]:
+        """
+        Get the aggregated statistics, the most expensive contexts first.
+        """
+        with self._lock:
+            summaries = [summary.copy(deep=True) for summary in self._summaries.values()]
+        return sorted(summaries, key=lambda s: s.max_statement_count, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._summaries.clear()
@@ -1,14 +1,15 @@
+import filecmp
 import glob
 import logging
 import os
 import shutil
 import tempfile
+import threading
 import time
 import typing as t
 import zipfile
 from pathlib import Path
 
-import py7zr
 import redis
 
 from antarest.core.config import RedisConfig
@@ -75,6 +76,8 @@ def extract_zip(stream: t.BinaryIO, target_dir: Path) -> None:
             raise BadArchiveContent("Unsupported ZIP format") from error
 
     elif file_format[:2] == b"7z":
+        import py7zr  # slow to import, and rarely needed
+
         try:
             with py7zr.SevenZipFile(stream, "r") as zf:
                 zf.extractall(target_dir)
@@ -131,6 +134,46 @@ class StopWatch:
 
 
 T = t.TypeVar("T")
+K = t.TypeVar("K")
+
+
+class TTLCache(t.Generic[K, T]):
+    """
+    Thread-safe in-process cache whose entries expire after a fixed duration.
+
+    Args:
+        ttl: Time to live of the entries (in seconds), zero or a negative value disables the cache.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: t.Dict[K, t.Tuple[float, T]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> t.Optional[T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiration, value = entry
+            if time.monotonic() >= expiration:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: K, value: T) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 def retry(func: t.Callable[[], T], attempts: int = 10, interval: float = 0.5) -> T:
@@ -169,6 +212,27 @@ def concat_files_to_str(files: t.List[Path]) -> str:
     return concat_str
 
 
+def diff_directories(dir1: Path, dir2: Path) -> t.List[str]:
+    """
+    Compare the trees of files of two directories, and their contents.
+
+    Args:
+        dir1: Path of the first directory.
+        dir2: Path of the second directory.
+
+    Returns:
+        The relative paths (in POSIX format) of the files or directories which are missing
+        in one of the directories or which have a different content (compared byte to byte).
+    """
+    comparison = filecmp.dircmp(dir1, dir2)
+    _, mismatch, errors = filecmp.cmpfiles(dir1, dir2, comparison.common_files, shallow=False)
+    names = comparison.left_only + comparison.right_only + comparison.common_funny + mismatch + errors
+    differences = sorted(names)
+    for name in comparison.common_dirs:
+        differences.extend(f"{name}/{path}" for path in diff_directories(dir1 / name, dir2 / name))
+    return differences
+
+
 def zip_dir(dir_path: Path, zip_path: Path, remove_source_dir: bool = False) -> None:
     with zipfile.ZipFile(zip_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=2) as zipf:
         len_dir_path = len(str(dir_path))
@@ -25,3 +25,11 @@ class IEventBusBackend(abc.ABC):
     @abstractmethod
     def clear_events(self) -> None:
         raise NotImplementedError
+
+    def count_pending_events(self, queues: List[str]) -> int:
+        """
+        Count the events waiting to be processed: the pushed events and the events of the given queues.
+
+        The backends which cannot count some events do not count them.
+        """
+        return 0
@@ -30,3 +30,6 @@ class LocalEventBus(IEventBusBackend):
         if queue in self.queues and len(self.queues[queue]) > 0:
             return self.queues[queue].pop(0)
         return None
+
+    def count_pending_events(self, queues: List[str]) -> int:
+        return len(self.events) + sum(len(self.queues.get(queue, [])) for queue in queues)
@@ -41,3 +41,12 @@ class RedisEventBus(IEventBusBackend):
     def clear_events(self) -> None:
         # Nothing to do
         pass
+
+    def count_pending_events(self, queues: List[str]) -> int:
+        # The published events are not stored by Redis: only the queued events can be counted.
+        if not queues:
+            return 0
+        pipeline = self.redis.pipeline(transaction=False)
+        for queue in queues:
+            pipeline.llen(queue)
+        return sum(pipeline.execute())
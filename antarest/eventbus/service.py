@@ -7,10 +7,17 @@ import uuid
 from typing import Awaitable, Callable, Dict, List, Optional
 
 from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
+from antarest.core.metrics import REGISTRY
 from antarest.eventbus.business.interfaces import IEventBusBackend
 
 logger = logging.getLogger(__name__)
 
+EVENTS_PUSHED = REGISTRY.counter(
+    "antarest_eventbus_events_total",
+    "Number of events pushed to the event bus by this worker, by event type",
+    ("type",),
+)
+
 
 class EventBusService(IEventBus):
     def __init__(self, backend: IEventBusBackend, autostart: bool = True) -> None:
@@ -21,10 +28,16 @@ class EventBusService(IEventBus):
         self.consumers: Dict[str, Dict[str, Callable[[Event], Awaitable[None]]]] = {}
 
         self.lock = threading.Lock()
+        REGISTRY.register_callback(
+            "antarest_eventbus_backlog",
+            "Number of events waiting to be processed by the event bus (pushed events and consumed queues)",
+            lambda: self.backend.count_pending_events(list(self.consumers)),
+        )
         if autostart:
             self.start()
 
     def push(self, event: Event) -> None:
+        EVENTS_PUSHED.labels(event.type.value).inc()
         self.backend.push_event(event)
 
     def queue(self, event: Event, queue: str) -> None:
@@ -13,6 +13,7 @@ from starlette.websockets import WebSocket, WebSocketDisconnect
 from antarest.core.config import Config
 from antarest.core.interfaces.eventbus import Event, IEventBus
 from antarest.core.jwt import DEFAULT_ADMIN_USER, JWTUser
+from antarest.core.metrics import REGISTRY
 from antarest.core.model import PermissionInfo, StudyPermissionType
 from antarest.core.permissions import check_permission
 from antarest.login.auth import Auth
@@ -81,6 +82,11 @@ class ConnectionManager:
 
 def configure_websockets(application: FastAPI, config: Config, event_bus: IEventBus) -> None:
     manager = ConnectionManager()
+    REGISTRY.register_callback(
+        "antarest_websocket_connections",
+        "Number of websocket connections opened on this worker",
+        lambda: len(manager.active_connections),
+    )
 
     async def send_event_to_ws(event: Event) -> None:
         event_data = event.dict()
@@ -6,7 +6,6 @@ from antarest.core.interfaces.cache import ICache
 from antarest.core.interfaces.eventbus import IEventBus
 from antarest.launcher.adapters.abstractlauncher import AbstractLauncher, LauncherCallbacks
 from antarest.launcher.adapters.local_launcher.local_launcher import LocalLauncher
-from antarest.launcher.adapters.slurm_launcher.slurm_launcher import SlurmLauncher
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +22,9 @@ class FactoryLauncher:
         if config.launcher.local is not None:
             dict_launchers["local"] = LocalLauncher(config, callbacks, event_bus, cache)
         if config.launcher.slurm is not None:
+            # Importing the SLURM launcher (and `antareslauncher`) is slow, it is only done when it is configured
+            from antarest.launcher.adapters.slurm_launcher.slurm_launcher import SlurmLauncher
+
             dict_launchers["slurm"] = SlurmLauncher(
                 config,
                 callbacks,
@@ -1,21 +1,105 @@
+import codecs
 import contextlib
+import ctypes
+import ctypes.util
 import io
 import logging
+import os
+import select
+import struct
+import sys
+import threading
 import time
 from pathlib import Path
-from threading import Thread
-from typing import Callable, Dict, Optional, cast
+from typing import BinaryIO, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Flags and event masks of the Linux inotify API (see `man 7 inotify`)
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_IN_MODIFY = 0x00000002
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """
+    Minimal binding of the Linux inotify API, used to wait for modifications of the tracked files.
+
+    A pipe is watched along with the inotify file descriptor, so that the waiting can be interrupted.
+    """
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._rm_watch = libc.inotify_rm_watch
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
+    def add_watch(self, path: str) -> int:
+        wd: int = self._add_watch(self.fd, os.fsencode(path), _IN_MODIFY)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._rm_watch(self.fd, wd)
+
+    def wake_up(self) -> None:
+        os.write(self._wake_w, b"\0")
+
+    def wait(self, timeout: float) -> None:
+        """
+        Wait for a modification of a watched file, a call to `wake_up`, or the end of the timeout.
+        """
+        ready, _, _ = select.select([self.fd, self._wake_r], [], [], timeout)
+        # The events are drained: all the tracked files are checked after a wake-up.
+        for fd in ready:
+            with contextlib.suppress(BlockingIOError):
+                while os.read(fd, 4096 * _IN_EVENT_HEADER.size):
+                    pass
+
+
+class _TrackedLog:
+    def __init__(self, path: str, handler: Callable[[str], None]) -> None:
+        self.path = path
+        self.handler = handler
+        self.file: Optional[BinaryIO] = None
+        self.position = 0
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.pending = ""  # last line, not yet terminated by a newline
+        self.wd: Optional[int] = None
+
 
 class LogTailManager:
-    BATCH_SIZE = 10
+    """
+    Tail the log files of the running jobs and deliver their new lines to handlers.
+
+    A single thread follows all the tracked files. On Linux, it sleeps until a tracked file
+    is modified (using inotify); otherwise, the size of the files is checked every `POLL_INTERVAL` seconds.
+    The complete lines read from a file are delivered to its handler in batches (one call per read).
+    """
+
+    BATCH_SIZE = 10  # number of lines delivered at once by `follow`
+    POLL_INTERVAL = 0.5  # in seconds
+    INOTIFY_TIMEOUT = 5.0  # in seconds, files are also checked periodically in case an event is missed
+    READ_SIZE = 1024 * 1024  # maximum number of bytes read from a file before moving to the next one
 
     def __init__(self, log_base_dir: Path) -> None:
         logger.info("Initiating Log manager")
         self.log_base_dir = log_base_dir
-        self.tracked_logs: Dict[str, Thread] = {}
+        self.tracked_logs: Dict[str, _TrackedLog] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.warning("Failed to initialize inotify, falling back to polling", exc_info=e)
 
     def is_tracking(self, log_path: Optional[Path]) -> bool:
         return str(log_path) in self.tracked_logs if log_path else False
@@ -26,43 +110,98 @@ class LogTailManager:
         if str(log_path) in self.tracked_logs:
             logger.info(f"Already tracking log {log_path}")
             return None
+        if not log_path.exists():
+            logger.warning(f"Failed to find {log_path}. Aborting log tracking")
+            return None
 
         logger.info(f"Adding log {log_path} track")
-        thread = Thread(
-            target=lambda: self._follow(log_path, handler, self._stop_tracking(str(log_path))),
-            name=f"{self.__class__.__name__}-LogsWatcher",
-            daemon=True,
-        )
-        self.tracked_logs[str(log_path)] = thread
-        thread.start()
-
-    def _stop_tracking(self, log_path: str) -> Callable[[], bool]:
-        def stop() -> bool:
-            return log_path not in self.tracked_logs
-
-        return stop
+        with self._condition:
+            self.tracked_logs[str(log_path)] = _TrackedLog(str(log_path), handler)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.__class__.__name__}-LogsWatcher",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+        if self._inotify is not None:
+            self._inotify.wake_up()
 
     def stop_tracking(self, log_path: Optional[Path]) -> None:
         if log_path is None:
             return None
-        log_path_key = str(log_path)
-        if log_path_key in self.tracked_logs:
-            del self.tracked_logs[log_path_key]
-
-    def _follow(
-        self,
-        log_file: Optional[Path],
-        handler: Callable[[str], None],
-        stop: Callable[[], bool],
-    ) -> None:
-        if not log_file or not log_file.exists():
-            logger.warning(f"Failed to find {log_file}. Aborting log tracking")
-            self.stop_tracking(log_file)
-            return
-
-        with open(log_file, "r") as fh:
-            logger.info(f"Scanning {log_file}")
-            follow(cast(io.StringIO, fh), handler, stop, str(log_file))
+        with self._condition:
+            # The file is closed by the tailer thread.
+            self.tracked_logs.pop(str(log_path), None)
+
+    def _run(self) -> None:
+        opened: Dict[str, _TrackedLog] = {}
+        while True:
+            with self._condition:
+                # Release the logs which are no longer tracked, and sleep while nothing is tracked.
+                for path in [p for p, log in opened.items() if self.tracked_logs.get(p) is not log]:
+                    self._close(opened.pop(path))
+                while not self.tracked_logs:
+                    self._condition.wait()
+                tracked: List[_TrackedLog] = list(self.tracked_logs.values())
+            remaining_data = False
+            for log in tracked:
+                opened[log.path] = log
+                try:
+                    remaining_data |= self._read(log)
+                except Exception as e:
+                    logger.error(f"Failed to read log {log.path}. Aborting log tracking", exc_info=e)
+                    self.stop_tracking(Path(log.path))
+            if remaining_data:
+                continue
+            if self._inotify is not None:
+                self._inotify.wait(self.INOTIFY_TIMEOUT)
+            else:
+                time.sleep(self.POLL_INTERVAL)
+
+    def _read(self, log: _TrackedLog) -> bool:
+        """
+        Read the new content of a log file and deliver its complete lines to the handler.
+
+        Returns:
+            `True` if the file has more content to read.
+        """
+        if log.file is None:
+            log.file = open(log.path, mode="rb")
+            log.file.seek(log.position)
+            if self._inotify is not None:
+                try:
+                    log.wd = self._inotify.add_watch(log.path)
+                except OSError as e:
+                    # the file is still checked every `INOTIFY_TIMEOUT` seconds
+                    logger.warning(f"Failed to watch {log.path}", exc_info=e)
+        size = os.fstat(log.file.fileno()).st_size
+        if size < log.position:
+            logger.info(f"Log {log.path} was truncated, reading it from the beginning")
+            log.file.seek(0)
+            log.position = 0
+            log.pending = ""
+        if size == log.position:
+            return False
+        data = log.file.read(self.READ_SIZE)
+        log.position += len(data)
+        text = log.pending + log.decoder.decode(data)
+        end = text.rfind("\n") + 1
+        log.pending = text[end:]
+        if end:
+            logger.debug(f"Calling handler for {log.path}")
+            with contextlib.suppress(Exception):
+                log.handler(text[:end])
+        return log.position < size
+
+    def _close(self, log: _TrackedLog) -> None:
+        if log.wd is not None and self._inotify is not None:
+            self._inotify.rm_watch(log.wd)
+            log.wd = None
+        if log.file is not None:
+            log.file.close()
+            log.file = None
 
 
 def follow(
@@ -5,7 +5,6 @@ import re
 import shutil
 import tempfile
 import threading
-import time
 import traceback
 import typing as t
 from pathlib import Path
@@ -36,6 +35,8 @@ LOCK_FILE_NAME = "slurm_launcher_init.lock"
 LOG_DIR_NAME = "LOGS"
 STUDIES_INPUT_DIR_NAME = "STUDIES_IN"
 STUDIES_OUTPUT_DIR_NAME = "OUTPUT"
+MIN_CHECK_DELAY = 2.0  # in seconds, delay between two checks of the studies state while a job is running
+MAX_CHECK_DELAY = 60.0  # in seconds, maximum delay reached when no job is running
 
 
 class VersionNotSupportedError(Exception):
@@ -144,6 +145,8 @@ class SlurmLauncher(AbstractLauncher):
         self.event_bus = event_bus
         self.event_bus.add_listener(self._create_event_listener(), [EventType.STUDY_JOB_CANCEL_REQUEST])
         self.thread: t.Optional[threading.Thread] = None
+        self.check_delay = MIN_CHECK_DELAY
+        self._wake_up = threading.Event()
         self.job_list: t.List[str] = []
         self._check_config()
         self.antares_launcher_lock = threading.Lock()
@@ -207,7 +210,9 @@ class SlurmLauncher(AbstractLauncher):
                     "An uncaught exception occurred in slurm_launcher loop",
                     exc_info=True,
                 )
-            time.sleep(2)
+            # The waiting is interrupted when a study is submitted or when the loop is stopped.
+            self._wake_up.wait(self.check_delay)
+            self._wake_up.clear()
 
     def start(self) -> None:
         logger.info("Starting slurm_launcher loop")
@@ -222,6 +227,7 @@ class SlurmLauncher(AbstractLauncher):
     def stop(self) -> None:
         self.check_state = False
         self.thread = None
+        self._wake_up.set()
         logger.info("slurm_launcher loop stopped")
 
     def _init_launcher_arguments(self, local_workspace: t.Optional[Path] = None) -> argparse.Namespace:
@@ -350,6 +356,14 @@ class SlurmLauncher(AbstractLauncher):
                 logger.info("Could not get data on remote server", exc_info=e)
 
             study_list = self.data_repo_tinydb.get_list_of_studies()
+
+            # The studies state is checked less and less often while no job is running
+            # (for instance, when all the jobs are pending in the SLURM queue).
+            if any(s.started and not (s.done or s.with_error) for s in study_list):
+                self.check_delay = MIN_CHECK_DELAY
+            else:
+                self.check_delay = min(2 * self.check_delay, MAX_CHECK_DELAY)
+
             for study in study_list:
                 log_path = SlurmLauncher._get_log_path(study)
                 if study.with_error:
@@ -539,8 +553,11 @@ class SlurmLauncher(AbstractLauncher):
             finally:
                 self._delete_workspace_file(study_path)
 
+        self.check_delay = MIN_CHECK_DELAY
         if not self.thread:
             self.start()
+        else:
+            self._wake_up.set()
 
     def _call_launcher(self, arguments: argparse.Namespace, parameters: MainParameters) -> None:
         run_with(arguments, parameters, show_banner=False)
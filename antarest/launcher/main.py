@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import FastAPI
 
@@ -6,13 +6,21 @@ from antarest.core.config import Config
 from antarest.core.filetransfer.service import FileTransferManager
 from antarest.core.interfaces.cache import ICache
 from antarest.core.interfaces.eventbus import DummyEventBusService, IEventBus
+from antarest.core.metrics import REGISTRY
 from antarest.core.tasks.service import ITaskService
+from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.launcher.repository import JobResultRepository
 from antarest.launcher.service import LauncherService
 from antarest.launcher.web import create_launcher_api
 from antarest.study.service import StudyService
 
 
+def _count_jobs(repository: JobResultRepository) -> Dict[Tuple[str, ...], int]:
+    with db():
+        counts = repository.count_by_status()
+    return {(launcher, status.value): count for (launcher, status), count in counts.items()}
+
+
 def build_launcher(
     application: Optional[FastAPI],
     config: Config,
@@ -37,7 +45,18 @@ def build_launcher(
             cache=cache,
         )
 
+    # The jobs are counted in the database when the metrics are scraped (a single query)
+    repository = service_launcher.job_result_repository
+    REGISTRY.register_callback(
+        "antarest_launcher_jobs",
+        "Number of simulation jobs, by launcher and status",
+        lambda: _count_jobs(repository),
+        labelnames=("launcher", "status"),
+    )
+
     if service_launcher and application:
         application.include_router(create_launcher_api(service_launcher, config))
+        # The log messages buffered by the launcher service are saved when the application stops
+        application.add_event_handler("shutdown", service_launcher.flush_all_logs)
 
     return service_launcher
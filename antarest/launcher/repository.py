@@ -1,10 +1,10 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import exists  # type: ignore
+from sqlalchemy import exists, func  # type: ignore
 
 from antarest.core.utils.fastapi_sqlalchemy import db
-from antarest.launcher.model import JobResult
+from antarest.launcher.model import JobLog, JobResult, JobStatus
 from antarest.study.model import Study
 
 logger = logging.getLogger(__name__)
@@ -25,11 +25,31 @@ class JobResultRepository:
         db.session.commit()
         return job
 
+    def add_logs(self, job_id: str, logs: List[JobLog]) -> None:
+        """
+        Insert several log messages of a job in a single transaction, without loading the job.
+
+        The messages of a job which does not exist (or no longer exists) are ignored.
+        """
+        logger.debug(f"Adding {len(logs)} logs to JobResult {job_id}")
+        if db.session.query(exists().where(JobResult.id == job_id)).scalar():
+            db.session.add_all(logs)
+            db.session.commit()
+        else:
+            logger.warning(f"Ignoring {len(logs)} logs of the missing JobResult {job_id}")
+
     def get(self, id: str) -> Optional[JobResult]:
         logger.debug(f"Retrieving JobResult {id}")
         job: JobResult = db.session.query(JobResult).get(id)
         return job
 
+    def get_logs(self, job_id: str) -> List[JobLog]:
+        """
+        Get the log messages of a job, in insertion order.
+        """
+        logs: List[JobLog] = db.session.query(JobLog).filter(JobLog.job_id == job_id).order_by(JobLog.id).all()
+        return logs
+
     def get_all(self, filter_orphan: bool = False, latest: Optional[int] = None) -> List[JobResult]:
         logger.debug("Retrieving all JobResults")
         query = db.session.query(JobResult)
@@ -46,6 +66,14 @@ class JobResultRepository:
         job_results: List[JobResult] = query.all()
         return job_results
 
+    def count_by_status(self) -> Dict[Tuple[str, JobStatus], int]:
+        """
+        Count the jobs by launcher and status, in a single query.
+        """
+        query = db.session.query(JobResult.launcher, JobResult.job_status, func.count(JobResult.id))
+        rows = query.group_by(JobResult.launcher, JobResult.job_status).all()
+        return {(launcher or "", status): count for launcher, status, count in rows}
+
     def find_by_study(self, study_id: str) -> List[JobResult]:
         logger.debug(f"Retrieving JobResults from study {study_id}")
         job_results: List[JobResult] = db.session.query(JobResult).filter(JobResult.study_id == study_id).all()
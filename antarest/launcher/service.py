@@ -2,10 +2,12 @@ import functools
 import logging
 import os
 import shutil
+import threading
+import time
 from datetime import datetime, timedelta
 from http import HTTPStatus
 from pathlib import Path
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Optional, Set, Tuple, cast
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
@@ -62,6 +64,9 @@ class LauncherServiceNotAvailableException(HTTPException):
 ORPHAN_JOBS_VISIBILITY_THRESHOLD = 10  # days
 LAUNCHER_PARAM_NAME_SUFFIX = "output_suffix"
 EXECUTION_INFO_FILE = "execution_info.ini"
+LOG_BUFFER_SIZE = 100  # number of log messages
+LOG_FLUSH_DELAY = 2.0  # in seconds
+LOAD_CACHE_TTL = 10.0  # in seconds
 
 
 class LauncherService:
@@ -82,6 +87,17 @@ class LauncherService:
         self.event_bus = event_bus
         self.file_transfer_manager = file_transfer_manager
         self.task_service = task_service
+        # Log messages not yet saved in the database, by job ID (see `append_log`)
+        self._log_buffers: Dict[str, List[JobLog]] = {}
+        # Jobs whose messages are being saved, and number of flushes started, by job ID (see `flush_logs`)
+        self._log_flushing: Set[str] = set()
+        self._log_flush_counts: Dict[str, int] = {}
+        # Number of flush counts removed, when the jobs are completed (see `update`)
+        self._log_flush_counts_removed = 0
+        self._log_buffers_lock = threading.Condition()
+        # Last load of the SLURM cluster, with the (monotonic) time of its computation (see `get_load`)
+        self._slurm_load: Optional[Tuple[float, LauncherLoadDTO]] = None
+        self._slurm_load_lock = threading.Lock()
         self.launchers = factory_launcher.build_launcher(
             config,
             LauncherCallbacks(
@@ -160,6 +176,12 @@ class LauncherService:
         msg: Optional[str],
         output_id: Optional[str],
     ) -> None:
+        # The buffered logs are saved before the status, in particular when the job is completed.
+        self.flush_logs(job_uuid)
+        if status in [JobStatus.SUCCESS, JobStatus.FAILED]:
+            with self._log_buffers_lock:
+                self._log_flush_counts.pop(job_uuid, None)
+                self._log_flush_counts_removed += 1
         with db():
             logger.info(f"Setting study with job id {job_uuid} status to {status}")
             job_result = self.job_result_repository.get(job_uuid)
@@ -183,23 +205,57 @@ class LauncherService:
             logger.info("Study status set")
 
     def append_log(self, job_id: str, message: str, log_type: JobLogType) -> None:
+        """
+        Append a log message to a job.
+
+        The messages are buffered in memory and saved in the database by batches:
+        when `LOG_BUFFER_SIZE` messages are buffered, `LOG_FLUSH_DELAY` seconds after
+        the first buffered message, or when the job status is updated.
+        The buffered messages are merged with the saved ones by `get_log`.
+        """
+        log = JobLog(job_id=job_id, message=message, log_type=str(log_type))
+        with self._log_buffers_lock:
+            buffer = self._log_buffers.setdefault(job_id, [])
+            buffer.append(log)
+            size = len(buffer)
+        if size >= LOG_BUFFER_SIZE:
+            self.flush_logs(job_id)
+        elif size == 1:
+            timer = threading.Timer(LOG_FLUSH_DELAY, self.flush_logs, args=[job_id])
+            timer.daemon = True
+            timer.start()
+
+    def flush_logs(self, job_id: str) -> None:
+        """
+        Save the buffered log messages of a job in the database.
+        """
+        # The lock is only held to swap the buffer: the messages are saved without it.
+        # The flushes of a job are serialized, so that `get_log` can wait for the running one.
+        with self._log_buffers_lock:
+            self._log_buffers_lock.wait_for(lambda: job_id not in self._log_flushing)
+            logs = self._log_buffers.pop(job_id, [])
+            if not logs:
+                return
+            self._log_flushing.add(job_id)
+            self._log_flush_counts[job_id] = self._log_flush_counts.get(job_id, 0) + 1
         try:
             with db():
-                job_result = self.job_result_repository.get(job_id)
-                if job_result is not None:
-                    job_result.logs.append(
-                        JobLog(
-                            job_id=job_id,
-                            message=message,
-                            log_type=str(log_type),
-                        )
-                    )
-                    self.job_result_repository.save(job_result)
+                self.job_result_repository.add_logs(job_id, logs)
         except Exception as e:
-            logger.error(
-                f"Failed to append log with message {message} to job {job_id}",
-                exc_info=e,
-            )
+            logger.error(f"Failed to append {len(logs)} logs to job {job_id}", exc_info=e)
+        finally:
+            with self._log_buffers_lock:
+                self._log_flushing.discard(job_id)
+                self._log_buffers_lock.notify_all()
+
+    def flush_all_logs(self) -> None:
+        """
+        Save the buffered log messages of all the jobs, for instance when the application stops.
+        """
+        with self._log_buffers_lock:
+            job_ids = list(self._log_buffers)
+        for job_id in job_ids:
+            self.flush_logs(job_id)
 
     def _assert_launcher_is_initialized(self, launcher: str) -> None:
         if launcher not in self.launchers:
@@ -384,6 +440,28 @@ class LauncherService:
         logs[JobLogType.AFTER if log.log_type == str(JobLogType.AFTER) else JobLogType.BEFORE].append(log.message)
         return logs
 
+    def _get_app_logs(self, job_id: str) -> Tuple[List[JobLog], List[JobLog]]:
+        """
+        Get the saved and the buffered log messages of a job, without missing or duplicating a message.
+
+        The saved messages are read without holding the lock:
+        the reading is retried if a flush of the job has started in the meantime
+        (or if a flush count was removed, since the count of the job may restart from zero).
+        """
+        while True:
+            with self._log_buffers_lock:
+                self._log_buffers_lock.wait_for(lambda: job_id not in self._log_flushing)
+                flush_count = self._log_flush_counts.get(job_id, 0), self._log_flush_counts_removed
+                # The buffered messages are copied, because they are attached to a session once flushed
+                buffered_logs = [
+                    JobLog(job_id=log.job_id, message=log.message, log_type=log.log_type)
+                    for log in self._log_buffers.get(job_id, [])
+                ]
+            saved_logs = self.job_result_repository.get_logs(job_id)
+            with self._log_buffers_lock:
+                if (self._log_flush_counts.get(job_id, 0), self._log_flush_counts_removed) == flush_count:
+                    return saved_logs, buffered_logs
+
     def get_log(self, job_id: str, log_type: LogType, params: RequestParameters) -> Optional[str]:
         job_result = self.job_result_repository.get(str(job_id))
         if job_result:
@@ -404,9 +482,10 @@ class LauncherService:
                 self._assert_launcher_is_initialized(job_result.launcher)
                 launcher_logs = str(self.launchers[job_result.launcher].get_log(job_id, log_type) or "")
             if log_type == LogType.STDOUT:
+                saved_logs, buffered_logs = self._get_app_logs(str(job_id))
                 app_logs: Dict[JobLogType, List[str]] = functools.reduce(
                     lambda logs, log: LauncherService.sort_log(log, logs),
-                    job_result.logs or [],
+                    saved_logs + buffered_logs,
                     {JobLogType.BEFORE: [], JobLogType.AFTER: []},
                 )
                 return "\n".join(app_logs[JobLogType.BEFORE] + [launcher_logs] + app_logs[JobLogType.AFTER])
@@ -631,27 +710,34 @@ class LauncherService:
     def get_load(self) -> LauncherLoadDTO:
         """
         Get the load of the SLURM cluster or the local machine.
+
+        The load of the SLURM cluster is computed at most once every `LOAD_CACHE_TTL` seconds:
+        the concurrent requests share the same snapshot.
         """
         # SLURM load calculation
         if self.config.launcher.default == "slurm":
             if slurm_config := self.config.launcher.slurm:
-                ssh_config = SSHConfigDTO(
-                    config_path=Path(),
-                    username=slurm_config.username,
-                    hostname=slurm_config.hostname,
-                    port=slurm_config.port,
-                    private_key_file=slurm_config.private_key_file,
-                    key_password=slurm_config.key_password,
-                    password=slurm_config.password,
-                )
-                partition = slurm_config.partition
-                allocated_cpus, cluster_load, queued_jobs = calculates_slurm_load(ssh_config, partition)
-                return LauncherLoadDTO(
-                    allocated_cpu_rate=allocated_cpus,
-                    cluster_load_rate=cluster_load,
-                    nb_queued_jobs=queued_jobs,
-                    launcher_status="SUCCESS",
-                )
+                with self._slurm_load_lock:
+                    if self._slurm_load is None or time.monotonic() - self._slurm_load[0] >= LOAD_CACHE_TTL:
+                        ssh_config = SSHConfigDTO(
+                            config_path=Path(),
+                            username=slurm_config.username,
+                            hostname=slurm_config.hostname,
+                            port=slurm_config.port,
+                            private_key_file=slurm_config.private_key_file,
+                            key_password=slurm_config.key_password,
+                            password=slurm_config.password,
+                        )
+                        partition = slurm_config.partition
+                        allocated_cpus, cluster_load, queued_jobs = calculates_slurm_load(ssh_config, partition)
+                        load = LauncherLoadDTO(
+                            allocated_cpu_rate=allocated_cpus,
+                            cluster_load_rate=cluster_load,
+                            nb_queued_jobs=queued_jobs,
+                            launcher_status="SUCCESS",
+                        )
+                        self._slurm_load = (time.monotonic(), load)
+                    return self._slurm_load[1].copy()
             else:
                 raise KeyError("Default launcher is slurm but it is not registered in the config file")
 
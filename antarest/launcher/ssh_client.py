@@ -1,29 +1,94 @@
 import contextlib
+import logging
 import shlex
 import socket
-from typing import Any, List, Tuple
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
 
 import paramiko
 
 from antarest.launcher.ssh_config import SSHConfigDTO
 
+logger = logging.getLogger(__name__)
 
-@contextlib.contextmanager  # type: ignore
-def ssh_client(ssh_config: SSHConfigDTO) -> paramiko.SSHClient:  # type: ignore
+
+def _connect(ssh_config: SSHConfigDTO) -> paramiko.SSHClient:
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    client.connect(
-        hostname=ssh_config.hostname,
-        port=ssh_config.port,
-        username=ssh_config.username,
-        pkey=paramiko.RSAKey.from_private_key_file(filename=str(ssh_config.private_key_file)),
-        timeout=600,
-        allow_agent=False,
-    )
+    try:
+        client.connect(
+            hostname=ssh_config.hostname,
+            port=ssh_config.port,
+            username=ssh_config.username,
+            pkey=paramiko.RSAKey.from_private_key_file(filename=str(ssh_config.private_key_file)),
+            timeout=600,
+            allow_agent=False,
+        )
+    except BaseException:
+        client.close()
+        raise
+    return client
+
+
+@contextlib.contextmanager  # type: ignore
+def ssh_client(ssh_config: SSHConfigDTO) -> paramiko.SSHClient:  # type: ignore
+    client = _connect(ssh_config)
     with contextlib.closing(client):
         yield client
 
 
+class SSHSessionPool:
+    """
+    Pool of persistent SSH sessions, one per remote host and user.
+
+    The SSH connections are kept open between the commands, so that the cost of the connection
+    and of the authentication is paid only once. The sessions can be used by several threads
+    at the same time: each command is executed in its own channel.
+    A session which fails is closed and removed from the pool.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: Dict[Tuple[str, int, str], paramiko.SSHClient] = {}
+        self._lock = threading.Lock()
+        # A slow (or unreachable) host must not block the sessions to the other hosts:
+        # the connection is opened holding only the lock of its host.
+        self._host_locks: Dict[Tuple[str, int, str], threading.Lock] = {}
+
+    @contextlib.contextmanager
+    def session(self, ssh_config: SSHConfigDTO) -> Iterator[paramiko.SSHClient]:
+        key = (ssh_config.hostname, ssh_config.port, ssh_config.username)
+        with self._lock:
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+        with host_lock:
+            with self._lock:
+                client = self._sessions.get(key)
+            transport = client.get_transport() if client is not None else None
+            if client is None or transport is None or not transport.is_active():
+                if client is not None:
+                    client.close()
+                logger.info(f"Opening SSH session to {ssh_config.username}@{ssh_config.hostname}")
+                client = _connect(ssh_config)
+                with self._lock:
+                    self._sessions[key] = client
+        try:
+            yield client
+        except (paramiko.SSHException, socket.error):
+            with self._lock:
+                if self._sessions.get(key) is client:
+                    del self._sessions[key]
+            client.close()
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._sessions.values():
+                client.close()
+            self._sessions.clear()
+
+
+ssh_session_pool = SSHSessionPool()
+
+
 class SlurmError(Exception):
     pass
 
@@ -31,7 +96,7 @@ class SlurmError(Exception):
 def execute_command(ssh_config: SSHConfigDTO, args: List[str]) -> Any:
     command = " ".join(args)
     try:
-        with ssh_client(ssh_config) as client:  # type: ignore
+        with ssh_session_pool.session(ssh_config) as client:
             _, stdout, stderr = client.exec_command(command, timeout=10)
             output = stdout.read().decode("utf-8").strip()
             error = stderr.read().decode("utf-8").strip()
@@ -52,6 +52,7 @@ def build_login(
             role_repo=role_repo,
             ldap=ldap,
             event_bus=event_bus,
+            identity_cache_ttl=config.security.identity_cache_ttl,
         )
 
     if application:
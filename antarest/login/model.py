@@ -322,10 +322,12 @@ def init_admin_user(engine: Engine, session_args: t.Mapping[str, bool], admin_pa
             session.commit()
 
     with make_session() as session:
-        user = User(id=ADMIN_ID, name=ADMIN_NAME, password=Password(admin_password))
-        with contextlib.suppress(IntegrityError):
-            session.add(user)
-            session.commit()
+        # Hashing the password is slow (on purpose), so it is only done when the admin must be created
+        if session.query(Identity.id).filter(Identity.id == ADMIN_ID).first() is None:
+            user = User(id=ADMIN_ID, name=ADMIN_NAME, password=Password(admin_password))
+            with contextlib.suppress(IntegrityError):
+                session.add(user)
+                session.commit()
 
     with make_session() as session:
         role = Role(type=RoleType.ADMIN, identity_id=ADMIN_ID, group_id=GROUP_ID)
@@ -3,10 +3,12 @@ from typing import List, Optional, Union
 
 from fastapi import HTTPException
 
-from antarest.core.interfaces.eventbus import IEventBus
+from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
 from antarest.core.jwt import JWTGroup, JWTUser
+from antarest.core.model import PermissionInfo, PublicMode
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
 from antarest.core.roles import RoleType
+from antarest.core.utils.utils import TTLCache
 from antarest.login.ldap import LdapService
 from antarest.login.model import (
     Bot,
@@ -45,6 +47,11 @@ class UserNotFoundError(HTTPException):
 class LoginService:
     """
     Facade module service to handle request to manage user, group and role
+
+    The identities (JWT data with the user roles) and the bots existence are kept
+    in a short-lived cache to avoid database lookups on each token refresh or
+    bot token check. This cache is cleared whenever a user, group, role or bot
+    is modified through this service, in all the workers (through the event bus).
     """
 
     def __init__(
@@ -55,6 +62,7 @@ class LoginService:
         role_repo: RoleRepository,
         ldap: LdapService,
         event_bus: IEventBus,
+        identity_cache_ttl: int = 0,
     ):
         self.users = user_repo
         self.bots = bot_repo
@@ -62,6 +70,35 @@ class LoginService:
         self.roles = role_repo
         self.ldap = ldap
         self.event_bus = event_bus
+        self._jwt_cache: TTLCache[int, JWTUser] = TTLCache(identity_cache_ttl)
+        self._bot_cache: TTLCache[int, bool] = TTLCache(identity_cache_ttl)
+        self._use_identity_cache = identity_cache_ttl > 0
+        if self._use_identity_cache:
+            self.event_bus.add_listener(self._identities_edited_callback, [EventType.IDENTITIES_EDITED])
+
+    async def _identities_edited_callback(self, event: Event) -> None:
+        self._jwt_cache.clear()
+        self._bot_cache.clear()
+
+    def invalidate_identity_cache(self) -> None:
+        """
+        Clear the cached identities and bots, must be called after each modification
+        of the users, groups, roles or bots.
+
+        The cache of this worker is cleared at once, the cache of the other workers
+        is cleared when they receive the event.
+        """
+        self._jwt_cache.clear()
+        self._bot_cache.clear()
+        if self._use_identity_cache:
+            self.event_bus.push(
+                Event(
+                    type=EventType.IDENTITIES_EDITED,
+                    payload=None,
+                    # Use `NONE` for internal events
+                    permissions=PermissionInfo(public_mode=PublicMode.NONE),
+                )
+            )
 
     def save_group(self, group: Group, params: RequestParameters) -> Group:
         """
@@ -84,7 +121,9 @@ class LoginService:
                 group.id,
                 params.get_user_id(),
             )
-            return self.groups.save(group)
+            saved_group = self.groups.save(group)
+            self.invalidate_identity_cache()
+            return saved_group
         else:
             logger.error(
                 "user %s has not permission to save group",
@@ -107,7 +146,9 @@ class LoginService:
             if self.users.get_by_name(create.name):
                 logger.error("user %s already exist", create.name)
                 raise HTTPException(status_code=400, detail="User already exists")
-            return self.users.save(User(name=create.name, password=Password(create.password)))
+            new_user = self.users.save(User(name=create.name, password=Password(create.password)))
+            self.invalidate_identity_cache()
+            return new_user
         else:
             logger.error("User %s has no permission to create user", param.get_user_id())
             raise UserHasNotPermissionError()
@@ -125,7 +166,9 @@ class LoginService:
         """
         if params.user and any((params.user.is_site_admin(), params.user.is_himself(user))):
             logger.info("user %d saved by user %s", user.id, params.get_user_id())
-            return self.users.save(user)
+            saved_user = self.users.save(user)
+            self.invalidate_identity_cache()
+            return saved_user
         else:
             logger.error(
                 "user %s has not permission to save user %d",
@@ -176,6 +219,7 @@ class LoginService:
                         identity=b,
                     )
                 )
+            self.invalidate_identity_cache()
             logger.info(
                 "bot %s (%d) created by user %s",
                 bot.name,
@@ -218,7 +262,9 @@ class LoginService:
                 role.group_id,
                 params.get_user_id(),
             )
-            return self.roles.save(role_obj)
+            saved_role = self.roles.save(role_obj)
+            self.invalidate_identity_cache()
+            return saved_role
         else:
             logger.error(
                 "user %s, has not permission to create role (user=%d, group=%s)",
@@ -460,7 +506,11 @@ class LoginService:
         Returns: true if bot exist, false else.
 
         """
-        return self.bots.exists(id)
+        exists = self._bot_cache.get(id)
+        if exists is None:
+            exists = self.bots.exists(id)
+            self._bot_cache.put(id, exists)
+        return exists
 
     def authenticate(self, name: str, pwd: str) -> Optional[JWTUser]:
         """
@@ -475,11 +525,15 @@ class LoginService:
         intern: Optional[User] = self.users.get_by_name(name)
         if intern and intern.password.check(pwd):  # type: ignore
             logger.info("successful login from intern user %s", name)
+            # A new login always fetches up-to-date roles from the database
+            self._jwt_cache.invalidate(intern.id)
             return self.get_jwt(intern.id)
 
         extern = self.ldap.login(name, pwd)
         if extern:
             logger.info("successful login from ldap user %s", name)
+            # The LDAP login may have updated the user roles
+            self._jwt_cache.invalidate(extern.id)
             return self.get_jwt(extern.id)
 
         logger.error("wrong authentication from user %s", name)
@@ -495,10 +549,14 @@ class LoginService:
         Returns: jwt data with user information.
 
         """
+        if jwt_user := self._jwt_cache.get(user_id):
+            logger.info("JWT claimed for user=%d (cached)", user_id)
+            return jwt_user.copy(deep=True)
+
         user = self.ldap.get(user_id) or self.users.get(user_id)
         if user:
             logger.info("JWT claimed for user=%d", user_id)
-            return JWTUser(
+            jwt_user = JWTUser(
                 id=user.id,
                 impersonator=user.get_impersonator(),
                 type=user.type,
@@ -506,6 +564,8 @@ class LoginService:
                     JWTGroup(id=r.group.id, name=r.group.name, role=r.type) for r in self.roles.get_all_by_user(user_id)
                 ],
             )
+            self._jwt_cache.put(user_id, jwt_user.copy(deep=True))
+            return jwt_user
 
         logger.error("Can't claim JWT for user=%d", user_id)
         return None
@@ -663,7 +723,8 @@ class LoginService:
                 self.roles.delete(user=role.identity_id, group=role.group_id)
 
             logger.info("group %s deleted by user %s", id, params.get_user_id())
-            return self.groups.delete(id)
+            self.groups.delete(id)
+            self.invalidate_identity_cache()
         else:
             logger.error(
                 "user %s has not permission to delete group %s",
@@ -693,9 +754,10 @@ class LoginService:
 
             user = self.get_user(id, params)
             if isinstance(user, UserLdap):
-                return self.ldap.delete(id)
+                self.ldap.delete(id)
             else:
-                return self.users.delete(id)  # return for test purpose
+                self.users.delete(id)
+            self.invalidate_identity_cache()
 
         else:
             logger.info(
@@ -730,7 +792,8 @@ class LoginService:
             logger.info("bot %d deleted by user %s", id, params.get_user_id())
             for role in self.roles.get_all_by_user(id):
                 self.roles.delete(user=role.identity_id, group=role.group_id)
-            return self.bots.delete(id)
+            self.bots.delete(id)
+            self.invalidate_identity_cache()
         else:
             logger.error(
                 "user %s has not permission to delete bot %d",
@@ -763,7 +826,8 @@ class LoginService:
                 group,
                 params.get_user_id(),
             )
-            return self.roles.delete(user, group)
+            self.roles.delete(user, group)
+            self.invalidate_identity_cache()
         else:
             logger.error(
                 "user %s has not permission to delete role (user=%d, group=%s)",
@@ -795,6 +859,7 @@ class LoginService:
         ):
             for role in roles:
                 self.roles.delete(role.identity_id, role.group_id)
+            self.invalidate_identity_cache()
             return id
         else:
             raise UserHasNotPermissionError()
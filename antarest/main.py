@@ -2,10 +2,12 @@ import argparse
 import copy
 import logging
 import re
+from http import HTTPStatus
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence, Tuple, cast
 
 import pydantic
+import sqlalchemy.exc  # type: ignore
 import uvicorn  # type: ignore
 import uvicorn.config  # type: ignore
 from fastapi import FastAPI, HTTPException
@@ -13,7 +15,6 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi_jwt_auth import AuthJWT  # type: ignore
 from ratelimit import RateLimitMiddleware  # type: ignore
-from ratelimit.backends.redis import RedisBackend  # type: ignore
 from ratelimit.backends.simple import MemoryBackend  # type: ignore
 from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction, RequestResponseEndpoint
 from starlette.middleware.cors import CORSMiddleware
@@ -28,6 +29,7 @@ from antarest.core.config import Config
 from antarest.core.core_blueprint import create_utils_routes
 from antarest.core.filesystem_blueprint import create_file_system_blueprint
 from antarest.core.logging.utils import LoggingMiddleware, configure_logger
+from antarest.core.profiling import Profiler, ProfilerMiddleware
 from antarest.core.requests import RATE_LIMIT_CONFIG
 from antarest.core.swagger import customize_openapi
 from antarest.core.tasks.model import cancel_orphan_tasks
@@ -41,7 +43,14 @@ from antarest.singleton_services import start_all_services
 from antarest.study.storage.auto_archive_service import AutoArchiveService
 from antarest.study.storage.rawstudy.watcher import Watcher
 from antarest.tools.admin_lib import clean_locks
-from antarest.utils import SESSION_ARGS, Module, create_services, init_db_engine
+from antarest.utils import (
+    SESSION_ARGS,
+    Module,
+    create_query_monitor,
+    create_services,
+    init_background_db_engine,
+    init_db_engine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -247,8 +256,15 @@ def fastapi_app(
     )
 
     # Database
+    # The background work has its own connection pool, so that the requests don't wait behind it
     engine = init_db_engine(config_file, config, auto_upgrade_db)
-    application.add_middleware(DBSessionMiddleware, custom_engine=engine, session_args=SESSION_ARGS)
+    application.add_middleware(
+        DBSessionMiddleware,
+        custom_engine=engine,
+        session_args=SESSION_ARGS,
+        query_monitor=create_query_monitor(config),
+        background_engine=init_background_db_engine(config),
+    )
 
     application.add_middleware(LoggingMiddleware)
 
@@ -371,6 +387,28 @@ def fastapi_app(
             status_code=422,
         )
 
+    # noinspection PyUnusedLocal
+    @application.exception_handler(sqlalchemy.exc.TimeoutError)
+    def handle_pool_timeout_error(request: Request, exc: sqlalchemy.exc.TimeoutError) -> Any:
+        """
+        Custom exception handler to return JSON response when no database connection is available.
+
+        Args:
+            request: The incoming request object.
+            exc: The raised exception.
+
+        Returns:
+            The JSON response containing error details.
+        """
+        logger.error("Database pool timeout", exc_info=exc)
+        return JSONResponse(
+            content={
+                "description": f"{exc}",
+                "exception": exc.__class__.__name__,
+            },
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+
     # noinspection PyUnusedLocal
     @application.exception_handler(Exception)
     def handle_all_exception(request: Request, exc: Exception) -> Any:
@@ -395,20 +433,32 @@ def fastapi_app(
 
     # rate limiter
     auth_manager = Auth(config)
+    if config.redis is None:
+        rate_limit_backend = MemoryBackend()
+    else:
+        # Importing the Redis backend (and `aredis`) is slow, it is only done when Redis is configured
+        from ratelimit.backends.redis import RedisBackend  # type: ignore
+
+        rate_limit_backend = RedisBackend(config.redis.host, config.redis.port, 1, config.redis.password)
     application.add_middleware(
         RateLimitMiddleware,
         authenticate=auth_manager.create_auth_function(),
-        backend=(
-            MemoryBackend()
-            if config.redis is None
-            else RedisBackend(config.redis.host, config.redis.port, 1, config.redis.password)
-        ),
+        backend=rate_limit_backend,
         config=RATE_LIMIT_CONFIG,
     )
 
     init_admin_user(engine=engine, session_args=SESSION_ARGS, admin_password=config.security.admin_pwd)
     services = create_services(config, application)
 
+    # The profiler wraps the other middlewares, to profile the whole processing of the requests
+    profiler = Profiler(
+        services["cache"],
+        sampling_ratio=config.server.profiling_sampling_ratio,
+        sampling_interval=config.server.profiling_interval,
+    )
+    profiler.install(engine)
+    application.add_middleware(ProfilerMiddleware, profiler=profiler, auth=auth_manager)
+
     if mount_front:
         # When the web application is running in Desktop mode, the ReactJS web app
         # is served at the `/static` entry point. Any requests that are not API
@@ -59,7 +59,7 @@ class MatrixGarbageCollector(IService):
 
         def transform_to_command(command_dto: CommandDTO, study_ref: str) -> List[ICommand]:
             try:
-                return self.variant_study_service.command_factory.to_command(command_dto)
+                return self.variant_study_service.command_factory.to_command(command_dto, trusted=True)
             except Exception as e:
                 logger.warning(
                     f"Failed to parse command {command_dto} (from study {study_ref}) !",
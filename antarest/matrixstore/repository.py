@@ -1,5 +1,6 @@
 import hashlib
 import logging
+import time
 import typing as t
 from pathlib import Path
 
@@ -9,11 +10,28 @@ from numpy import typing as npt
 from sqlalchemy import exists  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 
+from antarest.core.metrics import REGISTRY
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.matrixstore.model import Matrix, MatrixContent, MatrixData, MatrixDataSet
 
 logger = logging.getLogger(__name__)
 
+MATRIX_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+"""Upper bounds of the buckets of the matrix read and write durations (in seconds)."""
+
+MATRIX_READ_BYTES = REGISTRY.counter("antarest_matrix_store_read_bytes_total", "Size of the matrix files read")
+MATRIX_WRITTEN_BYTES = REGISTRY.counter("antarest_matrix_store_written_bytes_total", "Size of the matrix files written")
+MATRIX_READ_DURATION = REGISTRY.histogram(
+    "antarest_matrix_store_read_seconds",
+    "Duration of the matrix reads from the matrix store",
+    buckets=MATRIX_BUCKETS,
+)
+MATRIX_WRITE_DURATION = REGISTRY.histogram(
+    "antarest_matrix_store_write_seconds",
+    "Duration of the matrix saves in the matrix store (including the ones already stored)",
+    buckets=MATRIX_BUCKETS,
+)
+
 
 class MatrixDataSetRepository:
     """
@@ -148,12 +166,15 @@ class MatrixContentRepository:
             The matrix content or `None` if the file is not found.
         """
 
+        start = time.perf_counter()
         matrix_file = self.bucket_dir.joinpath(f"{matrix_hash}.tsv")
         matrix = np.loadtxt(matrix_file, delimiter="\t", dtype=np.float64, ndmin=2)
         matrix = matrix.reshape((1, 0)) if matrix.size == 0 else matrix
         data = matrix.tolist()
         index = list(range(matrix.shape[0]))
         columns = list(range(matrix.shape[1]))
+        MATRIX_READ_BYTES.inc(matrix_file.stat().st_size)
+        MATRIX_READ_DURATION.observe(time.perf_counter() - start)
         return MatrixContent.construct(data=data, columns=columns, index=index)
 
     def exists(self, matrix_hash: str) -> bool:
@@ -201,7 +222,9 @@ class MatrixContentRepository:
         #    of the floating point numbers which can introduce rounding errors.
         # However, this method is still a good approach to calculate a hash value
         # for a non-mutable NumPy Array.
-        matrix = content if isinstance(content, np.ndarray) else np.array(content, dtype=np.float64)
+        # The hash is computed from the array buffer, which must be C-contiguous (no copy if it already is).
+        start = time.perf_counter()
+        matrix = np.ascontiguousarray(content, dtype=np.float64)
         matrix_hash = hashlib.sha256(matrix.data).hexdigest()
         matrix_file = self.bucket_dir.joinpath(f"{matrix_hash}.tsv")
         # Avoid having to save the matrix again (that's the whole point of using a hash).
@@ -215,12 +238,14 @@ class MatrixContentRepository:
                     open(matrix_file, mode="wb").close()
                 else:
                     np.savetxt(matrix_file, matrix, delimiter="\t", fmt="%.18f")
+            MATRIX_WRITTEN_BYTES.inc(matrix_file.stat().st_size)
 
             # IMPORTANT: Deleting the lock file under Linux can make locking unreliable.
             # See https://github.com/tox-dev/py-filelock/issues/31
             # However, this deletion is possible when the matrix is no longer in use.
             # This is done in `MatrixGarbageCollector` when matrix files are deleted.
 
+        MATRIX_WRITE_DURATION.observe(time.perf_counter() - start)
         return matrix_hash
 
     def delete(self, matrix_hash: str) -> None:
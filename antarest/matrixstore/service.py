@@ -3,14 +3,16 @@ import io
 import json
 import logging
 import tempfile
+import threading
+import time
 import typing as t
 import zipfile
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-import py7zr
 from fastapi import UploadFile
 from numpy import typing as npt
 
@@ -53,9 +55,75 @@ EXCLUDED_FILES = {
 logger = logging.getLogger(__name__)
 
 
+KNOWN_MATRICES_MAX_SIZE = 100_000
+"""
+Maximum number of matrix IDs kept in the in-process index of existing matrices.
+"""
+
+KNOWN_MATRICES_TTL = 60.0
+"""
+Maximum duration (in seconds) during which a matrix is known to exist without any storage lookup.
+
+The matrices are deleted by the `MatrixGarbageCollector` in another process, so the index of
+a `MatrixService` uses a shorter duration if the garbage collector runs more often.
+"""
+
+
+class MatrixIndex:
+    """
+    In-process index of the matrices known to exist, used to avoid storage lookups.
+
+    Only the existing matrices are indexed: a matrix which is not in the index may have been
+    created by another process, so the storage must still be checked. The index is updated when
+    a matrix is created, found or deleted, and the least recently used IDs are evicted
+    when the index is full.
+
+    A matrix may also be deleted by another process (the garbage collector):
+    the IDs expire `ttl` seconds after they are added, so that the storage is checked again.
+
+    Attributes:
+        avoided_lookups: Number of existence checks answered without any storage lookup.
+    """
+
+    def __init__(self, max_size: int = KNOWN_MATRICES_MAX_SIZE, ttl: float = KNOWN_MATRICES_TTL) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.avoided_lookups = 0
+        # Expiration (monotonic) time of the matrix IDs, in least recently used order
+        self._ids: t.OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, matrix_id: object) -> bool:
+        with self._lock:
+            expiration = self._ids.get(matrix_id)  # type: ignore
+            if expiration is None:
+                return False
+            if expiration <= time.monotonic():
+                del self._ids[matrix_id]  # type: ignore
+                return False
+            self._ids.move_to_end(matrix_id)  # type: ignore
+            self.avoided_lookups += 1
+            return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, matrix_id: str) -> None:
+        with self._lock:
+            self._ids[matrix_id] = time.monotonic() + self.ttl
+            self._ids.move_to_end(matrix_id)
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+
+    def discard(self, matrix_id: str) -> None:
+        with self._lock:
+            self._ids.pop(matrix_id, None)
+
+
 class ISimpleMatrixService(ABC):
     def __init__(self, matrix_content_repository: MatrixContentRepository) -> None:
         self.matrix_content_repository = matrix_content_repository
+        self.matrix_index = MatrixIndex()
 
     @abstractmethod
     def create(self, data: t.Union[t.List[t.List[MatrixData]], npt.NDArray[np.float64]]) -> str:
@@ -104,7 +172,9 @@ class SimpleMatrixService(ISimpleMatrixService):
         super().__init__(matrix_content_repository=matrix_content_repository)
 
     def create(self, data: t.Union[t.List[t.List[MatrixData]], npt.NDArray[np.float64]]) -> str:
-        return self.matrix_content_repository.save(data)
+        matrix_id = self.matrix_content_repository.save(data)
+        self.matrix_index.add(matrix_id)
+        return matrix_id
 
     def get(self, matrix_id: str) -> MatrixDTO:
         data = self.matrix_content_repository.get(matrix_id)
@@ -118,9 +188,15 @@ class SimpleMatrixService(ISimpleMatrixService):
         )
 
     def exists(self, matrix_id: str) -> bool:
-        return self.matrix_content_repository.exists(matrix_id)
+        if matrix_id in self.matrix_index:
+            return True
+        found = self.matrix_content_repository.exists(matrix_id)
+        if found:
+            self.matrix_index.add(matrix_id)
+        return found
 
     def delete(self, matrix_id: str) -> None:
+        self.matrix_index.discard(matrix_id)
         self.matrix_content_repository.delete(matrix_id)
 
 
@@ -142,6 +218,9 @@ class MatrixService(ISimpleMatrixService):
         self.file_transfer_manager = file_transfer_manager
         self.task_service = task_service
         self.config = config
+        # The matrices deleted by the garbage collector (in another process) must expire before its next run
+        gc_sleeping_time = config.storage.matrix_gc_sleeping_time
+        self.matrix_index = MatrixIndex(ttl=min(KNOWN_MATRICES_TTL, gc_sleeping_time / 2))
 
     @staticmethod
     def _from_dto(dto: MatrixDTO) -> t.Tuple[Matrix, MatrixContent]:
@@ -191,6 +270,7 @@ class MatrixService(ISimpleMatrixService):
                 created_at=created_at,
             )
             self.repo.save(matrix)
+        self.matrix_index.add(matrix_id)
         return matrix_id
 
     def create_by_importation(self, file: UploadFile, is_json: bool = False) -> t.List[MatrixInfoDTO]:
@@ -225,6 +305,8 @@ class MatrixService(ISimpleMatrixService):
                             matrix_id = self._file_importation(zf.read(info.filename), is_json=is_json)
                             matrix_info.append(MatrixInfoDTO(id=matrix_id, name=info.filename))
                 else:
+                    import py7zr  # slow to import, and rarely needed
+
                     with py7zr.SevenZipFile(buffer, "r") as szf:
                         for info in szf.list():
                             if info.is_directory or info.filename in EXCLUDED_FILES:  # type:ignore
@@ -396,8 +478,17 @@ class MatrixService(ISimpleMatrixService):
 
         Returns:
             bool: `True` if the matrix object exists in both repositories, `False` otherwise.
+
+        Note:
+            The matrices known to exist are kept in `matrix_index`, so that checking
+            the same matrix again does not query the database nor the file system.
         """
-        return self.matrix_content_repository.exists(matrix_id) and self.repo.exists(matrix_id)
+        if matrix_id in self.matrix_index:
+            return True
+        found = self.matrix_content_repository.exists(matrix_id) and self.repo.exists(matrix_id)
+        if found:
+            self.matrix_index.add(matrix_id)
+        return found
 
     def delete(self, matrix_id: str) -> None:
         """
@@ -415,6 +506,7 @@ class MatrixService(ISimpleMatrixService):
         # In the case of a unitary deletion, it is preferable to use a transaction
         # in order to have a rollback in case of failure, and to start with the
         # database deletion and finish with the file deletion (considered as atomic).
+        self.matrix_index.discard(matrix_id)
         with db():
             self.repo.delete(matrix_id)
             with contextlib.suppress(FileNotFoundError):
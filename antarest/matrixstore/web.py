@@ -3,12 +3,13 @@ from pathlib import Path
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Body, Depends, File, UploadFile
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, Response
 
 from antarest.core.config import Config
 from antarest.core.filetransfer.service import FileTransferManager
 from antarest.core.jwt import JWTUser
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
+from antarest.core.serialization import to_json
 from antarest.core.utils.web import APITag
 from antarest.login.auth import Auth
 from antarest.matrixstore.model import MatrixData, MatrixDataSetDTO, MatrixDataSetUpdateDTO, MatrixDTO, MatrixInfoDTO
@@ -62,7 +63,8 @@ def create_matrix_api(service: MatrixService, ftm: FileTransferManager, config:
     def get(id: str, user: JWTUser = Depends(auth.get_current_user)) -> Any:
         logger.info("Fetching matrix", extra={"user": user.id})
         if user.id is not None:
-            return service.get(id)
+            # the matrix is encoded directly: the validation of the response model is too slow for large matrices
+            return Response(content=to_json(service.get(id)), media_type="application/json")
         raise UserHasNotPermissionError()
 
     @bp.post("/matrixdataset", tags=[APITag.matrix], response_model=MatrixDataSetDTO)
@@ -13,24 +13,37 @@ from antarest.utils import (
     Module,
     create_archive_worker,
     create_core_services,
+    create_event_bus,
     create_matrix_gc,
+    create_query_monitor,
     create_simulator_worker,
     create_watcher,
-    init_db_engine,
+    init_background_db_engine,
 )
 
 
 def _init(config_file: Path, services_list: List[Module]) -> Dict[Module, IService]:
     res = get_local_path() / "resources"
     config = Config.from_yaml_file(res=res, file=config_file)
-    engine = init_db_engine(
-        config_file,
-        config,
-        False,
+    # The services of the workers only do background work
+    engine = init_background_db_engine(config)
+    DBSessionMiddleware(
+        None,
+        custom_engine=engine,
+        session_args=cast(Dict[str, bool], SESSION_ARGS),
+        query_monitor=create_query_monitor(config),
     )
-    DBSessionMiddleware(None, custom_engine=engine, session_args=cast(Dict[str, bool], SESSION_ARGS))
     configure_logger(config)
 
+    services: Dict[Module, IService] = {}
+
+    # Building the core services is slow, the archive worker only needs the event bus
+    if set(services_list) <= {Module.ARCHIVE_WORKER}:
+        event_bus, _ = create_event_bus(None, config)
+        if Module.ARCHIVE_WORKER in services_list:
+            services[Module.ARCHIVE_WORKER] = create_archive_worker(config, "test", event_bus=event_bus)
+        return services
+
     (
         cache,
         event_bus,
@@ -41,8 +54,6 @@ def _init(config_file: Path, services_list: List[Module]) -> Dict[Module, IServi
         study_service,
     ) = create_core_services(None, config)
 
-    services: Dict[Module, IService] = {}
-
     if Module.WATCHER in services_list:
         watcher = create_watcher(config=config, application=None, study_service=study_service)
         services[Module.WATCHER] = watcher
@@ -3,7 +3,7 @@ Management of spatial correlations between the different generators.
 The generators are of the same category and can be hydraulic, wind, load or solar.
 """
 import collections
-from typing import Dict, List, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -15,7 +15,7 @@ from antarest.study.business.utils import FormFieldsBaseModel, execute_or_add_co
 from antarest.study.model import Study
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.storage_service import StudyStorageService
-from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_correlation import UpdateCorrelation
 
 
 class AreaCoefficientItem(FormFieldsBaseModel):
@@ -54,7 +54,7 @@ class CorrelationFormFields(FormFieldsBaseModel):
             raise ValueError(f"correlation must not contain duplicate area IDs: {duplicates}")
 
         array = np.array([a.coefficient for a in correlation], dtype=np.float64)
-        if np.any((array < -100) | np.any(array > 100)):
+        if np.any((array < -100) | (array > 100)):
             raise ValueError("percentage must be between -100 and 100")
         if np.any(np.isnan(array)):
             raise ValueError("correlation matrix must not contain NaN coefficients")
@@ -107,7 +107,7 @@ class CorrelationMatrix(FormFieldsBaseModel):
             raise ValueError("correlation matrix must not be empty")
         if array.shape != (rows, cols):
             raise ValueError(f"correlation matrix must have shape ({rows}×{cols})")
-        if np.any((array < -1) | np.any(array > 1)):
+        if np.any((array < -1) | (array > 1)):
             raise ValueError("coefficients must be between -1 and 1")
         if np.any(np.isnan(array)):
             raise ValueError("correlation matrix must not contain NaN coefficients")
@@ -131,41 +131,102 @@ class CorrelationMatrix(FormFieldsBaseModel):
         }
 
 
-def _config_to_array(
-    area_ids: Sequence[str],
-    correlation_cfg: Dict[str, str],
-) -> npt.NDArray[np.float64]:
-    array = np.identity(len(area_ids), dtype=np.float64)
-    for key, value in correlation_cfg.items():
-        a1, a2 = key.split("%")
-        i = area_ids.index(a1)
-        j = area_ids.index(a2)
+class _SparseCorrelation:
+    """
+    Sparse representation of a (symmetric) correlation matrix.
+
+    Only the non-null coefficients outside the diagonal are stored (the diagonal is always == 1.0),
+    as a mapping of the neighbors of each area. The updated coefficients are recorded,
+    so that only the modified pairs of areas are written back to the configuration.
+    """
+
+    def __init__(self, area_ids: Sequence[str], correlation_cfg: Mapping[str, Any]) -> None:
+        self.area_ids = list(area_ids)
+        self.positions = {area_id: i for i, area_id in enumerate(self.area_ids)}
+        self.neighbors: Dict[int, Dict[int, float]] = collections.defaultdict(dict)
+        self.keys: Dict[Tuple[int, int], str] = {}  # keys of the pairs in the configuration
+        self.changes: Dict[Tuple[int, int], float] = {}
+        for key, value in correlation_cfg.items():
+            a1, a2 = key.split("%")
+            i = self.positions.get(a1)
+            j = self.positions.get(a2)
+            if i is None or j is None or i == j:
+                # ignored: unknown areas and values from the diagonal (always == 1.0)
+                continue
+            coefficient = float(value)
+            if coefficient:
+                self.neighbors[i][j] = self.neighbors[j][i] = coefficient
+                self.keys[(min(i, j), max(i, j))] = key
+
+    def get_positions(self, area_ids: Sequence[str]) -> npt.NDArray[np.int_]:
+        """
+        Get the positions of the given areas in the matrix.
+
+        Raises:
+            AreaNotFound: if some areas are not found.
+        """
+        if missing := set(area_ids) - self.positions.keys():
+            # sort for deterministic error message and testing
+            raise AreaNotFound(*sorted(missing))
+        return np.array([self.positions[area_id] for area_id in area_ids], dtype=np.int_)
+
+    def get_column(self, j: int) -> npt.NDArray[np.float64]:
+        column = np.zeros(len(self.area_ids), dtype=np.float64)
+        column[j] = 1.0
+        neighbors = self.neighbors.get(j, {})
+        column[list(neighbors)] = list(neighbors.values())
+        return column
+
+    def to_array(
+        self,
+        rows: npt.NDArray[np.int_],
+        cols: npt.NDArray[np.int_],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Extract a dense block of the matrix, given the positions of its rows and columns.
+        """
+        count = len(self.area_ids)
+        row_indices = np.full(count, -1, dtype=np.int_)
+        row_indices[rows] = np.arange(len(rows))
+        col_indices = np.full(count, -1, dtype=np.int_)
+        col_indices[cols] = np.arange(len(cols))
+
+        array = np.zeros((len(rows), len(cols)), dtype=np.float64)
+        diagonal = np.intersect1d(rows, cols)
+        array[row_indices[diagonal], col_indices[diagonal]] = 1.0
+
+        nnz = sum(len(neighbors) for neighbors in self.neighbors.values())
+        pairs = np.fromiter(
+            (k for i, neighbors in self.neighbors.items() for j, c in neighbors.items() for k in (i, j, c)),
+            dtype=np.float64,
+            count=3 * nnz,
+        ).reshape(nnz, 3)
+        i, j = pairs[:, 0].astype(np.int_), pairs[:, 1].astype(np.int_)
+        mask = (row_indices[i] >= 0) & (col_indices[j] >= 0)
+        array[row_indices[i[mask]], col_indices[j[mask]]] = pairs[mask, 2]
+        return array
+
+    def set(self, i: int, j: int, coefficient: float) -> None:
         if i == j:
             # ignored: values from the diagonal are always == 1.0
-            continue
-        coefficient = value
-        array[i][j] = coefficient
-        array[j][i] = coefficient
-    return array
-
-
-def _array_to_config(
-    area_ids: Sequence[str],
-    array: npt.NDArray[np.float64],
-) -> Dict[str, str]:
-    correlation_cfg: Dict[str, str] = {}
-    count = len(area_ids)
-    for i in range(count):
-        # not saved: values from the diagonal are always == 1.0
-        for j in range(i + 1, count):
-            coefficient = array[i][j]
-            if not coefficient:
-                # null values are not saved
-                continue
-            a1 = area_ids[i]
-            a2 = area_ids[j]
-            correlation_cfg[f"{a1}%{a2}"] = coefficient
-    return correlation_cfg
+            return
+        if self.neighbors[i].get(j, 0.0) == coefficient:
+            return
+        if coefficient:
+            self.neighbors[i][j] = self.neighbors[j][i] = coefficient
+        else:
+            del self.neighbors[i][j], self.neighbors[j][i]
+        self.changes[(min(i, j), max(i, j))] = coefficient
+
+    def get_delta(self) -> Dict[str, Optional[float]]:
+        """
+        Get the coefficients of the modified pairs of areas (a null coefficient must be removed).
+        """
+        delta: Dict[str, Optional[float]] = {}
+        for (i, j), coefficient in self.changes.items():
+            key = self.keys.get((i, j)) or f"{self.area_ids[i]}%{self.area_ids[j]}"
+            delta[key] = coefficient or None
+        return delta
 
 
 class CorrelationManager:
@@ -182,26 +243,27 @@ class CorrelationManager:
     def __init__(self, storage_service: StudyStorageService) -> None:
         self.storage_service = storage_service
 
-    def _get_array(
+    def _get_correlation(
         self,
         file_study: FileStudy,
         area_ids: Sequence[str],
-    ) -> npt.NDArray[np.float64]:
+    ) -> _SparseCorrelation:
         correlation_cfg = file_study.tree.get(self.url, depth=3)
-        return _config_to_array(area_ids, correlation_cfg)
+        return _SparseCorrelation(area_ids, correlation_cfg)
 
-    def _set_array(
+    def _save_changes(
         self,
         study: Study,
         file_study: FileStudy,
-        area_ids: Sequence[str],
-        array: npt.NDArray[np.float64],
+        correlation: _SparseCorrelation,
     ) -> None:
-        correlation_cfg = _array_to_config(area_ids, array)
+        delta = correlation.get_delta()
+        if not delta:
+            return
         command_context = self.storage_service.variant_study_service.command_factory.command_context
-        command = UpdateConfig(
+        command = UpdateCorrelation(
             target="/".join(self.url),
-            data=correlation_cfg,
+            data=delta,
             command_context=command_context,
         )
         execute_or_add_commands(study, file_study, [command], self.storage_service)
@@ -217,25 +279,28 @@ class CorrelationManager:
             study: study to get the correlation coefficients from.
             area_id: area to get the correlation coefficients from.
 
+        Raises:
+            AreaNotFound: if the area is not found.
+
         Returns:
             The correlation coefficients.
         """
         file_study = self.storage_service.get_storage(study).get_raw(study)
 
         area_ids = [area.id for area in all_areas]
-        array = self._get_array(file_study, area_ids)
-        column = array[:, area_ids.index(area_id)] * 100
+        correlation = self._get_correlation(file_study, area_ids)
+        (j,) = correlation.get_positions([area_id])
+        column = correlation.get_column(j) * 100
 
         correlation_field = [
-            AreaCoefficientItem.construct(area_id=a, coefficient=c)
-            for a, c in zip(area_ids, column)
-            if a != area_id and c
+            AreaCoefficientItem.construct(area_id=area_ids[i], coefficient=column[i])
+            for i in np.flatnonzero(column)
+            if i != j
         ]
 
-        current_area_coefficient = column[area_ids.index(area_id)]
         correlation_field.insert(
             0,
-            AreaCoefficientItem.construct(area_id=area_id, coefficient=current_area_coefficient),
+            AreaCoefficientItem.construct(area_id=area_id, coefficient=column[j]),
         )
 
         return CorrelationFormFields.construct(correlation=correlation_field)
@@ -250,6 +315,8 @@ class CorrelationManager:
         """
         Set the correlation coefficients of a given area from the form fields (percentage values).
 
+        The coefficients of the areas which are not in the form fields are reset to zero.
+
         Args:
             all_areas: list of all areas in the study.
             study: study to set the correlation coefficients to.
@@ -263,24 +330,25 @@ class CorrelationManager:
             The updated correlation coefficients.
         """
         area_ids = [area.id for area in all_areas]
-        correlation_values = collections.OrderedDict.fromkeys(area_ids, 0.0)
-        correlation_values.update({field.area_id: field.coefficient for field in data.correlation})
-
-        if invalid_ids := set(correlation_values) - set(area_ids):
-            # sort for deterministic error message and testing
-            raise AreaNotFound(*sorted(invalid_ids))
-
         file_study = self.storage_service.get_storage(study).get_raw(study)
-        array = self._get_array(file_study, area_ids)
-        j = area_ids.index(area_id)
-        for i, coefficient in enumerate(correlation_values.values()):
-            array[i][j] = coefficient / 100
-            array[j][i] = coefficient / 100
-        self._set_array(study, file_study, area_ids, array)
-
-        column = array[:, area_ids.index(area_id)] * 100
+        correlation = self._get_correlation(file_study, area_ids)
+
+        (j,) = correlation.get_positions([area_id])
+        positions = correlation.get_positions([field.area_id for field in data.correlation])
+        coefficients = np.array([field.coefficient for field in data.correlation], dtype=np.float64) / 100
+        # only the current neighbors of the area can be reset
+        for i in set(correlation.neighbors.get(j, {})) - set(positions.tolist()):
+            correlation.set(i, j, 0.0)
+        for i, coefficient in zip(positions.tolist(), coefficients.tolist()):
+            correlation.set(i, j, coefficient)
+        self._save_changes(study, file_study, correlation)
+
+        column = correlation.get_column(j) * 100
         return CorrelationFormFields.construct(
-            correlation=[AreaCoefficientItem.construct(area_id=a, coefficient=c) for a, c in zip(area_ids, column) if c]
+            correlation=[
+                AreaCoefficientItem.construct(area_id=area_ids[i], coefficient=column[i])
+                for i in np.flatnonzero(column)
+            ]
         )
 
     def get_correlation_matrix(
@@ -300,11 +368,10 @@ class CorrelationManager:
         file_study = self.storage_service.get_storage(study).get_raw(study)
         area_ids = [area.id for area in all_areas]
         columns = [a for a in area_ids if a in columns] if columns else area_ids
-        array = self._get_array(file_study, area_ids)
-        # noinspection PyTypeChecker
-        data = [[c for i, c in enumerate(row) if area_ids[i] in columns] for row in array.tolist()]
+        correlation = self._get_correlation(file_study, area_ids)
+        array = correlation.to_array(np.arange(len(area_ids)), correlation.get_positions(columns))
 
-        return CorrelationMatrix.construct(index=area_ids, columns=columns, data=data)
+        return CorrelationMatrix.construct(index=area_ids, columns=columns, data=array.tolist())
 
     def set_correlation_matrix(
         self,
@@ -315,31 +382,39 @@ class CorrelationManager:
         """
         Set the correlation coefficients from the coefficient matrix (values in the range -1 to 1).
 
+        Only the modified coefficients are saved.
+
         Args:
             all_areas: list of all areas in the study.
             study: study to get the correlation matrix from.
             matrix: correlation matrix to update
 
+        Raises:
+            AreaNotFound: if an area of the matrix is not found.
+
         Returns:
             The updated correlation matrix.
         """
         file_study = self.storage_service.get_storage(study).get_raw(study)
         area_ids = [area.id for area in all_areas]
-
-        array = self._get_array(file_study, area_ids)
-
-        for row, a1 in zip(matrix.data, matrix.index):
-            for coefficient, a2 in zip(row, matrix.columns):
-                if missing := {a1, a2} - set(area_ids):
-                    raise AreaNotFound(*missing)
-                i = area_ids.index(a1)
-                j = area_ids.index(a2)
-                array[i][j] = coefficient
-                array[j][i] = coefficient
-
-        self._set_array(study, file_study, area_ids, array)
-
-        # noinspection PyTypeChecker
-        data = [[c for i, c in enumerate(row) if area_ids[i] in matrix.columns] for row in array.tolist()]
-
-        return CorrelationMatrix.construct(index=area_ids, columns=matrix.columns, data=data)
+        correlation = self._get_correlation(file_study, area_ids)
+
+        rows = correlation.get_positions(matrix.index)
+        cols = correlation.get_positions(matrix.columns)
+        array = np.array(matrix.data, dtype=np.float64).reshape(len(rows), len(cols))
+
+        # Each cell sets a pair of areas: when a pair is set twice, the last cell wins.
+        i, j = (a.ravel() for a in np.meshgrid(rows, cols, indexing="ij"))
+        coefficients = array.ravel()
+        pairs = np.minimum(i, j) * len(area_ids) + np.maximum(i, j)
+        _, last = np.unique(pairs[::-1], return_index=True)
+        cells = pairs.size - 1 - last
+        current = correlation.to_array(rows, cols).ravel()
+        changed = cells[current[cells] != coefficients[cells]]
+        for args in zip(i[changed].tolist(), j[changed].tolist(), coefficients[changed].tolist()):
+            correlation.set(*args)
+        self._save_changes(study, file_study, correlation)
+
+        columns = [a for a in area_ids if a in matrix.columns]
+        data = correlation.to_array(np.arange(len(area_ids)), correlation.get_positions(columns))
+        return CorrelationMatrix.construct(index=area_ids, columns=columns, data=data.tolist())
@@ -1,9 +1,10 @@
 import itertools
 import logging
 import operator
-from typing import List, Tuple, cast
+from typing import Dict, List, Tuple, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from antarest.matrixstore.matrix_editor import MatrixEditInstruction, MatrixSlice, Operation
@@ -46,26 +47,101 @@ class MatrixIndexError(MatrixUpdateError):
         super().__init__(operation, reason)
 
 
-def update_matrix_content_with_slices(
-    matrix_data: pd.DataFrame,
+_UFUNCS: Dict[str, np.ufunc] = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.divide,
+}
+
+
+def apply_operation_on_slices(
+    matrix: npt.NDArray[np.float64],
     slices: List[MatrixSlice],
     operation: Operation,
-) -> pd.DataFrame:
-    mask = pd.DataFrame(np.zeros(matrix_data.shape), dtype=bool)
+) -> None:
+    """
+    Apply an operation, in place, on the cells of a matrix selected by a list of slices.
 
-    for matrix_slice in slices:
-        # note: the `.loc` attribute doesn't raise `IndexError`
-        mask.loc[
-            matrix_slice.row_from : matrix_slice.row_to,
-            matrix_slice.column_from : matrix_slice.column_to,
-        ] = True
+    The slice bounds are inclusive and out-of-bounds slices are clipped to the matrix shape.
+    A cell covered by several slices is updated only once. NaN cells are left unchanged.
 
-    # noinspection PyTypeChecker
-    new_matrix_data = matrix_data.where(mask).apply(operation.compute)
-    new_matrix_data[new_matrix_data.isnull()] = matrix_data
+    Args:
+        matrix: The matrix to update (modified in place).
+        slices: The list of slices to update.
+        operation: The operation to apply on the selected cells.
+    """
+    selections = [(slice(s.row_from, s.row_to + 1), slice(s.column_from, s.column_to + 1)) for s in slices]
+    if len(selections) == 1:
+        # Most common case: the operation is applied on a view of the matrix, without copy.
+        _apply_operation(matrix[selections[0]], operation)
+    elif selections:
+        # Overlapping slices must be updated once: use a mask instead of views.
+        mask = np.zeros(matrix.shape, dtype=bool)
+        for selection in selections:
+            mask[selection] = True
+        values = matrix[mask]
+        _apply_operation(values, operation)
+        matrix[mask] = values
+
+
+def _apply_operation(values: npt.NDArray[np.float64], operation: Operation) -> None:
+    if operation.operation == "=":
+        values[~np.isnan(values)] = operation.value
+    elif operation.operation == "ABS":
+        np.abs(values, out=values)
+    else:
+        _UFUNCS[operation.operation](values, operation.value, out=values)
+
+
+def apply_operation_on_coordinates(
+    matrix: npt.NDArray[np.float64],
+    coordinates: List[Tuple[int, int]],
+    operation: Operation,
+) -> None:
+    """
+    Apply an operation, in place, on the cells of a matrix selected by their coordinates.
+
+    Unlike slices, the "=" operation also updates the NaN cells.
+    A cell given several times is updated several times (for instance, "+" is applied twice).
 
+    Args:
+        matrix: The matrix to update (modified in place).
+        coordinates: The list of (row, column) coordinates of the cells.
+        operation: The operation to apply on the selected cells.
+
+    Raises:
+        MatrixIndexError: If a coordinate is outside the matrix.
+    """
+    if not coordinates:
+        return
+    rows, columns = np.array(coordinates, dtype=np.int64).reshape(-1, 2).T
+    height, width = matrix.shape
+    invalid = (rows < -height) | (rows >= height) | (columns < -width) | (columns >= width)
+    if invalid.any():
+        index = int(np.argmax(invalid))
+        cell = (int(rows[index]), int(columns[index]))
+        exc = IndexError(f"index {cell} is out of bounds for matrix of shape {matrix.shape}")
+        raise MatrixIndexError(operation, cell, exc)
+    if operation.operation == "=":
+        matrix[rows, columns] = operation.value
+    elif operation.operation == "ABS":
+        matrix[rows, columns] = np.abs(matrix[rows, columns])
+    else:
+        # Unbuffered operation: duplicated cells are updated several times
+        _UFUNCS[operation.operation].at(matrix, (rows, columns), operation.value)
+
+
+def update_matrix_content_with_slices(
+    matrix_data: pd.DataFrame,
+    slices: List[MatrixSlice],
+    operation: Operation,
+) -> pd.DataFrame:
+    matrix = matrix_data.to_numpy(dtype=np.float64, copy=True)
+    apply_operation_on_slices(matrix, slices, operation)
+    new_matrix_data = pd.DataFrame(matrix, index=matrix_data.index, columns=matrix_data.columns)
     # noinspection PyTypeChecker
-    return cast(pd.DataFrame, new_matrix_data.astype(matrix_data.dtypes))
+    return new_matrix_data.astype(dict(matrix_data.dtypes))
 
 
 def update_matrix_content_with_coordinates(
@@ -73,13 +149,11 @@ def update_matrix_content_with_coordinates(
     coordinates: List[Tuple[int, int]],
     operation: Operation,
 ) -> pd.DataFrame:
-    for row, column in coordinates:
-        try:
-            df.iat[row, column] = operation.compute(df.iat[row, column], use_coords=True)
-        except IndexError as exc:
-            raise MatrixIndexError(operation, (row, column), exc) from None
+    matrix = df.to_numpy(dtype=np.float64, copy=True)
+    apply_operation_on_coordinates(matrix, coordinates, operation)
+    new_df = pd.DataFrame(matrix, index=df.index, columns=df.columns)
     # noinspection PyTypeChecker
-    return df.astype(dict(df.dtypes))
+    return new_df.astype(dict(df.dtypes))
 
 
 def group_by_slices(cells: List[Tuple[int, int]]) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
@@ -247,6 +321,11 @@ class MatrixManager:
         except ValueError as exc:
             raise MatrixManagerError(f"Cannot parse matrix: {exc}") from exc
 
+        # The matrix is edited in place: a C-contiguous array is required
+        # to compute the matrix hash directly from its buffer.
+        matrix = np.ascontiguousarray(matrix_df.to_numpy(dtype=np.float64))
+        del matrix_df
+
         logger.info(f"Merging {len(edit_instructions)} instructions...")
         edit_instructions = merge_edit_instructions(edit_instructions)
 
@@ -254,17 +333,9 @@ class MatrixManager:
         for instr in edit_instructions:
             try:
                 if instr.slices:
-                    matrix_df = update_matrix_content_with_slices(
-                        matrix_data=matrix_df,
-                        slices=instr.slices,
-                        operation=instr.operation,
-                    )
+                    apply_operation_on_slices(matrix, instr.slices, instr.operation)
                 elif instr.coordinates:
-                    matrix_df = update_matrix_content_with_coordinates(
-                        df=matrix_df,
-                        coordinates=instr.coordinates,
-                        operation=instr.operation,
-                    )
+                    apply_operation_on_coordinates(matrix, instr.coordinates, instr.operation)
                 else:  # pragma: no cover
                     raise MatrixEditError(
                         instr,
@@ -273,8 +344,8 @@ class MatrixManager:
             except MatrixUpdateError as exc:
                 raise MatrixEditError(instr, reason=str(exc)) from None
 
-        logger.info(f"Writing matrix data of shape {matrix_df.shape}...")
-        new_matrix_id = matrix_service.create(matrix_df.to_numpy().tolist())
+        logger.info(f"Writing matrix data of shape {matrix.shape}...")
+        new_matrix_id = matrix_service.create(matrix)
 
         logger.info(f"Preparing 'ReplaceMatrix' command for path '{path}'...")
         command = [
@@ -2,6 +2,7 @@ import enum
 import typing as t
 
 import typing_extensions as te
+from requests.structures import CaseInsensitiveDict
 
 from antarest.study.business.utils import execute_or_add_commands
 from antarest.study.model import Study
@@ -183,7 +184,8 @@ class ScenarioBuilderManager:
 
         sections: _Sections = {}
         for ruleset_name, ruleset in rulesets.items():
-            section = sections[ruleset_name] = {}
+            section: _Section = {}
+            sections[ruleset_name] = section
             for symbol, data in ruleset.items():
                 if symbol in _AREA_RELATED_SYMBOLS:
                     _populate_common(section, symbol, data)
@@ -196,6 +198,18 @@ class ScenarioBuilderManager:
                 else:  # pragma: no cover
                     raise NotImplementedError(f"Unknown symbol {symbol}")
 
+        # Only the modified rules are saved (an empty section removes the ruleset)
+        current_sections = CaseInsensitiveDict(file_study.tree.get(["settings", "scenariobuilder"]))
+        for ruleset_name, section in list(sections.items()):
+            current_section = current_sections.get(ruleset_name, {})
+            changes: _Section = {key: value for key, value in section.items() if current_section.get(key) != value}
+            if changes:
+                sections[ruleset_name] = changes
+            elif section:
+                del sections[ruleset_name]
+        if not sections:
+            return
+
         context = self.storage_service.variant_study_service.command_factory.command_context
         execute_or_add_commands(
             study,
@@ -215,17 +229,18 @@ class ScenarioBuilderManager:
         return table_form
 
     def update_scenario_by_type(self, study: Study, table_form: TableForm, scenario_type: ScenarioType) -> TableForm:
+        symbol = SYMBOLS_BY_SCENARIO_TYPES[scenario_type]
         file_study = self.storage_service.get_storage(study).get_raw(study)
-        ruleset = _build_ruleset(file_study)
-        ruleset.update_table_form(table_form, str(scenario_type), nan_value="")
+        ruleset = _build_ruleset(file_study, symbol)
+        rules = ruleset.update_table_form(table_form, str(scenario_type), nan_value="")
         ruleset.sort_scenarios()
 
-        # Create the UpdateScenarioBuilder command
-        ruleset_name = _get_active_ruleset_name(file_study)
-        data = {ruleset_name: ruleset.get_rules(allow_nan=True)}
-        command_context = self.storage_service.variant_study_service.command_factory.command_context
-        update_scenario = UpdateScenarioBuilder(data=data, command_context=command_context)
-        execute_or_add_commands(study, file_study, [update_scenario], self.storage_service)
+        # Create the UpdateScenarioBuilder command, with the modified rules only
+        if rules:
+            ruleset_name = _get_active_ruleset_name(file_study)
+            command_context = self.storage_service.variant_study_service.command_factory.command_context
+            update_scenario = UpdateScenarioBuilder(data={ruleset_name: rules}, command_context=command_context)
+            execute_or_add_commands(study, file_study, [update_scenario], self.storage_service)
 
         # Extract the updated table form for the given scenario type
         table_form = ruleset.get_table_form(str(scenario_type), nan_value="")
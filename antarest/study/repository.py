@@ -122,10 +122,12 @@ class StudyPagination(BaseModel, frozen=True, extra="forbid"):
     Attributes:
         page_nb: offset
         page_size: SQL limit
+        after: ID of the last study of the previous page (keyset pagination), if set `page_nb` is ignored
     """
 
     page_nb: NonNegativeInt = 0
     page_size: NonNegativeInt = 0
+    after: str = ""
 
 
 class StudyMetadataRepository:
@@ -232,40 +234,58 @@ class StudyMetadataRepository:
         Returns:
             The matching studies in proper order and pagination.
         """
-        # When we fetch a study, we also need to fetch the associated owner and groups
-        # to check the permissions of the current user efficiently.
-        # We also need to fetch the additional data to display the study information
-        # efficiently (see: `AbstractStorageService.get_study_information`)
         entity = with_polymorphic(Study, "*")
 
-        q = self._search_studies(study_filter)
+        q = self._search_studies(study_filter, entity)
 
         # sorting
-        if sort_by:
-            if sort_by == StudySortBy.DATE_DESC:
-                q = q.order_by(entity.created_at.desc())
-            elif sort_by == StudySortBy.DATE_ASC:
-                q = q.order_by(entity.created_at.asc())
-            elif sort_by == StudySortBy.NAME_DESC:
-                q = q.order_by(func.upper(entity.name).desc())
-            elif sort_by == StudySortBy.NAME_ASC:
-                q = q.order_by(func.upper(entity.name).asc())
+        if sort_by == StudySortBy.DATE_DESC:
+            sort_key, descending = entity.created_at, True
+        elif sort_by == StudySortBy.DATE_ASC:
+            sort_key, descending = entity.created_at, False
+        elif sort_by == StudySortBy.NAME_DESC:
+            sort_key, descending = func.upper(entity.name), True
+        elif sort_by == StudySortBy.NAME_ASC:
+            sort_key, descending = func.upper(entity.name), False
+        elif sort_by is None:
+            sort_key, descending = entity.name, False
+        else:
+            raise NotImplementedError(sort_by)
+
+        paginated = bool(pagination.page_nb or pagination.page_size or pagination.after)
+        if sort_by or paginated:
+            # The study ID is used as a tiebreaker to have a stable order, required by the keyset pagination.
+            if descending:
+                q = q.order_by(sort_key.desc(), entity.id.desc())
             else:
-                raise NotImplementedError(sort_by)
+                q = q.order_by(sort_key.asc(), entity.id.asc())
 
         # pagination
-        if pagination.page_nb or pagination.page_size:
-            limit = pagination.page_size
-            offset = pagination.page_nb * pagination.page_size
-            end = offset + limit
-            if sort_by is None:
-                q = q.order_by(entity.name.asc())
-            if study_filter.groups or study_filter.tags:
-                studies: t.Sequence[Study] = q.all()[offset:end]
-                return studies
-            q = q.offset(offset).limit(limit)
-
-        studies = q.all()
+        if pagination.after:
+            # keyset pagination: studies located after the given study in the sort order
+            after_key = self.session.query(sort_key).filter(entity.id == pagination.after).scalar_subquery()
+            if descending:
+                q = q.filter(or_(sort_key < after_key, and_(sort_key == after_key, entity.id < pagination.after)))
+            else:
+                q = q.filter(or_(sort_key > after_key, and_(sort_key == after_key, entity.id > pagination.after)))
+        elif pagination.page_nb or pagination.page_size:
+            q = q.offset(pagination.page_nb * pagination.page_size)
+        if pagination.page_size:
+            q = q.limit(pagination.page_size)
+
+        # When we fetch a study, we also need to fetch the associated owner and groups
+        # to check the permissions of the current user efficiently.
+        # We also need to fetch the additional data to display the study information
+        # efficiently (see: `AbstractStorageService.get_study_information`).
+        # Note: when the query is paginated, SQLAlchemy applies the LIMIT/OFFSET in a subquery
+        # and joins the related tables to this subquery, so that only the relations of
+        # the studies of the current page are fetched.
+        q = q.options(joinedload(entity.owner))
+        q = q.options(joinedload(entity.groups))
+        q = q.options(joinedload(entity.tags))
+        q = q.options(joinedload(entity.additional_data))
+
+        studies: t.Sequence[Study] = q.all()
         return studies
 
     def count_studies(self, study_filter: StudyFilter = StudyFilter()) -> int:
@@ -278,7 +298,9 @@ class StudyMetadataRepository:
         Returns:
             Integer, corresponding to total number of studies matching with specified filters.
         """
-        q = self._search_studies(study_filter)
+        entity = with_polymorphic(Study, "*")
+
+        q = self._search_studies(study_filter, entity)
 
         total: int = q.count()
 
@@ -287,22 +309,22 @@ class StudyMetadataRepository:
     def _search_studies(
         self,
         study_filter: StudyFilter,
+        entity: t.Any,
     ) -> Query:
         """
         Build a `SQL Query` based on specified filters.
 
+        The filters on the groups and tags are expressed with `EXISTS` subqueries
+        (instead of joins), so that each matching study appears only once in the results:
+        the pagination and the counting can therefore be done by the database.
+
         Args:
             study_filter: composed of all filtering criteria.
+            entity: polymorphic `Study` entity to query (see `with_polymorphic`).
 
         Returns:
             The `Query` corresponding to specified criteria (except for permissions).
         """
-        # When we fetch a study, we also need to fetch the associated owner and groups
-        # to check the permissions of the current user efficiently.
-        # We also need to fetch the additional data to display the study information
-        # efficiently (see: `AbstractStorageService.get_study_information`)
-        entity = with_polymorphic(Study, "*")
-
         # noinspection PyTypeChecker
         q = self.session.query(entity)
         if study_filter.exists is not None:
@@ -311,11 +333,6 @@ class StudyMetadataRepository:
             else:
                 q = q.filter(not_(RawStudy.missing.is_(None)))
 
-        q = q.options(joinedload(entity.owner))
-        q = q.options(joinedload(entity.groups))
-        q = q.options(joinedload(entity.tags))
-        q = q.options(joinedload(entity.additional_data))
-
         if study_filter.managed is not None:
             if study_filter.managed:
                 q = q.filter(or_(entity.type == "variantstudy", RawStudy.workspace == DEFAULT_WORKSPACE_NAME))
@@ -328,7 +345,7 @@ class StudyMetadataRepository:
             q = q.filter(entity.owner_id.in_(study_filter.users))
         if study_filter.tags:
             upper_tags = [tag.upper() for tag in study_filter.tags]
-            q = q.join(entity.tags).filter(func.upper(Tag.label).in_(upper_tags))
+            q = q.filter(entity.tags.any(func.upper(Tag.label).in_(upper_tags)))
         if study_filter.archived is not None:
             q = q.filter(entity.archived == study_filter.archived)
         if study_filter.name:
@@ -351,21 +368,16 @@ class StudyMetadataRepository:
         if not study_filter.access_permissions.is_admin and study_filter.access_permissions.user_id is not None:
             condition_1 = entity.public_mode != PublicMode.NONE
             condition_2 = entity.owner_id == study_filter.access_permissions.user_id
-            q1 = q.join(entity.groups).filter(Group.id.in_(study_filter.access_permissions.user_groups))
+            condition_3 = entity.groups.any(Group.id.in_(study_filter.access_permissions.user_groups))
+            q = q.filter(or_(condition_1, condition_2, condition_3))
             if study_filter.groups:
-                q2 = q.join(entity.groups).filter(Group.id.in_(study_filter.groups))
-                q2 = q1.intersect(q2)
-                q = q2.union(
-                    q.join(entity.groups).filter(and_(or_(condition_1, condition_2), Group.id.in_(study_filter.groups)))
-                )
-            else:
-                q = q1.union(q.filter(or_(condition_1, condition_2)))
+                q = q.filter(entity.groups.any(Group.id.in_(study_filter.groups)))
         elif not study_filter.access_permissions.is_admin and study_filter.access_permissions.user_id is None:
             # return empty result
             # noinspection PyTypeChecker
             q = self.session.query(entity).filter(sql.false())
         elif study_filter.groups:
-            q = q.join(entity.groups).filter(Group.id.in_(study_filter.groups))
+            q = q.filter(entity.groups.any(Group.id.in_(study_filter.groups)))
 
         return q
 
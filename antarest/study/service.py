@@ -1,6 +1,7 @@
 import base64
 import collections
 import contextlib
+import hashlib
 import http
 import io
 import json
@@ -40,8 +41,9 @@ from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
 from antarest.core.jwt import DEFAULT_ADMIN_USER, JWTGroup, JWTUser
 from antarest.core.model import JSON, SUB_JSON, PermissionInfo, PublicMode, StudyPermissionType
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
+from antarest.core.serialization import to_json
 from antarest.core.tasks.model import TaskListFilter, TaskResult, TaskStatus, TaskType
-from antarest.core.tasks.service import ITaskService, TaskUpdateNotifier, noop_notifier
+from antarest.core.tasks.service import ITaskService, Task, TaskUpdateNotifier, noop_notifier
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.core.utils.utils import StopWatch
 from antarest.login.model import Group
@@ -981,9 +983,13 @@ class StudyService:
 
         logger.info("Exporting study %s", uuid)
         export_name = f"Study {study.name} ({uuid}) export"
-        export_file_download = self.file_transfer_manager.request_download(
-            f"{study.name}-{uuid}.zip", export_name, params.user
+        export_key = self._get_export_key(study, "study", outputs, outputs and self._get_output_signature(study))
+        # The studies of the external workspaces can be edited on disk, without updating their modification date
+        export_file_download, task_id = self.file_transfer_manager.request_export(
+            export_key, f"{study.name}-{uuid}.zip", export_name, params.user, use_cache=is_managed(study)
         )
+        if task_id is not None:
+            return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
         export_path = Path(export_file_download.path)
         export_id = export_file_download.id
 
@@ -991,23 +997,74 @@ class StudyService:
             try:
                 target_study = self.get_study(uuid)
                 self.storage_service.get_storage(target_study).export_study(target_study, export_path, outputs)
+                self.file_transfer_manager.export_done(export_key, export_path)
                 self.file_transfer_manager.set_ready(export_id)
                 return TaskResult(success=True, message=f"Study {uuid} successfully exported")
             except Exception as e:
+                self.file_transfer_manager.export_failed(export_key, str(e))
                 self.file_transfer_manager.fail(export_id, str(e))
                 raise e
 
-        task_id = self.task_service.add_task(
-            export_task,
-            export_name,
-            task_type=TaskType.EXPORT,
-            ref_id=study.id,
-            custom_event_messages=None,
-            request_params=params,
-        )
-
+        task_id = self._add_export_task(export_task, export_name, export_key, study, params)
         return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
 
+    def _get_export_key(self, study: Study, *args: t.Any) -> str:
+        """
+        Build the key of an export of the study in the export cache of the file transfer manager.
+
+        Args:
+            study: exported study.
+            args: parameters of the export (kind of export, output ID, filters, format...).
+
+        Returns:
+            A key which changes when the study is modified through the API, since its modification date
+            is updated at each edition (but not when the study is edited on disk).
+        """
+        content = json.dumps([study.id, str(study.updated_at), *args], default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_output_signature(study: Study, output_id: str = "") -> str:
+        """
+        Get a signature of the outputs of the study (or of one output) which changes
+        when the outputs are added, removed or archived, since this doesn't change the modification date of the study.
+        """
+        output_dir = Path(study.path) / "output"
+        paths = [output_dir / output_id, output_dir / f"{output_id}.zip"] if output_id else [output_dir]
+        signature = []
+        for path in paths:
+            with contextlib.suppress(FileNotFoundError):
+                stat = path.stat()
+                signature.append(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}")
+        return ",".join(signature)
+
+    def _add_export_task(
+        self,
+        export_task: Task,
+        export_name: str,
+        export_key: str,
+        study: Study,
+        params: RequestParameters,
+    ) -> str:
+        """
+        Add the task building the archive of an export, and register it in the export cache
+        so that the concurrent requests of the same export share it.
+        """
+        try:
+            task_id = self.task_service.add_task(
+                export_task,
+                export_name,
+                task_type=TaskType.EXPORT,
+                ref_id=study.id,
+                custom_event_messages=None,
+                request_params=params,
+            )
+        except Exception as e:
+            self.file_transfer_manager.export_failed(export_key, str(e))
+            raise
+        self.file_transfer_manager.register_export_task(export_key, task_id)
+        return task_id
+
     def output_variables_information(
         self,
         study_uuid: str,
@@ -1045,11 +1102,15 @@ class StudyService:
 
         logger.info(f"Exporting {output_uuid} from study {study_uuid}")
         export_name = f"Study output {study.name}/{output_uuid} export"
-        export_file_download = self.file_transfer_manager.request_download(
+        export_key = self._get_export_key(study, "output", output_uuid, self._get_output_signature(study, output_uuid))
+        export_file_download, task_id = self.file_transfer_manager.request_export(
+            export_key,
             f"{study.name}-{study_uuid}-{output_uuid}.zip",
             export_name,
             params.user,
         )
+        if task_id is not None:
+            return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
         export_path = Path(export_file_download.path)
         export_id = export_file_download.id
 
@@ -1061,24 +1122,18 @@ class StudyService:
                     output_id=output_uuid,
                     target=export_path,
                 )
+                self.file_transfer_manager.export_done(export_key, export_path)
                 self.file_transfer_manager.set_ready(export_id)
                 return TaskResult(
                     success=True,
                     message=f"Study output {study_uuid}/{output_uuid} successfully exported",
                 )
             except Exception as e:
+                self.file_transfer_manager.export_failed(export_key, str(e))
                 self.file_transfer_manager.fail(export_id, str(e))
                 raise e
 
-        task_id = self.task_service.add_task(
-            export_task,
-            export_name,
-            task_type=TaskType.EXPORT,
-            ref_id=study.id,
-            custom_event_messages=None,
-            request_params=params,
-        )
-
+        task_id = self._add_export_task(export_task, export_name, export_key, study, params)
         return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
 
     def export_study_flat(
@@ -1208,11 +1263,17 @@ class StudyService:
         if use_task:
             logger.info(f"Exporting {output_id} from study {study_id}")
             export_name = f"Study filtered output {study.name}/{output_id} export"
-            export_file_download = self.file_transfer_manager.request_download(
+            export_key = self._get_export_key(
+                study, "filtered_output", output_id, self._get_output_signature(study, output_id), data.dict(), filetype
+            )
+            export_file_download, task_id = self.file_transfer_manager.request_export(
+                export_key,
                 f"{study.name}-{study_id}-{output_id}_filtered{filetype.suffix}",
                 export_name,
                 params.user,
             )
+            if task_id is not None:
+                return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
             export_path = Path(export_file_download.path)
             export_id = export_file_download.id
 
@@ -1232,24 +1293,18 @@ class StudyService:
                     _stopwatch.log_elapsed(
                         lambda x: logger.info(f"Study {study_id} filtered output {output_id} exported in {x}s")
                     )
+                    self.file_transfer_manager.export_done(export_key, export_path)
                     self.file_transfer_manager.set_ready(export_id)
                     return TaskResult(
                         success=True,
                         message=f"Study filtered output {study_id}/{output_id} successfully exported",
                     )
                 except Exception as e:
+                    self.file_transfer_manager.export_failed(export_key, str(e))
                     self.file_transfer_manager.fail(export_id, str(e))
                     raise
 
-            task_id = self.task_service.add_task(
-                export_task,
-                export_name,
-                task_type=TaskType.EXPORT,
-                ref_id=study.id,
-                custom_event_messages=None,
-                request_params=params,
-            )
-
+            task_id = self._add_export_task(export_task, export_name, export_key, study, params)
             return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
         else:
             stopwatch = StopWatch()
@@ -1277,14 +1332,7 @@ class StudyService:
                 return FileResponse(tmp_export_file, headers=headers, media_type=filetype)
 
             else:
-                json_response = json.dumps(
-                    matrix.dict(),
-                    ensure_ascii=False,
-                    allow_nan=True,
-                    indent=None,
-                    separators=(",", ":"),
-                ).encode("utf-8")
-                return Response(content=json_response, media_type="application/json")
+                return Response(content=to_json(matrix), media_type="application/json")
 
     def get_study_sim_result(self, study_id: str, params: RequestParameters) -> t.List[StudySimResultDTO]:
         """
@@ -1,4 +1,3 @@
-import json
 import logging
 import shutil
 import tempfile
@@ -26,7 +25,7 @@ from antarest.study.model import (
     StudySimResultDTO,
     StudySimSettingsDTO,
 )
-from antarest.study.storage.patch_service import PatchService
+from antarest.study.storage.patch_service import PatchService, parse_patch
 from antarest.study.storage.rawstudy.model.filesystem.config.files import get_playlist
 from antarest.study.storage.rawstudy.model.filesystem.config.model import Simulation
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy, StudyFactory
@@ -75,8 +74,7 @@ class AbstractStorageService(IStudyStorageService[T], ABC):
         additional_data = study.additional_data or StudyAdditionalData()
 
         try:
-            patch_obj = json.loads(additional_data.patch or "{}")
-            patch = Patch.parse_obj(patch_obj)
+            patch = parse_patch(additional_data.patch)
         except ValueError as e:
             # The conversion to JSON and the parsing can fail if the patch is not valid
             logger.warning(f"Failed to parse patch for study {study.id}", exc_info=e)
@@ -1,3 +1,4 @@
+import functools
 import json
 import typing as t
 from pathlib import Path
@@ -9,6 +10,39 @@ from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
 
 PATCH_JSON = "patch.json"
 
+PATCH_CACHE_SIZE = 4096
+"""
+Maximum number of parsed patches kept in memory by `parse_patch`.
+"""
+
+
+@functools.lru_cache(maxsize=PATCH_CACHE_SIZE)
+def _parse_patch(patch_json: str) -> Patch:
+    return Patch.parse_obj(json.loads(patch_json or "{}"))
+
+
+def parse_patch(patch_json: t.Optional[str]) -> Patch:
+    """
+    Parse the JSON content of a `study.additional_data.patch` field, for reading only.
+
+    The parsed patches are cached by content: the JSON string is the version stamp of the patch,
+    so listing thousands of studies does not parse the same patch again and again.
+    A modified patch has a different content and is therefore parsed again.
+
+    The returned patch is shared by all the callers and must not be modified:
+    use `PatchService.get` to get a patch that can be modified and saved.
+
+    Args:
+        patch_json: JSON content of the patch (may be empty).
+
+    Returns:
+        The parsed patch, shared with the other callers.
+
+    Raises:
+        ValueError: If the content is not a valid JSON patch.
+    """
+    return _parse_patch(patch_json or "")
+
 
 class PatchService:
     """
@@ -22,6 +56,8 @@ class PatchService:
         if not get_from_file and study.additional_data is not None:
             # the `study.additional_data.patch` field is optional
             if study.additional_data.patch:
+                # The caller may modify the patch: it is not taken from the `parse_patch` cache,
+                # because a deep copy of the cached patch is slower than parsing it again.
                 patch_obj = json.loads(study.additional_data.patch or "{}")
                 return Patch.parse_obj(patch_obj)
 
@@ -1,6 +1,7 @@
 import typing as t
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import typing_extensions as te
 
@@ -181,37 +182,42 @@ class RulesetMatrices:
                         "symbol,group_id,year": value,  # binding constraints
                     }
         """
+        # The rules are grouped by matrix, so that each matrix is updated at once.
+        cells: t.Dict[t.Tuple[str, t.Optional[str]], t.Tuple[t.List[str], t.List[str], t.List[_Value]]] = {}
         for key, value in rules.items():
             symbol, *parts = key.split(",")
             scenario_type = self.scenario_types[symbol]
             # Common values
             area_id = parts[0].lower()  # or group_id for BC
             year = parts[2] if symbol in _LINK_RELATED_SYMBOLS else parts[1]
+            area: t.Optional[str] = None  # the cluster matrices are stored by area
             if symbol in _AREA_RELATED_SYMBOLS:
-                area = self.areas[area_id]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_area(area), str(year)] = value
+                row = idx_area(self.areas[area_id])
             elif symbol in _LINK_RELATED_SYMBOLS:
-                area1 = self.areas[area_id]
-                area2 = self.areas[parts[1].lower()]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_link(area1, area2), str(year)] = value
+                row = idx_link(self.areas[area_id], self.areas[parts[1].lower()])
             elif symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
-                area = self.areas[area_id]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_area(area), str(year)] = value * 100
+                row = idx_area(self.areas[area_id])
+                value = value * 100
             elif symbol in _CLUSTER_RELATED_SYMBOLS:
                 area = self.areas[area_id]
                 clusters = self.clusters_by_symbols[symbol][area_id]
-                cluster = clusters[parts[2].lower()]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type][area])
-                scenario.at[idx_cluster(area, cluster), str(year)] = value
+                row = idx_cluster(area, clusters[parts[2].lower()])
             elif symbol in _BINDING_CONSTRAINTS_RELATED_SYMBOLS:
-                group = self.groups[area_id]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_group(group), str(year)] = value
+                row = idx_group(self.groups[area_id])
             else:
                 raise NotImplementedError(f"Unknown symbol {symbol}")
+            rows, years, values = cells.setdefault((scenario_type, area), ([], [], []))
+            rows.append(row)
+            years.append(str(year))
+            values.append(value)
+
+        for (scenario_type, area), (rows, years, values) in cells.items():
+            if area is None:
+                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
+                self.scenarios[scenario_type] = _set_cells(scenario, rows, years, values)
+            else:
+                cluster_scenario = t.cast(_ClusterScenario, self.scenarios[scenario_type])
+                cluster_scenario[area] = _set_cells(cluster_scenario[area], rows, years, values)
 
     def get_rules(self, *, allow_nan: bool = False) -> t.Dict[str, _Value]:
         """
@@ -252,54 +258,85 @@ class RulesetMatrices:
             Dictionary of rules.
         """
 
-        def to_ts_number(v: t.Any) -> _Value:
-            """Convert value to TimeSeries number."""
-            return np.nan if pd.isna(v) else int(v)
+        if isinstance(scenario, pd.DataFrame):
+            return self._get_matrix_rules(symbol, None, scenario, allow_nan=allow_nan)
+        scenario_rules: t.Dict[str, _Value] = {}
+        for area, matrix in scenario.items():
+            scenario_rules.update(self._get_matrix_rules(symbol, area, matrix, allow_nan=allow_nan))
+        return scenario_rules
 
-        def to_percent(v: t.Any) -> _Value:
-            """Convert value to percentage in range [0, 100]."""
-            return np.nan if pd.isna(v) else float(v) / 100
+    def _get_rule_keys(self, symbol: str, area: t.Optional[str]) -> t.Dict[str, t.Tuple[str, str]]:
+        """
+        Get the beginning and the end of the rule keys (around the year) of each row of a matrix.
 
-        if symbol in _AREA_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{area_id},{year}": to_ts_number(value)
-                for area_id, area in self.areas.items()
-                for year, value in scenario.loc[idx_area(area)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
+        Args:
+            symbol: Rule symbol.
+            area: Area of the matrix, for the cluster matrices.
+
+        Returns:
+            Dictionary of ``(head, tail)`` tuples indexed by row labels: the rule keys are ``f"{head},{year}{tail}"``.
+        """
+        if symbol in _AREA_RELATED_SYMBOLS or symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
+            return {idx_area(area): (f"{symbol},{area_id}", "") for area_id, area in self.areas.items()}
         elif symbol in _LINK_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{area1_id},{area2_id},{year}": to_ts_number(value)
+            return {
+                idx_link(area1, area2): (f"{symbol},{area1_id},{area2_id}", "")
                 for (area1_id, area2_id), (area1, area2) in self.links.items()
-                for year, value in scenario.loc[idx_link(area1, area2)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
-        elif symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{area_id},{year}": to_percent(value)
-                for area_id, area in self.areas.items()
-                for year, value in scenario.loc[idx_area(area)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
             }
         elif symbol in _CLUSTER_RELATED_SYMBOLS:
-            clusters_mapping = self.clusters_by_symbols[symbol]
-            scenario_rules = {
-                f"{symbol},{area_id},{year},{cluster_id}": to_ts_number(value)
-                for area_id, clusters in clusters_mapping.items()
+            area_id = str(area).lower()
+            clusters = self.clusters_by_symbols[symbol].get(area_id, {})
+            return {
+                idx_cluster(self.areas[area_id], cluster): (f"{symbol},{area_id}", f",{cluster_id}")
                 for cluster_id, cluster in clusters.items()
-                for year, value in scenario[self.areas[area_id]].loc[idx_cluster(self.areas[area_id], cluster)].items()
-                if allow_nan or not pd.isna(value)
             }
         elif symbol in _BINDING_CONSTRAINTS_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{group_id},{year}": to_ts_number(value)
-                for group_id, group in self.groups.items()
-                for year, value in scenario.loc[idx_group(group)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
+            return {idx_group(group): (f"{symbol},{group_id}", "") for group_id, group in self.groups.items()}
         else:
             raise NotImplementedError(f"Unknown symbol {symbol}")
-        return scenario_rules
+
+    def _get_matrix_rules(
+        self,
+        symbol: str,
+        area: t.Optional[str],
+        matrix: pd.DataFrame,
+        *,
+        allow_nan: bool = False,
+        mask: t.Optional[pd.DataFrame] = None,
+    ) -> t.Dict[str, _Value]:
+        """
+        Get the rules of the cells of a matrix.
+
+        Args:
+            symbol: Rule symbol.
+            area: Area of the matrix, for the cluster matrices.
+            matrix: Scenario matrix.
+            allow_nan: Allow NaN values if True.
+            mask: Boolean matrix (with the same labels) selecting the cells, all the cells by default.
+
+        Returns:
+            Dictionary of rules.
+        """
+        rule_keys = self._get_rule_keys(symbol, area)
+        positions = _get_positions(matrix.index, list(rule_keys))
+        keys = [key for key, position in zip(rule_keys.values(), positions) if position >= 0]
+        values = _to_array(matrix)[positions[positions >= 0]]
+        selected = np.ones(values.shape, dtype=bool) if mask is None else mask.to_numpy()[positions[positions >= 0]]
+        if not allow_nan:
+            selected &= ~np.isnan(values)
+        if symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
+            # percentage converted to a value in range [0, 1]
+            values = values / 100
+
+        rows, cols = np.nonzero(selected)
+        years = matrix.columns.tolist()
+        is_percent = symbol in _HYDRO_LEVEL_RELATED_SYMBOLS
+        rules: t.Dict[str, _Value] = {}
+        for row, col, value in zip(rows.tolist(), cols.tolist(), values[rows, cols].tolist()):
+            head, tail = keys[row]
+            # NaN values are kept as is, the time series numbers are integers
+            rules[f"{head},{years[col]}{tail}"] = value if is_percent or value != value else int(value)
+        return rules
 
     def get_table_form(self, scenario_type: str, *, nan_value: t.Union[str, None] = "") -> TableForm:
         """
@@ -373,7 +410,13 @@ class RulesetMatrices:
                 for area, df in table_form.items()
             }
 
-    def update_table_form(self, table_form: TableForm, scenario_type: str, *, nan_value: str = "") -> None:
+    def update_table_form(
+        self,
+        table_form: TableForm,
+        scenario_type: str,
+        *,
+        nan_value: str = "",
+    ) -> t.Dict[str, t.Optional[_Value]]:
         """
         Update the scenario matrices from table form data (partial update).
 
@@ -381,15 +424,80 @@ class RulesetMatrices:
             table_form: Simple or cluster table form data (see :meth:`get_table_form` for the format).
             scenario_type: Scenario type.
             nan_value: Value to replace NaNs. for instance: ``{"& psp x1": {"0": 10}}``.
+
+        Returns:
+            The rules of the modified cells only (see :meth:`get_rules` for the format),
+            a removed rule has a `None` value.
         """
+        symbol = next(s for s, st in self.scenario_types.items() if st == scenario_type)
         scenario = self.scenarios[scenario_type]
         if isinstance(scenario, pd.DataFrame):
             simple_table_form = t.cast(SimpleTableForm, table_form)
-            df = pd.DataFrame(simple_table_form).transpose().replace([None, nan_value], np.nan)
-            scenario.at[df.index, df.columns] = df
+            df, mask = _update_matrix(scenario, simple_table_form, nan_value)
+            rules = self._get_matrix_rules(symbol, None, df, allow_nan=True, mask=mask)
         else:
             cluster_table_form = t.cast(ClusterTableForm, table_form)
+            rules = {}
             for area, simple_table_form in cluster_table_form.items():
                 scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type][area])
-                df = pd.DataFrame(simple_table_form).transpose().replace([None, nan_value], np.nan)
-                scenario.at[df.index, df.columns] = df
+                df, mask = _update_matrix(scenario, simple_table_form, nan_value)
+                rules.update(self._get_matrix_rules(symbol, area, df, allow_nan=True, mask=mask))
+        # NaN values are not JSON compliant
+        return {key: None if np.isnan(value) else value for key, value in rules.items()}
+
+
+def _to_array(matrix: pd.DataFrame) -> npt.NDArray[np.float64]:
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in matrix.dtypes):
+        return matrix.to_numpy(dtype=np.float64)
+    # the non-numeric values are converted to NaN
+    array = np.empty(matrix.shape, dtype=np.float64)
+    for position, values in enumerate(matrix.to_numpy().T):
+        array[:, position] = pd.to_numeric(values, errors="coerce")
+    return array
+
+
+def _get_positions(index: pd.Index, labels: t.Sequence[str]) -> npt.NDArray[np.intp]:
+    """
+    Get the positions of some labels in an index, -1 for the missing labels.
+    """
+    positions: npt.NDArray[np.intp] = index.get_indexer(labels)  # type: ignore
+    return positions
+
+
+def _set_cells(
+    matrix: pd.DataFrame, rows: t.Sequence[str], columns: t.Sequence[str], values: t.Sequence[_Value]
+) -> pd.DataFrame:
+    """
+    Set the values of some cells of a matrix at once, the missing columns are added.
+
+    Returns:
+        The updated matrix (a new DataFrame).
+    """
+    missing_columns = [c for c in dict.fromkeys(columns) if c not in matrix.columns]
+    if missing_columns:
+        matrix = matrix.reindex(columns=[*matrix.columns, *missing_columns])
+    array = _to_array(matrix)
+    array[_get_positions(matrix.index, rows), _get_positions(matrix.columns, columns)] = values
+    return pd.DataFrame(array, index=matrix.index, columns=matrix.columns)
+
+
+def _update_matrix(
+    matrix: pd.DataFrame,
+    table_form: SimpleTableForm,
+    nan_value: t.Union[str, None],
+) -> t.Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Update the cells of a matrix (in place) with the cells given in a table form.
+
+    Returns:
+        The updated part of the matrix, and a boolean matrix (with the same labels)
+        selecting the cells whose value has changed.
+    """
+    update = pd.DataFrame(table_form).transpose().replace([None, nan_value], np.nan)
+    # The cells which are missing in the table form are not modified.
+    given = pd.DataFrame({row: {col: True for col in cells} for row, cells in table_form.items()}).transpose()
+    given = given.reindex(index=update.index, columns=update.columns).notna()
+    current = matrix.reindex(index=update.index, columns=update.columns)
+    update = update.where(given, current)
+    matrix.loc[update.index, update.columns] = update
+    return update, ~(current.eq(update) | (current.isna() & update.isna()))
@@ -13,6 +13,7 @@ from pathlib import Path
 from filelock import FileLock
 
 from antarest.core.model import JSON, SUB_JSON
+from antarest.core.profiling import profile_operation
 from antarest.study.storage.rawstudy.ini_reader import IniReader, IReader
 from antarest.study.storage.rawstudy.ini_writer import IniWriter
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
@@ -93,13 +94,14 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
         url = url or []
         kwargs = self._get_filtering_kwargs(url)
 
-        if self.config.zip_path:
-            with zipfile.ZipFile(self.config.zip_path, mode="r") as zipped_folder:
-                inside_zip_path = self.config.path.relative_to(self.config.zip_path.with_suffix("")).as_posix()
-                with io.TextIOWrapper(zipped_folder.open(inside_zip_path)) as f:
-                    data = self.reader.read(f, **kwargs)
-        else:
-            data = self.reader.read(self.path, **kwargs)
+        with profile_operation(f"{type(self).__name__}.read"):
+            if self.config.zip_path:
+                with zipfile.ZipFile(self.config.zip_path, mode="r") as zipped_folder:
+                    inside_zip_path = self.config.path.relative_to(self.config.zip_path.with_suffix("")).as_posix()
+                    with io.TextIOWrapper(zipped_folder.open(inside_zip_path)) as f:
+                        data = self.reader.read(f, **kwargs)
+            else:
+                data = self.reader.read(self.path, **kwargs)
 
         if len(url) == 2:
             data = data[url[0]][url[1]]
@@ -154,7 +156,7 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
     def save(self, data: SUB_JSON, url: t.Optional[t.List[str]] = None) -> None:
         self._assert_not_in_zipped_file()
         url = url or []
-        with FileLock(
+        with profile_operation(f"{type(self).__name__}.save"), FileLock(
             str(
                 Path(tempfile.gettempdir())
                 / f"{self.config.study_id}-{self.path.relative_to(self.config.study_path).name.replace(os.sep, '.')}.lock"
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, Dict, Generic, List, Optional, Tuple, Union, cast
 from zipfile import ZipFile
 
+from antarest.core.profiling import profile_operation
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.context import ContextServer
 from antarest.study.storage.rawstudy.model.filesystem.inode import G, INode, S, V
@@ -74,12 +75,14 @@ class LazyNode(INode, ABC, Generic[G, S, V]):  # type: ignore
             if expanded:
                 return link
             else:
-                return cast(G, self.context.resolver.resolve(link, formatted))
+                with profile_operation(f"{type(self).__name__}.resolve"):
+                    return cast(G, self.context.resolver.resolve(link, formatted))
 
         if expanded:
             return self.get_lazy_content()
         else:
-            return self.load(url, depth, expanded, formatted)
+            with profile_operation(f"{type(self).__name__}.load"):
+                return self.load(url, depth, expanded, formatted)
 
     def get(
         self,
@@ -121,7 +124,8 @@ class LazyNode(INode, ABC, Generic[G, S, V]):  # type: ignore
                 self.config.path.unlink()
             return None
 
-        self.dump(cast(S, data), url)
+        with profile_operation(f"{type(self).__name__}.dump"):
+            self.dump(cast(S, data), url)
         if self.get_link_path().exists():
             self.get_link_path().unlink()
         return None
@@ -13,6 +13,7 @@ from filelock import FileLock
 from antarest.core.config import Config
 from antarest.core.exceptions import CannotScanInternalWorkspace
 from antarest.core.interfaces.service import IService
+from antarest.core.metrics import REGISTRY
 from antarest.core.requests import RequestParameters
 from antarest.core.tasks.model import TaskResult, TaskType
 from antarest.core.tasks.service import ITaskService, TaskUpdateNotifier
@@ -24,15 +25,23 @@ from antarest.study.service import StudyService
 
 logger = logging.getLogger(__name__)
 
+SCAN_DURATION = REGISTRY.histogram(
+    "antarest_watcher_scan_seconds",
+    "Duration of the scans of the workspace folders by the watcher, by workspace",
+    ("workspace",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0),
+)
+
 
 class _LogScanDuration:
-    """Functional object use to log the scanning duration of a workspace."""
+    """Functional object use to log and record the scanning duration of a workspace."""
 
     def __init__(self, workspace_name: str) -> None:
         self.workspace_name = workspace_name
 
     def __call__(self, duration: float) -> None:
         logger.info(f"Workspace {self.workspace_name} scanned in {duration}s")
+        SCAN_DURATION.labels(self.workspace_name).observe(duration)
 
 
 class WorkspaceNotFound(HTTPException):
@@ -208,6 +217,7 @@ class Watcher(IService):
                 workspace.filter_in,
                 workspace.filter_out,
             )
+            stopwatch.log_elapsed(_LogScanDuration(workspace_name))
         elif workspace_directory_path is None and workspace_name is None:
             for name, workspace in self.config.storage.workspaces.items():
                 if name != DEFAULT_WORKSPACE_NAME:
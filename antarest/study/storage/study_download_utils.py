@@ -1,5 +1,4 @@
 import csv
-import json
 import logging
 import os
 import re
@@ -13,6 +12,7 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 from fastapi import HTTPException
 
+from antarest.core.serialization import to_json
 from antarest.study.model import (
     ExportFormat,
     MatrixAggregationResult,
@@ -329,15 +329,7 @@ class StudyDownloader:
     ) -> None:
         if filetype == ExportFormat.JSON:
             # 1- JSON
-            with open(target_file, "w") as fh:
-                json.dump(
-                    matrix.dict(),
-                    fh,
-                    ensure_ascii=False,
-                    allow_nan=True,
-                    indent=None,
-                    separators=(",", ":"),
-                )
+            target_file.write_bytes(to_json(matrix))
         else:
             # 1- Zip/tar+gz container
             with (
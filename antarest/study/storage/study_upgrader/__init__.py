@@ -1,13 +1,16 @@
+import concurrent.futures
 import logging
+import os
 import re
 import shutil
-import tempfile
 import time
 import typing as t
 from http import HTTPStatus
 from http.client import HTTPException
 from pathlib import Path
 
+from pydantic import BaseModel
+
 from antarest.core.exceptions import StudyValidationError
 
 from .upgrader_710 import upgrade_710
@@ -27,6 +30,11 @@ STUDY_ANTARES = "study.antares"
 Main file of an Antares study containing the caption, the version, the creation date, etc.
 """
 
+CHECKPOINT_FILE = "checkpoint.json"
+"""
+File saved in the staging directory of a study upgrade to record its progress.
+"""
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,22 +86,114 @@ def find_next_version(from_version: str) -> str:
     )
 
 
-def upgrade_study(study_path: Path, target_version: str) -> None:
-    with tempfile.TemporaryDirectory(suffix=".upgrade.tmp", prefix="~", dir=study_path.parent) as path:
-        tmp_dir = Path(path)
+class _UpgradeCheckpoint(BaseModel):
+    """
+    Progress of a study upgrade, saved in the staging directory to resume an interrupted upgrade.
+
+    Attributes:
+        src_version: Version of the study before the upgrade.
+        target_version: Version of the study after the upgrade.
+        version: Last version successfully reached in the staging directory.
+        files: List of files and folders staged for the upgrade (relative to the study path).
+    """
+
+    src_version: str
+    target_version: str
+    version: str
+    files: t.List[Path]
+
+    @classmethod
+    def load(cls, staging_dir: Path) -> t.Optional["_UpgradeCheckpoint"]:
         try:
-            src_version = get_current_version(study_path)
-            files_to_upgrade = can_upgrade_version(src_version, target_version)
-            files_to_retrieve = _copies_only_necessary_files(files_to_upgrade, study_path, tmp_dir)
-            _do_upgrade(tmp_dir, src_version, target_version)
-        except (StudyValidationError, InvalidUpgrade) as e:
-            logger.warning(str(e))
-            raise
-        except Exception as e:
-            logger.error(f"Unhandled exception : {e}", exc_info=True)
-            raise
+            return cls.parse_file(staging_dir / CHECKPOINT_FILE)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, staging_dir: Path) -> None:
+        # Write the checkpoint in a temporary file first, so that it is replaced atomically.
+        tmp_path = staging_dir / f"{CHECKPOINT_FILE}.tmp"
+        tmp_path.write_text(self.json(), encoding="utf-8")
+        tmp_path.replace(staging_dir / CHECKPOINT_FILE)
+
+
+def _get_staging_dir(study_path: Path) -> Path:
+    return study_path.parent / f"~{study_path.name}.upgrade.tmp"
+
+
+def upgrade_study(study_path: Path, target_version: str) -> None:
+    """
+    Upgrade a raw study to the target version.
+
+    The impacted files are staged in a directory next to the study, upgraded step by step,
+    and then swapped with the original files. The progress is saved in a checkpoint,
+    so that calling this function again after an interruption resumes the upgrade
+    from the last completed step.
+
+    Args:
+        study_path: Path to the study.
+        target_version: Version of the study after the upgrade.
+
+    Raises:
+        StudyValidationError: If the study version cannot be read.
+        InvalidUpgrade: If the upgrade is not possible.
+    """
+    staging_dir = _get_staging_dir(study_path)
+    try:
+        src_version = get_current_version(study_path)
+        files_to_upgrade = can_upgrade_version(src_version, target_version)
+        checkpoint = _UpgradeCheckpoint.load(staging_dir)
+        if checkpoint and (checkpoint.src_version, checkpoint.target_version) == (src_version, target_version):
+            logger.info(f"Resuming the upgrade of '{study_path}' from version '{checkpoint.version}'")
         else:
-            _replace_safely_original_files(files_to_retrieve, study_path, tmp_dir)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            version_dir = staging_dir / src_version
+            version_dir.mkdir(parents=True)
+            files_to_retrieve = _copies_only_necessary_files(files_to_upgrade, study_path, version_dir)
+            checkpoint = _UpgradeCheckpoint(
+                src_version=src_version,
+                target_version=target_version,
+                version=src_version,
+                files=files_to_retrieve,
+            )
+            checkpoint.save(staging_dir)
+        _do_upgrade(staging_dir, checkpoint)
+    except (StudyValidationError, InvalidUpgrade) as e:
+        logger.warning(str(e))
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    except Exception as e:
+        logger.error(f"Unhandled exception : {e}", exc_info=True)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    else:
+        _replace_safely_original_files(checkpoint.files, study_path, staging_dir / target_version)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def upgrade_studies(
+    study_paths: t.Sequence[Path],
+    target_version: str,
+    max_workers: int = 4,
+) -> t.Dict[Path, t.Optional[Exception]]:
+    """
+    Upgrade several raw studies to the target version concurrently.
+
+    Args:
+        study_paths: Paths to the studies.
+        target_version: Version of the studies after the upgrade.
+        max_workers: Maximum number of studies upgraded at the same time.
+
+    Returns:
+        The error raised during the upgrade of each study, or `None` if the study was upgraded.
+    """
+    results: t.Dict[Path, t.Optional[Exception]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="upgrade_") as executor:
+        futures = {executor.submit(upgrade_study, path, target_version): path for path in study_paths}
+        for future in concurrent.futures.as_completed(futures):
+            study_path = futures[future]
+            exc = future.exception()
+            results[study_path] = t.cast(t.Optional[Exception], exc)
+    return results
 
 
 def get_current_version(study_path: Path) -> str:
@@ -186,6 +286,24 @@ def _update_study_antares_file(target_version: str, study_path: Path) -> None:
     antares_path.write_text(content, encoding="utf-8")
 
 
+def _stage_file(src: t.Union[str, Path], dst: t.Union[str, Path]) -> None:
+    """
+    Copy function used to stage the files of a study before upgrading them.
+
+    Matrices (".txt" files) are hard-linked instead of being copied: the upgraders never
+    rewrite a matrix in place, they write new files and remove the old ones.
+    Other files (like INI files) are small and may be rewritten in place, so they are copied.
+    If the file system does not support hard links, the matrices are copied too.
+    """
+    if Path(src).suffix == ".txt":
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 def _copies_only_necessary_files(files_to_upgrade: t.List[Path], study_path: Path, tmp_path: Path) -> t.List[Path]:
     """
     Copies files concerned by the version upgrader into a temporary directory.
@@ -207,15 +325,11 @@ def _copies_only_necessary_files(files_to_upgrade: t.List[Path], study_path: Pat
             continue
         if entire_path.is_dir():
             if not (tmp_path / path).exists():
-                shutil.copytree(entire_path, tmp_path / path, dirs_exist_ok=True)
+                shutil.copytree(entire_path, tmp_path / path, copy_function=_stage_file, dirs_exist_ok=True)
                 files_to_retrieve.append(path)
-        elif len(path.parts) == 1:
-            shutil.copy(entire_path, tmp_path / path)
-            files_to_retrieve.append(path)
         else:
-            parent_path = path.parent
-            (tmp_path / parent_path).mkdir(parents=True, exist_ok=True)
-            shutil.copy(entire_path, tmp_path / parent_path)
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            _stage_file(entire_path, tmp_path / path)
             files_to_retrieve.append(path)
     return files_to_retrieve
 
@@ -239,39 +353,48 @@ def _filters_out_children_files(files_to_upgrade: t.List[Path]) -> t.List[Path]:
 def _replace_safely_original_files(files_to_replace: t.List[Path], study_path: Path, tmp_path: Path) -> None:
     """
     Replace files/folders of the study that should be upgraded by their copy already upgraded in the tmp directory.
-    It uses Path.rename() and an intermediary tmp directory to swap the folders safely.
-    In the end, all tmp directories are removed.
+    It uses Path.rename() and an intermediary backup directory to swap the folders safely.
+    The files which are already swapped (by an interrupted upgrade) are skipped.
     Args:
         study_path: Path to the study.
-        tmp_path: Path to the temporary directory where the file modification will be performed.
+        tmp_path: Path to the temporary directory where the file modification was performed.
         files_to_replace: List[Path]: List of files and folders that were really copied
         (cf. _copies_only_necessary_files's doc just above)
     """
+    backup_dir = tmp_path.parent / "backup"
+    backup_dir.mkdir(exist_ok=True)
     for k, path in enumerate(files_to_replace):
-        backup_dir = Path(
-            tempfile.mkdtemp(
-                suffix=f".backup_{k}.tmp",
-                prefix="~",
-                dir=study_path.parent,
-            )
-        )
-        backup_dir.rmdir()
+        upgraded_path = tmp_path / path
+        if not upgraded_path.exists():
+            continue
         original_path = study_path / path
-        original_path.rename(backup_dir)
-        (tmp_path / path).rename(original_path)
-        if backup_dir.is_dir():
-            shutil.rmtree(backup_dir)
-        else:
-            backup_dir.unlink()
+        if original_path.exists():
+            original_path.rename(backup_dir / str(k))
+        upgraded_path.rename(original_path)
+    shutil.rmtree(backup_dir)
 
 
-def _do_upgrade(study_path: Path, src_version: str, target_version: str) -> None:
-    _update_study_antares_file(target_version, study_path)
-    curr_version = src_version
+def _do_upgrade(staging_dir: Path, checkpoint: _UpgradeCheckpoint) -> None:
+    """
+    Upgrade the staged files step by step, from the checkpoint version to the target version.
+
+    Each step works on a copy of the files of the previous step (using hard links for the matrices),
+    and the checkpoint is saved once the step is completed. This way, an interrupted step
+    can be restarted from the files of the previous step.
+    """
+    curr_version = checkpoint.version
     for old, new, method, _ in UPGRADE_METHODS:
-        if curr_version == old and curr_version != target_version:
-            method(study_path)
-            curr_version = new
+        if curr_version == old and curr_version != checkpoint.target_version:
+            prev_dir = staging_dir / old
+            next_dir = staging_dir / new
+            shutil.rmtree(next_dir, ignore_errors=True)
+            shutil.copytree(prev_dir, next_dir, copy_function=_stage_file)
+            if new == checkpoint.target_version:
+                _update_study_antares_file(new, next_dir)
+            method(next_dir)
+            checkpoint.version = curr_version = new
+            checkpoint.save(staging_dir)
+            shutil.rmtree(prev_dir)
 
 
 def should_study_be_denormalized(src_version: str, target_version: str) -> bool:
@@ -1,10 +1,24 @@
-import glob
 from pathlib import Path
-from typing import cast
 
-import numpy as np
-import numpy.typing as npt
-import pandas
+from antarest.study.storage.study_upgrader.utils import process_files, split_matrix_columns
+
+
+def _split_link_matrix(txt_path: Path) -> None:
+    """
+    Split the link matrix `{area2}.txt` into `{area2}_parameters.txt` and the
+    `capacities/{area2}_direct.txt` and `capacities/{area2}_indirect.txt` matrices.
+    """
+    folder_path = txt_path.parent
+    name = txt_path.stem
+    split_matrix_columns(
+        txt_path,
+        [
+            (folder_path / f"{name}_parameters.txt", slice(2, 8)),
+            (folder_path / "capacities" / f"{name}_direct.txt", 0),
+            (folder_path / "capacities" / f"{name}_indirect.txt", 1),
+        ],
+    )
+    txt_path.unlink()
 
 
 def upgrade_820(study_path: Path) -> None:
@@ -18,38 +32,11 @@ def upgrade_820(study_path: Path) -> None:
         study_path: path to the study directory.
     """
 
-    links = glob.glob(str(study_path / "input" / "links" / "*"))
-    if len(links) > 0:
-        for folder in links:
-            folder_path = Path(folder)
-            all_txt = glob.glob(str(folder_path / "*.txt"))
-            if len(all_txt) > 0:
-                (folder_path / "capacities").mkdir(exist_ok=True)
-                for txt in all_txt:
-                    df = pandas.read_csv(txt, sep="\t", header=None)
-                    df_parameters = df.iloc[:, 2:8]
-                    df_direct = df.iloc[:, 0]
-                    df_indirect = df.iloc[:, 1]
-                    name = Path(txt).stem
-                    # noinspection PyTypeChecker
-                    np.savetxt(
-                        folder_path / f"{name}_parameters.txt",
-                        cast(npt.NDArray[np.float64], df_parameters.values),
-                        delimiter="\t",
-                        fmt="%.6f",
-                    )
-                    # noinspection PyTypeChecker
-                    np.savetxt(
-                        folder_path / "capacities" / f"{name}_direct.txt",
-                        cast(npt.NDArray[np.float64], df_direct.values),
-                        delimiter="\t",
-                        fmt="%.6f",
-                    )
-                    # noinspection PyTypeChecker
-                    np.savetxt(
-                        folder_path / "capacities" / f"{name}_indirect.txt",
-                        cast(npt.NDArray[np.float64], df_indirect.values),
-                        delimiter="\t",
-                        fmt="%.6f",
-                    )
-                    (folder_path / f"{name}.txt").unlink()
+    links_path = study_path / "input" / "links"
+    all_txt = []
+    for folder_path in sorted(links_path.glob("*")):
+        txt_files = sorted(folder_path.glob("*.txt"))
+        if txt_files:
+            (folder_path / "capacities").mkdir(exist_ok=True)
+            all_txt.extend(txt_files)
+    process_files(_split_link_matrix, all_txt)
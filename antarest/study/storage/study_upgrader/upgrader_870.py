@@ -1,12 +1,25 @@
-import typing as t
 from pathlib import Path
 
-import numpy as np
-import numpy.typing as npt
-import pandas as pd
-
 from antarest.study.storage.rawstudy.ini_reader import IniReader
 from antarest.study.storage.rawstudy.ini_writer import IniWriter
+from antarest.study.storage.study_upgrader.utils import process_files, split_matrix_columns
+
+_TERMS = ["lt", "gt", "eq"]
+
+
+def _split_binding_constraint_matrix(txt_path: Path) -> None:
+    """
+    Split the binding constraint matrix `{bc_id}.txt` into the
+    `{bc_id}_lt.txt`, `{bc_id}_gt.txt` and `{bc_id}_eq.txt` matrices.
+    """
+    targets = [txt_path.with_name(f"{txt_path.stem}_{term}.txt") for term in _TERMS]
+    if txt_path.stat().st_size == 0:
+        for target in targets:
+            target.unlink(missing_ok=True)
+            target.touch()
+    else:
+        split_matrix_columns(txt_path, list(zip(targets, range(len(_TERMS)))))
+    txt_path.unlink()
 
 
 # noinspection SpellCheckingInspection
@@ -23,23 +36,8 @@ def upgrade_870(study_path: Path) -> None:
 
     # Split existing binding constraints in 3 different files
     binding_constraints_path = study_path / "input" / "bindingconstraints"
-    binding_constraints_files = binding_constraints_path.glob("*.txt")
-    for file in binding_constraints_files:
-        name = file.stem
-        if file.stat().st_size == 0:
-            lt, gt, eq = pd.Series(), pd.Series(), pd.Series()
-        else:
-            df = pd.read_csv(file, sep="\t", header=None)
-            lt, gt, eq = df.iloc[:, 0], df.iloc[:, 1], df.iloc[:, 2]
-        for term, suffix in zip([lt, gt, eq], ["lt", "gt", "eq"]):
-            # noinspection PyTypeChecker
-            np.savetxt(
-                binding_constraints_path / f"{name}_{suffix}.txt",
-                t.cast(npt.NDArray[np.float64], term.values),
-                delimiter="\t",
-                fmt="%.6f",
-            )
-        file.unlink()
+    binding_constraints_files = sorted(binding_constraints_path.glob("*.txt"))
+    process_files(_split_binding_constraint_matrix, binding_constraints_files)
 
     # Add property group for every section in .ini file
     ini_file_path = binding_constraints_path / "bindingconstraints.ini"
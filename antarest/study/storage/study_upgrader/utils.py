@@ -0,0 +1,103 @@
+import concurrent.futures
+import contextlib
+import multiprocessing
+import typing as t
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 8760
+"""
+Number of rows read at once when a matrix is rewritten (one year of hourly values).
+"""
+
+
+_process_pool: t.Optional[concurrent.futures.Executor] = None
+"""
+Pool of worker processes used by `process_files`, only set within a `process_pool` context.
+"""
+
+
+@contextlib.contextmanager
+def process_pool(max_workers: t.Optional[int] = None) -> t.Iterator[None]:
+    """
+    Use a pool of worker processes in `process_files`, shared by all the upgrades run in the context.
+
+    The worker processes are started with the "spawn" method, because forking a multithreaded
+    process may deadlock on the locks held by the other threads.
+    This is only meant for the command line: in the server, the files are processed in the
+    thread of the upgrade task, to keep the number of processes under control.
+
+    Args:
+        max_workers: Maximum number of worker processes, defaults to the number of CPUs.
+    """
+    global _process_pool
+    mp_context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        previous_pool, _process_pool = _process_pool, executor
+        try:
+            yield
+        finally:
+            _process_pool = previous_pool
+
+
+def process_files(func: t.Callable[[Path], None], files: t.Sequence[Path]) -> None:
+    """
+    Apply a per-file transformation to a list of files, using the process pool if any.
+
+    The transformations must be independent of each other: each file is processed
+    in its own task. Outside a `process_pool` context (or if there is only one file to process),
+    the transformation is applied in the current thread.
+
+    Args:
+        func: Module-level function (it must be picklable) applied to each file.
+        files: List of the files to process.
+
+    Raises:
+        Exception: The first exception raised by a transformation, once all tasks are done.
+    """
+    executor = _process_pool
+    if executor is None or len(files) <= 1:
+        for file in files:
+            func(file)
+        return
+    # Consuming the iterator re-raises the first exception in the calling thread.
+    for _ in executor.map(func, files):
+        pass
+
+
+def split_matrix_columns(
+    src_path: Path,
+    targets: t.Sequence[t.Tuple[Path, t.Union[int, slice]]],
+) -> None:
+    """
+    Split the columns of a TSV matrix into several matrices, streaming the source file by chunks.
+
+    The source file is never loaded entirely in memory: it is read by chunks of `CHUNK_SIZE` rows,
+    and each chunk is appended to the target files. Values are written with a "%.6f" format.
+
+    NOTE:
+        The target files are removed before being written, because they may be hard links
+        to the original study files (see `upgrade_study`): they must be replaced, not truncated.
+
+    Args:
+        src_path: Path of the matrix to split.
+        targets: List of target paths with the index (or the slice) of the columns to write in them.
+
+    Raises:
+        pandas.errors.EmptyDataError: If the source matrix has no column to parse.
+    """
+    for path, _ in targets:
+        path.unlink(missing_ok=True)
+    chunks = pd.read_csv(src_path, sep="\t", header=None, chunksize=CHUNK_SIZE)
+    files = [path.open(mode="w") for path, _ in targets]
+    try:
+        for chunk in chunks:
+            for file, (_, columns) in zip(files, targets):
+                values = chunk.iloc[:, columns].to_numpy(dtype=np.float64)
+                # noinspection PyTypeChecker
+                np.savetxt(file, values, delimiter="\t", fmt="%.6f")
+    finally:
+        for file in files:
+            file.close()
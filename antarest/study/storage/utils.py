@@ -140,13 +140,18 @@ def is_managed(study: Study) -> bool:
     return not hasattr(study, "workspace") or study.workspace == DEFAULT_WORKSPACE_NAME
 
 
+def get_study_cache_ids(root_id: str) -> t.List[str]:
+    """
+    Get the keys of the cache entries of a study.
+    """
+    return [
+        f"{CacheConstants.RAW_STUDY}/{root_id}",
+        f"{CacheConstants.STUDY_FACTORY}/{root_id}",
+    ]
+
+
 def remove_from_cache(cache: ICache, root_id: str) -> None:
-    cache.invalidate_all(
-        [
-            f"{CacheConstants.RAW_STUDY}/{root_id}",
-            f"{CacheConstants.STUDY_FACTORY}/{root_id}",
-        ]
-    )
+    cache.invalidate_all(get_study_cache_ids(root_id))
 
 
 def create_new_empty_study(version: str, path_study: Path, path_resources: Path) -> None:
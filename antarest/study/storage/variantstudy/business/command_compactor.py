@@ -0,0 +1,124 @@
+import logging
+import typing as t
+
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.variantstudy.business.command_reverter import CommandReverter
+from antarest.study.storage.variantstudy.model.command.common import CommandName
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_raw_file import UpdateRawFile
+
+logger = logging.getLogger(__name__)
+
+# Commands which overwrite the whole content of their target and read nothing else in the study.
+OVERWRITE_COMMANDS = (UpdateConfig, ReplaceMatrix, UpdateRawFile)
+
+# Commands which can be cancelled by the command which reverts them (see `CommandReverter`).
+CREATE_COMMANDS = {
+    CommandName.CREATE_AREA,
+    CommandName.CREATE_DISTRICT,
+    CommandName.CREATE_LINK,
+    CommandName.CREATE_BINDING_CONSTRAINT,
+    CommandName.CREATE_THERMAL_CLUSTER,
+    CommandName.CREATE_RENEWABLES_CLUSTER,
+    CommandName.CREATE_ST_STORAGE,
+}
+
+
+def _overlap(target1: str, target2: str) -> bool:
+    """
+    Check if two command targets may refer to the same part of the study.
+
+    Aliases (targets starting with "@") are resolved when the command is applied,
+    so they are considered to overlap any other target.
+    """
+    if target1 == target2 or target1.startswith("@") or target2.startswith("@"):
+        return True
+    return target1.startswith(f"{target2}/") or target2.startswith(f"{target1}/")
+
+
+class CommandCompactor:
+    """
+    Rewrite a list of variant commands into an equivalent, shorter list of commands.
+
+    The rewriting rules are conservative:
+
+    - In a sequence of commands which overwrite their target (`UpdateConfig`, `ReplaceMatrix`
+      and `UpdateRawFile`), a command followed by a command of the same type on the same target
+      is replaced by the last one, provided that no command in between targets an overlapping path.
+      The replacement keeps the position of the first command, so that the sections and keys
+      of the INI files are created in the same order.
+    - A creation command immediately followed by the command which reverts it
+      (for instance, `CreateArea` followed by `RemoveArea` for the same area) is removed with it.
+      This rule can be disabled because some commands are not exactly reverted
+      (for instance, removing an area does not restore the districts).
+
+    The rules are applied until the list of commands no longer changes.
+    Since the rules cannot take into account every side effect of the commands,
+    the result should be checked by comparing the generated studies.
+    """
+
+    def __init__(self, cancel_reverted: bool = True) -> None:
+        """
+        Args:
+            cancel_reverted: Whether to remove the creation commands immediately reverted.
+        """
+        self.cancel_reverted = cancel_reverted
+        self.reverter = CommandReverter()
+
+    def compact(self, commands: t.Sequence[ICommand]) -> t.List[ICommand]:
+        """
+        Compact a list of commands.
+
+        Args:
+            commands: The commands of a variant study, in order of application.
+
+        Returns:
+            The compacted list of commands.
+        """
+        compacted = list(commands)
+        while True:
+            count = len(compacted)
+            compacted = self._merge_overwrite_commands(compacted)
+            if self.cancel_reverted:
+                compacted = self._cancel_reverted_commands(compacted)
+            if len(compacted) == count:
+                logger.info(f"Commands compacted from {len(commands)} to {count}")
+                return compacted
+
+    @staticmethod
+    def _merge_overwrite_commands(commands: t.Sequence[ICommand]) -> t.List[ICommand]:
+        result: t.List[ICommand] = []
+        # index (in `result`) of the mergeable commands of the current sequence, by type and target
+        mergeable: t.Dict[t.Tuple[t.Type[ICommand], str], int] = {}
+        for command in commands:
+            if not isinstance(command, OVERWRITE_COMMANDS):
+                mergeable.clear()
+                result.append(command)
+                continue
+            key = (type(command), command.target)
+            for other_key in [k for k in mergeable if k != key and _overlap(k[1], command.target)]:
+                del mergeable[other_key]
+            if key in mergeable:
+                result[mergeable[key]] = command
+            else:
+                mergeable[key] = len(result)
+                result.append(command)
+        return result
+
+    def _cancel_reverted_commands(self, commands: t.Sequence[ICommand]) -> t.List[ICommand]:
+        result: t.List[ICommand] = []
+        for command in commands:
+            if result and self._is_reverted_by(result[-1], command):
+                result.pop()
+            else:
+                result.append(command)
+        return result
+
+    def _is_reverted_by(self, command: ICommand, other: ICommand) -> bool:
+        if command.command_name not in CREATE_COMMANDS:
+            return False
+        # The creation commands can be reverted without any history nor study.
+        reverted = self.reverter.revert(command, [], t.cast(FileStudy, None))
+        return len(reverted) == 1 and reverted[0].to_dto() == other.to_dto()
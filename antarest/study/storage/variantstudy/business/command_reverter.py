@@ -28,6 +28,7 @@ from antarest.study.storage.variantstudy.model.command.replace_matrix import Rep
 from antarest.study.storage.variantstudy.model.command.update_binding_constraint import UpdateBindingConstraint
 from antarest.study.storage.variantstudy.model.command.update_comments import UpdateComments
 from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_correlation import UpdateCorrelation
 from antarest.study.storage.variantstudy.model.command.update_district import UpdateDistrict
 from antarest.study.storage.variantstudy.model.command.update_playlist import UpdatePlaylist
 from antarest.study.storage.variantstudy.model.command.update_raw_file import UpdateRawFile
@@ -259,6 +260,36 @@ class CommandReverter:
             )
             return []
 
+    @staticmethod
+    def _revert_update_correlation(
+        base_command: UpdateCorrelation,
+        history: t.List["ICommand"],
+        base: FileStudy,
+    ) -> t.List[ICommand]:
+        # The previous state is the last full update of the section, followed by the partial updates.
+        updates: t.List[ICommand] = []
+        for command in reversed(history):
+            if isinstance(command, UpdateCorrelation) and command.target == base_command.target:
+                updates.insert(0, command)
+            elif isinstance(command, UpdateConfig) and command.target == base_command.target:
+                return [command] + updates
+
+        try:
+            extractor = base_command.get_command_extractor()
+            return [extractor.generate_update_config(base.tree, base_command.target.split("/"))] + updates
+        except KeyError:
+            # the section is missing in the base study
+            empty_section = UpdateConfig(
+                target=base_command.target, data={}, command_context=base_command.command_context
+            )
+            return [empty_section] + updates
+        except ChildNotFoundError as e:
+            logger.warning(
+                f"Failed to extract revert command for update_correlation {base_command.target}",
+                exc_info=e,
+            )
+            return updates
+
     @staticmethod
     def _revert_update_comments(
         base_command: UpdateComments,
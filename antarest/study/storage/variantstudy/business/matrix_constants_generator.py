@@ -1,4 +1,5 @@
 import tempfile
+import threading
 from pathlib import Path
 from typing import Dict
 
@@ -54,64 +55,79 @@ _LOCK_FILE_NAME = "matrix_constant_init.lock"
 
 # noinspection SpellCheckingInspection
 class GeneratorMatrixConstants:
+    """
+    Identifiers of the constant matrices used by the commands, in the matrix store.
+
+    The constant matrices are created in the matrix store on first use (or by calling
+    `init_constant_matrices`), so that building the services at startup stays fast.
+    """
+
     def __init__(self, matrix_service: ISimpleMatrixService) -> None:
-        self.hashes: Dict[str, str] = {}
+        self._hashes: Dict[str, str] = {}
+        self._hashes_lock = threading.Lock()
         self.matrix_service: ISimpleMatrixService = matrix_service
         self._lock_dir = tempfile.gettempdir()
 
+    @property
+    def hashes(self) -> Dict[str, str]:
+        if not self._hashes:
+            self.init_constant_matrices()
+        return self._hashes
+
+    @hashes.setter
+    def hashes(self, hashes: Dict[str, str]) -> None:
+        self._hashes = hashes
+
     def init_constant_matrices(
         self,
     ) -> None:
+        with self._hashes_lock:
+            if not self._hashes:
+                self._hashes = self._create_constant_matrices()
+
+    def _create_constant_matrices(self) -> Dict[str, str]:
+        hashes: Dict[str, str] = {}
         with FileLock(str(Path(self._lock_dir) / _LOCK_FILE_NAME)):
-            self.hashes[HYDRO_COMMON_CAPACITY_MAX_POWER_V7] = self.matrix_service.create(
-                matrix_constants.hydro.v7.max_power
-            )
-            self.hashes[HYDRO_COMMON_CAPACITY_RESERVOIR_V7] = self.matrix_service.create(
-                matrix_constants.hydro.v7.reservoir
-            )
-            self.hashes[HYDRO_COMMON_CAPACITY_RESERVOIR_V6] = self.matrix_service.create(
-                matrix_constants.hydro.v6.reservoir
-            )
-            self.hashes[HYDRO_COMMON_CAPACITY_INFLOW_PATTERN] = self.matrix_service.create(
+            hashes[HYDRO_COMMON_CAPACITY_MAX_POWER_V7] = self.matrix_service.create(matrix_constants.hydro.v7.max_power)
+            hashes[HYDRO_COMMON_CAPACITY_RESERVOIR_V7] = self.matrix_service.create(matrix_constants.hydro.v7.reservoir)
+            hashes[HYDRO_COMMON_CAPACITY_RESERVOIR_V6] = self.matrix_service.create(matrix_constants.hydro.v6.reservoir)
+            hashes[HYDRO_COMMON_CAPACITY_INFLOW_PATTERN] = self.matrix_service.create(
                 matrix_constants.hydro.v7.inflow_pattern
             )
-            self.hashes[HYDRO_COMMON_CAPACITY_CREDIT_MODULATION] = self.matrix_service.create(
+            hashes[HYDRO_COMMON_CAPACITY_CREDIT_MODULATION] = self.matrix_service.create(
                 matrix_constants.hydro.v7.credit_modulations
             )
-            self.hashes[PREPRO_CONVERSION] = self.matrix_service.create(matrix_constants.prepro.conversion)
-            self.hashes[PREPRO_DATA] = self.matrix_service.create(matrix_constants.prepro.data)
-            self.hashes[THERMAL_PREPRO_DATA] = self.matrix_service.create(matrix_constants.thermals.prepro.data)
+            hashes[PREPRO_CONVERSION] = self.matrix_service.create(matrix_constants.prepro.conversion)
+            hashes[PREPRO_DATA] = self.matrix_service.create(matrix_constants.prepro.data)
+            hashes[THERMAL_PREPRO_DATA] = self.matrix_service.create(matrix_constants.thermals.prepro.data)
 
-            self.hashes[THERMAL_PREPRO_MODULATION] = self.matrix_service.create(
-                matrix_constants.thermals.prepro.modulation
-            )
-            self.hashes[LINK_V7] = self.matrix_service.create(matrix_constants.link.v7.link)
-            self.hashes[LINK_V8] = self.matrix_service.create(matrix_constants.link.v8.link)
-            self.hashes[LINK_DIRECT] = self.matrix_service.create(matrix_constants.link.v8.direct)
-            self.hashes[LINK_INDIRECT] = self.matrix_service.create(matrix_constants.link.v8.indirect)
+            hashes[THERMAL_PREPRO_MODULATION] = self.matrix_service.create(matrix_constants.thermals.prepro.modulation)
+            hashes[LINK_V7] = self.matrix_service.create(matrix_constants.link.v7.link)
+            hashes[LINK_V8] = self.matrix_service.create(matrix_constants.link.v8.link)
+            hashes[LINK_DIRECT] = self.matrix_service.create(matrix_constants.link.v8.direct)
+            hashes[LINK_INDIRECT] = self.matrix_service.create(matrix_constants.link.v8.indirect)
 
-            self.hashes[NULL_MATRIX_NAME] = self.matrix_service.create(NULL_MATRIX)
-            self.hashes[EMPTY_SCENARIO_MATRIX] = self.matrix_service.create(NULL_SCENARIO_MATRIX)
-            self.hashes[RESERVES_TS] = self.matrix_service.create(FIXED_4_COLUMNS)
-            self.hashes[MISCGEN_TS] = self.matrix_service.create(FIXED_8_COLUMNS)
+            hashes[NULL_MATRIX_NAME] = self.matrix_service.create(NULL_MATRIX)
+            hashes[EMPTY_SCENARIO_MATRIX] = self.matrix_service.create(NULL_SCENARIO_MATRIX)
+            hashes[RESERVES_TS] = self.matrix_service.create(FIXED_4_COLUMNS)
+            hashes[MISCGEN_TS] = self.matrix_service.create(FIXED_8_COLUMNS)
 
         # Binding constraint matrices
         series_before_87 = matrix_constants.binding_constraint.series_before_v87
-        self.hashes[BINDING_CONSTRAINT_HOURLY_v86] = self.matrix_service.create(series_before_87.default_bc_hourly)
-        self.hashes[BINDING_CONSTRAINT_DAILY_WEEKLY_v86] = self.matrix_service.create(
+        hashes[BINDING_CONSTRAINT_HOURLY_v86] = self.matrix_service.create(series_before_87.default_bc_hourly)
+        hashes[BINDING_CONSTRAINT_DAILY_WEEKLY_v86] = self.matrix_service.create(
             series_before_87.default_bc_weekly_daily
         )
 
         series_after_87 = matrix_constants.binding_constraint.series_after_v87
-        self.hashes[BINDING_CONSTRAINT_HOURLY_v87] = self.matrix_service.create(series_after_87.default_bc_hourly)
-        self.hashes[BINDING_CONSTRAINT_DAILY_WEEKLY_v87] = self.matrix_service.create(
+        hashes[BINDING_CONSTRAINT_HOURLY_v87] = self.matrix_service.create(series_after_87.default_bc_hourly)
+        hashes[BINDING_CONSTRAINT_DAILY_WEEKLY_v87] = self.matrix_service.create(
             series_after_87.default_bc_weekly_daily
         )
 
         # Some short-term storage matrices use np.ones((8760, 1))
-        self.hashes[ONES_SCENARIO_MATRIX] = self.matrix_service.create(
-            matrix_constants.st_storage.series.pmax_injection
-        )
+        hashes[ONES_SCENARIO_MATRIX] = self.matrix_service.create(matrix_constants.st_storage.series.pmax_injection)
+        return hashes
 
     def get_hydro_max_power(self, version: int) -> str:
         if version > 650:
@@ -24,6 +24,7 @@ from antarest.study.storage.variantstudy.model.command.replace_matrix import Rep
 from antarest.study.storage.variantstudy.model.command.update_binding_constraint import UpdateBindingConstraint
 from antarest.study.storage.variantstudy.model.command.update_comments import UpdateComments
 from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_correlation import UpdateCorrelation
 from antarest.study.storage.variantstudy.model.command.update_district import UpdateDistrict
 from antarest.study.storage.variantstudy.model.command.update_playlist import UpdatePlaylist
 from antarest.study.storage.variantstudy.model.command.update_raw_file import UpdateRawFile
@@ -49,6 +50,7 @@ COMMAND_MAPPING = {
     CommandName.REMOVE_ST_STORAGE.value: RemoveSTStorage,
     CommandName.REPLACE_MATRIX.value: ReplaceMatrix,
     CommandName.UPDATE_CONFIG.value: UpdateConfig,
+    CommandName.UPDATE_CORRELATION.value: UpdateCorrelation,
     CommandName.UPDATE_COMMENTS.value: UpdateComments,
     CommandName.UPDATE_FILE.value: UpdateRawFile,
     CommandName.UPDATE_DISTRICT.value: UpdateDistrict,
@@ -74,10 +76,24 @@ class CommandFactory:
             patch_service=patch_service,
         )
 
-    def _to_single_command(self, action: str, args: JSON, version: int, command_id: t.Optional[str]) -> ICommand:
+    def _to_single_command(
+        self,
+        action: str,
+        args: JSON,
+        version: int,
+        command_id: t.Optional[str],
+        trusted: bool = False,
+    ) -> ICommand:
         """Convert a single CommandDTO to ICommand."""
         if action in COMMAND_MAPPING:
             command_class = COMMAND_MAPPING[action]
+            if trusted:
+                return command_class.from_trusted_args(
+                    args,
+                    command_context=self.command_context,
+                    version=version,
+                    command_id=command_id,
+                )
             return command_class(  # type: ignore
                 **args,
                 command_context=self.command_context,
@@ -86,12 +102,15 @@ class CommandFactory:
             )
         raise NotImplementedError(action)
 
-    def to_command(self, command_dto: CommandDTO) -> t.List[ICommand]:
+    def to_command(self, command_dto: CommandDTO, trusted: bool = False) -> t.List[ICommand]:
         """
         Convert a CommandDTO to a list of ICommand.
 
         Args:
             command_dto: The CommandDTO to convert.
+            trusted: Whether the command arguments have already been validated,
+                for instance when the command is read from the database.
+                In that case, the most common commands are built without validation.
 
         Returns:
             List: A list of ICommand instances.
@@ -101,20 +120,21 @@ class CommandFactory:
         """
         args = command_dto.args
         if isinstance(args, dict):
-            return [self._to_single_command(command_dto.action, args, command_dto.version, command_dto.id)]
+            return [self._to_single_command(command_dto.action, args, command_dto.version, command_dto.id, trusted)]
         elif isinstance(args, list):
             return [
-                self._to_single_command(command_dto.action, argument, command_dto.version, command_dto.id)
+                self._to_single_command(command_dto.action, argument, command_dto.version, command_dto.id, trusted)
                 for argument in args
             ]
         raise NotImplementedError()
 
-    def to_commands(self, cmd_dto_list: t.List[CommandDTO]) -> t.List[ICommand]:
+    def to_commands(self, cmd_dto_list: t.List[CommandDTO], trusted: bool = False) -> t.List[ICommand]:
         """
         Convert a list of CommandDTO to a list of ICommand.
 
         Args:
             cmd_dto_list: The CommandDTO objects to convert.
+            trusted: Whether the command arguments have already been validated (see `to_command`).
 
         Returns:
             List: A list of ICommand instances.
@@ -122,4 +142,4 @@ class CommandFactory:
         Raises:
             NotImplementedError: If the argument type is not implemented.
         """
-        return [cmd for dto in cmd_dto_list for cmd in self.to_command(dto)]
+        return [cmd for dto in cmd_dto_list for cmd in self.to_command(dto, trusted=trusted)]
@@ -31,6 +31,7 @@ class CommandName(Enum):
     REMOVE_ST_STORAGE = "remove_st_storage"
     REPLACE_MATRIX = "replace_matrix"
     UPDATE_CONFIG = "update_config"
+    UPDATE_CORRELATION = "update_correlation"
     UPDATE_COMMENTS = "update_comments"
     UPDATE_FILE = "update_file"
     UPDATE_DISTRICT = "update_district"
@@ -39,6 +39,55 @@ class ICommand(ABC, BaseModel, extra=Extra.forbid, arbitrary_types_allowed=True,
     version: int
     command_context: CommandContext
 
+    @classmethod
+    def from_trusted_args(
+        cls,
+        args: t.Mapping[str, t.Any],
+        *,
+        command_context: CommandContext,
+        version: int,
+        command_id: t.Optional[str],
+    ) -> "ICommand":
+        """
+        Build a command from arguments which have already been validated,
+        typically the arguments of a `CommandBlock` stored in the database.
+
+        By default, the arguments are validated again. Commands which are very numerous
+        in variant studies can override this method to skip the validation
+        (and the copies it implies), provided that the resulting command is the same.
+
+        Args:
+            args: The command arguments, as returned by `to_dto`.
+            command_context: The context of the command.
+            version: The version of the command.
+            command_id: The ID of the command in the database, if any.
+
+        Returns:
+            The command instance.
+        """
+        return cls(**args, command_context=command_context, version=version, command_id=command_id)
+
+    @classmethod
+    def _construct_trusted(
+        cls,
+        fields: t.Mapping[str, t.Any],
+        *,
+        command_context: CommandContext,
+        version: int,
+        command_id: t.Optional[str],
+    ) -> "ICommand":
+        """
+        Create a command instance without validation: the fields must already have their final type.
+        """
+        return cls.construct(
+            command_id=command_id if command_id is None else uuid.UUID(str(command_id)),
+            # avoid the deep copy of the default value done by `construct`
+            command_name=cls.__fields__["command_name"].default,
+            version=version,
+            command_context=command_context,
+            **fields,
+        )
+
     @abstractmethod
     def _apply_config(self, study_data: FileStudyTreeConfig) -> OutputTuple:
         """
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from pydantic import validator
 
@@ -9,9 +9,11 @@ from antarest.study.storage.rawstudy.model.filesystem.config.model import FileSt
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.rawstudy.model.filesystem.folder_node import ChildNotFoundError
 from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix import MatrixNode
+from antarest.study.storage.variantstudy.business.matrix_constants_generator import MATRIX_PROTOCOL_PREFIX
 from antarest.study.storage.variantstudy.business.utils import AliasDecoder, strip_matrix_protocol, validate_matrix
 from antarest.study.storage.variantstudy.model.command.common import CommandName, CommandOutput
 from antarest.study.storage.variantstudy.model.command.icommand import MATCH_SIGNATURE_SEPARATOR, ICommand
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
 from antarest.study.storage.variantstudy.model.model import CommandDTO
 
 
@@ -34,6 +36,34 @@ class ReplaceMatrix(ICommand):
 
     _validate_matrix = validator("matrix", each_item=True, always=True, allow_reuse=True)(validate_matrix)
 
+    @classmethod
+    def from_trusted_args(
+        cls,
+        args: Mapping[str, Any],
+        *,
+        command_context: CommandContext,
+        version: int,
+        command_id: Optional[str],
+    ) -> ICommand:
+        target, matrix = args.get("target"), args.get("matrix")
+        if (
+            args.keys() != {"target", "matrix"}
+            or not isinstance(target, str)
+            or not isinstance(matrix, str)
+            or not matrix
+            or matrix.startswith(MATRIX_PROTOCOL_PREFIX)
+        ):
+            return super().from_trusted_args(
+                args, command_context=command_context, version=version, command_id=command_id
+            )
+        # The matrix was checked when the command was stored: no need to check its existence again.
+        return cls._construct_trusted(
+            {"target": target, "matrix": MATRIX_PROTOCOL_PREFIX + matrix},
+            command_context=command_context,
+            version=version,
+            command_id=command_id,
+        )
+
     def _apply_config(self, study_data: FileStudyTreeConfig) -> Tuple[CommandOutput, Dict[str, Any]]:
         return (
             CommandOutput(
@@ -8,6 +8,7 @@ from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.rawstudy.model.filesystem.ini_file_node import IniFileNode
 from antarest.study.storage.variantstudy.model.command.common import CommandName, CommandOutput
 from antarest.study.storage.variantstudy.model.command.icommand import MATCH_SIGNATURE_SEPARATOR, ICommand
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
 from antarest.study.storage.variantstudy.model.model import CommandDTO
 
 _ENR_MODELLING_KEY = "settings/generaldata/other preferences/renewable-generation-modelling"
@@ -41,6 +42,30 @@ class UpdateConfig(ICommand):
     target: str
     data: _Data
 
+    @classmethod
+    def from_trusted_args(
+        cls,
+        args: t.Mapping[str, t.Any],
+        *,
+        command_context: CommandContext,
+        version: int,
+        command_id: t.Optional[str],
+    ) -> ICommand:
+        target, data = args.get("target"), args.get("data", ...)
+        if args.keys() != {"target", "data"} or not isinstance(target, str):
+            return super().from_trusted_args(
+                args, command_context=command_context, version=version, command_id=command_id
+            )
+        if isinstance(data, (int, float)):
+            # Same coercion as the validation of the `data` field (`str` is the first type of the union)
+            data = str(data)
+        return cls._construct_trusted(
+            {"target": target, "data": data},
+            command_context=command_context,
+            version=version,
+            command_id=command_id,
+        )
+
     def _apply_config(self, study_data: FileStudyTreeConfig) -> t.Tuple[CommandOutput, t.Dict[str, t.Any]]:
         # The renewable-generation-modelling parameter must be reflected in the config
         if self.target.startswith("settings"):
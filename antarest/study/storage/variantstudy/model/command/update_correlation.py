@@ -0,0 +1,95 @@
+import typing as t
+
+from pydantic import validator
+
+from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.rawstudy.model.filesystem.ini_file_node import IniFileNode
+from antarest.study.storage.variantstudy.model.command.common import CommandName, CommandOutput
+from antarest.study.storage.variantstudy.model.command.icommand import MATCH_SIGNATURE_SEPARATOR, ICommand
+from antarest.study.storage.variantstudy.model.model import CommandDTO
+
+
+class UpdateCorrelation(ICommand):
+    """
+    Command used to update some coefficients of a correlation matrix,
+    for instance the section `annual` of `input/hydro/prepro/correlation.ini`.
+
+    Only the given pairs of areas are modified: the other coefficients of the section are kept.
+    """
+
+    # Overloaded metadata
+    # ===================
+
+    command_name = CommandName.UPDATE_CORRELATION
+    version = 1
+
+    # Command parameters
+    # ==================
+
+    target: str
+    data: t.Dict[str, t.Optional[float]]
+    """
+    Coefficients of the updated pairs of areas, indexed by keys of the form `area1%area2`.
+    A null (or missing) coefficient is removed from the section.
+    """
+
+    # noinspection PyMethodParameters
+    @validator("data")
+    def _check_pairs(cls, data: t.Dict[str, t.Optional[float]]) -> t.Dict[str, t.Optional[float]]:
+        if invalid_keys := [key for key in data if len(key.split("%")) != 2]:
+            raise ValueError(f"Invalid correlation keys (expected 'area1%area2'): {invalid_keys}")
+        return data
+
+    def _apply_config(self, study_data: FileStudyTreeConfig) -> t.Tuple[CommandOutput, t.Dict[str, t.Any]]:
+        return CommandOutput(status=True, message="ok"), {}
+
+    def _apply(self, study_data: FileStudy) -> CommandOutput:
+        url = self.target.split("/")
+        file_url, section = url[:-1], url[-1]
+        tree_node = study_data.tree.get_node(file_url)
+        if not isinstance(tree_node, IniFileNode):
+            return CommandOutput(
+                status=False,
+                message=f"Study node at path {self.target} is invalid",
+            )
+
+        ini_data = study_data.tree.get(file_url)
+        correlation_cfg = dict(ini_data.get(section, {}))
+        for key, coefficient in self.data.items():
+            a1, a2 = key.split("%")
+            # The coefficient of a pair may be stored in any order
+            correlation_cfg.pop(f"{a2}%{a1}", None)
+            if coefficient:
+                correlation_cfg[key] = coefficient
+            else:
+                correlation_cfg.pop(key, None)
+
+        study_data.tree.save(correlation_cfg, url)
+        return CommandOutput(status=True, message="ok")
+
+    def to_dto(self) -> CommandDTO:
+        return CommandDTO(
+            action=CommandName.UPDATE_CORRELATION.value,
+            args={
+                "target": self.target,
+                "data": self.data,
+            },
+        )
+
+    def match_signature(self) -> str:
+        return str(self.command_name.value + MATCH_SIGNATURE_SEPARATOR + self.target)
+
+    def match(self, other: ICommand, equal: bool = False) -> bool:
+        if not isinstance(other, UpdateCorrelation):
+            return False
+        simple_match = self.target == other.target
+        if not equal:
+            return simple_match
+        return simple_match and self.data == other.data
+
+    def _create_diff(self, other: "ICommand") -> t.List["ICommand"]:
+        return [other]
+
+    def get_inner_matrices(self) -> t.List[str]:
+        return []
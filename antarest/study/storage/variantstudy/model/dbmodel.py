@@ -57,7 +57,8 @@ class CommandBlock(Base):  # type: ignore
     def to_dto(self) -> CommandDTO:
         # Database may lack a version number, defaulting to 1 if so.
         version = self.version or 1
-        return CommandDTO(id=self.id, action=self.command, args=json.loads(self.args), version=version)
+        # The arguments were validated before being stored: no need to validate them again.
+        return CommandDTO.construct(id=self.id, action=self.command, args=json.loads(self.args), version=version)
 
     def __str__(self) -> str:
         return (
@@ -88,6 +88,24 @@ class VariantStudyRepository(StudyMetadataRepository):
         cmd_blocks: t.List[CommandBlock] = self.session.query(CommandBlock).all()
         return cmd_blocks
 
+    def get_command_blocks(self, study_id: str) -> t.List[CommandBlock]:
+        """
+        Get the command blocks of a variant study, as currently stored in the database.
+
+        The command blocks already loaded in the session are refreshed,
+        so that the changes committed by other sessions are taken into account.
+
+        Args:
+            study_id: Identifier of the variant study.
+
+        Returns:
+            List of `CommandBlock` objects, ordered by index.
+        """
+        q = self.session.query(CommandBlock).filter(CommandBlock.study_id == study_id)
+        q = q.order_by(CommandBlock.index).populate_existing()
+        cmd_blocks: t.List[CommandBlock] = q.all()
+        return cmd_blocks
+
     def find_variants(self, variant_ids: t.Sequence[str]) -> t.Sequence[VariantStudy]:
         """
         Find a list of variants by IDs
@@ -4,12 +4,14 @@ This module dedicated to variant snapshot generation.
 import datetime
 import logging
 import shutil
+import time
 import typing as t
 from pathlib import Path
 
 from antarest.core.exceptions import VariantGenerationError
 from antarest.core.interfaces.cache import CacheConstants, ICache
 from antarest.core.jwt import JWTUser
+from antarest.core.metrics import REGISTRY
 from antarest.core.model import StudyPermissionType
 from antarest.core.tasks.service import TaskUpdateNotifier, noop_notifier
 from antarest.study.model import RawStudy, StudyAdditionalData
@@ -29,6 +31,13 @@ logger = logging.getLogger(__name__)
 
 OUTPUT_RELATIVE_PATH = "output"
 
+SNAPSHOT_GENERATION_DURATION = REGISTRY.histogram(
+    "antarest_snapshot_generation_seconds",
+    "Duration of the generation of the variant study snapshots, by status (success or failure)",
+    ("status",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0),
+)
+
 
 class SnapshotGenerator:
     """
@@ -69,6 +78,7 @@ class SnapshotGenerator:
         # The locking done at the task level nevertheless makes it possible to limit the risks.
 
         logger.info(f"Generating variant study snapshot for '{variant_study_id}'")
+        start = time.perf_counter()
 
         root_study, descendants = self._retrieve_descendants(variant_study_id)
         assert_permission_on_studies(jwt_user, [root_study, *descendants], StudyPermissionType.READ, raising=True)
@@ -117,9 +127,11 @@ class SnapshotGenerator:
 
         except Exception:
             shutil.rmtree(snapshot_dir, ignore_errors=True)
+            SNAPSHOT_GENERATION_DURATION.labels("failure").observe(time.perf_counter() - start)
             raise
 
         else:
+            SNAPSHOT_GENERATION_DURATION.labels("success").observe(time.perf_counter() - start)
             try:
                 notifier(results.json())
             except Exception as exc:
@@ -128,6 +140,27 @@ class SnapshotGenerator:
 
         return results
 
+    def generate_parent_snapshot(self, variant_study_id: str, dest_dir: Path) -> None:
+        """
+        Generate, in a given directory, the study on which the commands of a variant study are applied.
+
+        The parent study is generated from the most recent snapshot of the ancestors
+        (or from the root study), without modifying the snapshots of the variant studies.
+        The matrices are not de-normalized.
+
+        Args:
+            variant_study_id: The ID of the variant study.
+            dest_dir: The directory where the parent study is generated (it must not exist).
+
+        Raises:
+            VariantGenerationError: If the commands of the ancestors cannot be applied.
+        """
+        root_study, descendants = self._retrieve_descendants(variant_study_id)
+        search_result = search_ref_study(root_study, descendants[:-1])
+        logger.info(f"Exporting the reference study '{search_result.ref_study.id}' to '{dest_dir}'...")
+        self._export_ref_study(dest_dir, search_result.ref_study)
+        self._apply_commands(dest_dir, descendants[-1], search_result.cmd_blocks)
+
     def _retrieve_descendants(self, variant_study_id: str) -> t.Tuple[RawStudy, t.Sequence[VariantStudy]]:
         # Get all ancestors of the current study from bottom to top
         # The first IDs are variant IDs, the last is the root study ID.
@@ -163,7 +196,7 @@ class SnapshotGenerator:
         variant_study: VariantStudy,
         cmd_blocks: t.Sequence[CommandBlock],
     ) -> GenerationResultInfoDTO:
-        commands = [self.command_factory.to_command(cb.to_dto()) for cb in cmd_blocks]
+        commands = [self.command_factory.to_command(cb.to_dto(), trusted=True) for cb in cmd_blocks]
         generator = VariantCommandGenerator(self.study_factory)
         results = generator.generate(
             commands,
@@ -3,6 +3,7 @@ import json
 import logging
 import re
 import shutil
+import tempfile
 import typing as t
 from datetime import datetime
 from functools import reduce
@@ -33,7 +34,7 @@ from antarest.core.model import JSON, PermissionInfo, PublicMode, StudyPermissio
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
 from antarest.core.tasks.model import CustomTaskEventMessages, TaskDTO, TaskResult, TaskType
 from antarest.core.tasks.service import DEFAULT_AWAIT_MAX_TIMEOUT, ITaskService, TaskUpdateNotifier, noop_notifier
-from antarest.core.utils.utils import assert_this, suppress_exception
+from antarest.core.utils.utils import assert_this, diff_directories, suppress_exception
 from antarest.matrixstore.service import MatrixService
 from antarest.study.model import RawStudy, Study, StudyAdditionalData, StudyMetadataDTO, StudySimResultDTO
 from antarest.study.storage.abstract_storage_service import AbstractStorageService
@@ -41,7 +42,14 @@ from antarest.study.storage.patch_service import PatchService
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig, FileStudyTreeConfigDTO
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy, StudyFactory
 from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
-from antarest.study.storage.utils import assert_permission, export_study_flat, is_managed, remove_from_cache
+from antarest.study.storage.utils import (
+    assert_permission,
+    export_study_flat,
+    get_study_cache_ids,
+    is_managed,
+    remove_from_cache,
+)
+from antarest.study.storage.variantstudy.business.command_compactor import CommandCompactor
 from antarest.study.storage.variantstudy.business.utils import transform_command_to_dto
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
@@ -62,6 +70,10 @@ SNAPSHOT_RELATIVE_PATH = "snapshot"
 OUTPUT_RELATIVE_PATH = "output"
 
 
+def _get_commands_signature(command_blocks: t.Sequence[CommandBlock]) -> t.List[t.Tuple[str, str, str, int]]:
+    return [(block.id, block.command, block.args, block.version) for block in command_blocks]
+
+
 class VariantStudyService(AbstractStorageService[VariantStudy]):
     def __init__(
         self,
@@ -313,7 +325,7 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
             for matrix in suppress_exception(
                 lambda: reduce(
                     lambda m, c: m + c.get_inner_matrices(),
-                    self.command_factory.to_command(command.to_dto()),
+                    self.command_factory.to_command(command.to_dto(), trusted=True),
                     t.cast(t.List[str], []),
                 ),
                 lambda e: logger.warning(f"Failed to parse command {command}", exc_info=e),
@@ -361,15 +373,20 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
         variant_study: Study,
         invalidate_self_snapshot: bool = False,
     ) -> None:
-        remove_from_cache(self.cache, variant_study.id)
-        if isinstance(variant_study, VariantStudy) and variant_study.snapshot and invalidate_self_snapshot:
-            variant_study.snapshot.last_executed_command = None
-        self.repository.save(
-            metadata=variant_study,
-            update_modification_date=True,
-        )
-        for child in self.repository.get_children(parent_id=variant_study.id):
-            self.invalidate_cache(child, invalidate_self_snapshot=True)
+        # The cache entries of the whole variant tree are removed at once, in a single round trip.
+        cache_ids: t.List[str] = []
+        pending = [(variant_study, invalidate_self_snapshot)]
+        while pending:
+            study, invalidate_snapshot = pending.pop()
+            cache_ids.extend(get_study_cache_ids(study.id))
+            if isinstance(study, VariantStudy) and study.snapshot and invalidate_snapshot:
+                study.snapshot.last_executed_command = None
+            self.repository.save(
+                metadata=study,
+                update_modification_date=True,
+            )
+            pending.extend((child, True) for child in self.repository.get_children(parent_id=study.id))
+        self.cache.invalidate_all(cache_ids)
 
     def clear_snapshot(self, variant_study: Study) -> None:
         logger.info(f"Clearing snapshot for study {variant_study.id}")
@@ -626,6 +643,104 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
             self.repository.save(metadata)
             return str(metadata.generation_task)
 
+    def compact_commands(self, study_id: str, params: RequestParameters) -> str:
+        """
+        Launch a task which replaces the commands of a variant study by an equivalent, shorter list of commands.
+
+        The compacted commands are saved only if the study generated with them
+        is identical to the study generated with the original commands.
+
+        Args:
+            study_id: The variant study ID.
+            params: The request parameters (WRITE permission is required).
+
+        Returns:
+            The ID of the compaction task.
+        """
+        study = self._get_variant_study(study_id, params)
+        assert_permission(params.user, study, StudyPermissionType.WRITE)
+        self._check_update_authorization(study)
+
+        def callback(notifier: TaskUpdateNotifier) -> TaskResult:
+            return self._compact_commands(study_id, notifier)
+
+        return self.task_service.add_task(
+            action=callback,
+            name=f"Compaction of the commands of {study_id} study",
+            task_type=TaskType.VARIANT_COMPACTION,
+            ref_id=study_id,
+            custom_event_messages=None,
+            request_params=params,
+        )
+
+    def _compact_commands(self, study_id: str, notifier: TaskUpdateNotifier) -> TaskResult:
+        study = self._get_variant_study(study_id, RequestParameters(DEFAULT_ADMIN_USER))
+        # The arguments of a command can be edited in place: the whole content of the commands is compared
+        signature = _get_commands_signature(self.repository.get_command_blocks(study_id))
+        commands = [cmd for block in study.commands for cmd in self.command_factory.to_command(block.to_dto(), True)]
+
+        # The compaction with all the rules is tried first. If it modifies the study
+        # (some commands are not exactly reverted), only the safest rules are used.
+        candidates: t.List[t.List[ICommand]] = []
+        for compactor in [CommandCompactor(), CommandCompactor(cancel_reverted=False)]:
+            compacted = compactor.compact(commands)
+            if len(compacted) < len(commands) and compacted not in candidates:
+                candidates.append(compacted)
+        if not candidates:
+            return TaskResult(success=True, message=f"The {len(commands)} commands of {study_id} cannot be compacted")
+
+        with tempfile.TemporaryDirectory(dir=self.config.storage.tmp_dir) as tmp_dir:
+            original_dir = Path(tmp_dir) / "original"
+            generator = SnapshotGenerator(
+                cache=self.cache,
+                raw_study_service=self.raw_study_service,
+                command_factory=self.command_factory,
+                study_factory=self.study_factory,
+                patch_service=self.patch_service,
+                repository=self.repository,
+            )
+            generator.generate_parent_snapshot(study_id, original_dir)
+            parent_dir = Path(tmp_dir) / "parent"
+            shutil.copytree(original_dir, parent_dir)
+            if not self._apply_commands_to_dir(commands, original_dir):
+                return TaskResult(success=False, message=f"Failed to generate {study_id} to check the compaction")
+
+            for index, compacted in enumerate(candidates):
+                notifier(f"Checking the compaction of {len(commands)} commands into {len(compacted)} commands")
+                compacted_dir = Path(tmp_dir) / f"compacted{index}"
+                shutil.copytree(parent_dir, compacted_dir)
+                if self._apply_commands_to_dir(compacted, compacted_dir):
+                    differences = diff_directories(original_dir, compacted_dir)
+                    if not differences:
+                        break
+                    logger.warning(f"The compaction of {study_id} would modify the files: {differences}")
+            else:
+                return TaskResult(success=False, message=f"The compaction would modify the {study_id} study")
+
+        # The commands may have been added, removed or edited during the check
+        self.repository.refresh(study)
+        if _get_commands_signature(self.repository.get_command_blocks(study_id)) != signature:
+            return TaskResult(success=False, message=f"The commands of {study_id} were modified during the compaction")
+
+        # noinspection PyArgumentList
+        study.commands = [
+            CommandBlock(command=dto.action, args=json.dumps(dto.args), index=i, version=dto.version)
+            for i, dto in enumerate(command.to_dto() for command in compacted)
+        ]
+        self.invalidate_cache(study, invalidate_self_snapshot=True)
+        return TaskResult(
+            success=True,
+            message=f"The commands of {study_id} were compacted from {len(commands)} to {len(compacted)}",
+        )
+
+    def _apply_commands_to_dir(self, commands: t.Sequence[ICommand], dest_dir: Path) -> bool:
+        results = VariantCommandGenerator(self.study_factory).generate(
+            [[command] for command in commands],
+            dest_dir,
+            delete_on_failure=False,
+        )
+        return results.success
+
     def generate(
         self,
         variant_study_id: str,
@@ -722,7 +837,7 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
 
     def _to_commands(self, metadata: VariantStudy, from_index: int = 0) -> t.List[t.List[ICommand]]:
         commands: t.List[t.List[ICommand]] = [
-            self.command_factory.to_command(command_block.to_dto())
+            self.command_factory.to_command(command_block.to_dto(), trusted=True)
             for index, command_block in enumerate(metadata.commands)
             if from_index <= index
         ]
@@ -1,5 +1,6 @@
 import collections
 import http
+import importlib.util
 import io
 import json
 import logging
@@ -14,6 +15,7 @@ from antarest.core.config import Config
 from antarest.core.jwt import JWTUser
 from antarest.core.model import SUB_JSON
 from antarest.core.requests import RequestParameters
+from antarest.core.serialization import to_json
 from antarest.core.swagger import get_path_examples
 from antarest.core.utils.utils import sanitize_uuid
 from antarest.core.utils.web import APITag
@@ -23,11 +25,10 @@ from antarest.study.service import StudyService
 from antarest.study.storage.df_download import TableExportFormat, export_file
 from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix import MatrixFrequency
 
-try:
-    import tables  # type: ignore
-    import xlsxwriter  # type: ignore
-except ImportError:
-    raise ImportError("The 'xlsxwriter' and 'tables' packages are required") from None
+# The export packages are only imported by pandas when a table is exported,
+# but their presence is checked at startup (importing `tables` takes more than a second).
+if importlib.util.find_spec("tables") is None or importlib.util.find_spec("xlsxwriter") is None:
+    raise ImportError("The 'xlsxwriter' and 'tables' packages are required")
 
 logger = logging.getLogger(__name__)
 
@@ -163,16 +164,7 @@ def create_raw_study_routes(
 
         # We want to allow `NaN`, `+Infinity`, and `-Infinity` values in the JSON response
         # even though they are not standard JSON values because they are supported in JavaScript.
-        # Additionally, we cannot use `orjson` because, despite its superior performance, it converts
-        # `NaN` and other values to `null`, even when using a custom encoder.
-        json_response = json.dumps(
-            output,
-            ensure_ascii=False,
-            allow_nan=True,
-            indent=None,
-            separators=(",", ":"),
-        ).encode("utf-8")
-        return Response(content=json_response, media_type="application/json")
+        return Response(content=to_json(output), media_type="application/json")
 
     @bp.get(
         "/studies/{uuid}/areas/aggregate/{output_id}",
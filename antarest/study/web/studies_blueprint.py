@@ -95,6 +95,10 @@ def create_study_routes(study_service: StudyService, ftm: FileTransferManager, c
         page_size: NonNegativeInt = Query(
             0, description="Number of studies per page (0 = no limit).", alias="pageSize"
         ),
+        after: str = Query(
+            "",
+            description="ID of the last study of the previous page (keyset pagination, replaces `pageNb`).",
+        ),
     ) -> t.Dict[str, StudyMetadataDTO]:
         """
         Get the list of studies matching the specified criteria.
@@ -116,6 +120,7 @@ def create_study_routes(study_service: StudyService, ftm: FileTransferManager, c
         - `sortBy`: Sort studies based on their name (case-insensitive) or date.
         - `pageNb`: Page number (starting from 0).
         - `pageSize`: Number of studies per page (0 = no limit).
+        - `after`: ID of the last study of the previous page (keyset pagination, replaces `pageNb`).
 
         Returns:
         - A dictionary of studies matching the specified criteria,
@@ -149,7 +154,7 @@ def create_study_routes(study_service: StudyService, ftm: FileTransferManager, c
         matching_studies = study_service.get_studies_information(
             study_filter=study_filter,
             sort_by=sort_by,
-            pagination=StudyPagination(page_nb=page_nb, page_size=page_size),
+            pagination=StudyPagination(page_nb=page_nb, page_size=page_size, after=after),
         )
 
         return matching_studies
@@ -373,6 +373,34 @@ def create_study_variant_routes(
         sanitized_uuid = sanitize_uuid(uuid)
         return variant_study_service.generate(sanitized_uuid, denormalize, from_scratch, params)
 
+    @bp.put(
+        "/studies/{uuid}/compact",
+        tags=[APITag.study_variant_management],
+        summary="Compact the commands of a variant study",
+        response_model=str,
+    )
+    def compact_commands(
+        uuid: str,
+        current_user: JWTUser = Depends(auth.get_current_user),
+    ) -> str:
+        """
+        Launch a task which replaces the commands of a variant study by an equivalent, shorter list of commands
+        (for instance, successive updates of the same configuration are merged).
+        The compacted commands are saved only if they generate the same study as the original commands.
+
+        Parameters:
+        - `uuid`: The UUID of the variant study.
+
+        Returns the ID of the compaction task.
+        """
+        logger.info(
+            f"Compacting the commands of variant study {uuid}",
+            extra={"user": current_user.id},
+        )
+        params = RequestParameters(user=current_user)
+        sanitized_uuid = sanitize_uuid(uuid)
+        return variant_study_service.compact_commands(sanitized_uuid, params)
+
     @bp.get(
         "/studies/{uuid}/task",
         tags=[APITag.study_variant_management],
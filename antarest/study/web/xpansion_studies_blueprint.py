@@ -1,4 +1,3 @@
-import json
 import logging
 import typing as t
 
@@ -9,6 +8,7 @@ from antarest.core.config import Config
 from antarest.core.jwt import JWTUser
 from antarest.core.model import JSON, StudyPermissionType
 from antarest.core.requests import RequestParameters
+from antarest.core.serialization import to_json
 from antarest.core.utils.web import APITag
 from antarest.login.auth import Auth
 from antarest.study.business.xpansion_management import (
@@ -270,14 +270,7 @@ def create_xpansion_routes(study_service: StudyService, config: Config) -> APIRo
             except (AttributeError, UnicodeDecodeError):
                 pass
 
-        json_response = json.dumps(
-            output,
-            ensure_ascii=False,
-            allow_nan=True,
-            indent=None,
-            separators=(",", ":"),
-        ).encode("utf-8")
-        return Response(content=json_response, media_type="application/json")
+        return Response(content=to_json(output), media_type="application/json")
 
     @bp.get(
         "/studies/{uuid}/extensions/xpansion/resources/{resource_type}",
@@ -3,7 +3,6 @@ from pathlib import Path
 
 from antarest.core.config import Config
 from antarest.core.utils.utils import get_local_path
-from antarest.launcher.adapters.slurm_launcher.slurm_launcher import WORKSPACE_LOCK_FILE_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,9 @@ def get_config(config_path: Path) -> Config:
 
 def clean_locks_from_config(config: Config) -> None:
     if config.launcher.slurm:
+        # Importing the SLURM launcher (and `antareslauncher`) is slow, it is only done when it is configured
+        from antarest.launcher.adapters.slurm_launcher.slurm_launcher import WORKSPACE_LOCK_FILE_NAME
+
         slurm_workspace = config.launcher.slurm.local_workspace
         if slurm_workspace.exists() and slurm_workspace.is_dir():
             for workspace in slurm_workspace.iterdir():
@@ -1,11 +1,12 @@
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
 
 from antarest.study.model import NEW_DEFAULT_STUDY_VERSION
-from antarest.study.storage.study_upgrader import upgrade_study
+from antarest.study.storage.study_upgrader import upgrade_studies, upgrade_study
+from antarest.study.storage.study_upgrader.utils import process_pool
 from antarest.tools.lib import extract_commands, generate_diff, generate_study
 
 
@@ -149,7 +150,8 @@ def cli_generate_script_diff(base: str, variant: str, output: str, version: str)
 @commands.command("upgrade-study")
 @click.argument(
     "study-path",
-    nargs=1,
+    nargs=-1,
+    required=True,
     type=click.Path(exists=True, dir_okay=True, readable=True, writable=True),
 )
 @click.argument(
@@ -157,14 +159,42 @@ def cli_generate_script_diff(base: str, variant: str, output: str, version: str)
     nargs=1,
     type=click.STRING,
 )
-def cli_upgrade_study(study_path: Path, target_version: str) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    nargs=1,
+    required=False,
+    type=click.IntRange(min=1),
+    help="Maximum number of studies upgraded concurrently. Default: 4",
+    default=4,
+)
+@click.option(
+    "--processes",
+    "-p",
+    nargs=1,
+    required=False,
+    type=click.IntRange(min=1),
+    help="Maximum number of processes rewriting the matrices, shared by all the studies. Default: number of CPUs",
+    default=None,
+)
+def cli_upgrade_study(study_path: Tuple[str, ...], target_version: str, jobs: int, processes: Optional[int]) -> None:
     """Upgrades study version
 
-    STUDY_PATH is the path of the study you want to update
+    STUDY_PATH is the path of the study you want to update (several paths can be given)
 
     TARGET_VERSION is the version you want your study to be at (example 8.4.0 or 840)
     """
-    upgrade_study(Path(study_path), target_version.replace(".", ""))
+    target_version = target_version.replace(".", "")
+    with process_pool(max_workers=processes):
+        if len(study_path) == 1:
+            upgrade_study(Path(study_path[0]), target_version)
+            return
+        results = upgrade_studies([Path(p) for p in study_path], target_version, max_workers=jobs)
+    failures = {path: exc for path, exc in results.items() if exc is not None}
+    for path, exc in failures.items():
+        print(f"Failed to upgrade '{path}': {exc}")
+    if failures:
+        exit(1)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,11 @@
-import datetime
 import logging
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional, Tuple
 
 import redis
-import sqlalchemy.ext.baked  # type: ignore
-import uvicorn  # type: ignore
 from fastapi import FastAPI
-from fastapi_jwt_auth import AuthJWT  # type: ignore
-from ratelimit import RateLimitMiddleware  # type: ignore
-from ratelimit.backends.redis import RedisBackend  # type: ignore
-from ratelimit.backends.simple import MemoryBackend  # type: ignore
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine  # type: ignore
 from sqlalchemy.engine.base import Engine  # type: ignore
 from sqlalchemy.pool import NullPool  # type: ignore
 
@@ -26,6 +19,13 @@ from antarest.core.maintenance.main import build_maintenance_manager
 from antarest.core.persistence import upgrade_db
 from antarest.core.tasks.main import build_taskjob_manager
 from antarest.core.tasks.service import ITaskService
+from antarest.core.utils.fastapi_sqlalchemy.pool import (
+    BACKGROUND_POOL,
+    INTERACTIVE_POOL,
+    MonitoredQueuePool,
+    register_pool_metrics,
+)
+from antarest.core.utils.fastapi_sqlalchemy.query_monitor import QueryMonitor
 from antarest.core.utils.utils import new_redis_instance
 from antarest.eventbus.main import build_eventbus
 from antarest.launcher.main import build_launcher
@@ -68,39 +68,75 @@ class Module(str, Enum):
     SIMULATOR_WORKER = "simulator_worker"
 
 
-def init_db_engine(
-    config_file: Path,
-    config: Config,
-    auto_upgrade_db: bool,
-) -> Engine:
-    if auto_upgrade_db:
-        upgrade_db(config_file)
+def _create_db_engine(config: Config, pool_name: str, pool_size: int, max_overflow: int, timeout: int) -> Engine:
     connect_args: Dict[str, Any] = {}
     if config.db.db_url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
     else:
         connect_args["connect_timeout"] = config.db.db_connect_timeout
 
-    extra = {}
+    extra: Dict[str, Any] = {}
     if config.db.pool_use_null:
         extra["poolclass"] = NullPool
     elif not config.db.db_url.startswith("sqlite"):
+        extra["poolclass"] = MonitoredQueuePool
+        extra["pool_logging_name"] = pool_name
+        extra["pool_timeout"] = timeout
         if config.db.pool_pre_ping:
             extra["pool_pre_ping"] = True
         if config.db.pool_recycle:
             extra["pool_recycle"] = config.db.pool_recycle
-        if config.db.pool_max_overflow:
-            extra["max_overflow"] = config.db.pool_max_overflow
-        if config.db.pool_size:
-            extra["pool_size"] = config.db.pool_size
+        if max_overflow:
+            extra["max_overflow"] = max_overflow
+        if pool_size:
+            extra["pool_size"] = pool_size
         if config.db.pool_use_lifo:
             extra["pool_use_lifo"] = config.db.pool_use_lifo
 
     engine = create_engine(config.db.db_url, echo=config.debug, connect_args=connect_args, **extra)
-
+    if isinstance(engine.pool, MonitoredQueuePool):
+        register_pool_metrics(engine)
     return engine
 
 
+def init_db_engine(
+    config_file: Path,
+    config: Config,
+    auto_upgrade_db: bool,
+) -> Engine:
+    """Create the engine of the HTTP requests, after upgrading the database if requested."""
+    if auto_upgrade_db:
+        upgrade_db(config_file)
+    return _create_db_engine(
+        config,
+        INTERACTIVE_POOL,
+        pool_size=config.db.pool_size,
+        max_overflow=config.db.pool_max_overflow,
+        timeout=config.db.pool_timeout,
+    )
+
+
+def init_background_db_engine(config: Config) -> Engine:
+    """Create the engine of the background work (tasks, watcher, garbage collector, launcher callbacks...)."""
+    return _create_db_engine(
+        config,
+        BACKGROUND_POOL,
+        pool_size=config.db.background_pool_size,
+        max_overflow=config.db.background_pool_max_overflow,
+        timeout=config.db.background_pool_timeout,
+    )
+
+
+def create_query_monitor(config: Config) -> QueryMonitor:
+    """Create the monitor of the SQL statements executed in the requests and the background tasks."""
+    return QueryMonitor(
+        budget=config.db.query_budget,
+        budgets=config.db.query_budgets,
+        repeat_threshold=config.db.query_repeat_threshold,
+        strict=config.db.query_budget_strict,
+    )
+
+
 def create_event_bus(application: Optional[FastAPI], config: Config) -> Tuple[IEventBus, Optional[redis.Redis]]:  # type: ignore
     redis_client = new_redis_instance(config.redis) if config.redis is not None else None
     return (
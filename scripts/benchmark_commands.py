@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+Benchmark the conversion of variant study commands read from the database.
+
+The script generates a synthetic variant study made of `UpdateConfig` and `ReplaceMatrix` commands
+(the most common commands in real variants) and compares the time spent by `CommandFactory.to_commands`
+with the full validation and with the trusted path used for the commands stored in the database.
+The time spent reading the command blocks (`CommandBlock.to_dto`) is measured separately.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+import antarest.dbmodel  # noqa: F401  # register all the ORM models
+from antarest.matrixstore.repository import MatrixContentRepository
+from antarest.matrixstore.service import SimpleMatrixService
+from antarest.study.storage.patch_service import PatchService
+from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
+from antarest.study.storage.variantstudy.command_factory import CommandFactory
+from antarest.study.storage.variantstudy.model.command.common import CommandName
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock
+
+
+def generate_command_blocks(matrix_service: SimpleMatrixService, nb_commands: int) -> t.List[CommandBlock]:
+    matrix_ids = [matrix_service.create([[float(i), 2.0], [3.0, 4.0]]) for i in range(100)]
+    command_blocks = []
+    for index in range(nb_commands):
+        if index % 2:
+            action = CommandName.REPLACE_MATRIX.value
+            args: t.Dict[str, t.Any] = {
+                "target": f"input/load/series/load_area{index % 500}",
+                "matrix": matrix_ids[index % len(matrix_ids)],
+            }
+        else:
+            action = CommandName.UPDATE_CONFIG.value
+            args = {
+                "target": f"input/areas/area{index % 500}/optimization/nodal optimization",
+                "data": {"spread-unsupplied-energy-cost": str(index), "non-dispatchable-power": "true"},
+            }
+        command_blocks.append(
+            CommandBlock(
+                id=f"00000000-0000-0000-0000-{index:012d}",
+                study_id="variant",
+                index=index,
+                command=action,
+                version=1,
+                args=json.dumps(args),
+            )
+        )
+    return command_blocks
+
+
+def benchmark(nb_commands: int, repeat: int) -> t.Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        matrix_service = SimpleMatrixService(MatrixContentRepository(Path(tmp_dir)))
+        command_factory = CommandFactory(
+            generator_matrix_constants=GeneratorMatrixConstants(matrix_service),
+            matrix_service=matrix_service,
+            patch_service=PatchService(),
+        )
+        command_blocks = generate_command_blocks(matrix_service, nb_commands)
+        results = {}
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            command_dtos = [cb.to_dto() for cb in command_blocks]
+            durations.append(time.perf_counter() - start)
+        results["to_dto"] = min(durations)
+        for trusted in [False, True]:
+            durations = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                command_factory.to_commands(command_dtos, trusted=trusted)
+                durations.append(time.perf_counter() - start)
+            results["trusted" if trusted else "validated"] = min(durations)
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("-n", "--commands", type=int, default=50_000, help="number of commands in the variant")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="number of runs (the best one is kept)")
+    args = parser.parse_args()
+
+    results = benchmark(args.commands, args.repeat)
+    for name, duration in results.items():
+        print(f"{name:>10}: {duration:.3f}s ({args.commands / duration:,.0f} commands/s)")
+    print(f"   speedup: x{results['validated'] / results['trusted']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
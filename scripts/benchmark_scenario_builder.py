@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+"""
+Benchmark the scenario builder rulesets on a synthetic large study.
+
+The script generates a ruleset where all the thermal clusters have a rule for each Monte Carlo year,
+then measures the loading of the rules in the matrices (`RulesetMatrices.update_rules`),
+the conversion of all the rules back to the INI format (`RulesetMatrices.get_rules`, what was saved
+after each table form update) and the update of a table form with a single modified cell
+(`RulesetMatrices.update_table_form`, which returns the modified rules only).
+"""
+
+import argparse
+import time
+import typing as t
+
+from antarest.study.storage.rawstudy.model.filesystem.config.ruleset_matrices import RulesetMatrices
+
+
+def generate_ruleset(nb_years: int, nb_areas: int, nb_clusters: int) -> t.Tuple[RulesetMatrices, t.Dict[str, int]]:
+    areas = [f"area{i}" for i in range(nb_areas)]
+    thermals = {area: [f"cluster{j}" for j in range(nb_clusters // nb_areas)] for area in areas}
+    ruleset = RulesetMatrices(
+        nb_years=nb_years,
+        areas=areas,
+        links=[(a1, a2) for a1, a2 in zip(areas, areas[1:])],
+        thermals=thermals,
+        renewables={},
+        groups=[],
+    )
+    rules = {
+        f"t,{area},{year},{cluster}": (year % 10) + 1
+        for area, clusters in thermals.items()
+        for cluster in clusters
+        for year in range(nb_years)
+    }
+    return ruleset, rules
+
+
+def measure(func: t.Callable[[], t.Any], repeat: int) -> t.Tuple[float, t.Any]:
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return min(durations), result
+
+
+def benchmark(nb_years: int, nb_areas: int, nb_clusters: int, repeat: int) -> None:
+    ruleset, rules = generate_ruleset(nb_years, nb_areas, nb_clusters)
+    print(f"{len(rules):,} rules ({nb_years} years, {nb_clusters} thermal clusters)")
+
+    duration, _ = measure(lambda: ruleset.update_rules(rules), repeat)
+    print(f"{'update_rules':>18}: {duration:.3f}s")
+
+    duration, all_rules = measure(lambda: ruleset.get_rules(allow_nan=True), repeat)
+    print(f"{'get_rules':>18}: {duration:.3f}s ({len(all_rules):,} rules)")
+
+    table_form = {"area0": {"cluster0": {"0": 42}}}
+    ruleset.update_table_form({"area0": {"cluster0": {"0": 1}}}, "thermal")
+    duration, modified_rules = measure(lambda: ruleset.update_table_form(table_form, "thermal"), 1)
+    print(f"{'update_table_form':>18}: {duration:.3f}s ({len(modified_rules):,} rules)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("-y", "--years", type=int, default=1000, help="number of Monte Carlo years")
+    parser.add_argument("-a", "--areas", type=int, default=50, help="number of areas")
+    parser.add_argument("-c", "--clusters", type=int, default=500, help="number of thermal clusters")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="number of runs (the best one is kept)")
+    args = parser.parse_args()
+    benchmark(args.years, args.areas, args.clusters, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
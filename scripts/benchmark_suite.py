@@ -0,0 +1,636 @@
+#!/usr/bin/python3
+"""
+Benchmark suite of the main study operations on synthetic large studies.
+
+The script generates a synthetic study of configurable size (areas, links, thermal clusters,
+Monte Carlo years, outputs and variant depth), a database with many studies, then measures:
+
+- the matrix store (`MatrixContentRepository.save` and `MatrixContentRepository.get`),
+- the reading of the study tree at various depths (`FileStudyTree.get`),
+- the parsing of the study configuration (`StudyFactory.create_from_fs`),
+- the generation of a variant snapshot (`VariantCommandGenerator.generate`),
+- the aggregation of the outputs (`AggregatorManager.aggregate_output_data`),
+- the download of the outputs (`StudyDownloader.build` and `StudyDownloader.export`),
+- the study listing (`StudyMetadataRepository.get_all` and `RawStudyService.get_study_information`),
+- the parsing of the study patches of the listing (`parse_patch`, compared with `Patch.parse_obj`),
+- the JSON encoding of the matrices returned by the endpoints (`to_json`, compared with `json.dumps`).
+
+Everything runs offline, on a SQLite database and the local filesystem. The data is generated
+with a fixed random seed, so the runs are reproducible. The results can be saved in a JSON file
+used as a baseline to detect the regressions between two commits:
+
+    python scripts/benchmark_suite.py --size medium --output baseline.json
+    git checkout my-branch
+    python scripts/benchmark_suite.py --size medium --baseline baseline.json
+
+The script exits with status 1 if a benchmark is slower than the baseline by more than the tolerance.
+"""
+
+import argparse
+import dataclasses
+import datetime
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+import zipfile
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine  # type: ignore
+from sqlalchemy.orm import Session, sessionmaker  # type: ignore
+
+import antarest.dbmodel  # noqa: F401  # register all the ORM models
+from antarest.core.cache.business.local_chache import LocalCache
+from antarest.core.config import CacheConfig, Config
+from antarest.core.model import PublicMode
+from antarest.core.serialization import to_json
+from antarest.dbmodel import Base
+from antarest.login.model import Group, User
+from antarest.matrixstore.repository import MatrixContentRepository
+from antarest.matrixstore.service import SimpleMatrixService
+from antarest.matrixstore.uri_resolver_service import UriResolverService
+from antarest.study.business.aggregator_management import AggregatorManager, AreasQueryFile, LinksQueryFile
+from antarest.study.model import (
+    ExportFormat,
+    Patch,
+    RawStudy,
+    StudyAdditionalData,
+    StudyDownloadDTO,
+    StudyDownloadLevelDTO,
+    StudyDownloadType,
+    Tag,
+)
+from antarest.study.repository import AccessPermissions, StudyFilter, StudyMetadataRepository
+from antarest.study.storage.patch_service import PatchService, parse_patch
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy, StudyFactory
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix import MatrixFrequency
+from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
+from antarest.study.storage.study_download_utils import StudyDownloader
+from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
+from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
+from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
+from antarest.study.storage.variantstudy.model.command.create_link import CreateLink
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+from antarest.study.storage.variantstudy.variant_command_generator import VariantCommandGenerator
+
+RESOURCES_DIR = Path(__file__).resolve().parents[1] / "resources"
+EMPTY_STUDY_VERSION = 870
+
+HOURS_PER_YEAR = 8760
+AREA_VARIABLES = {
+    "OV. COST": "Euro",
+    "OP. COST": "Euro",
+    "MRG. PRICE": "Euro",
+    "CO2 EMIS.": "Tons",
+    "BALANCE": "MWh",
+    "LOAD": "MWh",
+    "WIND": "MWh",
+    "SOLAR": "MWh",
+    "NUCLEAR": "MWh",
+    "GAS": "MWh",
+    "UNSP. ENRG": "MWh",
+    "SPIL. ENRG": "MWh",
+}
+LINK_VARIABLES = {
+    "FLOW LIN.": "MWh",
+    "UCAP LIN.": "MWh",
+    "LOOP FLOW": "MWh",
+    "CONG. FEE (ALG.)": "Euro",
+    "MARG. COST": "Euro/MW",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class StudySize:
+    """
+    Size of the synthetic study and database.
+
+    Attributes:
+        areas: number of areas.
+        links_per_area: number of links from each area to the next ones.
+        clusters_per_area: number of thermal clusters of each area.
+        nb_years: number of Monte Carlo years of the outputs.
+        outputs: number of outputs (hourly results of all the areas and links for each year).
+        variant_depth: number of variants in the chain of variants (one command block per variant).
+        commands_per_variant: number of commands of each variant.
+        db_studies: number of studies stored in the database.
+    """
+
+    areas: int
+    links_per_area: int
+    clusters_per_area: int
+    nb_years: int
+    outputs: int
+    variant_depth: int
+    commands_per_variant: int
+    db_studies: int
+
+
+SIZES = {
+    "small": StudySize(
+        areas=10,
+        links_per_area=1,
+        clusters_per_area=2,
+        nb_years=2,
+        outputs=1,
+        variant_depth=3,
+        commands_per_variant=10,
+        db_studies=200,
+    ),
+    "medium": StudySize(
+        areas=50,
+        links_per_area=3,
+        clusters_per_area=10,
+        nb_years=5,
+        outputs=2,
+        variant_depth=10,
+        commands_per_variant=50,
+        db_studies=2000,
+    ),
+    "large": StudySize(
+        areas=200,
+        links_per_area=5,
+        clusters_per_area=20,
+        nb_years=10,
+        outputs=3,
+        variant_depth=20,
+        commands_per_variant=100,
+        db_studies=10000,
+    ),
+}
+
+
+class BenchmarkContext:
+    """
+    Services shared by the benchmarks, all stored in a temporary directory.
+    """
+
+    def __init__(self, tmp_dir: Path, size: StudySize, seed: int) -> None:
+        self.tmp_dir = tmp_dir
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.matrix_service = SimpleMatrixService(MatrixContentRepository(tmp_dir / "matrices"))
+        self.cache = LocalCache(CacheConfig())
+        self.patch_service = PatchService()
+        self.study_factory = StudyFactory(
+            matrix=self.matrix_service,
+            resolver=UriResolverService(matrix_service=self.matrix_service),
+            cache=self.cache,
+        )
+        generator_matrix_constants = GeneratorMatrixConstants(self.matrix_service)
+        generator_matrix_constants.init_constant_matrices()
+        self.command_context = CommandContext(
+            generator_matrix_constants=generator_matrix_constants,
+            matrix_service=self.matrix_service,
+            patch_service=self.patch_service,
+        )
+        self.engine = create_engine(f"sqlite:///{tmp_dir / 'db.sqlite'}", echo=False)
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+
+    def new_path(self, prefix: str) -> Path:
+        return Path(tempfile.mkdtemp(prefix=f"{prefix}-", dir=self.tmp_dir))
+
+
+def _area_id(index: int) -> str:
+    # zero-padded names keep the links sorted (`area1 < area2`) whatever the number of areas
+    return f"area{index:04d}"
+
+
+def generate_study(ctx: BenchmarkContext) -> FileStudy:
+    """
+    Generate a study with the areas, links and thermal clusters of the requested size, and its outputs.
+    """
+    size = ctx.size
+    study_path = ctx.new_path("study")
+    with zipfile.ZipFile(RESOURCES_DIR / f"empty_study_{EMPTY_STUDY_VERSION}.zip") as zf:
+        zf.extractall(study_path)
+    file_study = ctx.study_factory.create_from_fs(study_path, "bench", use_cache=False)
+
+    commands: t.List[ICommand] = [
+        UpdateConfig(
+            target="settings/generaldata/general/nbyears",
+            data=size.nb_years,
+            command_context=ctx.command_context,
+        ),
+        # the Monte Carlo years results are only available in the outputs of year-by-year simulations
+        UpdateConfig(
+            target="settings/generaldata/general/year-by-year",
+            data=True,
+            command_context=ctx.command_context,
+        ),
+    ]
+    for i in range(size.areas):
+        commands.append(CreateArea(area_name=_area_id(i), command_context=ctx.command_context))
+    for i in range(size.areas):
+        for j in range(i + 1, min(i + 1 + size.links_per_area, size.areas)):
+            commands.append(CreateLink(area1=_area_id(i), area2=_area_id(j), command_context=ctx.command_context))
+    for i in range(size.areas):
+        for j in range(size.clusters_per_area):
+            commands.append(
+                CreateCluster(
+                    area_id=_area_id(i),
+                    cluster_name=f"cluster{j:03d}",
+                    parameters={"group": "gas", "unitcount": "1", "nominalcapacity": "500", "marginal-cost": str(j)},
+                    command_context=ctx.command_context,
+                )
+            )
+    for command in commands:
+        output = command.apply(file_study)
+        if not output.status:
+            raise RuntimeError(f"Synthetic study generation failed: {output.message}")
+
+    for index in range(size.outputs):
+        generate_output(ctx, study_path, f"20240101-{index:04d}eco-bench")
+    return ctx.study_factory.create_from_fs(study_path, "bench", use_cache=False)
+
+
+def _format_rows(values: np.ndarray, time_columns: t.Sequence[str]) -> str:
+    return "".join(f"{prefix}\t{row}\n" for prefix, row in zip(time_columns, ("\t".join(r) for r in values)))
+
+
+def _write_output_matrix(
+    path: Path,
+    header: t.Tuple[str, str, str],
+    variables: t.Mapping[str, str],
+    values: np.ndarray,
+    time_columns: t.Sequence[str],
+) -> None:
+    """
+    Write a matrix in the format of the Antares Simulator output files.
+    """
+    element1, element2, kind = header
+    names = "\t".join(variables)
+    units = "\t".join(variables.values())
+    padding = "\t" * len(variables)
+    lines = [
+        f"{element1.upper()}\t{kind}\tva\thourly\n",
+        f"{element2.upper()}\tVARIABLES\tBEGIN\tEND\n",
+        f"\t{len(variables)}\t1\t{len(values)}\n",
+        "\n",
+        f"{element1.upper()}\thourly\t\t\t\t{names}\n",
+        f"\t\t\t\t\t{units}\n",
+        f"\tindex\tday\tmonth\thour{padding}\n",
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as fd:
+        fd.writelines(lines)
+        fd.write(_format_rows(values.astype(str), time_columns))
+
+
+def generate_output(ctx: BenchmarkContext, study_path: Path, output_id: str) -> None:
+    """
+    Generate the hourly results of all the areas and links for each Monte Carlo year.
+    """
+    size = ctx.size
+    output_path = study_path / "output" / output_id
+    (output_path / "about-the-study").mkdir(parents=True)
+    shutil.copyfile(study_path / "settings/generaldata.ini", output_path / "about-the-study/parameters.ini")
+    (output_path / "info.antares-output").write_text(
+        f"[general]\nversion = {EMPTY_STUDY_VERSION}\nname = bench\nmode = Economy\n"
+        f"date = 2024.01.01 - 00:00\ntitle = 2024.01.01 - 00:00\ntimestamp = 1704067200\n"
+    )
+    (output_path / "checkIntegrity.txt").write_text("")
+
+    start = datetime.datetime(2018, 1, 1)
+    time_columns = []
+    for hour in range(HOURS_PER_YEAR):
+        date = start + datetime.timedelta(hours=hour)
+        time_columns.append(f"\t{hour + 1}\t{date:%d}\t{date:%b}".upper() + f"\t{date:%H:%M}")
+
+    links = [
+        (_area_id(i), _area_id(j))
+        for i in range(size.areas)
+        for j in range(i + 1, min(i + 1 + size.links_per_area, size.areas))
+    ]
+    for year in range(1, size.nb_years + 1):
+        year_path = output_path / "economy/mc-ind" / f"{year:05d}"
+        for i in range(size.areas):
+            values = ctx.rng.integers(0, 10_000, size=(HOURS_PER_YEAR, len(AREA_VARIABLES)))
+            area_file = year_path / "areas" / _area_id(i) / "values-hourly.txt"
+            _write_output_matrix(area_file, (_area_id(i), "", "area"), AREA_VARIABLES, values, time_columns)
+        for area1, area2 in links:
+            values = ctx.rng.integers(-5_000, 5_000, size=(HOURS_PER_YEAR, len(LINK_VARIABLES)))
+            link_file = year_path / "links" / f"{area1} - {area2}" / "values-hourly.txt"
+            _write_output_matrix(link_file, (area1, area2, "link"), LINK_VARIABLES, values, time_columns)
+
+
+def generate_variant_commands(ctx: BenchmarkContext) -> t.List[t.List[ICommand]]:
+    """
+    Generate the commands of a chain of variants, made of the most common commands in real variants.
+    """
+    size = ctx.size
+    matrix_ids = [ctx.matrix_service.create(ctx.rng.random((HOURS_PER_YEAR, 1)) * 1000) for _ in range(10)]
+    commands = []
+    for depth in range(size.variant_depth):
+        variant_commands: t.List[ICommand] = []
+        for index in range(size.commands_per_variant):
+            area_id = _area_id((depth * size.commands_per_variant + index) % size.areas)
+            if index % 2:
+                variant_commands.append(
+                    ReplaceMatrix(
+                        target=f"input/load/series/load_{area_id}",
+                        matrix=matrix_ids[index % len(matrix_ids)],
+                        command_context=ctx.command_context,
+                    )
+                )
+            else:
+                variant_commands.append(
+                    UpdateConfig(
+                        target=f"input/areas/{area_id}/optimization/nodal optimization/spread-unsupplied-energy-cost",
+                        data=float(depth * size.commands_per_variant + index),
+                        command_context=ctx.command_context,
+                    )
+                )
+        commands.append(variant_commands)
+    return commands
+
+
+def populate_database(ctx: BenchmarkContext, study_path: Path) -> None:
+    """
+    Store many raw studies with their owner, groups, tags and additional data, as in a real instance.
+    """
+    with ctx.session_factory() as session:
+        users = [User(id=i + 10, name=f"user{i}") for i in range(20)]
+        groups = [Group(id=f"group{i}", name=f"group{i}") for i in range(10)]
+        tags = [Tag(label=f"tag{i}") for i in range(10)]
+        session.add_all(users + groups + tags)
+        patch = json.dumps({"study": {"scenario": "reference", "lifecycle": "draft", "status": "ok"}})
+        for i in range(ctx.size.db_studies):
+            session.add(
+                RawStudy(
+                    id=f"00000000-0000-0000-0000-{i:012d}",
+                    name=f"study{i}",
+                    version=str(EMPTY_STUDY_VERSION),
+                    path=str(study_path),
+                    workspace="default",
+                    public_mode=PublicMode.NONE,
+                    owner=users[i % len(users)],
+                    groups=[groups[i % len(groups)]],
+                    tags=[tags[i % len(tags)]],
+                    additional_data=StudyAdditionalData(author="bench", horizon="2030", patch=patch),
+                    created_at=datetime.datetime(2024, 1, 1),
+                    updated_at=datetime.datetime(2024, 1, 1),
+                )
+            )
+        session.commit()
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    """
+    A benchmarked function, and the optional function preparing each run (not measured).
+    """
+
+    name: str
+    func: t.Callable[[t.Any], t.Any]
+    setup: t.Callable[[], t.Any] = lambda: None
+
+
+def build_benchmarks(ctx: BenchmarkContext, file_study: FileStudy) -> t.List[Benchmark]:
+    size = ctx.size
+    study_path = file_study.config.study_path
+    output_id = sorted(file_study.config.outputs)[0]
+    benchmarks = []
+
+    # Matrix store: new matrices are saved at each run, the matrices already stored being skipped
+    def new_matrices() -> t.Tuple[MatrixContentRepository, t.List[np.ndarray]]:
+        repository = MatrixContentRepository(ctx.new_path("matrix-store"))
+        return repository, [ctx.rng.random((HOURS_PER_YEAR, 10)) * 1000 for _ in range(size.areas)]
+
+    def save_matrices(args: t.Tuple[MatrixContentRepository, t.List[np.ndarray]]) -> t.List[str]:
+        repository, matrices = args
+        return [repository.save(matrix) for matrix in matrices]
+
+    def saved_matrices() -> t.Tuple[MatrixContentRepository, t.List[str]]:
+        repository, matrices = new_matrices()
+        return repository, [repository.save(matrix) for matrix in matrices]
+
+    benchmarks.append(Benchmark("matrix_save", save_matrices, new_matrices))
+    benchmarks.append(
+        Benchmark("matrix_get", lambda args: [args[0].get(matrix_id) for matrix_id in args[1]], saved_matrices)
+    )
+
+    # Study tree
+    for depth in [1, 2, 3]:
+        benchmarks.append(Benchmark(f"tree_get_depth_{depth}", lambda _, d=depth: file_study.tree.get([], depth=d)))
+    benchmarks.append(Benchmark("tree_get_input_areas", lambda _: file_study.tree.get(["input", "areas"], depth=-1)))
+    benchmarks.append(
+        Benchmark(
+            "create_from_fs",
+            lambda _: ctx.study_factory.create_from_fs(study_path, "bench", use_cache=False),
+        )
+    )
+
+    # JSON encoding of an hourly matrix with a column per area, as returned by the raw data endpoint
+    values = ctx.rng.random((HOURS_PER_YEAR, size.areas)) * 1000
+    payload = {"index": list(range(HOURS_PER_YEAR)), "columns": list(range(size.areas)), "data": values.tolist()}
+    values_with_nan = np.where(ctx.rng.random(values.shape) < 0.01, np.nan, values)
+    payload_with_nan = {**payload, "data": values_with_nan.tolist()}
+
+    def encode_stdlib(obj: t.Any) -> bytes:
+        # encoding used by the endpoints before `to_json`
+        return json.dumps(obj, ensure_ascii=False, allow_nan=True, indent=None, separators=(",", ":")).encode("utf-8")
+
+    benchmarks.append(Benchmark("json_encode_stdlib", lambda _: encode_stdlib(payload)))
+    benchmarks.append(Benchmark("json_encode", lambda _: to_json(payload)))
+    benchmarks.append(Benchmark("json_encode_array", lambda _: to_json({**payload, "data": values})))
+    benchmarks.append(Benchmark("json_encode_nan_stdlib", lambda _: encode_stdlib(payload_with_nan)))
+    benchmarks.append(Benchmark("json_encode_nan", lambda _: to_json(payload_with_nan)))
+
+    # Variant snapshot: the commands of all the variants are applied on a copy of the study
+    commands = generate_variant_commands(ctx)
+    generator = VariantCommandGenerator(ctx.study_factory)
+
+    def copy_study() -> Path:
+        dest_path = ctx.new_path("snapshot") / "study"
+        shutil.copytree(study_path, dest_path, ignore=shutil.ignore_patterns("output"))
+        return dest_path
+
+    def generate_snapshot(dest_path: Path) -> None:
+        result = generator.generate(commands, dest_path)
+        if not result.success:
+            raise RuntimeError(f"Snapshot generation failed: {result.details}")
+
+    benchmarks.append(Benchmark("variant_generate", generate_snapshot, copy_study))
+
+    # Outputs
+    def aggregate(query_file: t.Union[AreasQueryFile, LinksQueryFile]) -> t.Any:
+        manager = AggregatorManager(study_path, output_id, query_file, MatrixFrequency.HOURLY, [], [], [])
+        df = manager.aggregate_output_data()
+        if df.empty:
+            raise RuntimeError("No output data aggregated")
+        return df
+
+    benchmarks.append(Benchmark("aggregate_areas", lambda _: aggregate(AreasQueryFile.VALUES)))
+    benchmarks.append(Benchmark("aggregate_links", lambda _: aggregate(LinksQueryFile.VALUES)))
+
+    def download(download_type: StudyDownloadType) -> None:
+        params = StudyDownloadDTO(type=download_type, years=[], level=StudyDownloadLevelDTO.HOURLY)
+        matrix = StudyDownloader.build(file_study, output_id, params)
+        if matrix.warnings or not matrix.data:
+            raise RuntimeError(f"Output data not downloaded: {matrix.warnings[:1]}")
+        StudyDownloader.export(matrix, ExportFormat.ZIP, ctx.new_path("download") / "outputs.zip")
+
+    benchmarks.append(Benchmark("download_areas", lambda _: download(StudyDownloadType.AREA)))
+    benchmarks.append(Benchmark("download_links", lambda _: download(StudyDownloadType.LINK)))
+
+    # Study listing
+    populate_database(ctx, study_path)
+    raw_study_service = RawStudyService(
+        config=Config(),
+        study_factory=ctx.study_factory,
+        path_resources=RESOURCES_DIR,
+        patch_service=ctx.patch_service,
+        cache=ctx.cache,
+    )
+    study_filter = StudyFilter(access_permissions=AccessPermissions(is_admin=True))
+
+    def list_studies(session: Session) -> int:
+        with session:
+            repository = StudyMetadataRepository(cache_service=ctx.cache, session=session)
+            studies = repository.get_all(study_filter=study_filter)
+            return len([raw_study_service.get_study_information(study) for study in studies])
+
+    benchmarks.append(Benchmark("study_listing", list_studies, ctx.session_factory))
+
+    # Patches of the listed studies: the studies share a few distinct patches
+    patches = [
+        json.dumps(
+            {
+                "study": {"scenario": f"scenario{i % 10}", "lifecycle": "draft", "status": "ok", "doc": "doc"},
+                "areas": {_area_id(a): {"country": "FR", "tags": ["tag"]} for a in range(5)},
+                "outputs": {"reference": f"output{i % 10}"},
+            }
+        )
+        for i in range(size.db_studies)
+    ]
+    benchmarks.append(Benchmark("patch_parse_stdlib", lambda _: [Patch.parse_obj(json.loads(p)) for p in patches]))
+    benchmarks.append(Benchmark("patch_parse", lambda _: [parse_patch(p) for p in patches]))
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, repeat: int) -> t.Dict[str, float]:
+    durations = []
+    for _ in range(repeat):
+        args = benchmark.setup()
+        start = time.perf_counter()
+        benchmark.func(args)
+        durations.append(time.perf_counter() - start)
+    return {"min": min(durations), "median": statistics.median(durations), "runs": len(durations)}
+
+
+def get_environment(size_name: str, size: StudySize, seed: int, repeat: int) -> t.Dict[str, t.Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": size_name,
+        "parameters": dataclasses.asdict(size),
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+
+def compare(results: t.Mapping[str, t.Any], baseline: t.Mapping[str, t.Any], tolerance: float) -> t.List[str]:
+    """
+    Compare the best durations with the ones of the baseline, and return the names of the regressions,
+    a benchmark which failed being a regression.
+    """
+    if baseline["environment"]["parameters"] != results["environment"]["parameters"]:
+        print("Warning: the baseline was measured with another study size", file=sys.stderr)
+    regressions = []
+    print(f"\nBaseline: commit {baseline['environment']['commit'] or '<unknown>'}")
+    for name, stats in results["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if "error" in stats:
+            regressions.append(name)
+            print(f"{name:>22}: failed: {stats['error']}")
+            continue
+        if reference is None or "error" in reference:
+            print(f"{name:>22}: {stats['min']:.3f}s (new)")
+            continue
+        ratio = stats["min"] / reference["min"] if reference["min"] else float("inf")
+        regression = ratio > 1 + tolerance
+        if regression:
+            regressions.append(name)
+        flag = "REGRESSION" if regression else ""
+        print(f"{name:>22}: {stats['min']:.3f}s vs {reference['min']:.3f}s ({ratio - 1:+.1%}) {flag}".rstrip())
+    return regressions
+
+
+def benchmark(size_name: str, seed: int, repeat: int, selection: t.Sequence[str]) -> t.Dict[str, t.Any]:
+    size = SIZES[size_name]
+    with tempfile.TemporaryDirectory(prefix="antarest-benchmark-") as tmp_dir:
+        ctx = BenchmarkContext(Path(tmp_dir), size, seed)
+        start = time.perf_counter()
+        file_study = generate_study(ctx)
+        print(f"Synthetic {size_name} study generated in {time.perf_counter() - start:.1f}s: {size}")
+        results = {}
+        for bench in build_benchmarks(ctx, file_study):
+            if selection and bench.name not in selection:
+                continue
+            try:
+                results[bench.name] = stats = measure(bench, repeat)
+            except Exception as exc:
+                # a failing benchmark is reported, and the other benchmarks are still run
+                results[bench.name] = {"error": str(exc)}
+                print(f"{bench.name:>22}: failed: {exc}")
+            else:
+                print(f"{bench.name:>22}: {stats['min']:.3f}s (median {stats['median']:.3f}s)")
+        ctx.engine.dispose()
+    return {"environment": get_environment(size_name, size, seed, repeat), "benchmarks": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        epilog="Study sizes: " + "; ".join(f"{name}: {size}" for name, size in SIZES.items()),
+    )
+    parser.add_argument("-s", "--size", choices=list(SIZES), default="small", help="size of the synthetic study")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="number of runs (the best one is compared)")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the generated data")
+    parser.add_argument("-b", "--benchmark", action="append", default=[], help="run only the given benchmarks")
+    parser.add_argument("-o", "--output", type=Path, help="JSON file where the results are saved")
+    parser.add_argument("--baseline", type=Path, help="JSON file of previous results to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="relative slowdown compared to the baseline above which a benchmark is a regression",
+    )
+    args = parser.parse_args()
+
+    results = benchmark(args.size, args.seed, args.repeat, args.benchmark)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
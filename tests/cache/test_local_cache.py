@@ -2,8 +2,9 @@ import time
 from pathlib import Path
 from unittest import mock
 
-from antarest.core.cache.business.local_chache import LocalCache, LocalCacheElement
+from antarest.core.cache.business.local_chache import LocalCache, LocalCacheElement, _estimate_size
 from antarest.core.config import CacheConfig
+from antarest.core.interfaces.cache import CacheStats
 from antarest.study.storage.rawstudy.model.filesystem.config.model import Area, FileStudyTreeConfigDTO
 
 
@@ -29,7 +30,8 @@ def test_lifecycle():
     id = "some_id"
     duration = 3600
     timeout = int(time.time()) + duration
-    cache_element = LocalCacheElement(duration=duration, data=config.dict(), timeout=timeout)
+    size = _estimate_size(config.dict())
+    cache_element = LocalCacheElement(duration=duration, data=config.dict(), timeout=timeout, size=size)
 
     # PUT
     cache.put(id=id, data=config.dict(), duration=duration)
@@ -37,3 +39,53 @@ def test_lifecycle():
 
     # GET
     assert cache.get(id=id) == config.dict()
+    assert cache.get(id="unknown") is None
+    assert cache.get_stats() == CacheStats(hits=1, misses=1, count=1, size=size, max_size=CacheConfig().max_size)
+
+    # INVALIDATE
+    cache.invalidate(id=id)
+    assert cache.get(id=id) is None
+    assert cache.get_stats().size == 0
+
+
+def test_expiration():
+    cache = LocalCache(CacheConfig())
+    with mock.patch("time.time", mock.MagicMock(return_value=1000)):
+        cache.put(id="key", data={"foo": "bar"}, duration=10)
+    with mock.patch("time.time", mock.MagicMock(return_value=1009)):
+        # the access refreshes the timeout
+        assert cache.get(id="key") == {"foo": "bar"}
+    with mock.patch("time.time", mock.MagicMock(return_value=1018)):
+        assert cache.get(id="key") == {"foo": "bar"}
+    with mock.patch("time.time", mock.MagicMock(return_value=1028)):
+        assert cache.get(id="key") is None
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.count, stats.size) == (2, 1, 0, 0)
+
+
+def test_lru_eviction():
+    values = {f"key{i}": {"data": str(i) * 100} for i in range(4)}
+    size = _estimate_size(values["key0"])
+    cache = LocalCache(CacheConfig(max_size=3 * size))
+
+    for key in ["key0", "key1", "key2"]:
+        cache.put(id=key, data=values[key])
+    # `key0` becomes the most recently used entry
+    assert cache.get(id="key0") == values["key0"]
+    cache.put(id="key3", data=values["key3"])
+
+    assert list(cache.cache) == ["key2", "key0", "key3"]
+    assert cache.get_stats() == CacheStats(hits=1, evictions=1, count=3, size=3 * size, max_size=3 * size)
+
+    # replacing an entry does not evict anything
+    cache.put(id="key2", data=values["key1"])
+    assert list(cache.cache) == ["key0", "key3", "key2"]
+    assert cache.get_stats().evictions == 1
+
+    # a value larger than the budget is not stored and removes the previous value
+    cache.put(id="key0", data={"data": "x" * 4 * size})
+    assert list(cache.cache) == ["key3", "key2"]
+    assert cache.get_stats().size == 2 * size
+
+    cache.invalidate_all(["key2", "key3", "unknown"])
+    assert cache.get_stats() == CacheStats(hits=1, evictions=1, max_size=3 * size)
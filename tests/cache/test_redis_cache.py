@@ -1,15 +1,80 @@
 import json
+import typing as t
 from pathlib import Path
-from unittest.mock import Mock
 
-from antarest.core.cache.business.redis_cache import RedisCache, RedisCacheElement
+import pytest
+
+from antarest.core.cache.business.redis_cache import RedisCache
 from antarest.study.storage.rawstudy.model.filesystem.config.model import Area, FileStudyTreeConfigDTO
 
 
-def test_lifecycle():
-    redis_client = Mock()
-    cache = RedisCache(redis_client)
-    config = FileStudyTreeConfigDTO(
+class FakeRedis:
+    """
+    In-process stand-in of a Redis client, implementing the commands used by `RedisCache`.
+
+    Each call to the client (or each execution of a pipeline) is counted as a round trip.
+    """
+
+    def __init__(self) -> None:
+        self.data: t.Dict[str, bytes] = {}
+        self.ttl: t.Dict[str, int] = {}
+        self.round_trips = 0
+
+    def _execute(self, command: str, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        if command == "get":
+            return self.data.get(args[0])
+        elif command == "set":
+            key, value = args
+            self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+            if kwargs.get("ex") is not None:
+                self.ttl[key] = kwargs["ex"]
+            return True
+        elif command == "expire":
+            key, duration = args
+            if key not in self.data:
+                return False
+            self.ttl[key] = duration
+            return True
+        elif command == "delete":
+            if not args:
+                raise ValueError("wrong number of arguments for 'del' command")
+            deleted = [self.data.pop(key, None) for key in args]
+            for key in args:
+                self.ttl.pop(key, None)
+            return sum(value is not None for value in deleted)
+        raise NotImplementedError(command)
+
+    def __getattr__(self, command: str) -> t.Callable[..., t.Any]:
+        def call(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            self.round_trips += 1
+            return self._execute(command, *args, **kwargs)
+
+        return call
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: t.List[t.Tuple[str, t.Tuple[t.Any, ...], t.Dict[str, t.Any]]] = []
+
+    def __getattr__(self, command: str) -> t.Callable[..., "FakePipeline"]:
+        def queue(*args: t.Any, **kwargs: t.Any) -> "FakePipeline":
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> t.List[t.Any]:
+        self.redis.round_trips += 1
+        return [self.redis._execute(command, *args, **kwargs) for command, args, kwargs in self.commands]
+
+
+@pytest.fixture(name="config")
+def config_fixture() -> FileStudyTreeConfigDTO:
+    return FileStudyTreeConfigDTO(
         study_path=Path("somepath"),
         path=Path("somepath"),
         study_id="",
@@ -25,21 +90,66 @@ def test_lifecycle():
             )
         },
     )
+
+
+def test_lifecycle(config: FileStudyTreeConfigDTO) -> None:
+    redis_client = FakeRedis()
+    cache = RedisCache(redis_client)
     id = "some_id"
     redis_key = f"cache:{id}"
-    duration = 3600
-    cache_element = RedisCacheElement(duration=duration, data=config.dict()).json()
-
-    # GET
-    redis_client.get.return_value = cache_element
-    load = json.loads(cache_element)
-    assert cache.get(id=id) == load["data"]
-    redis_client.expire.assert_called_with(redis_key, duration)
-    redis_client.get.assert_called_once_with(redis_key)
 
     # PUT
-    duration = 7200
-    cache_element = RedisCacheElement(duration=duration, data=config.dict()).json()
-    cache.put(id=id, data=config.dict(), duration=duration)
-    redis_client.set.assert_called_once_with(redis_key, cache_element)
-    redis_client.expire.assert_called_with(redis_key, duration)
+    cache.put(id=id, data=config.dict(), duration=7200)
+    assert redis_client.ttl[redis_key] == 7200
+    assert redis_client.round_trips == 1
+
+    # GET: the paths are encoded like in JSON
+    expected = json.loads(config.json())
+    assert cache.get(id=id) == expected
+    assert redis_client.ttl[redis_key] == 7200
+    assert cache.get(id=id, refresh_timeout=60) == expected
+    assert redis_client.ttl[redis_key] == 60
+    assert redis_client.round_trips == 4
+    assert FileStudyTreeConfigDTO.parse_obj(cache.get(id=id)) == config
+
+    # INVALIDATE
+    cache.invalidate(id=id)
+    assert cache.get(id=id) is None
+    cache.invalidate_all([])
+
+
+def test_get__unknown_encoding() -> None:
+    redis_client = FakeRedis()
+    cache = RedisCache(redis_client)
+
+    # entries stored by a previous version of the application are removed
+    redis_client.set("cache:json", json.dumps({"duration": 3600, "data": {"foo": "bar"}}))
+    redis_client.set("cache:other_version", b"\x93\x00\xcd\x0e\x10\xa3foo")
+    assert cache.get(id="json") is None
+    assert cache.get(id="other_version", refresh_timeout=60) is None
+    assert redis_client.data == {}
+
+
+def test_invalidate_all() -> None:
+    redis_client = FakeRedis()
+    cache = RedisCache(redis_client)
+    ids = [f"study{i}" for i in range(10)]
+    for id in ids:
+        cache.put(id=id, data={"id": id, "bytes": b"\x00\x01", 12: [1.5, None]})
+    assert cache.get(id="study0") == {"id": "study0", "bytes": b"\x00\x01", 12: [1.5, None]}
+
+    round_trips = redis_client.round_trips
+    cache.invalidate_all(ids=ids + ["unknown"])
+    assert redis_client.round_trips == round_trips + 1
+    assert redis_client.data == {}
+
+
+def test_get_stats() -> None:
+    cache = RedisCache(FakeRedis())
+    cache.put(id="a", data={"foo": 1})
+    cache.get(id="a")
+    cache.get(id="missing", refresh_timeout=60)
+    cache.get(id="a", refresh_timeout=60)
+    cache.get(id="b")
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses) == (2, 2)
@@ -0,0 +1,93 @@
+import threading
+import typing as t
+
+import pytest
+
+from antarest.core.tasks.scheduler import TaskPriority, TaskScheduler
+
+
+class TestTaskScheduler:
+    @staticmethod
+    def _block(scheduler: TaskScheduler, task_type: t.Optional[str] = None) -> threading.Event:
+        """Occupy a worker until the returned event is set."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_task(wait_time: float) -> None:
+            started.set()
+            release.wait(10)
+
+        scheduler.submit(blocking_task, task_type=task_type)
+        assert started.wait(10)
+        return release
+
+    def test_submit__priority_and_fairness(self) -> None:
+        scheduler = TaskScheduler(max_workers=1)
+        executed: t.List[str] = []
+
+        def task(name: str) -> t.Callable[[float], None]:
+            return lambda wait_time: executed.append(name)
+
+        release = self._block(scheduler)
+        futures = [
+            scheduler.submit(task("export"), owner=1, priority=TaskPriority.LOW),
+            scheduler.submit(task("copy-1a"), owner=1),
+            scheduler.submit(task("copy-1b"), owner=1),
+            scheduler.submit(task("copy-1c"), owner=1),
+            scheduler.submit(task("copy-2a"), owner=2),
+            scheduler.submit(task("variant"), owner=2, priority=TaskPriority.HIGH),
+        ]
+        assert scheduler.queue_depth() == 6
+        release.set()
+        for future in futures:
+            future.result(10)
+
+        # the users are served in turn, by priority class
+        assert executed == ["variant", "copy-1a", "copy-2a", "copy-1b", "copy-1c", "export"]
+        assert scheduler.queue_depth() == 0
+
+    def test_submit__max_workers_by_type(self) -> None:
+        scheduler = TaskScheduler(max_workers=3, max_workers_by_type={"EXPORT": 1})
+        running_exports = []
+        max_running_exports = 0
+        lock = threading.Lock()
+
+        def export(wait_time: float) -> None:
+            nonlocal max_running_exports
+            with lock:
+                running_exports.append(wait_time)
+                max_running_exports = max(max_running_exports, len(running_exports))
+            threading.Event().wait(0.05)
+            with lock:
+                running_exports.pop()
+
+        release = self._block(scheduler, task_type="EXPORT")
+        exports = [scheduler.submit(export, task_type="EXPORT") for _ in range(3)]
+        # the other types are not blocked by the pending exports
+        scheduler.submit(lambda wait_time: None, task_type="COPY").result(10)
+        assert not any(future.done() for future in exports)
+
+        release.set()
+        for future in exports:
+            future.result(10)
+        assert max_running_exports == 1
+
+    def test_submit__cancel_and_errors(self) -> None:
+        scheduler = TaskScheduler(max_workers=1)
+        wait_times: t.List[float] = []
+
+        def failing_task(wait_time: float) -> None:
+            wait_times.append(wait_time)
+            raise ValueError("task failed")
+
+        release = self._block(scheduler)
+        cancelled = scheduler.submit(lambda wait_time: wait_times.append(-1))
+        failed = scheduler.submit(failing_task)
+        assert cancelled.cancel()
+        release.set()
+
+        with pytest.raises(ValueError, match="task failed"):
+            failed.result(10)
+        assert cancelled.cancelled()
+        # the cancelled task is not run, the other one waited for the blocking task
+        assert len(wait_times) == 1 and wait_times[0] > 0
@@ -1,4 +1,6 @@
 import datetime
+import os
+import typing as t
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -97,3 +99,121 @@ def test_lifecycle(tmp_path: Path):
         ftm.repository.save(filedownload)
         downloads = ftm.list_downloads(params=RequestParameters(user=DEFAULT_ADMIN_USER))
         assert len(downloads) == 0
+
+
+class TestExportCache:
+    @pytest.fixture(name="config")
+    def config_fixture(self, tmp_path: Path) -> t.Iterator[Config]:
+        engine = create_engine("sqlite:///:memory:", echo=False)
+        Base.metadata.create_all(engine)
+        # noinspection SpellCheckingInspection
+        DBSessionMiddleware(
+            None,
+            custom_engine=engine,
+            session_args={"autocommit": False, "autoflush": False},
+        )
+        with db():
+            yield Config(storage=StorageConfig(tmp_dir=tmp_path, export_cache_max_size_mb=1))
+
+    @pytest.fixture(name="ftm")
+    def ftm_fixture(self, config: Config) -> FileTransferManager:
+        return FileTransferManager(FileDownloadRepository(), Mock(), config)
+
+    def test_request_export(self, ftm: FileTransferManager) -> None:
+        # the first request builds the archive, the concurrent requests wait for its task
+        builder, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id is None
+        ftm.register_export_task("key", "task-id")
+        waiter, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id == "task-id"
+        assert not ftm.repository.get(waiter.id).ready
+
+        Path(builder.path).write_bytes(b"archive")
+        ftm.export_done("key", Path(builder.path))
+        assert ftm.repository.get(waiter.id).ready
+        assert Path(waiter.path).read_bytes() == b"archive"
+        assert not ftm._exports
+
+        # the cached archive is used as long as it is not expired
+        Path(builder.path).unlink()
+        cached, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id == "task-id"
+        assert ftm.repository.get(cached.id).ready
+        assert Path(cached.path).read_bytes() == b"archive"
+
+        (archive,) = ftm.export_cache_dir.iterdir()
+        creation_time = datetime.datetime.now() - datetime.timedelta(
+            minutes=ftm.download_default_expiration_timeout_minutes
+        )
+        os.utime(archive, (creation_time.timestamp(), creation_time.timestamp()))
+        ftm.list_downloads(params=RequestParameters(user=DEFAULT_ADMIN_USER))
+        assert not list(ftm.export_cache_dir.iterdir())
+        _, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id is None
+
+    def test_request_export__done_before_registration(self, ftm: FileTransferManager) -> None:
+        builder, _ = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        Path(builder.path).write_bytes(b"archive")
+        ftm.export_done("key", Path(builder.path))
+        ftm.register_export_task("key", "task-id")
+        cached, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id == "task-id"
+        assert Path(cached.path).read_bytes() == b"archive"
+
+    def test_request_export__shared_cache(self, config: Config, ftm: FileTransferManager) -> None:
+        # the archives are cached on disk: they are shared by the workers, and kept after a restart
+        builder, _ = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        ftm.register_export_task("key", "task-id")
+        Path(builder.path).write_bytes(b"archive")
+        ftm.export_done("key", Path(builder.path))
+
+        other_ftm = FileTransferManager(FileDownloadRepository(), Mock(), config)
+        cached, task_id = other_ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id == "task-id"
+        assert Path(cached.path).read_bytes() == b"archive"
+
+    def test_request_export__without_cache(self, ftm: FileTransferManager) -> None:
+        builder, _ = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER, use_cache=False)
+        ftm.register_export_task("key", "task-id")
+        waiter, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER, use_cache=False)
+        assert task_id == "task-id"
+        Path(builder.path).write_bytes(b"archive")
+        ftm.export_done("key", Path(builder.path))
+        assert Path(waiter.path).read_bytes() == b"archive"
+
+        # the archive is only shared by the concurrent requests
+        assert not list(ftm.export_cache_dir.iterdir())
+        _, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER, use_cache=False)
+        assert task_id is None
+
+    def test_export_failed(self, ftm: FileTransferManager) -> None:
+        builder, _ = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        ftm.register_export_task("key", "task-id")
+        waiter, _ = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        ftm.export_failed("key", "export failed")
+        download = ftm.repository.get(waiter.id)
+        assert download.failed and download.error_message == "export failed"
+
+        # the next request builds the archive again
+        _, task_id = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert task_id is None
+
+    def test_export_failed__after_export_done(self, ftm: FileTransferManager) -> None:
+        # the export may fail after its archive is cached (when the download of the builder is removed)
+        builder, _ = ftm.request_export("key", "export.zip", "export", DEFAULT_ADMIN_USER)
+        ftm.register_export_task("key", "task-id")
+        Path(builder.path).write_bytes(b"archive")
+        ftm.export_done("key", Path(builder.path))
+        ftm.export_failed("key", "export failed")
+        assert not list(ftm.export_cache_dir.iterdir())
+
+    def test_export_done__eviction(self, ftm: FileTransferManager) -> None:
+        # the least recently used archives are removed when the cache exceeds its maximum size (1 MB)
+        for key in ["key1", "key2", "key3"]:
+            builder, _ = ftm.request_export(key, "export.zip", "export", DEFAULT_ADMIN_USER)
+            ftm.register_export_task(key, f"task-{key}")
+            Path(builder.path).write_bytes(b"0" * 400_000)
+            ftm.export_done(key, Path(builder.path))
+            if key == "key2":
+                ftm.request_export("key1", "export.zip", "export", DEFAULT_ADMIN_USER)
+        assert sorted(p.name for p in ftm.export_cache_dir.iterdir()) == ["key1.task-key1", "key3.task-key3"]
@@ -0,0 +1,81 @@
+import math
+
+import pytest
+
+from antarest.core.metrics import MetricsRegistry
+
+
+def test_render() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("app_requests_total", "Number of requests", ("method",))
+    counter.labels("GET").inc()
+    counter.labels("GET").inc(2)
+    counter.labels('P"O\\ST').inc()
+    gauge = registry.gauge("app_temperature", "Temperature")
+    gauge.set(20)
+    gauge.dec(0.5)
+    histogram = registry.histogram("app_duration_seconds", "Duration", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    registry.register_callback("app_queue_depth", "Queue depth", lambda: 3)
+    registry.register_callback(
+        "app_jobs", "Jobs", lambda: {("running",): 2, ("failed",): math.inf}, labelnames=("status",)
+    )
+
+    assert registry.render().splitlines() == [
+        "# HELP app_duration_seconds Duration",
+        "# TYPE app_duration_seconds histogram",
+        'app_duration_seconds_bucket{le="0.1"} 1.0',
+        'app_duration_seconds_bucket{le="1.0"} 2.0',
+        'app_duration_seconds_bucket{le="+Inf"} 3.0',
+        "app_duration_seconds_sum 5.55",
+        "app_duration_seconds_count 3.0",
+        "# HELP app_jobs Jobs",
+        "# TYPE app_jobs gauge",
+        'app_jobs{status="failed"} +Inf',
+        'app_jobs{status="running"} 2.0',
+        "# HELP app_queue_depth Queue depth",
+        "# TYPE app_queue_depth gauge",
+        "app_queue_depth 3.0",
+        "# HELP app_requests_total Number of requests",
+        "# TYPE app_requests_total counter",
+        'app_requests_total{method="GET"} 3.0',
+        'app_requests_total{method="P\\"O\\\\ST"} 1.0',
+        "# HELP app_temperature Temperature",
+        "# TYPE app_temperature gauge",
+        "app_temperature 19.5",
+    ]
+
+
+def test_register() -> None:
+    registry = MetricsRegistry()
+    # the metrics are shared by the modules registering the same name
+    counter = registry.counter("app_requests_total", "Number of requests", ("method",))
+    assert registry.counter("app_requests_total", "Number of requests", ("method",)) is counter
+    with pytest.raises(ValueError, match="another type or other labels"):
+        registry.gauge("app_requests_total", "Number of requests", ("method",))
+    with pytest.raises(ValueError, match="expects the labels"):
+        counter.labels("GET", "/")
+
+    # the last registered callback is used, a failing callback is skipped
+    registry.register_callback("app_queue_depth", "Queue depth", lambda: 1 / 0)
+    assert "app_queue_depth" not in registry.render()
+    registry.register_callback("app_queue_depth", "Queue depth", lambda: 1)
+    assert "app_queue_depth 1.0" in registry.render()
+    registry.unregister("app_queue_depth")
+    assert "app_queue_depth" not in registry.render()
+
+
+def test_render__not_updated() -> None:
+    registry = MetricsRegistry()
+    registry.counter("app_requests_total", "Number of requests", ("method",))
+    registry.counter("app_errors_total", "Number of errors")
+    # the metrics without labels are exposed before their first update
+    assert registry.render().splitlines() == [
+        "# HELP app_errors_total Number of errors",
+        "# TYPE app_errors_total counter",
+        "app_errors_total 0.0",
+        "# HELP app_requests_total Number of requests",
+        "# TYPE app_requests_total counter",
+    ]
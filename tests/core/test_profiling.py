@@ -0,0 +1,119 @@
+import sys
+import time
+import typing as t
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.pool import StaticPool  # type: ignore
+from starlette.testclient import TestClient
+
+from antarest.core.cache.business.local_chache import LocalCache
+from antarest.core.config import Config, SecurityConfig
+from antarest.core.profiling import (
+    PROFILE_HEADER,
+    PROFILE_ID_HEADER,
+    Profiler,
+    ProfilerMiddleware,
+    get_profiler,
+    profile_operation,
+)
+from antarest.core.tasks.model import TaskJob
+from antarest.core.utils.fastapi_sqlalchemy import DBSessionMiddleware, db
+from antarest.dbmodel import Base
+from antarest.login.auth import Auth
+
+
+@pytest.fixture(name="engine")
+def engine_fixture() -> Engine:
+    # the same connection is shared by the threads of the requests
+    engine = create_engine(
+        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _compute(duration: float) -> None:
+    with profile_operation("IniFileNode.read"):
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            pass
+
+
+def _create_client(engine: Engine, profiler: Profiler, security_disabled: bool) -> TestClient:
+    app = FastAPI(title=__name__)
+
+    @app.get("/tasks")
+    def get_tasks() -> t.Any:
+        db.session.query(TaskJob).all()
+        _compute(0.2)
+        return "OK"
+
+    @app.get("/fail")
+    async def fail() -> t.Any:
+        raise ValueError("failure")
+
+    profiler.install(engine)
+    app.add_middleware(DBSessionMiddleware, custom_engine=engine)
+    auth = Auth(Config(security=SecurityConfig(disabled=security_disabled)))
+    app.add_middleware(ProfilerMiddleware, profiler=profiler, auth=auth)
+    return TestClient(app)
+
+
+def test_middleware(engine: Engine) -> None:
+    profiler = Profiler(LocalCache(), sampling_interval=0.005)
+    client = _create_client(engine, profiler, security_disabled=True)
+    assert get_profiler() is profiler
+
+    # the requests are not profiled without the header
+    res = client.get("/tasks")
+    assert res.status_code == 200
+    assert PROFILE_ID_HEADER not in res.headers
+
+    res = client.get("/tasks", headers={PROFILE_HEADER: "true"})
+    assert res.status_code == 200
+    profile = profiler.get_profile(res.headers[PROFILE_ID_HEADER])
+    assert profile is not None
+    assert profile.route == "GET /tasks"
+    assert profile.status_code == 200
+    assert profile.duration >= 0.2
+    assert profile.sql_statement_count == 1
+    (statement,) = profile.sql_statements
+    assert statement.name.startswith("SELECT")
+    (operation,) = profile.tree_operations
+    assert operation.name == "IniFileNode.read"
+    assert operation.duration >= 0.2
+    # the stacks are sampled in the thread running the endpoint
+    assert profile.sample_count > 0
+    functions = {function.name: function for function in profile.functions}
+    assert functions[f"{__name__}:_compute"].total_samples > 0
+    # the qualified names of the functions are only available from Python 3.11
+    endpoint = "_create_client.<locals>.get_tasks" if sys.version_info >= (3, 11) else "get_tasks"
+    assert all(stack.startswith(f"{__name__}:{endpoint}") for stack in profile.stacks)
+
+    # the profile of a failed request is also saved
+    with pytest.raises(ValueError):
+        client.get("/fail", headers={PROFILE_HEADER: "1"})
+    profiles = [element.data for element in profiler.cache.cache.values()]  # type: ignore
+    assert [(p["route"], p["status_code"]) for p in profiles] == [("GET /tasks", 200), ("GET /fail", 500)]
+
+    assert profiler.get_profile("unknown") is None
+
+
+def test_middleware__not_admin(engine: Engine) -> None:
+    profiler = Profiler(LocalCache())
+    client = _create_client(engine, profiler, security_disabled=False)
+    # the requests of the users who are not authenticated as administrator are not profiled
+    res = client.get("/tasks", headers={PROFILE_HEADER: "true"})
+    assert res.status_code == 200
+    assert PROFILE_ID_HEADER not in res.headers
+
+
+def test_middleware__sampling_ratio(engine: Engine) -> None:
+    profiler = Profiler(LocalCache(), sampling_ratio=1)
+    client = _create_client(engine, profiler, security_disabled=False)
+    res = client.get("/tasks")
+    assert res.status_code == 200
+    assert profiler.get_profile(res.headers[PROFILE_ID_HEADER]) is not None
@@ -0,0 +1,56 @@
+import json
+import math
+import typing as t
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from antarest.core.serialization import to_json
+
+
+class MatrixModel(BaseModel):
+    name: str
+    data: t.List[t.List[float]]
+
+
+def _dumps(obj: t.Any) -> bytes:
+    # the encoding previously used by the endpoints
+    return json.dumps(obj, ensure_ascii=False, allow_nan=True, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"index": [0, 1], "columns": ["a", "é"], "data": [[1.5, -2.0], [3e-7, 1e20]]},
+        [[1.0, math.nan], [math.inf, -math.inf]],
+        {"a": [None, math.nan], "b": "null", "c": {"d": True, "e": -math.inf}},
+        ["null", math.inf, [None]],
+        {1: "one", "two": (2, [math.nan])},
+        2**70,
+        [],
+    ],
+)
+def test_to_json(obj: t.Any) -> None:
+    # the numbers may be formatted differently (e.g. `1e20` instead of `1e+20`), but they are the same
+    assert json.loads(to_json(obj)) == json.loads(_dumps(obj))
+    assert to_json(obj).count(b"NaN") == _dumps(obj).count(b"NaN")
+    assert to_json(obj).count(b"Infinity") == _dumps(obj).count(b"Infinity")
+
+
+def test_to_json__numpy() -> None:
+    array = np.arange(6, dtype=np.float64).reshape(2, 3)
+    array[0, 1] = np.nan
+    array[1, 2] = -np.inf
+    obj = {"data": array, "transposed": array.T, "int": np.arange(2), "scalar": np.float32(0.5)}
+    assert to_json(obj) == _dumps({k: v.tolist() for k, v in obj.items()})
+
+
+def test_to_json__pydantic() -> None:
+    model = MatrixModel(name="load", data=[[1.5, math.nan]])
+    assert to_json({"matrix": model}) == b'{"matrix":{"name":"load","data":[[1.5,NaN]]}}'
+
+
+def test_to_json__invalid() -> None:
+    with pytest.raises(TypeError):
+        to_json({"a": {1, 2}})
@@ -1,9 +1,10 @@
 import dataclasses
 import datetime
+import threading
 import time
 import typing as t
 from pathlib import Path
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import create_engine  # type: ignore
@@ -11,12 +12,13 @@ from sqlalchemy.engine.base import Engine  # type: ignore
 from sqlalchemy.orm import Session, sessionmaker  # type: ignore
 
 from antarest.core.config import Config, RemoteWorkerConfig, TaskConfig
-from antarest.core.interfaces.eventbus import EventType, IEventBus
+from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
 from antarest.core.jwt import DEFAULT_ADMIN_USER
 from antarest.core.model import PermissionInfo, PublicMode
 from antarest.core.persistence import Base
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
 from antarest.core.tasks.model import (
+    TaskEventPayload,
     TaskJob,
     TaskJobLog,
     TaskListFilter,
@@ -107,6 +109,8 @@ def test_service(core_config: Config, event_bus: IEventBus) -> None:
         },
         "status": TaskStatus.FAILED,
         "type": None,
+        "queue_depth": None,
+        "wait_time": None,
     }
     assert res.dict() == expected
 
@@ -164,6 +168,8 @@ def test_service(core_config: Config, event_bus: IEventBus) -> None:
     assert len(ok_task.logs) == 2
     assert ok_task.logs[0].message == "start"
     assert ok_task.logs[1].message == "end"
+    assert ok_task.queue_depth == 0
+    assert ok_task.wait_time is not None and ok_task.wait_time >= 0
 
 
 class DummyWorker(AbstractWorker):
@@ -207,6 +213,49 @@ def test_worker_tasks(tmp_path: Path, core_config: Config, event_bus: IEventBus)
     assert (tmp_path / file_to_create).exists()
 
 
+@with_db_context
+def test_await_task__other_worker(core_config: Config, event_bus: IEventBus) -> None:
+    task_job_repo = TaskJobRepository()
+    service = TaskJobService(config=core_config, repository=task_job_repo, event_bus=event_bus)
+
+    def complete_task(task_id: str, push_event: bool) -> None:
+        # simulate a task running on another worker
+        time.sleep(0.5)
+        with db():
+            db.session.query(TaskJob).filter(TaskJob.id == task_id).update({TaskJob.status: TaskStatus.COMPLETED.value})
+            db.session.commit()
+        if push_event:
+            event_bus.push(
+                Event(
+                    type=EventType.TASK_COMPLETED,
+                    payload=TaskEventPayload(id=task_id, message="completed").dict(),
+                    permissions=PermissionInfo(public_mode=PublicMode.READ),
+                )
+            )
+
+    # the completion is notified by an event
+    task_job_repo.save(TaskJob(id="remote1", name="remote", status=TaskStatus.RUNNING.value))
+    threading.Thread(target=complete_task, args=("remote1", True)).start()
+    start = time.time()
+    with patch("antarest.core.tasks.service.DB_POLLING_INTERVAL", 60):
+        service.await_task("remote1", timeout_sec=30)
+    assert time.time() - start < 10
+    assert task_job_repo.get("remote1").status == TaskStatus.COMPLETED.value
+
+    # without event, the status is polled from the database
+    task_job_repo.save(TaskJob(id="remote2", name="remote", status=TaskStatus.RUNNING.value))
+    threading.Thread(target=complete_task, args=("remote2", False)).start()
+    with patch("antarest.core.tasks.service.DB_POLLING_INTERVAL", 0.1):
+        service.await_task("remote2", timeout_sec=30)
+    assert task_job_repo.get("remote2").status == TaskStatus.COMPLETED.value
+
+    # timeout
+    task_job_repo.save(TaskJob(id="remote3", name="remote", status=TaskStatus.RUNNING.value))
+    service.await_task("remote3", timeout_sec=1)
+    db.session.expire_all()
+    assert task_job_repo.get("remote3").status == TaskStatus.TIMEOUT.value
+
+
 def test_repository(db_session: Session) -> None:
     # Prepare two users in the database
     user1_id = 9
@@ -1,10 +1,21 @@
+import time
 import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from antarest.core.exceptions import ShouldNotHappenException
-from antarest.core.utils.utils import concat_files, concat_files_to_str, read_in_zip, retry, suppress_exception
+from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.fastapi_sqlalchemy import middleware as db_middleware
+from antarest.core.utils.utils import (
+    TTLCache,
+    concat_files,
+    concat_files_to_str,
+    read_in_zip,
+    retry,
+    suppress_exception,
+)
 
 
 def test_retry() -> None:
@@ -63,3 +74,40 @@ def test_suppress_exception() -> None:
     caught_exc = []
     suppress_exception(func_failure, lambda ex: caught_exc.append(ex))
     assert len(caught_exc) == 1
+
+
+def test_ttl_cache() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=60)
+    assert cache.get("foo") is None
+    cache.put("foo", 1)
+    cache.put("bar", 2)
+    assert cache.get("foo") == 1
+    cache.invalidate("foo")
+    assert cache.get("foo") is None
+    assert cache.get("bar") == 2
+    cache.clear()
+    assert cache.get("bar") is None
+
+    # Entries expire after the TTL
+    cache.put("foo", 1)
+    with patch.object(time, "monotonic", return_value=time.monotonic() + 61):
+        assert cache.get("foo") is None
+
+    # A zero TTL disables the cache
+    cache = TTLCache(ttl=0)
+    cache.put("foo", 1)
+    assert cache.get("foo") is None
+
+
+def test_db_session_is_lazy() -> None:
+    with patch.object(db_middleware, "_Session") as make_session:
+        make_session.__class__ = db_middleware.sessionmaker
+        with db():
+            pass
+        make_session.assert_not_called()
+
+        with db(commit_on_exit=True):
+            assert db.session is db.session
+        make_session.assert_called_once()
+        make_session.return_value.commit.assert_called_once()
+        make_session.return_value.close.assert_called_once()
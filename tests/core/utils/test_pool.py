@@ -0,0 +1,85 @@
+import threading
+import typing as t
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from starlette.testclient import TestClient
+
+from antarest.core.metrics import REGISTRY
+from antarest.core.utils.fastapi_sqlalchemy import DBSessionMiddleware, db
+from antarest.core.utils.fastapi_sqlalchemy.exceptions import PoolTimeoutError
+from antarest.core.utils.fastapi_sqlalchemy.pool import MonitoredQueuePool, register_pool_metrics
+
+
+def _create_engine(db_path: Path, name: str, **kwargs: t.Any) -> Engine:
+    return create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        poolclass=MonitoredQueuePool,
+        pool_logging_name=name,
+        **kwargs,
+    )
+
+
+@pytest.fixture(name="engines")
+def engines_fixture(tmp_path: Path) -> t.Iterator[t.Tuple[Engine, Engine]]:
+    engine = _create_engine(tmp_path / "db.sqlite", "interactive")
+    background_engine = _create_engine(tmp_path / "db.sqlite", "background")
+    DBSessionMiddleware(None, custom_engine=engine, background_engine=background_engine)
+    yield engine, background_engine
+    DBSessionMiddleware(None, custom_engine=engine)
+
+
+def test_pool_timeout(tmp_path: Path) -> None:
+    engine = _create_engine(tmp_path / "db.sqlite", "test", pool_size=1, max_overflow=0, pool_timeout=0.1)
+    register_pool_metrics(engine)
+    with engine.connect():
+        metrics = REGISTRY.render()
+        assert 'antarest_db_pool_saturation{pool="test"} 1.0' in metrics
+        # the checkout fails fast, with a clear error
+        with pytest.raises(
+            PoolTimeoutError, match="No connection available in the 'test' database pool after 0.1 seconds"
+        ):
+            engine.connect()
+
+    pool = t.cast(MonitoredQueuePool, engine.pool)
+    assert pool.checkout_count == 1
+    assert pool.timeout_count == 1
+    metrics = REGISTRY.render()
+    assert 'antarest_db_pool_capacity{pool="test"} 1.0' in metrics
+    assert 'antarest_db_pool_saturation{pool="test"} 0.0' in metrics
+    assert 'antarest_db_pool_timeouts_total{pool="test"} 1.0' in metrics
+
+    # the statistics are kept when the engine is disposed
+    engine.dispose()
+    assert t.cast(MonitoredQueuePool, engine.pool).timeout_count == 1
+
+
+def test_background_engine(engines: t.Tuple[Engine, Engine]) -> None:
+    engine, background_engine = engines
+    app = FastAPI(title=__name__)
+
+    def get_bind() -> Engine:
+        with db():
+            return db.session.get_bind()
+
+    @app.get("/engines")
+    def get_engines() -> t.Any:
+        binds: t.List[Engine] = []
+        # the contexts opened by a request use the interactive engine, unlike those opened by another thread
+        thread = threading.Thread(target=lambda: binds.append(get_bind()))
+        thread.start()
+        thread.join()
+        return [str(get_bind().pool.name), str(binds[0].pool.name)]
+
+    app.add_middleware(DBSessionMiddleware, custom_engine=engine, background_engine=background_engine)
+    client = TestClient(app)
+    assert client.get("/engines").json() == ["interactive", "background"]
+
+    # the contexts opened outside the requests use the background engine, unless otherwise specified
+    assert get_bind() is background_engine
+    with db(background=False):
+        assert get_bind() is engine
@@ -0,0 +1,116 @@
+import typing as t
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.pool import StaticPool  # type: ignore
+from starlette.testclient import TestClient
+
+from antarest.core.tasks.model import TaskJob
+from antarest.core.utils.fastapi_sqlalchemy import DBSessionMiddleware, db
+from antarest.core.utils.fastapi_sqlalchemy.exceptions import QueryBudgetExceededError
+from antarest.core.utils.fastapi_sqlalchemy.middleware import get_query_monitor
+from antarest.core.utils.fastapi_sqlalchemy.query_monitor import QueryMonitor, QueryStats
+from antarest.dbmodel import Base
+
+
+@pytest.fixture(name="engine")
+def engine_fixture() -> Engine:
+    # the same connection is shared by the threads of the requests
+    engine = create_engine(
+        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(name="query_monitor")
+def query_monitor_fixture(engine: Engine) -> t.Iterator[QueryMonitor]:
+    query_monitor = QueryMonitor(budget=10, budgets={"GET /tasks/{task_id}": 3}, repeat_threshold=3)
+    # noinspection SpellCheckingInspection
+    DBSessionMiddleware(
+        None,
+        custom_engine=engine,
+        session_args={"autocommit": False, "autoflush": False},
+        query_monitor=query_monitor,
+    )
+    yield query_monitor
+    DBSessionMiddleware(None, custom_engine=engine)
+
+
+def _query_tasks(count: int) -> None:
+    for task_id in range(count):
+        db.session.query(TaskJob).filter(TaskJob.id == str(task_id)).all()
+
+
+def test_check(query_monitor: QueryMonitor) -> None:
+    with db(name="task EXPORT"):
+        db.session.query(TaskJob).all()
+        # the statements of the nested contexts are counted in the outermost context
+        with db():
+            _query_tasks(4)
+
+    (summary,) = query_monitor.get_summaries()
+    assert summary.name == "task EXPORT"
+    assert summary.context_count == 1
+    assert summary.statement_count == 5
+    assert summary.budget == 10
+    assert summary.budget_exceeded_count == 0
+    # the same parameterized query executed 4 times is reported as an N+1 query
+    (count,) = summary.repeated_statements.values()
+    assert count == 4
+
+    query_monitor.reset()
+    assert query_monitor.get_summaries() == []
+
+
+def test_check__strict(query_monitor: QueryMonitor) -> None:
+    query_monitor.strict = True
+    with pytest.raises(QueryBudgetExceededError, match="11 SQL statements exceed the budget of 10"):
+        with db(name="task EXPORT"):
+            _query_tasks(11)
+
+    # the error raised in the context is not replaced
+    with pytest.raises(ValueError):
+        with db(name="task EXPORT"):
+            _query_tasks(11)
+            raise ValueError()
+
+    (summary,) = query_monitor.get_summaries()
+    assert summary.context_count == 2
+    assert summary.budget_exceeded_count == 2
+
+
+def test_middleware(engine: Engine, query_monitor: QueryMonitor) -> None:
+    assert get_query_monitor() is query_monitor
+    query_monitor.strict = True
+    app = FastAPI(title=__name__)
+
+    @app.get("/tasks/{task_id}")
+    def get_task(task_id: int) -> None:
+        _query_tasks(task_id)
+
+    app.add_middleware(DBSessionMiddleware, custom_engine=engine, query_monitor=query_monitor)
+    client = TestClient(app)
+    client.get("/tasks/3")
+    # the requests are aggregated by route, each route may have its own budget
+    with pytest.raises(QueryBudgetExceededError, match="GET /tasks/{task_id}: 4 SQL statements"):
+        client.get("/tasks/4")
+
+    (summary,) = query_monitor.get_summaries()
+    assert summary.name == "GET /tasks/{task_id}"
+    assert summary.context_count == 2
+    assert summary.max_statement_count == 4
+
+
+def test_query_stats() -> None:
+    stats = QueryStats()
+    stats.record("SELECT 1", 0.5)
+    stats.record("SELECT 2", 0.25)
+    stats.record("SELECT 1", 0.25)
+    assert stats.name == "<unnamed>"
+    assert stats.statement_count == 3
+    assert stats.duration == 1.0
+    assert stats.get_repeated_statements(2) == {"SELECT 1": 2}
+    assert stats.get_repeated_statements(0) == {}
@@ -12,5 +12,9 @@ def test_lifecycle():
     )
     eventbus.push_event(event)
     assert eventbus.get_events() == [event]
+    eventbus.queue_event(event, "worker")
+    eventbus.queue_event(event, "other")
+    assert eventbus.count_pending_events(["worker"]) == 2
     eventbus.clear_events()
     assert len(eventbus.get_events()) == 0
+    assert eventbus.count_pending_events(["worker", "unknown"]) == 1
@@ -0,0 +1,84 @@
+from http import HTTPStatus
+
+import pytest
+from starlette.testclient import TestClient
+
+
+@pytest.mark.unit_test
+class TestScenarioBuilder:
+    """
+    Test the end points related to the scenario builder.
+
+    Those tests use the "examples/studies/STA-mini.zip" Study,
+    which contains the following areas: ["de", "es", "fr", "it"].
+    """
+
+    def test_update_scenario_by_type(
+        self,
+        client: TestClient,
+        user_access_token: str,
+        internal_study_id: str,
+    ):
+        user_header = {"Authorization": f"Bearer {user_access_token}"}
+
+        # Create a variant of a managed copy of the RAW study
+        res = client.post(
+            f"/v1/studies/{internal_study_id}/copy",
+            headers=user_header,
+            params={"dest": "Clone", "with_outputs": False, "use_task": False},
+        )
+        res.raise_for_status()
+        managed_id = res.json()
+        res = client.post(f"/v1/studies/{managed_id}/variants", headers=user_header, params={"name": "Variant"})
+        res.raise_for_status()
+        variant_id = res.json()
+
+        # Initialize the rules of several scenario types
+        res = client.put(
+            f"/v1/studies/{variant_id}/config/scenariobuilder",
+            headers=user_header,
+            json={"Default Ruleset": {"l": {"fr": {"0": 1, "1": 2}, "de": {"0": 3}}, "w": {"fr": {"0": 4}}}},
+        )
+        assert res.status_code == HTTPStatus.OK, res.json()
+        res = client.get(f"/v1/studies/{variant_id}/config/scenariobuilder", headers=user_header)
+        assert res.status_code == HTTPStatus.OK, res.json()
+        expected = res.json()
+
+        # Update the load table form: the rule of "de" is removed, a rule is added for "it"
+        res = client.put(
+            f"/v1/studies/{variant_id}/config/scenariobuilder/load",
+            headers=user_header,
+            json={"load": {"fr": {"0": 1, "1": 2}, "de": {"0": ""}, "it": {"1": 5}}},
+        )
+        assert res.status_code == HTTPStatus.OK, res.json()
+        assert res.json()["load"]["it"]["1"] == 5
+        assert res.json()["load"]["de"]["0"] == ""
+
+        # Only the modified rules are stored in the command
+        res = client.get(f"/v1/studies/{variant_id}/commands", headers=user_header)
+        res.raise_for_status()
+        command = res.json()[-1]
+        assert command["action"] == "update_scenario_builder"
+        rules = command["args"]["data"]["Default Ruleset"]
+        assert rules.keys() == {"l,de,0", "l,it,1"}
+        assert rules["l,it,1"] == 5
+
+        # The other rules are kept
+        res = client.get(f"/v1/studies/{variant_id}/config/scenariobuilder", headers=user_header)
+        assert res.status_code == HTTPStatus.OK, res.json()
+        load_rules = expected["Default Ruleset"]["l"]
+        del load_rules["de"]["0"]
+        load_rules["it"]["1"] = 5
+        assert res.json() == {
+            "Default Ruleset": {**expected["Default Ruleset"], "l": {k: v for k, v in load_rules.items() if v}},
+        }
+
+        # Nothing is saved if nothing changes
+        res = client.put(
+            f"/v1/studies/{variant_id}/config/scenariobuilder/load",
+            headers=user_header,
+            json={"load": {"fr": {"0": 1}}},
+        )
+        assert res.status_code == HTTPStatus.OK, res.json()
+        res = client.get(f"/v1/studies/{variant_id}/commands", headers=user_header)
+        assert res.json()[-1]["id"] == command["id"]
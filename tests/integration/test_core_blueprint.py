@@ -56,3 +56,95 @@ class TestKillWorker:
         res = client.get("/kill", headers={"Authorization": f"Bearer {admin_access_token}"})
         assert res.status_code == 500, res.json()
         assert not res.content
+
+
+class TestDBStatistics:
+    def test_get_db_statistics(self, client: TestClient, admin_access_token: str, user_access_token: str):
+        # the statistics are only available to the administrators
+        res = client.get("/v1/core/db-statistics", headers={"Authorization": f"Bearer {user_access_token}"})
+        assert res.status_code == http.HTTPStatus.FORBIDDEN, res.json()
+
+        admin_headers = {"Authorization": f"Bearer {admin_access_token}"}
+        client.get("/v1/studies", headers=admin_headers).raise_for_status()
+        res = client.get("/v1/core/db-statistics", headers=admin_headers, params={"reset": True})
+        res.raise_for_status()
+        summaries = {summary["name"]: summary for summary in res.json()}
+        # the requests are aggregated by route, with the budget of the route
+        summary = summaries["GET /v1/studies"]
+        assert summary["context_count"] == 1
+        assert 0 < summary["max_statement_count"] <= summary["budget"]
+
+        res = client.get("/v1/core/db-statistics", headers=admin_headers)
+        res.raise_for_status()
+        assert "GET /v1/studies" not in {summary["name"] for summary in res.json()}
+
+
+def _get_sample(metrics: str, name: str) -> float:
+    (value,) = [line.split()[-1] for line in metrics.splitlines() if line.startswith(f"{name} ")]
+    return float(value)
+
+
+class TestMetrics:
+    def test_get_metrics(self, client: TestClient, admin_access_token: str, user_access_token: str):
+        # the metrics are only available to the administrators
+        res = client.get("/metrics", headers={"Authorization": f"Bearer {user_access_token}"})
+        assert res.status_code == http.HTTPStatus.FORBIDDEN, res.json()
+
+        admin_headers = {"Authorization": f"Bearer {admin_access_token}"}
+        res = client.get("/metrics", headers=admin_headers)
+        res.raise_for_status()
+        assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+        for metric_type in [
+            "antarest_task_queue_depth gauge",
+            "antarest_cache_hit_ratio gauge",
+            "antarest_eventbus_backlog gauge",
+            "antarest_websocket_connections gauge",
+            "antarest_launcher_jobs gauge",
+        ]:
+            assert f"# TYPE {metric_type}" in res.text
+        written_bytes = _get_sample(res.text, "antarest_matrix_store_written_bytes_total")
+
+        # a new matrix is written in the matrix store
+        res = client.post("/v1/matrix", headers=admin_headers, json=[[1.5, 2.5], [3.5, 4.5]])
+        res.raise_for_status()
+        res = client.get("/metrics", headers=admin_headers)
+        res.raise_for_status()
+        assert _get_sample(res.text, "antarest_matrix_store_written_bytes_total") > written_bytes
+        assert _get_sample(res.text, "antarest_matrix_store_write_seconds_count") > 0
+
+
+class TestProfiles:
+    def test_get_profile(self, client: TestClient, admin_access_token: str, user_access_token: str):
+        # the requests of the users are not profiled, even with the header
+        user_headers = {"Authorization": f"Bearer {user_access_token}"}
+        res = client.get("/v1/studies", headers={**user_headers, "X-Profile": "true"})
+        res.raise_for_status()
+        assert "X-Profile-Id" not in res.headers
+
+        admin_headers = {"Authorization": f"Bearer {admin_access_token}"}
+        res = client.post("/v1/studies", headers=admin_headers, params={"name": "foo"})
+        res.raise_for_status()
+        study_id = res.json()
+        res = client.get(
+            f"/v1/studies/{study_id}/raw",
+            headers={**admin_headers, "X-Profile": "true"},
+            params={"path": "settings/generaldata", "depth": -1},
+        )
+        res.raise_for_status()
+        profile_id = res.headers["X-Profile-Id"]
+
+        # the profiles are only available to the administrators
+        res = client.get(f"/v1/core/profiles/{profile_id}", headers=user_headers)
+        assert res.status_code == http.HTTPStatus.FORBIDDEN, res.json()
+
+        res = client.get(f"/v1/core/profiles/{profile_id}", headers=admin_headers)
+        res.raise_for_status()
+        profile = res.json()
+        assert profile["route"] == "GET /v1/studies/{uuid}/raw"
+        assert profile["status_code"] == 200
+        assert profile["sql_statement_count"] > 0
+        operations = {operation["name"] for operation in profile["tree_operations"]}
+        assert "GeneralData.read" in operations
+
+        res = client.get("/v1/core/profiles/unknown", headers=admin_headers)
+        assert res.status_code == http.HTTPStatus.NOT_FOUND, res.json()
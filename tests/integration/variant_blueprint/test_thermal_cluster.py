@@ -143,4 +143,6 @@ class TestThermalCluster:
             },
             "status": TaskStatus.COMPLETED,
             "type": "VARIANT_GENERATION",
+            "queue_depth": mock.ANY,
+            "wait_time": mock.ANY,
         }
@@ -318,3 +318,46 @@ def test_outputs(client: TestClient, admin_access_token: str, variant_id: str, t
     assert res.status_code == 200, res.json()
     outputs = res.json()
     assert len(outputs) == 1
+
+
+def test_compact_commands(client: TestClient, admin_access_token: str, variant_id: str) -> None:
+    admin_headers = {"Authorization": f"Bearer {admin_access_token}"}
+    target = "settings/generaldata/general/nbyears"
+    commands = [
+        {"action": "create_area", "args": {"area_name": "FR"}},
+        {"action": "update_config", "args": {"target": target, "data": 10}},
+        {"action": "update_config", "args": {"target": "settings/generaldata/general/mode", "data": "Adequacy"}},
+        {"action": "update_config", "args": {"target": target, "data": 20}},
+        {"action": "create_area", "args": {"area_name": "DE"}},
+        {"action": "remove_area", "args": {"id": "de"}},
+        {"action": "update_config", "args": {"target": target, "data": 30}},
+    ]
+    res = client.post(f"/v1/studies/{variant_id}/commands", json=commands, headers=admin_headers)
+    res.raise_for_status()
+
+    res = client.put(f"/v1/studies/{variant_id}/compact", headers=admin_headers)
+    res.raise_for_status()
+    task_id = res.json()
+    res = client.get(f"/v1/tasks/{task_id}", headers=admin_headers, params={"wait_for_completion": True})
+    res.raise_for_status()
+    task_result = TaskDTO.parse_obj(res.json())
+    assert task_result.status == TaskStatus.COMPLETED, task_result.result
+    assert task_result.result is not None
+    assert task_result.result.success, task_result.result.message
+
+    # Removing an area does not restore the districts: the area creation is not cancelled
+    res = client.get(f"/v1/studies/{variant_id}/commands", headers=admin_headers)
+    actual = [(c["action"], c["args"]) for c in res.json()]
+    assert actual == [
+        ("create_area", {"area_name": "FR"}),
+        ("update_config", {"target": target, "data": "20"}),
+        ("update_config", {"target": "settings/generaldata/general/mode", "data": "Adequacy"}),
+        ("create_area", {"area_name": "DE"}),
+        ("remove_area", {"id": "de"}),
+        ("update_config", {"target": target, "data": "30"}),
+    ]
+
+    # The variant can be generated with the compacted commands
+    res = client.get(f"/v1/studies/{variant_id}/config/general/form", headers=admin_headers)
+    assert res.status_code == 200, res.json()
+    assert res.json()["nbYears"] == 30
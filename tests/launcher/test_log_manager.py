@@ -1,7 +1,10 @@
 import logging
+import threading
 import time
 from pathlib import Path
 
+import pytest
+
 from antarest.launcher.adapters.log_manager import LogTailManager
 
 logging.basicConfig(level=logging.DEBUG)
@@ -50,3 +53,45 @@ def test_reading(tmp_path: Path):
         count -= 1
         time.sleep(1)
     assert len(logs) == 0
+
+
+def _wait_for(condition, timeout: float = 10) -> None:
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.05)
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_reading__single_thread(tmp_path: Path, use_inotify: bool):
+    log_manager = LogTailManager(tmp_path)
+    if not use_inotify:
+        log_manager._inotify = None
+    logs = {f"job{i}": [] for i in range(20)}
+    thread_count = threading.active_count()
+
+    for name in logs:
+        log_path = tmp_path / f"{name}.log"
+        log_path.write_text("existing line\n")
+        log_manager.track(log_path, logs[name].append)
+    assert log_manager.is_tracking(tmp_path / "job0.log")
+    # a missing file is not tracked
+    log_manager.track(tmp_path / "missing.log", logs["job0"].append)
+    assert not log_manager.is_tracking(tmp_path / "missing.log")
+
+    # only one thread is used to follow all the files
+    assert threading.active_count() == thread_count + 1
+    _wait_for(lambda: all(logs.values()))
+    assert all(lines == ["existing line\n"] for lines in logs.values())
+
+    # the lines are delivered once they are complete
+    with open(tmp_path / "job3.log", mode="a") as fh:
+        fh.write("first\nsec")
+        fh.flush()
+        _wait_for(lambda: len(logs["job3"]) == 2)
+        fh.write("ond\nthird\n")
+    _wait_for(lambda: len(logs["job3"]) == 3)
+    assert logs["job3"] == ["existing line\n", "first\n", "second\nthird\n"]
+
+    for name in logs:
+        log_manager.stop_tracking(tmp_path / f"{name}.log")
+    assert not log_manager.tracked_logs
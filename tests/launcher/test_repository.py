@@ -148,3 +148,32 @@ def test_logs():
     assert b.logs[0].message == "a"
     assert b.logs[0].log_type == JobLogType.BEFORE
     assert b.logs[0].job_id == uuid
+
+
+@pytest.mark.unit_test
+@with_db_context
+def test_add_logs():
+    repo = JobResultRepository()
+    uuid = str(uuid4())
+    repo.save(JobResult(id=uuid, study_id="a", job_status=JobStatus.RUNNING))
+
+    repo.add_logs(uuid, [JobLog(job_id=uuid, message="a", log_type=JobLogType.BEFORE)])
+    repo.add_logs(
+        uuid,
+        [
+            JobLog(job_id=uuid, message="b", log_type=JobLogType.BEFORE),
+            JobLog(job_id=uuid, message="c", log_type=JobLogType.AFTER),
+        ],
+    )
+    # the logs of a missing job are ignored
+    repo.add_logs("missing", [JobLog(job_id="missing", message="d", log_type=JobLogType.BEFORE)])
+
+    job = repo.get(uuid)
+    assert [(log.message, log.log_type) for log in job.logs] == [
+        ("a", JobLogType.BEFORE),
+        ("b", JobLogType.BEFORE),
+        ("c", JobLogType.AFTER),
+    ]
+    assert db.session.query(JobLog).count() == 3
+    assert [log.message for log in repo.get_logs(uuid)] == ["a", "b", "c"]
+    assert repo.get_logs("missing") == []
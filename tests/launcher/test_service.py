@@ -1,6 +1,8 @@
+import concurrent.futures
 import json
 import math
 import os
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -624,8 +626,8 @@ class TestLauncherService:
         job_result_mock.study_id = "study_id"
         job_result_mock.output_id = None
         job_result_mock.launcher = launcher
-        job_result_mock.logs = []
         launcher_service.job_result_repository.get.return_value = job_result_mock
+        launcher_service.job_result_repository.get_logs.return_value = []
 
         engine = create_engine("sqlite:///:memory:", echo=False)
         Base.metadata.create_all(engine)
@@ -635,11 +637,106 @@ class TestLauncherService:
             custom_engine=engine,
             session_args={"autocommit": False, "autoflush": False},
         )
-        launcher_service.append_log(job_id, "test", JobLogType.BEFORE)
-        launcher_service.job_result_repository.save.assert_called_with(job_result_mock)
-        assert job_result_mock.logs[0].message == "test"
-        assert job_result_mock.logs[0].job_id == "job_id"
-        assert job_result_mock.logs[0].log_type == str(JobLogType.BEFORE)
+        slurm_launcher = Mock()
+        slurm_launcher.get_log.return_value = "launcher logs"
+        launcher_service.launchers = {launcher: slurm_launcher}
+        repository = launcher_service.job_result_repository
+
+        # the logs are buffered, but they are returned by `get_log`
+        with patch("antarest.launcher.service.LOG_FLUSH_DELAY", 60):
+            launcher_service.append_log(job_id, "before", JobLogType.BEFORE)
+            launcher_service.append_log(job_id, "after", JobLogType.AFTER)
+        repository.add_logs.assert_not_called()
+        logs = launcher_service.get_log(job_id, LogType.STDOUT, RequestParameters(DEFAULT_ADMIN_USER))
+        assert logs == "before\nlauncher logs\nafter"
+
+        # the logs are saved when the job status is updated
+        launcher_service.update(job_id, JobStatus.SUCCESS, None, None)
+        repository.add_logs.assert_called_once()
+        saved_job_id, saved_logs = repository.add_logs.call_args[0]
+        assert saved_job_id == job_id
+        assert [(log.job_id, log.message, log.log_type) for log in saved_logs] == [
+            (job_id, "before", str(JobLogType.BEFORE)),
+            (job_id, "after", str(JobLogType.AFTER)),
+        ]
+        assert not launcher_service._log_buffers
+        # the flush count of a completed job is removed
+        assert not launcher_service._log_flush_counts
+
+        # the logs are saved when the buffer is full, or after a delay
+        repository.add_logs.reset_mock()
+        with patch("antarest.launcher.service.LOG_BUFFER_SIZE", 3):
+            for i in range(4):
+                launcher_service.append_log(job_id, f"line {i}", JobLogType.BEFORE)
+            assert [log.message for log in repository.add_logs.call_args[0][1]] == ["line 0", "line 1", "line 2"]
+        deadline = time.time() + 10
+        while repository.add_logs.call_count < 2 and time.time() < deadline:
+            time.sleep(0.1)
+        assert [log.message for log in repository.add_logs.call_args[0][1]] == ["line 3"]
+
+    def test_append_logs__concurrent_flush(self, tmp_path: Path) -> None:
+        launcher_service = LauncherService(
+            config=Config(storage=StorageConfig(tmp_dir=tmp_path)),
+            study_service=Mock(),
+            job_result_repository=Mock(),
+            event_bus=Mock(),
+            factory_launcher=Mock(),
+            file_transfer_manager=Mock(),
+            task_service=Mock(),
+            cache=Mock(),
+        )
+        job_id = "job_id"
+        job_result_mock = Mock(id=job_id, study_id="study_id", output_id=None, launcher="slurm")
+        slurm_launcher = Mock()
+        slurm_launcher.get_log.return_value = "launcher logs"
+        launcher_service.launchers = {"slurm": slurm_launcher}
+        repository = launcher_service.job_result_repository
+        repository.get.return_value = job_result_mock
+
+        # the saved logs are read while a flush of another job is running, and a flush of the job
+        # starts during the reading: the reading is retried, and no message is missed nor duplicated
+        saved_logs: List[JobLog] = []
+        flush_started = threading.Event()
+        flush_resumed = threading.Event()
+
+        def add_logs(flushed_job_id: str, logs: List[JobLog]) -> None:
+            if flushed_job_id == "other_job_id":
+                flush_started.set()
+                assert flush_resumed.wait(timeout=10)
+            else:
+                saved_logs.extend(logs)
+
+        def get_logs(_: str) -> List[JobLog]:
+            logs = list(saved_logs)
+            if not logs:
+                launcher_service.flush_logs(job_id)
+            return logs
+
+        repository.add_logs.side_effect = add_logs
+        repository.get_logs.side_effect = get_logs
+
+        with patch("antarest.launcher.service.LOG_FLUSH_DELAY", 60):
+            launcher_service.append_log("other_job_id", "other", JobLogType.BEFORE)
+            launcher_service.append_log(job_id, "before", JobLogType.BEFORE)
+            launcher_service.append_log(job_id, "after", JobLogType.AFTER)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(launcher_service.flush_logs, "other_job_id")
+            assert flush_started.wait(timeout=10)
+            logs = launcher_service.get_log(job_id, LogType.STDOUT, RequestParameters(DEFAULT_ADMIN_USER))
+            assert logs == "before\nlauncher logs\nafter"
+            flush_resumed.set()
+            future.result(timeout=10)
+        assert repository.get_logs.call_count == 2
+
+        # the remaining buffered logs are saved when the application stops
+        repository.add_logs.reset_mock()
+        repository.add_logs.side_effect = None
+        with patch("antarest.launcher.service.LOG_FLUSH_DELAY", 60):
+            launcher_service.append_log(job_id, "last", JobLogType.AFTER)
+            launcher_service.append_log("other_job_id", "last", JobLogType.AFTER)
+        launcher_service.flush_all_logs()
+        assert sorted(c[0][0] for c in repository.add_logs.call_args_list) == [job_id, "other_job_id"]
+        assert not launcher_service._log_buffers
 
     def test_get_logs(self, tmp_path: Path) -> None:
         study_service = Mock()
@@ -660,14 +757,14 @@ class TestLauncherService:
         job_result_mock.study_id = "study_id"
         job_result_mock.output_id = None
         job_result_mock.launcher = launcher
-        job_result_mock.logs = [
+        job_result_mock.launcher_params = '{"archive_output": false}'
+
+        launcher_service.job_result_repository.get.return_value = job_result_mock
+        launcher_service.job_result_repository.get_logs.return_value = [
             JobLog(message="first message", log_type=str(JobLogType.BEFORE)),
             JobLog(message="second message", log_type=str(JobLogType.BEFORE)),
             JobLog(message="last message", log_type=str(JobLogType.AFTER)),
         ]
-        job_result_mock.launcher_params = '{"archive_output": false}'
-
-        launcher_service.job_result_repository.get.return_value = job_result_mock
         slurm_launcher = Mock()
         launcher_service.launchers = {"slurm": slurm_launcher}
         slurm_launcher.get_log.return_value = "launcher logs"
@@ -1003,3 +1100,34 @@ class TestLauncherService:
             launcher_expected_result.allocated_cpu_rate,
             actual_result.allocated_cpu_rate,
         )
+
+    def test_get_load__slurm_cache(self, tmp_path: Path) -> None:
+        config = Config(
+            storage=StorageConfig(tmp_dir=tmp_path),
+            launcher=LauncherConfig(default="slurm", slurm=SlurmConfig(hostname="cluster", username="user")),
+        )
+        launcher_service = LauncherService(
+            config=config,
+            study_service=Mock(),
+            job_result_repository=Mock(),
+            event_bus=Mock(),
+            factory_launcher=Mock(),
+            file_transfer_manager=Mock(),
+            task_service=Mock(),
+            cache=Mock(),
+        )
+        expected = LauncherLoadDTO(
+            allocated_cpu_rate=25.0,
+            cluster_load_rate=50.0,
+            nb_queued_jobs=3,
+            launcher_status="SUCCESS",
+        )
+
+        with patch("antarest.launcher.service.calculates_slurm_load", return_value=(25.0, 50.0, 3)) as calculate:
+            # the cluster load is shared by the requests until it expires
+            assert launcher_service.get_load() == expected
+            assert launcher_service.get_load() == expected
+            calculate.assert_called_once()
+            with patch("antarest.launcher.service.LOAD_CACHE_TTL", 0):
+                assert launcher_service.get_load() == expected
+            assert calculate.call_count == 2
@@ -15,6 +15,8 @@ from antarest.core.config import Config, LauncherConfig, NbCoresConfig, SlurmCon
 from antarest.launcher.adapters.abstractlauncher import LauncherInitException
 from antarest.launcher.adapters.slurm_launcher.slurm_launcher import (
     LOG_DIR_NAME,
+    MAX_CHECK_DELAY,
+    MIN_CHECK_DELAY,
     WORKSPACE_LOCK_FILE_NAME,
     SlurmLauncher,
     VersionNotSupportedError,
@@ -351,6 +353,36 @@ def test_check_state(tmp_path: Path, launcher_config: Config) -> None:
     assert slurm_launcher._delete_workspace_file.call_count == 4
     assert data_repo_tinydb.remove_study.call_count == 2
     slurm_launcher.stop.assert_called_once()
+    # no job is running: the next check is delayed
+    assert slurm_launcher.check_delay == 2 * MIN_CHECK_DELAY
+
+
+@pytest.mark.unit_test
+def test_check_state__adaptive_delay(tmp_path: Path, launcher_config: Config) -> None:
+    slurm_launcher = SlurmLauncher(
+        config=launcher_config,
+        callbacks=Mock(),
+        event_bus=Mock(),
+        cache=Mock(),
+    )
+    slurm_launcher._call_launcher = Mock()
+    slurm_launcher.log_tail_manager = Mock()
+    pending_study = Mock(started=False, finished=False, done=False, with_error=False, job_log_dir=str(tmp_path))
+    running_study = Mock(started=True, finished=False, done=False, with_error=False, job_log_dir=str(tmp_path))
+    slurm_launcher.data_repo_tinydb = Mock()
+
+    # the delay increases while all the jobs are pending in the queue
+    slurm_launcher.data_repo_tinydb.get_list_of_studies.return_value = [pending_study]
+    delays = []
+    for _ in range(8):
+        slurm_launcher._check_studies_state()
+        delays.append(slurm_launcher.check_delay)
+    assert delays == [4, 8, 16, 32, MAX_CHECK_DELAY, MAX_CHECK_DELAY, MAX_CHECK_DELAY, MAX_CHECK_DELAY]
+
+    # the delay is reset as soon as a job is running
+    slurm_launcher.data_repo_tinydb.get_list_of_studies.return_value = [pending_study, running_study]
+    slurm_launcher._check_studies_state()
+    assert slurm_launcher.check_delay == MIN_CHECK_DELAY
 
 
 @pytest.mark.unit_test
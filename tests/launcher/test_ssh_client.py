@@ -1,9 +1,23 @@
+import concurrent.futures
 import math
-from unittest.mock import Mock
+import threading
+from pathlib import Path
+from typing import Any, List, Tuple
+from unittest.mock import Mock, patch
 
+import paramiko
 import pytest
 
-from antarest.launcher.ssh_client import SlurmError, calculates_slurm_load, parse_cpu_load, parse_cpu_used
+from antarest.launcher.ssh_client import (
+    SlurmError,
+    SSHSessionPool,
+    calculates_slurm_load,
+    execute_command,
+    parse_cpu_load,
+    parse_cpu_used,
+    ssh_session_pool,
+)
+from antarest.launcher.ssh_config import SSHConfigDTO
 
 
 @pytest.mark.unit_test
@@ -25,3 +39,107 @@ def test_calculates_slurm_load_without_private_key_fails() -> None:
     ssh_config = Mock()
     with pytest.raises(SlurmError):
         calculates_slurm_load(ssh_config, "fake_partition")
+
+
+class FakeChannelFile:
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    def read(self) -> bytes:
+        return self.content.encode("utf-8")
+
+
+class FakeSSHClient:
+    """
+    Stand-in of `paramiko.SSHClient` answering the `sinfo` and `squeue` commands of a small cluster.
+    """
+
+    instances: List["FakeSSHClient"] = []
+
+    def __init__(self) -> None:
+        self.active = False
+        self.commands: List[str] = []
+        FakeSSHClient.instances.append(self)
+
+    def set_missing_host_key_policy(self, policy: Any) -> None:
+        pass
+
+    def connect(self, **kwargs: Any) -> None:
+        self.active = True
+
+    def get_transport(self) -> Any:
+        return Mock(is_active=Mock(return_value=self.active))
+
+    def close(self) -> None:
+        self.active = False
+
+    def exec_command(self, command: str, timeout: int) -> Tuple[None, FakeChannelFile, FakeChannelFile]:
+        if not self.active:
+            raise paramiko.SSHException("SSH session not active")
+        self.commands.append(command)
+        if command.startswith("sinfo") and "NodeAIOT" in command:
+            output = "12/36/0/48"
+        elif command.startswith("sinfo"):
+            output = "6.00 24\n18.00 24"
+        elif command.startswith("squeue"):
+            output = "3"
+        else:
+            return None, FakeChannelFile(""), FakeChannelFile(f"{command}: command not found")
+        return None, FakeChannelFile(output), FakeChannelFile("")
+
+
+@pytest.mark.unit_test
+def test_calculates_slurm_load__pooled_session() -> None:
+    FakeSSHClient.instances.clear()
+    ssh_config = SSHConfigDTO(config_path=Path(), username="user", hostname="cluster", private_key_file=Path("key"))
+    with patch("paramiko.SSHClient", FakeSSHClient), patch("paramiko.RSAKey.from_private_key_file"):
+        try:
+            assert calculates_slurm_load(ssh_config, "") == (25.0, 50.0, 3)
+            assert calculates_slurm_load(ssh_config, "long") == (25.0, 50.0, 3)
+            # all the commands are executed in the same session
+            assert len(FakeSSHClient.instances) == 1
+            assert len(FakeSSHClient.instances[0].commands) == 6
+            assert FakeSSHClient.instances[0].commands[3] == "sinfo --partition=long -O NodeAIOT --noheader"
+
+            # a session closed by the server is replaced
+            FakeSSHClient.instances[0].close()
+            assert calculates_slurm_load(ssh_config, "") == (25.0, 50.0, 3)
+            assert len(FakeSSHClient.instances) == 2
+
+            # an error in a command does not close the session
+            with pytest.raises(SlurmError, match="command not found"):
+                execute_command(ssh_config, ["scontrol", "ping"])
+            assert FakeSSHClient.instances[1].active
+        finally:
+            ssh_session_pool.close()
+    assert not any(client.active for client in FakeSSHClient.instances)
+
+
+@pytest.mark.unit_test
+def test_ssh_session_pool__slow_host() -> None:
+    connecting = threading.Event()
+    release = threading.Event()
+
+    class SlowSSHClient(FakeSSHClient):
+        def connect(self, **kwargs: Any) -> None:
+            if kwargs["hostname"] == "slow":
+                connecting.set()
+                release.wait(5)
+            super().connect(**kwargs)
+
+    slow_config = SSHConfigDTO(config_path=Path(), username="user", hostname="slow", private_key_file=Path("key"))
+    fast_config = SSHConfigDTO(config_path=Path(), username="user", hostname="fast", private_key_file=Path("key"))
+    pool = SSHSessionPool()
+    with patch("paramiko.SSHClient", SlowSSHClient), patch("paramiko.RSAKey.from_private_key_file"):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(lambda: pool.session(slow_config).__enter__())
+            try:
+                assert connecting.wait(5)
+                # the session to another host is opened while the slow host is connecting
+                with pool.session(fast_config) as client:
+                    assert client.active
+                assert not future.done()
+            finally:
+                release.set()
+            assert future.result(5).active
+        pool.close()
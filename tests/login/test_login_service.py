@@ -1,3 +1,4 @@
+import time
 import typing as t
 from unittest.mock import patch
 
@@ -713,6 +714,75 @@ class TestLoginService:
         jwt_user = login_service.get_jwt(joh_bot.id)
         assert jwt_user is None
 
+    @with_db_context
+    def test_get_jwt__identity_cache(self, login_service: LoginService) -> None:
+        login_service._jwt_cache.ttl = 60
+        clark_id = 2
+        lois_id = 3
+        jwt_user = login_service.get_jwt(lois_id)
+        assert jwt_user is not None
+        assert jwt_user.groups == [JWTGroup(id="superman", name="Superman", role=RoleType.READER)]
+
+        # The identity is cached: the roles are not fetched again
+        with patch.object(login_service.roles, "get_all_by_user") as get_all_by_user:
+            assert login_service.get_jwt(lois_id) == jwt_user
+            get_all_by_user.assert_not_called()
+
+        # A role modification through the service invalidates the cache
+        _param = get_user_param(login_service, user_id=clark_id, group_id="superman")
+        login_service.delete_role(lois_id, "superman", _param)
+        jwt_user = login_service.get_jwt(lois_id)
+        assert jwt_user is not None
+        assert jwt_user.groups == []
+
+        login_service.save_role(RoleCreationDTO(type=RoleType.WRITER, identity_id=lois_id, group_id="superman"), _param)
+        jwt_user = login_service.get_jwt(lois_id)
+        assert jwt_user is not None
+        assert jwt_user.groups == [JWTGroup(id="superman", name="Superman", role=RoleType.WRITER)]
+
+    @with_db_context
+    def test_exists_bot__identity_cache(self, login_service: LoginService) -> None:
+        login_service._bot_cache.ttl = 60
+        joh_id = 4
+        _param = get_user_param(login_service, user_id=joh_id, group_id="superman")
+        joh_bot = login_service.save_bot(BotCreateDTO(name="Maria", roles=[]), _param)
+        assert login_service.exists_bot(joh_bot.id) is True
+
+        with patch.object(login_service.bots, "exists") as exists:
+            assert login_service.exists_bot(joh_bot.id) is True
+            exists.assert_not_called()
+
+        # A deleted bot token is revoked immediately
+        login_service.delete_bot(joh_bot.id, _param)
+        assert login_service.exists_bot(joh_bot.id) is False
+
+    @with_db_context
+    def test_invalidate_identity_cache__other_workers(self, login_service: LoginService) -> None:
+        # The services of two workers share the same event bus
+        services = [
+            LoginService(
+                user_repo=login_service.users,
+                bot_repo=login_service.bots,
+                group_repo=login_service.groups,
+                role_repo=login_service.roles,
+                ldap=login_service.ldap,
+                event_bus=login_service.event_bus,
+                identity_cache_ttl=60,
+            )
+            for _ in range(2)
+        ]
+        joh_id = 4
+        _param = get_user_param(login_service, user_id=joh_id, group_id="superman")
+        joh_bot = services[0].save_bot(BotCreateDTO(name="Maria", roles=[]), _param)
+        assert services[1].exists_bot(joh_bot.id) is True
+
+        # A bot deleted by a worker is revoked in the other workers once they receive the event
+        services[0].delete_bot(joh_bot.id, _param)
+        deadline = time.monotonic() + 5
+        while services[1].exists_bot(joh_bot.id) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert services[1].exists_bot(joh_bot.id) is False
+
     @with_db_context
     def test_get_all_groups(self, login_service: LoginService) -> None:
         # The site admin can get all groups
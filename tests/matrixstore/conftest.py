@@ -2,6 +2,7 @@ import unittest.mock
 
 import pytest
 
+from antarest.core.config import Config
 from antarest.matrixstore.repository import MatrixContentRepository, MatrixDataSetRepository, MatrixRepository
 from antarest.matrixstore.service import MatrixService
 
@@ -29,7 +30,7 @@ def matrix_service_fixture(matrix_repo, dataset_repo, content_repo) -> MatrixSer
         matrix_content_repository=content_repo,
         file_transfer_manager=unittest.mock.Mock(),
         task_service=unittest.mock.Mock(),
-        config=unittest.mock.Mock(),
+        config=Config(),
         user_service=unittest.mock.Mock(),
     )
 
@@ -201,6 +201,13 @@ class TestMatrixContentRepository:
         assert matrix_files == [matrix_file]
         assert matrix_file.stat().st_mtime == modif_time, "date changed!"
 
+        # when the data is saved again as a non-contiguous NumPy array (e.g.: from a DataFrame)
+        data = np.asfortranarray(np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype=np.float64))
+        assert matrix_content_repo.save(data) == matrix_hash
+        # then no new TSV file is created
+        matrix_files = list(bucket_dir.glob("*.tsv"))
+        assert matrix_files == [matrix_file]
+
         # when other data is saved with different values
         other_data = [[9.0, 2.0, 3.0], [10.0, 20.0, 30.0]]
         other_matrix_hash = matrix_content_repo.save(other_data)
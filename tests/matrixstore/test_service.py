@@ -4,13 +4,14 @@ import json
 import time
 import typing as t
 import zipfile
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, patch
 
 import numpy as np
 import pytest
 from fastapi import UploadFile
 from starlette.datastructures import Headers
 
+from antarest.core.config import Config
 from antarest.core.jwt import JWTGroup, JWTUser
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
 from antarest.core.roles import RoleType
@@ -135,6 +136,50 @@ class TestMatrixService:
             missing_hash = "8b1a9953c4611296a827abf8c47804d7e6c49c6b"
             assert not matrix_service.exists(missing_hash)
 
+    def test_exists__matrix_index(self, matrix_service: MatrixService) -> None:
+        """Existing matrices are checked only once in the storage."""
+        data: MatrixType = [[1, 2, 3], [4, 5, 6]]
+        matrix_id = matrix_service.create(data)
+        missing_hash = "8b1a9953c4611296a827abf8c47804d7e6c49c6b"
+
+        content_repository = matrix_service.matrix_content_repository
+        with db(), patch.object(content_repository, "exists", wraps=content_repository.exists) as exists:
+            for _ in range(3):
+                assert matrix_service.exists(matrix_id)
+                assert not matrix_service.exists(missing_hash)
+        # only the missing matrix is looked up (it may be created by another process)
+        assert [c.args for c in exists.call_args_list] == [(missing_hash,)] * 3
+        assert matrix_service.matrix_index.avoided_lookups == 3
+
+        # a deleted matrix is removed from the index
+        with db():
+            matrix_service.delete(matrix_id)
+            assert not matrix_service.exists(matrix_id)
+
+    def test_exists__matrix_index_expiration(self, matrix_service: MatrixService) -> None:
+        """Matrices deleted by another process (the garbage collector) are looked up again after a delay."""
+        # the index expires before the next run of the garbage collector
+        assert matrix_service.matrix_index.ttl <= Config().storage.matrix_gc_sleeping_time / 2
+
+        data: MatrixType = [[1, 2, 3], [4, 5, 6]]
+        matrix_id = matrix_service.create(data)
+        other_service = MatrixService(
+            repo=matrix_service.repo,
+            repo_dataset=matrix_service.repo_dataset,
+            matrix_content_repository=matrix_service.matrix_content_repository,
+            file_transfer_manager=Mock(),
+            task_service=Mock(),
+            config=Config(),
+            user_service=Mock(),
+        )
+        other_service.delete(matrix_id)
+
+        now = time.monotonic()
+        with db(), patch("time.monotonic", return_value=now) as monotonic:
+            assert matrix_service.exists(matrix_id)
+            monotonic.return_value = now + matrix_service.matrix_index.ttl
+            assert not matrix_service.exists(matrix_id)
+
     def test_delete__nominal_case(self, matrix_service: MatrixService) -> None:
         """Delete a matrix object from the matrix content repository and the database."""
         # when a matrix is created (inserted) in the service
@@ -308,7 +353,7 @@ def test_dataset_lifecycle() -> None:
     dataset_repo = Mock()
     user_service = Mock()
 
-    service = MatrixService(repo, dataset_repo, content, Mock(), Mock(), Mock(), user_service)
+    service = MatrixService(repo, dataset_repo, content, Mock(), Mock(), Config(), user_service)
 
     userA = RequestParameters(
         user=JWTUser(
@@ -20,7 +20,7 @@ from antarest.study.model import (
     StudyAdditionalData,
 )
 from antarest.study.repository import StudyMetadataRepository
-from antarest.study.storage.patch_service import PatchService
+from antarest.study.storage.patch_service import PatchService, _parse_patch, parse_patch
 from tests.helpers import with_db_context
 
 PATCH_CONTENT = """ 
@@ -236,3 +236,26 @@ class TestPatchService:
             """
         )
         assert actual_obj == expected_obj
+
+
+@pytest.mark.unit_test
+def test_parse_patch() -> None:
+    patch = parse_patch(PATCH_CONTENT)
+    assert patch.study is not None and patch.study.scenario == "BAU2025"
+    assert parse_patch(None) == parse_patch("") == Patch()
+
+    # the same content is parsed only once, and the parsed patch is shared
+    hits = _parse_patch.cache_info().hits
+    other = parse_patch(PATCH_CONTENT)
+    assert _parse_patch.cache_info().hits == hits + 1
+    assert other is patch
+
+    # the patch returned by `PatchService.get` can be modified without altering the shared patch
+    raw_study = RawStudy(id=str(uuid.uuid4()), additional_data=StudyAdditionalData(patch=PATCH_CONTENT))
+    own_patch = PatchService().get(raw_study)
+    assert own_patch == patch and own_patch is not patch
+    own_patch.study.scenario = "modified"
+    assert parse_patch(PATCH_CONTENT).study.scenario == "BAU2025"
+
+    with pytest.raises(ValueError):
+        parse_patch("{invalid")
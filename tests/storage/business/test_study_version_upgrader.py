@@ -5,16 +5,25 @@ import re
 import shutil
 import zipfile
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
 import pandas
 import pytest
 
+from antarest.study.storage import study_upgrader
 from antarest.study.storage.rawstudy.ini_reader import IniReader
 from antarest.study.storage.rawstudy.model.filesystem.config.model import transform_name_to_id
 from antarest.study.storage.rawstudy.model.filesystem.root.settings.generaldata import DUPLICATE_KEYS
-from antarest.study.storage.study_upgrader import UPGRADE_METHODS, InvalidUpgrade, upgrade_study
+from antarest.study.storage.study_upgrader import (
+    UPGRADE_METHODS,
+    InvalidUpgrade,
+    UpgradeMethod,
+    get_current_version,
+    upgrade_studies,
+    upgrade_study,
+)
 from antarest.study.storage.study_upgrader.upgrader_840 import MAPPING_TRANSMISSION_CAPACITIES
+from antarest.study.storage.study_upgrader.utils import process_pool
 from tests.storage.business.assets import ASSETS_DIR
 
 
@@ -85,6 +94,107 @@ def test_fallback_if_study_input_broken(tmp_path):
     assert are_same_dir(study_dir, before_upgrade_dir)
 
 
+class _Interruption(BaseException):
+    """Simulate an interruption of the process (which is not an `Exception`)."""
+
+
+def _spy(method: Callable[[Path], None], version: str, calls: List[str]) -> Callable[[Path], None]:
+    def wrapper(study_path: Path) -> None:
+        calls.append(version)
+        method(study_path)
+
+    return wrapper
+
+
+def test_upgrade_does_not_modify_original_matrices(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path_study = ASSETS_DIR / "little_study_700.zip"
+    study_dir = tmp_path / "little_study_700"
+    with zipfile.ZipFile(path_study) as zip_output:
+        zip_output.extractall(path=study_dir)
+    before_upgrade_dir = tmp_path / "backup"
+    shutil.copytree(study_dir, before_upgrade_dir, dirs_exist_ok=True)
+
+    # The matrices are hard-linked in the staging directory:
+    # a failing upgrade must not alter the original files.
+    index = next(i for i, m in enumerate(UPGRADE_METHODS) if m.new == "870")
+    old, new, method, files = UPGRADE_METHODS[index]
+
+    def _failing_upgrade(study_path: Path) -> None:
+        method(study_path)
+        raise ValueError("Upgrade failure")
+
+    upgrade_methods = list(UPGRADE_METHODS)
+    upgrade_methods[index] = UpgradeMethod(old, new, _failing_upgrade, files)
+    monkeypatch.setattr(study_upgrader, "UPGRADE_METHODS", upgrade_methods)
+    with pytest.raises(ValueError, match="Upgrade failure"):
+        upgrade_study(study_dir, "880")
+    assert are_same_dir(study_dir, before_upgrade_dir)
+    assert not list(tmp_path.glob("~*.upgrade.tmp"))
+
+
+def test_resume_interrupted_upgrade(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path_study = ASSETS_DIR / "little_study_700.zip"
+    study_dir = tmp_path / "little_study_700"
+    with zipfile.ZipFile(path_study) as zip_output:
+        zip_output.extractall(path=study_dir)
+    expected_dir = tmp_path / "expected"
+    shutil.copytree(study_dir, expected_dir)
+    upgrade_study(expected_dir, "880")
+
+    # Interrupt the upgrade during the step 860 -> 870
+    index = next(i for i, m in enumerate(UPGRADE_METHODS) if m.new == "870")
+    calls: List[str] = []
+
+    def _interrupted_upgrade(study_path: Path) -> None:
+        raise _Interruption()
+
+    upgrade_methods = []
+    for i, (old, new, method, files) in enumerate(UPGRADE_METHODS):
+        func = _interrupted_upgrade if i == index else _spy(method, new, calls)
+        upgrade_methods.append(UpgradeMethod(old, new, func, files))
+    monkeypatch.setattr(study_upgrader, "UPGRADE_METHODS", upgrade_methods)
+    with pytest.raises(_Interruption):
+        upgrade_study(study_dir, "880")
+    assert get_current_version(study_dir) == "700"
+    assert calls == ["710", "720", "800", "810", "820", "830", "840", "850", "860"]
+
+    # Resume the upgrade: the completed steps are not replayed
+    calls.clear()
+    upgrade_methods = [
+        UpgradeMethod(old, new, _spy(method, new, calls), files) for old, new, method, files in UPGRADE_METHODS
+    ]
+    monkeypatch.setattr(study_upgrader, "UPGRADE_METHODS", upgrade_methods)
+    upgrade_study(study_dir, "880")
+    assert calls == ["870", "880"]
+    assert get_current_version(study_dir) == "880"
+    assert not list(tmp_path.glob("~*.upgrade.tmp"))
+    assert are_same_dir(study_dir / "input", expected_dir / "input")
+    assert are_same_dir(study_dir / "settings", expected_dir / "settings")
+
+
+def test_upgrade_studies(tmp_path: Path):
+    study_dirs = []
+    for name in ["little_study_700", "little_study_720"]:
+        study_dir = tmp_path / name
+        with zipfile.ZipFile(ASSETS_DIR / f"{name}.zip") as zip_output:
+            zip_output.extractall(path=study_dir)
+        study_dirs.append(study_dir)
+    broken_dir = tmp_path / "broken_study_720"
+    with zipfile.ZipFile(ASSETS_DIR / "broken_study_720.zip") as zip_output:
+        zip_output.extractall(path=broken_dir)
+
+    # the matrices of all the studies are rewritten by a single pool of processes, as in the command line
+    with process_pool(max_workers=2):
+        results = upgrade_studies([*study_dirs, broken_dir], "880", max_workers=2)
+
+    assert results[study_dirs[0]] is None
+    assert results[study_dirs[1]] is None
+    assert isinstance(results[broken_dir], pandas.errors.EmptyDataError)
+    for study_dir in study_dirs:
+        assert get_current_version(study_dir) == "880"
+    assert get_current_version(broken_dir) == "720"
+
+
 def assert_study_antares_file_is_updated(tmp_path: Path, target_version: str) -> None:
     lines = (tmp_path / "study.antares").read_text(encoding="utf-8")
     assert re.search(r"version\s*=\s*(\d+)", lines)[1] == target_version
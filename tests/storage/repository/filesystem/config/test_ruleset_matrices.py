@@ -573,3 +573,37 @@ class TestRulesetMatrices:
         assert np.isnan(expected) and np.isnan(actual) or expected == actual
         actual_table_form = ruleset.get_table_form("load")
         assert actual_table_form["France"]["0"] == ("" if np.isnan(expected) else expected)
+
+    def test_update_table_form__modified_rules(self, ruleset: RulesetMatrices) -> None:
+        ruleset.update_rules({"l,france,0": 1, "l,france,1": 2, "hl,italy,0": 0.5, "t,france,0,nuclear": 3})
+
+        # only the modified cells are returned, the removed rules have a `None` value
+        rules = ruleset.update_table_form({"France": {"0": 1, "1": "", "2": 4}, "Italy": {"0": ""}}, "load")
+        assert rules == {"l,france,1": None, "l,france,2": 4}
+        assert isinstance(rules["l,france,2"], int)
+
+        rules = ruleset.update_table_form({"Italy": {"0": 50, "1": 25}}, "hydroInitialLevels")
+        assert rules == {"hl,italy,1": 0.25}
+
+        rules = ruleset.update_table_form({"France": {"nuclear": {"0": 4}, "coal": {"0": 3}}}, "thermal")
+        assert rules == {"t,france,0,nuclear": 4, "t,france,0,coal": 3}
+
+        # the cells missing in the table form are not modified
+        assert ruleset.update_table_form({"France": {"0": 1}, "Italy": {"3": 7}}, "load") == {"l,italy,3": 7}
+        assert ruleset.update_table_form({"France": {"0": 1}}, "load") == {}
+        assert ruleset.get_rules() == {
+            "l,france,0": 1,
+            "l,france,2": 4,
+            "l,italy,3": 7,
+            "hl,italy,0": 0.5,
+            "hl,italy,1": 0.25,
+            "t,france,0,nuclear": 4,
+            "t,france,0,coal": 3,
+        }
+
+    def test_update_rules__extra_years(self, ruleset: RulesetMatrices) -> None:
+        # the rules of the years beyond the number of years are kept
+        ruleset.update_rules({"l,france,0": 1, "l,italy,5": 2})
+        assert ruleset.columns == ["0", "1", "2", "3"]
+        assert ruleset.scenarios["load"].columns.tolist() == ["0", "1", "2", "3", "5"]
+        assert ruleset.get_rules() == {"l,france,0": 1, "l,italy,5": 2}
@@ -614,7 +614,7 @@ def test_download_output() -> None:
         path="path",
         expiration_date=datetime.utcnow(),
     )
-    service.file_transfer_manager.request_download.return_value = export_file_download  # type: ignore
+    service.file_transfer_manager.request_export.return_value = (export_file_download, None)  # type: ignore
     task_id = "task-id"
     service.task_service.add_task.return_value = task_id  # type: ignore
 
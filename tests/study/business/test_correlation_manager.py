@@ -22,7 +22,7 @@ from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
 from antarest.study.storage.storage_service import StudyStorageService
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
 from antarest.study.storage.variantstudy.model.command.common import CommandName
-from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_correlation import UpdateCorrelation
 from antarest.study.storage.variantstudy.model.command_context import CommandContext
 from antarest.study.storage.variantstudy.variant_study_service import VariantStudyService
 
@@ -301,11 +301,129 @@ class TestCorrelationManager:
         actual_study, _, actual_cmds, _ = mock_call.args
         assert actual_study == study
         assert len(actual_cmds) == 1
-        cmd: UpdateConfig = actual_cmds[0]
-        assert cmd.command_name == CommandName.UPDATE_CONFIG
+        cmd: UpdateCorrelation = actual_cmds[0]
+        assert cmd.command_name == CommandName.UPDATE_CORRELATION
         assert cmd.target == "input/hydro/prepro/correlation/annual"
         assert cmd.data == {"e%s": 0.3, "n%s": 0.4}
 
+    def test_set_field_values__only_changed_pairs(self, db_session, study_storage_service, study_uuid):
+        # The study must be fetched from the database
+        study: RawStudy = db_session.query(Study).get(study_uuid)
+
+        # Prepare the mocks: the pairs may be stored in any order
+        correlation_cfg = {"s%n": 0.4, "w%s": 0.5, "e%w": 0.1}
+        storage = study_storage_service.get_storage(study)
+        file_study = storage.get_raw(study)
+        file_study.tree = Mock(
+            spec=FileStudyTree,
+            get=Mock(return_value=correlation_cfg),
+        )
+
+        # Given the following arguments
+        all_areas = [
+            AreaInfoDTO(id="n", name="North", type=AreaType.AREA),
+            AreaInfoDTO(id="e", name="East", type=AreaType.AREA),
+            AreaInfoDTO(id="s", name="South", type=AreaType.AREA),
+            AreaInfoDTO(id="w", name="West", type=AreaType.AREA),
+        ]
+        manager = CorrelationManager(study_storage_service)
+        with patch(EXECUTE_OR_ADD_COMMANDS) as exe:
+            fields = manager.set_correlation_form_fields(
+                all_areas=all_areas,
+                study=study,
+                area_id="s",
+                data=CorrelationFormFields(
+                    correlation=[
+                        AreaCoefficientItem(area_id="n", coefficient=40),
+                        AreaCoefficientItem(area_id="e", coefficient=30),
+                    ]
+                ),
+            )
+
+        # only the modified pairs are updated: "w%s" is removed, "s%e" is added
+        assert exe.call_count == 1
+        _, _, actual_cmds, _ = exe.mock_calls[0].args
+        assert [cmd.data for cmd in actual_cmds] == [{"w%s": None, "e%s": 0.3}]
+        assert fields == CorrelationFormFields(
+            correlation=[
+                AreaCoefficientItem(area_id="n", coefficient=40),
+                AreaCoefficientItem(area_id="e", coefficient=30),
+                AreaCoefficientItem(area_id="s", coefficient=100),
+            ]
+        )
+
+        # nothing is saved if nothing changes
+        with patch(EXECUTE_OR_ADD_COMMANDS) as exe:
+            manager.set_correlation_form_fields(
+                all_areas=all_areas,
+                study=study,
+                area_id="e",
+                data=CorrelationFormFields(correlation=[AreaCoefficientItem(area_id="w", coefficient=10)]),
+            )
+        exe.assert_not_called()
+
+    def test_set_correlation_matrix__nominal_case(self, db_session, study_storage_service, study_uuid):
+        # The study must be fetched from the database
+        study: RawStudy = db_session.query(Study).get(study_uuid)
+
+        # Prepare the mocks
+        correlation_cfg = {"s%n": 0.2, "s%w": 0.6}
+        storage = study_storage_service.get_storage(study)
+        file_study = storage.get_raw(study)
+        file_study.tree = Mock(
+            spec=FileStudyTree,
+            get=Mock(return_value=correlation_cfg),
+        )
+
+        # Given the following arguments
+        all_areas = [
+            AreaInfoDTO(id="n", name="North", type=AreaType.AREA),
+            AreaInfoDTO(id="e", name="East", type=AreaType.AREA),
+            AreaInfoDTO(id="s", name="South", type=AreaType.AREA),
+            AreaInfoDTO(id="w", name="West", type=AreaType.AREA),
+        ]
+        manager = CorrelationManager(study_storage_service)
+        with patch(EXECUTE_OR_ADD_COMMANDS) as exe:
+            matrix = manager.set_correlation_matrix(
+                all_areas=all_areas,
+                study=study,
+                matrix=CorrelationMatrix(
+                    index=["n", "e", "s", "w"],
+                    columns=["s", "e"],
+                    data=[[0.2, 0.0], [0.5, 1.0], [1.0, 0.5], [0.0, 0.0]],
+                ),
+            )
+
+        # only the modified pairs are updated
+        assert exe.call_count == 1
+        _, _, actual_cmds, _ = exe.mock_calls[0].args
+        assert [cmd.data for cmd in actual_cmds] == [{"e%s": 0.5, "s%w": None}]
+        assert matrix == CorrelationMatrix(
+            index=["n", "e", "s", "w"],
+            columns=["e", "s"],
+            data=[[0.0, 0.2], [1.0, 0.5], [0.5, 1.0], [0.0, 0.0]],
+        )
+
+    def test_set_correlation_matrix__area_not_found(self, db_session, study_storage_service, study_uuid):
+        # The study must be fetched from the database
+        study: RawStudy = db_session.query(Study).get(study_uuid)
+
+        storage = study_storage_service.get_storage(study)
+        file_study = storage.get_raw(study)
+        file_study.tree = Mock(spec=FileStudyTree, get=Mock(return_value={}))
+
+        all_areas = [AreaInfoDTO(id="n", name="North", type=AreaType.AREA)]
+        manager = CorrelationManager(study_storage_service)
+        with patch(EXECUTE_OR_ADD_COMMANDS) as exe:
+            with pytest.raises(AreaNotFound) as ctx:
+                manager.set_correlation_matrix(
+                    all_areas=all_areas,
+                    study=study,
+                    matrix=CorrelationMatrix(index=["n", "UNKNOWN"], columns=["n"], data=[[1.0], [0.5]]),
+                )
+            assert "'UNKNOWN'" in ctx.value.detail
+        exe.assert_not_called()
+
     def test_set_field_values__area_not_found(self, db_session, study_storage_service, study_uuid):
         # The study must be fetched from the database
         study: RawStudy = db_session.query(Study).get(study_uuid)
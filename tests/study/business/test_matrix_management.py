@@ -1,5 +1,6 @@
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -10,6 +11,8 @@ from antarest.study.business.matrix_management import (
     MatrixIndexError,
     MatrixManagerError,
     MatrixUpdateError,
+    apply_operation_on_coordinates,
+    apply_operation_on_slices,
     group_by_slices,
     merge_edit_instructions,
     update_matrix_content_with_coordinates,
@@ -275,6 +278,35 @@ def test_update_matrix_content_with_coordinates__out_of_bounds() -> None:
         )
 
 
+def test_apply_operation_on_slices__overlapping_slices() -> None:
+    matrix = np.array([[1.0, np.nan, 1.0], [1.0, 1.0, 1.0]])
+    slices = [
+        MatrixSlice(row_from=0, row_to=1, column_from=0, column_to=1),
+        MatrixSlice(row_from=0, row_to=0, column_from=0, column_to=2),
+    ]
+    apply_operation_on_slices(matrix, slices, Operation(operation="+", value=1))
+    # each cell is updated once, NaN cells are left unchanged
+    assert np.array_equal(matrix, [[2, np.nan, 2], [2, 2, 1]], equal_nan=True)
+
+    apply_operation_on_slices(matrix, slices[:1], Operation(operation="=", value=5))
+    assert np.array_equal(matrix, [[5, np.nan, 2], [5, 5, 1]], equal_nan=True)
+
+
+def test_apply_operation_on_coordinates__duplicated_cells() -> None:
+    matrix = np.array([[1.0, np.nan], [1.0, 1.0]])
+    apply_operation_on_coordinates(matrix, [(0, 0), (0, 0), (1, 1)], Operation(operation="+", value=1))
+    assert np.array_equal(matrix, [[3, np.nan], [1, 2]], equal_nan=True)
+
+    # unlike slices, the "=" operation updates the NaN cells
+    apply_operation_on_coordinates(matrix, [(0, 1)], Operation(operation="=", value=4))
+    assert np.array_equal(matrix, [[3, 4], [1, 2]])
+
+    with pytest.raises(MatrixIndexError, match=r"\(2, 0\)"):
+        apply_operation_on_coordinates(matrix, [(1, 1), (2, 0)], Operation(operation="=", value=4))
+    # the matrix is not modified when a coordinate is invalid
+    assert np.array_equal(matrix, [[3, 4], [1, 2]])
+
+
 class TestGroupBySlices:
     @pytest.mark.parametrize(
         "cells, expected",
@@ -0,0 +1,77 @@
+import typing as t
+from unittest.mock import Mock
+
+import pytest
+
+from antarest.matrixstore.service import MatrixService
+from antarest.study.storage.variantstudy.business.command_compactor import CommandCompactor
+from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
+from antarest.study.storage.variantstudy.model.command.create_link import CreateLink
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.remove_area import RemoveArea
+from antarest.study.storage.variantstudy.model.command.remove_link import RemoveLink
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+
+
+@pytest.fixture(name="command_context")
+def command_context_fixture() -> CommandContext:
+    return CommandContext.construct(matrix_service=Mock(spec=MatrixService))
+
+
+def _dump(commands: t.Sequence[ICommand]) -> t.List[t.Tuple[str, t.Any]]:
+    return [(cmd.command_name.value, cmd.to_dto().args) for cmd in commands]
+
+
+class TestCommandCompactor:
+    def test_compact__overwrite_commands(self, command_context: CommandContext) -> None:
+        def update(target: str, data: t.Any) -> UpdateConfig:
+            return UpdateConfig(target=target, data=data, command_context=command_context)
+
+        def replace(target: str, matrix: str) -> ReplaceMatrix:
+            return ReplaceMatrix(target=target, matrix=matrix, command_context=command_context)
+
+        commands = [
+            update("settings/generaldata/general/nbyears", 1),
+            replace("input/load/series/load_fr", "m1"),
+            update("settings/generaldata/general/mode", "Economy"),
+            update("settings/generaldata/general/nbyears", 2),
+            replace("input/load/series/load_fr", "m2"),
+            # an overlapping target prevents the merge of `nbyears`
+            update("settings/generaldata/general", {"nbyears": 3}),
+            update("settings/generaldata/general/nbyears", 4),
+            # a command which does not overwrite its target prevents any merge
+            CreateArea(area_name="DE", command_context=command_context),
+            update("settings/generaldata/general/nbyears", 5),
+        ]
+        actual = CommandCompactor().compact(commands)
+        assert _dump(actual) == [
+            # the merged command takes the place of the first one
+            ("update_config", {"target": "settings/generaldata/general/nbyears", "data": "2"}),
+            ("replace_matrix", {"target": "input/load/series/load_fr", "matrix": "m2"}),
+            ("update_config", {"target": "settings/generaldata/general/mode", "data": "Economy"}),
+            ("update_config", {"target": "settings/generaldata/general", "data": {"nbyears": 3}}),
+            ("update_config", {"target": "settings/generaldata/general/nbyears", "data": "4"}),
+            ("create_area", {"area_name": "DE"}),
+            ("update_config", {"target": "settings/generaldata/general/nbyears", "data": "5"}),
+        ]
+
+    def test_compact__reverted_commands(self, command_context: CommandContext) -> None:
+        commands = [
+            CreateArea(area_name="FR", command_context=command_context),
+            CreateArea(area_name="DE", command_context=command_context),
+            CreateLink(area1="de", area2="fr", command_context=command_context),
+            RemoveLink(area1="de", area2="fr", command_context=command_context),
+            RemoveArea(id="de", command_context=command_context),
+            UpdateConfig(target="settings/generaldata/general/nbyears", data=1, command_context=command_context),
+            UpdateConfig(target="settings/generaldata/general/nbyears", data=2, command_context=command_context),
+        ]
+
+        # without the cancellation of the reverted commands, only the overwrite commands are merged
+        actual = CommandCompactor(cancel_reverted=False).compact(commands)
+        assert _dump(actual) == _dump(commands[:-2] + commands[-1:])
+
+        # the cancellation is applied until no more commands can be removed
+        actual = CommandCompactor().compact(commands)
+        assert _dump(actual) == _dump(commands[:1] + commands[-1:])
@@ -21,6 +21,7 @@ from antarest.study.storage.variantstudy.business.matrix_constants_generator imp
 from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
 from antarest.study.storage.variantstudy.model.command.create_st_storage import CreateSTStorage
 from antarest.study.storage.variantstudy.model.command_context import CommandContext
+from antarest.study.storage.variantstudy.model.model import CommandDTO
 from antarest.study.storage.variantstudy.variant_study_service import VariantStudyService
 from tests.helpers import with_db_context
 
@@ -227,3 +228,72 @@ class TestVariantStudyService:
         else:
             expected = EXPECTED_DENORMALIZED
         assert res_study_files == expected
+
+    @with_db_context
+    def test_compact_commands__edited_during_compaction(
+        self,
+        tmp_path: Path,
+        variant_study_service: VariantStudyService,
+        raw_study_service: RawStudyService,
+    ) -> None:
+        # noinspection PyArgumentList
+        user = User(id=0, name="admin")
+        db.session.add(user)
+        db.session.commit()
+
+        raw_study_path = tmp_path / "My RAW Study"
+        # noinspection PyArgumentList
+        raw_study = RawStudy(
+            id="my_raw_study",
+            name=raw_study_path.name,
+            version="860",
+            author="John Smith",
+            created_at=datetime.datetime(2023, 7, 15, 16, 45),
+            updated_at=datetime.datetime(2023, 7, 19, 8, 15),
+            last_access=datetime.datetime.utcnow(),
+            public_mode=PublicMode.FULL,
+            owner=user,
+            path=str(raw_study_path),
+            additional_data=StudyAdditionalData(author="John Smith"),
+        )
+        db.session.add(raw_study)
+        db.session.commit()
+        raw_study_service.create(raw_study)
+
+        params = Mock(
+            spec=RequestParameters,
+            user=Mock(impersonator=user.id, is_site_admin=Mock(return_value=True)),
+        )
+        variant_study = variant_study_service.create_variant_study(raw_study.id, "My Variant Study", params=params)
+        variant_id = variant_study.id
+
+        target = "settings/generaldata/general/nbyears"
+        command_ids = variant_study_service.append_commands(
+            variant_id,
+            [
+                CommandDTO(action="update_config", args={"target": target, "data": 10}),
+                CommandDTO(action="update_config", args={"target": target, "data": 20}),
+            ],
+            params,
+        )
+
+        # The user edits a command while the compacted commands are checked
+        apply_commands = variant_study_service._apply_commands_to_dir
+        edited_commands = []
+
+        def apply_and_edit(commands, dest_dir):  # type: ignore
+            if dest_dir.name.startswith("compacted") and not edited_commands:
+                new_command = CommandDTO(action="update_config", args={"target": target, "data": 15})
+                variant_study_service.update_command(variant_id, command_ids[0], new_command, params)
+                edited_commands.extend(variant_study_service.get_commands(variant_id, params))
+            return apply_commands(commands, dest_dir)
+
+        variant_study_service._apply_commands_to_dir = apply_and_edit  # type: ignore
+        result = variant_study_service._compact_commands(variant_id, Mock())
+
+        # The compaction is aborted, and the edition is kept
+        assert edited_commands
+        assert not result.success
+        assert "modified during the compaction" in result.message
+        actual = variant_study_service.get_commands(variant_id, params)
+        assert [(c.id, c.action, c.args) for c in actual] == [(c.id, c.action, c.args) for c in edited_commands]
@@ -849,6 +849,54 @@ def test_get_all__study_tags_filter(
     assert len(db_recorder.sql_statements) == 1, str(db_recorder)
 
 
+def test_get_all__pagination_in_sql(db_session: Session) -> None:
+    icache: Mock = Mock(spec=ICache)
+    repository = StudyMetadataRepository(cache_service=icache, session=db_session)
+
+    group_1 = Group(id="101", name="group-1")
+    tag_1 = Tag(label="decennial")
+    tag_2 = Tag(label="winter")
+    studies = [
+        RawStudy(id=str(k), name=f"study-{k}", groups=[group_1], tags=[tag_1, tag_2], public_mode=PublicMode.NONE)
+        for k in range(1, 9)
+    ]
+    db_session.add(group_1)
+    db_session.add_all(studies)
+    db_session.commit()
+
+    # The tags and groups filters must not prevent the database from paginating the results
+    study_filter = StudyFilter(
+        groups=["101"],
+        tags=["decennial", "WINTER"],
+        access_permissions=AccessPermissions(user_id=5, user_groups=["101"]),
+    )
+    with DBStatementRecorder(db_session.bind) as db_recorder:
+        page = repository.get_all(
+            study_filter=study_filter,
+            sort_by=StudySortBy.NAME_ASC,
+            pagination=StudyPagination(page_nb=1, page_size=3),
+        )
+        _ = [s.groups for s in page]
+        _ = [s.tags for s in page]
+    assert len(db_recorder.sql_statements) == 1, str(db_recorder)
+    assert "LIMIT" in db_recorder.sql_statements[0], str(db_recorder)
+    assert [s.name for s in page] == ["study-4", "study-5", "study-6"]
+    assert repository.count_studies(study_filter) == 8
+
+    # keyset pagination: fetch the studies after the last study of the previous page
+    for sort_by, expected in [
+        (StudySortBy.NAME_ASC, ["study-7", "study-8"]),
+        (StudySortBy.NAME_DESC, ["study-5", "study-4"]),
+        (None, ["study-7", "study-8"]),
+    ]:
+        page = repository.get_all(
+            study_filter=study_filter,
+            sort_by=sort_by,
+            pagination=StudyPagination(page_size=2, after="6"),
+        )
+        assert [s.name for s in page] == expected, sort_by
+
+
 @pytest.mark.parametrize(
     "user_id, study_groups, expected_ids",
     [
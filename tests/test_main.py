@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine  # type: ignore
+
+from antarest.dbmodel import Base
+
+STARTUP_BUDGET = 6.0
+"""Maximum duration (in seconds) of the import and the creation of the application (about 2.3 s measured)."""
+
+# The duration depends on the machine (and on the coverage measurement): it is only checked on demand
+CHECK_STARTUP_TIME = bool(os.environ.get("ANTAREST_CHECK_STARTUP_TIME"))
+
+# Modules which are slow to import and only needed by some endpoints, tasks or configurations
+DEFERRED_MODULES = ["alembic", "antareslauncher", "aredis", "py7zr", "tables", "xlsxwriter"]
+
+STARTUP_SCRIPT = """
+import json
+import sys
+import time
+from pathlib import Path
+
+start = time.perf_counter()
+from antarest.main import fastapi_app
+
+fastapi_app(Path(sys.argv[1]), Path(sys.argv[2]), mount_front=False)
+duration = time.perf_counter() - start
+Path(sys.argv[3]).write_text(json.dumps({"duration": duration, "modules": sorted(sys.modules)}))
+"""
+
+
+def _write_config(tmp_path: Path) -> Path:
+    db_path = tmp_path / "db.sqlite"
+    Base.metadata.create_all(create_engine(f"sqlite:///{db_path}"))
+    for name in ("matrices", "archives", "tmp", "workspace"):
+        tmp_path.joinpath(name).mkdir()
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(
+        f"""
+security:
+  disabled: true
+  jwt:
+    key: secret
+db:
+  url: sqlite:///{db_path}
+storage:
+  matrixstore: {tmp_path / "matrices"}
+  archive_dir: {tmp_path / "archives"}
+  tmp_dir: {tmp_path / "tmp"}
+  workspaces:
+    default:
+      path: {tmp_path / "workspace"}
+launcher:
+  default: local
+  local:
+    binaries:
+      700: {sys.executable}
+"""
+    )
+    return config_path
+
+
+def _start(project_path: Path, config_path: Path, result_path: Path) -> dict:
+    # the application is started in a new interpreter, to measure a cold start
+    env = {**os.environ, "PYTHONPATH": str(project_path)}
+    args = [sys.executable, "-c", STARTUP_SCRIPT, str(config_path), str(project_path / "resources"), str(result_path)]
+    subprocess.run(args, cwd=project_path, env=env, check=True, capture_output=True)
+    return json.loads(result_path.read_text())
+
+
+def _cold_start(project_path: Path, tmp_path: Path) -> dict:
+    config_path = _write_config(tmp_path)
+    # the first start initializes the database (administrator, default groups...)
+    _start(project_path, config_path, tmp_path / "first.json")
+    return _start(project_path, config_path, tmp_path / "result.json")
+
+
+def test_cold_start(project_path: Path, tmp_path: Path) -> None:
+    result = _cold_start(project_path, tmp_path)
+    assert not set(DEFERRED_MODULES) & set(result["modules"])
+
+
+@pytest.mark.skipif(not CHECK_STARTUP_TIME, reason="Set ANTAREST_CHECK_STARTUP_TIME to check the startup time")
+def test_cold_start__duration(project_path: Path, tmp_path: Path) -> None:
+    result = _cold_start(project_path, tmp_path)
+    assert result["duration"] < STARTUP_BUDGET
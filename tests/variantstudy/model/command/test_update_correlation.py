@@ -0,0 +1,65 @@
+import pytest
+
+from antarest.study.storage.rawstudy.ini_reader import IniReader
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.variantstudy.business.command_reverter import CommandReverter
+from antarest.study.storage.variantstudy.model.command.remove_area import RemoveArea
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_correlation import UpdateCorrelation
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+
+TARGET = "input/hydro/prepro/correlation/annual"
+
+
+@pytest.mark.unit_test
+def test_update_correlation(empty_study: FileStudy, command_context: CommandContext):
+    study_path = empty_study.config.study_path
+
+    output = UpdateConfig(
+        target=TARGET,
+        data={"north%south": 0.5, "east%north": 0.25, "east%west": 0.75},
+        command_context=command_context,
+    ).apply(empty_study)
+    assert output.status
+
+    # the pairs can be given in any order, the other pairs are kept
+    output = UpdateCorrelation(
+        target=TARGET,
+        data={"north%east": 0.1, "east%west": None, "south%west": 0.3},
+        command_context=command_context,
+    ).apply(empty_study)
+    assert output.status
+    correlation = IniReader().read(study_path / "input/hydro/prepro/correlation.ini")
+    assert correlation["annual"] == {"north%south": 0.5, "north%east": 0.1, "south%west": 0.3}
+
+
+def test_validation(command_context: CommandContext):
+    with pytest.raises(ValueError, match="area1%area2"):
+        UpdateCorrelation(target=TARGET, data={"north": 0.5}, command_context=command_context)
+
+
+def test_match(command_context: CommandContext):
+    base = UpdateCorrelation(target=TARGET, data={"a%b": 0.5}, command_context=command_context)
+    other_match = UpdateCorrelation(target=TARGET, data={"a%b": 0.5}, command_context=command_context)
+    other_not_match = UpdateCorrelation(target=TARGET, data={"a%b": 0.2}, command_context=command_context)
+    other_other = RemoveArea(id="id", command_context=command_context)
+    assert base.match(other_match, equal=True)
+    assert base.match(other_not_match)
+    assert not base.match(other_not_match, equal=True)
+    assert not base.match(other_other)
+    assert base.match_signature() == f"update_correlation%{TARGET}"
+
+
+def test_revert(empty_study: FileStudy, command_context: CommandContext):
+    base_command = UpdateCorrelation(target=TARGET, data={"a%b": 0.5}, command_context=command_context)
+    update_config = UpdateConfig(target=TARGET, data={"a%c": 0.1}, command_context=command_context)
+    update_correlation = UpdateCorrelation(target=TARGET, data={"b%c": 0.2}, command_context=command_context)
+    other = UpdateCorrelation(target="input/wind/prepro/correlation/annual", data={}, command_context=command_context)
+
+    # the previous state is rebuilt from the last full update and the following partial updates
+    history = [update_config, update_correlation, other]
+    assert CommandReverter().revert(base_command, history, empty_study) == [update_config, update_correlation]
+
+    # without full update, the state of the base study is used
+    actual = CommandReverter().revert(base_command, [update_correlation], empty_study)
+    assert actual == [UpdateConfig(target=TARGET, data={}, command_context=command_context), update_correlation]
@@ -295,6 +295,13 @@ class TestCommandFactory:
                     "reverse": False,
                 },
             ),
+            CommandDTO(
+                action=CommandName.UPDATE_CORRELATION.value,
+                args={
+                    "target": "input/hydro/prepro/correlation/annual",
+                    "data": {"area1%area2": 0.25, "area1%area3": None},
+                },
+            ),
             CommandDTO(
                 action=CommandName.UPDATE_SCENARIO_BUILDER.value,
                 args={
@@ -440,3 +447,39 @@ def test_unknown_command():
             patch_service=Mock(spec=PatchService),
         )
         command_factory.to_command(command_dto=CommandDTO(action="unknown_command", args={}))
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    "command_dto",
+    [
+        CommandDTO(action=CommandName.UPDATE_CONFIG.value, args={"target": "a/b", "data": data})
+        for data in ["foo", 5, 1.5, True, None, {"section": {"key": 1}}]
+    ]
+    + [
+        CommandDTO(action=CommandName.REPLACE_MATRIX.value, args={"target": "a/b", "matrix": "my_matrix_id"}),
+        CommandDTO(
+            action=CommandName.REPLACE_MATRIX.value,
+            args=[{"target": "a/b", "matrix": "my_matrix_id"}, {"target": "a/c", "matrix": "other_id"}],
+        ),
+        CommandDTO(action=CommandName.CREATE_AREA.value, args={"area_name": "area_name"}),
+    ],
+)
+def test_to_command__trusted(command_dto: CommandDTO) -> None:
+    command_dto.id = "f9d6e4a0-6c1c-4a8e-9a1e-3c1b8c0ad3a5"
+    matrix_service = Mock(spec=MatrixService)
+    command_factory = CommandFactory(
+        generator_matrix_constants=Mock(spec=GeneratorMatrixConstants),
+        matrix_service=matrix_service,
+        patch_service=Mock(spec=PatchService),
+    )
+    validated_commands = command_factory.to_command(command_dto)
+    matrix_service.reset_mock()
+
+    trusted_commands = command_factory.to_command(command_dto, trusted=True)
+
+    # the trusted commands are the same as the validated ones, without checking the matrices
+    assert [type(cmd) for cmd in trusted_commands] == [type(cmd) for cmd in validated_commands]
+    assert [cmd.dict() for cmd in trusted_commands] == [cmd.dict() for cmd in validated_commands]
+    assert [cmd.to_dto() for cmd in trusted_commands] == [cmd.to_dto() for cmd in validated_commands]
+    matrix_service.exists.assert_not_called()
@@ -368,6 +368,7 @@ export enum TaskType {
   LAUNCH = "LAUNCH",
   EXPORT = "EXPORT",
   VARIANT_GENERATION = "VARIANT_GENERATION",
+  VARIANT_COMPACTION = "VARIANT_COMPACTION",
   COPY = "COPY",
   ARCHIVE = "ARCHIVE",
   UNARCHIVE = "UNARCHIVE",
@@ -388,6 +389,8 @@ export interface TaskDTO extends IdentityDTO<string> {
   logs?: TaskLogDTO[];
   type?: TaskType;
   ref_id?: string;
+  queue_depth?: number;
+  wait_time?: number;
 }
 
 export interface TaskEventPayload {